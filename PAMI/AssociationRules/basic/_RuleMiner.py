@@ -52,70 +52,44 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.AssociationRules.basic import abstract as _ab
+from PAMI.AssociationRules.basic.ruleEngine import RuleEngine
 from deprecated import deprecated
 
+def _rules(patterns, minConf, dbSize=None):
+    """
+    Rules of the patterns with a confidence of at least minConf, with the consequents grown level-wise by RuleEngine.
+
+    :param patterns: given frequent patterns
+    :type patterns: dict
+    :param minConf: minimum confidence
+    :type minConf: float
+    :param dbSize: number of transactions, the largest support when it is not known
+    :type dbSize: int
+    :return: (antecedent, consequent, support, confidence, lift, leverage, conviction) of every rule
+    :rtype: list
+    """
+    engine = RuleEngine(patterns, dbSize=dbSize or max(patterns.values(), default=1), sep='\t')
+    return engine.mine(max(minConf, 0))
+
+
 class Confidence:
     """
     Association Rules are derived from frequent patterns using "confidence" metric.
     """
     
-    def __init__(self, patterns, singleItems, threshold):
+    def __init__(self, patterns, singleItems, threshold, dbSize=None):
         self._frequentPatterns = patterns
         self._singleItems = singleItems
         self._threshold = threshold
+        self._dbSize = dbSize
         self._finalPatterns = {}
-        
-    def _generation(self, prefix, suffix):
-        """
-        To generate the combinations all association rules.
-
-        :param prefix: the prefix of association rule.
-        :type prefix: str
-        :param suffix: the suffix of association rule.
-        :type suffix: str
-        """
-        if len(suffix) == 1:
-            self._generaeWithConfidence(prefix, suffix[0])
-        for i in range(len(suffix)):
-            suffix1 = suffix[:i] + suffix[i+1:]
-            prefix1 = prefix + ' ' + suffix[i]
-            for j in range(i+1, len(suffix)):
-                self._generaeWithConfidence(prefix + ' ' + suffix[i], suffix[j])
-                #self._generation(prefix+ ' ' +suffix[i], suffix[i+1:]) 
-            self._generation(prefix1, suffix1)
-            
-    def _generaeWithConfidence(self, lhs, rhs):
-        """
-        To find association rules satisfying user-specified minConf
-
-        :param lhs: the prefix of association rule.
-        :type lhs: str
-        :param rhs: the suffix of association rule.
-        :type rhs: str
-        """
-        s = lhs + '\t' + rhs
-        if self._frequentPatterns.get(s) is None:
-            return 0
-        minimum = self._frequentPatterns[s]
-        conflhs = minimum / self._frequentPatterns[lhs]
-        confrhs = minimum / self._frequentPatterns[rhs]
-        if conflhs >= self._threshold:
-            s1 = lhs + '->' + rhs
-            self._finalPatterns[s1] = conflhs
-        if confrhs >= self._threshold:
-            s1 = rhs + '->' + lhs
-            self._finalPatterns[s1] = confrhs
-            
+
     def run(self):
         """
-        To generate the combinations all association rules.
+        To generate all the association rules satisfying user-specified minConf.
         """
-        for i in range(len(self._singleItems)):
-            suffix = self._singleItems[:i] + self._singleItems[i+1:]
-            prefix = self._singleItems[i]
-            for j in range(i+1, len(self._singleItems)):
-                self._generaeWithConfidence(self._singleItems[i], self._singleItems[j])
-            self._generation(prefix, suffix)
+        for lhs, rhs, _, conf, _, _, _ in _rules(self._frequentPatterns, self._threshold, self._dbSize):
+            self._finalPatterns[' '.join(lhs) + '->' + ' '.join(rhs)] = conf
     
     
     
@@ -124,7 +98,7 @@ class Lift:
     Association Rules are derived from frequent patterns using "lift" metric.
     """
     
-    def __init__(self, patterns, singleItems, threshold):
+    def __init__(self, patterns, singleItems, threshold, dbSize=None):
         """
         :param patterns: given frequent patterns
         :type patterns: dict
@@ -132,65 +106,25 @@ class Lift:
         :type singleItems: list
         :param threshold: threshold for lifting rules
         :type threshold: float
+        :param dbSize: number of transactions
+        :type dbSize: int
         """
         self._frequentPatterns = patterns
         self._singleItems = singleItems
         self._threshold = threshold
+        self._dbSize = dbSize
         self._finalPatterns = {}
-        
-    def _generation(self, prefix, suffix):
-        """
-        To generate the combinations all association rules.
-
-        :param prefix: the prefix of association rule.
-        :type prefix: str
-        :param suffix: the suffix of association rule.
-        :type suffix: str
-        """
-        if len(suffix) == 1:
-            self._generateWithLift(prefix, suffix[0])
-        for i in range(len(suffix)):
-            suffix1 = suffix[:i] + suffix[i+1:]
-            prefix1 = prefix + ' ' + suffix[i]
-            for j in range(i+1, len(suffix)):
-                self._generateWithLift(prefix + ' ' + suffix[i], suffix[j])
-                #self._generation(prefix+ ' ' +suffix[i], suffix[i+1:]) 
-            self._generation(prefix1, suffix1)
-            
-    def _generateWithLift(self, lhs, rhs):
-        """
-        To find association rules satisfying user-specified minConf
-
-        :param lhs: the prefix of association rule.
-        :type lhs: str
-        :param rhs: the suffix of association rule.
-        :type rhs: str
-        """
-        s = lhs + '\t' + rhs
-        if self._frequentPatterns.get(s) is None:
-            return 0
-        minimum = self._frequentPatterns[s]
-        conflhs = minimum / self._frequentPatterns[lhs]
-        confrhs = minimum / self._frequentPatterns[rhs]
-        liftlhs = conflhs / self._frequentPatterns[rhs] * self._frequentPatterns[lhs]
-        rightrhs = confrhs / self._frequentPatterns[lhs] * self._frequentPatterns[rhs]
-        if liftlhs >= self._threshold:
-            s1 = lhs + '->' + rhs
-            self._finalPatterns[s1] = conflhs
-        if rightrhs >= self._threshold:
-            s1 = rhs + '->' + lhs
-            self._finalPatterns[s1] = confrhs
-            
+
     def run(self):
         """
-        To generate the combinations all association rules.
+        To generate all the association rules satisfying user-specified minimum lift.
         """
-        for i in range(len(self._singleItems)):
-            suffix = self._singleItems[:i] + self._singleItems[i+1:]
-            prefix = self._singleItems[i]
-            for j in range(i+1, len(self._singleItems)):
-                self._generateWithLift(self._singleItems[i], self._singleItems[j])
-            self._generation(prefix, suffix)
+        # the lift is the confidence divided by the support of the consequent, which is at least the smallest support
+        size = self._dbSize or max(self._frequentPatterns.values(), default=1)
+        minConf = self._threshold * min(self._frequentPatterns.values(), default=0) / size * (1 - 1e-9)
+        for lhs, rhs, _, conf, lift, _, _ in _rules(self._frequentPatterns, minConf, size):
+            if lift >= self._threshold:
+                self._finalPatterns[' '.join(lhs) + '->' + ' '.join(rhs)] = conf
     
     
     
@@ -199,7 +133,7 @@ class Leverage:
     Association Rules are derived from frequent patterns using "leverage" metric.
     """
     
-    def __init__(self, patterns, singleItems, threshold):
+    def __init__(self, patterns, singleItems, threshold, dbSize=None):
         """
         :param patterns: given frequent patterns
         :type patterns: dict
@@ -207,64 +141,26 @@ class Leverage:
         :type singleItems: list
         :param threshold: threshold for lifting rules
         :type threshold: float
+        :param dbSize: number of transactions
+        :type dbSize: int
         """
         self._frequentPatterns = patterns
         self._singleItems = singleItems
         self._threshold = threshold
+        self._dbSize = dbSize
         self._finalPatterns = {}
-        
-    def _generation(self, prefix, suffix):
-        """
-        To generate the combinations all association rules.
-
-        :param prefix: the prefix of association rule.
-        :type prefix: str
-        :param suffix: the suffix of association rule.
-        :type suffix: str
-        """
-        if len(suffix) == 1:
-            self._generateWithLeverage(prefix, suffix[0])
-        for i in range(len(suffix)):
-            suffix1 = suffix[:i] + suffix[i+1:]
-            prefix1 = prefix + ' ' + suffix[i]
-            for j in range(i+1, len(suffix)):
-                self._generateWithLeverage(prefix + ' ' + suffix[i], suffix[j])
-            self._generation(prefix1, suffix1)
-            
-    def _generateWithLeverage(self, lhs, rhs):
-        """
-        To find association rules satisfying user-specified minConf
-
-        :param lhs: the prefix of association rule.
-        :type lhs: str
-        :param rhs: the suffix of association rule.
-        :type rhs: str
-        """
-        s = lhs + '\t' + rhs
-        if self._frequentPatterns.get(s) is None:
-            return 0
-        minimum = self._frequentPatterns[s]
-        conflhs = minimum / self._frequentPatterns[lhs]
-        confrhs = minimum / self._frequentPatterns[rhs]
-        liftlhs = conflhs - self._frequentPatterns[rhs] * self._frequentPatterns[lhs]
-        rightrhs = confrhs - self._frequentPatterns[lhs] * self._frequentPatterns[rhs]
-        if liftlhs >= self._threshold:
-            s1 = lhs + '->' + rhs
-            self._finalPatterns[s1] = conflhs
-        if rightrhs >= self._threshold:
-            s1 = rhs + '->' + lhs
-            self._finalPatterns[s1] = confrhs
-            
+
     def run(self):
         """
-        To generate the combinations all association rules.
+        To generate all the association rules satisfying user-specified minimum leverage.
         """
-        for i in range(len(self._singleItems)):
-            suffix = self._singleItems[:i] + self._singleItems[i+1:]
-            prefix = self._singleItems[i]
-            for j in range(i+1, len(self._singleItems)):
-                self._generateWithLeverage(self._singleItems[i], self._singleItems[j])
-            self._generation(prefix, suffix)
+        # a non-negative leverage of X -> Y needs a confidence of at least the threshold plus the support of Y
+        size = self._dbSize or max(self._frequentPatterns.values(), default=1)
+        smallest = min(self._frequentPatterns.values(), default=0) / size
+        minConf = (self._threshold + smallest) * (1 - 1e-9) if self._threshold >= 0 else 0
+        for lhs, rhs, _, conf, _, leverage, _ in _rules(self._frequentPatterns, minConf, size):
+            if leverage >= self._threshold:
+                self._finalPatterns[' '.join(lhs) + '->' + ' '.join(rhs)] = conf
 
 class RuleMiner:
     """
@@ -290,6 +186,8 @@ class RuleMiner:
                    condition to satisfy
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  dbSize: int :
+                   Number of transactions of the database, used by lift and leverage. The largest support is taken when it is not given.
 
     :Attributes:
 
@@ -363,7 +261,7 @@ class RuleMiner:
             mine()
     """
 
-    def __init__(self, iFile, measure, threshold, sep):
+    def __init__(self, iFile, measure, threshold, sep, dbSize=None):
         """
         :param iFile: input file name or path
         :type iFile: str
@@ -373,8 +271,11 @@ class RuleMiner:
         :type threshold: float
         :param sep: Delimiter of input file
         :type sep: str
+        :param dbSize: number of transactions of the database
+        :type dbSize: int
         """
         self._iFile = iFile
+        self._dbSize = dbSize
         self._measure = measure
         self._threshold = threshold
         self._finalPatterns = {}
@@ -444,15 +345,15 @@ class RuleMiner:
         self._startTime = _ab._time.time()
         k = self._readPatterns()
         if self._measure == 'confidence':
-            a = Confidence(self._frequentPatterns, k, self._threshold)
+            a = Confidence(self._frequentPatterns, k, self._threshold, self._dbSize)
             a.run()
             self._finalPatterns = a._finalPatterns
         if self._measure == 'lift':
-            a = Lift(self._frequentPatterns, k, self._threshold)
+            a = Lift(self._frequentPatterns, k, self._threshold, self._dbSize)
             a.run()
             self._finalPatterns = a._finalPatterns
         if self._measure == 'leverage':
-            a = Leverage(self._frequentPatterns, k, self._threshold)
+            a = Leverage(self._frequentPatterns, k, self._threshold, self._dbSize)
             a.run()
             self._finalPatterns = a._finalPatterns
         self._endTime = _ab._time.time()
@@ -59,9 +59,9 @@ import sys
 from deprecated import deprecated
 
 from PAMI.AssociationRules.basic import abstract as _ab
+from PAMI.AssociationRules.basic.ruleEngine import RuleEngine
 
 sys.setrecursionlimit(10**4)
-from itertools import combinations
 import time, psutil, os, validators, pandas as pd, urllib.request as urlopen   # whatever you aliased as _ab.*
 
 
@@ -74,7 +74,7 @@ class confidence:
 
     :**Reference**:
 
-    :**Parameters**:    - **iFile** (*str*) -- *Name of the Input file to mine complete set of association rules*
+    :**Parameters**:    - **iFile** (*str*) -- *Name of the Input file to mine complete set of association rules. A frequent pattern mining algorithm after mine(), or a dictionary of its patterns, is used directly.*
                         - **oFile** (*str*) -- *Name of the Output file to write association rules*
                         - **minConf** (*float*) -- *Minimum confidence to mine all the satisfying association rules. The user can specify the minConf in float between the range of 0 to 1.*
                         - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
@@ -173,13 +173,20 @@ class confidence:
 
     def _readPatterns(self):
         """
-        Populate self._frequentPatterns from a dataframe, URL or local text file.
+        Populate self._frequentPatterns from a mining algorithm, a dictionary, a dataframe, URL or local text file.
         Accepted line-format in files:  item1<sep>item2 ... : support
         """
         fp = {}  # local scratch
 
+        # ▸ mining algorithm / dictionary input ----------------------------------
+        if hasattr(self._iFile, 'getPatterns') or isinstance(self._iFile, dict):
+            patterns = self._iFile.getPatterns() if hasattr(self._iFile, 'getPatterns') else self._iFile
+            for pat, sup in patterns.items():
+                pat = str(pat).split(self._sep) if isinstance(pat, str) else pat
+                fp[tuple(sorted(pat))] = sup[0] if isinstance(sup, (list, tuple)) else sup
+
         # ▸ dataframe input -----------------------------------------------------
-        if isinstance(self._iFile, pd.DataFrame):
+        elif isinstance(self._iFile, pd.DataFrame):
             pat_col = next(c for c in self._iFile.columns if 'pattern' in c.lower())
             sup_col = next(c for c in self._iFile.columns if 'support' in c.lower())
             for pat, sup in zip(self._iFile[pat_col], self._iFile[sup_col]):
@@ -208,22 +215,9 @@ class confidence:
         self._startTime = time.time()
         self._readPatterns()
 
-        for itemset, sup in self._frequentPatterns.items():
-            k = len(itemset)
-            if k < 2:           # singleton → no rule possible
-                continue
-
-            # all non-empty proper subsets are candidate antecedents
-            for r in range(1, k):
-                for antecedent in combinations(itemset, r):
-                    antecedent = tuple(sorted(antecedent))
-                    consequent = tuple(sorted(set(itemset) - set(antecedent)))
-
-                    conf = sup / self._frequentPatterns[antecedent]
-                    if conf >= self._minConf:
-                        self._associationRules.append(
-                            (antecedent, consequent, sup, conf)
-                        )
+        # consequents grown level-wise, see RuleEngine; the confidence does not depend on the database size
+        engine = RuleEngine(self._frequentPatterns, dbSize=1, sep=self._sep)
+        self._associationRules = [rule[:4] for rule in engine.mine(self._minConf)]
 
         # bookkeeping
         self._endTime   = time.time()
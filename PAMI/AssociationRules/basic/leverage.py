@@ -51,14 +51,13 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.AssociationRules.basic import abstract as _ab
+from PAMI.AssociationRules.basic.ruleEngine import RuleEngine
 from deprecated import deprecated
 # increase reucursion depth
 import os
 import sys
 sys.setrecursionlimit(10**4)
-from itertools import combinations
 
-from itertools import combinations
 import os, time, psutil, pandas as pd, validators, urllib.request as urlopen
 
 
@@ -225,17 +224,13 @@ class leverage:
         self._startTime = time.time()
         self._readPatterns()
 
-        for itemset, sup_xy in self._frequentPatterns.items():
-            k = len(itemset)
-            if k < 2:
-                continue
-            for r in range(1, k):
-                for ante in combinations(itemset, r):
-                    ante = tuple(sorted(ante))
-                    cons = tuple(sorted(set(itemset) - set(ante)))
-                    lev = sup_xy - self._frequentPatterns[ante] * self._frequentPatterns[cons]
-                    if lev >= self._minLev:
-                        self._associationRules.append((ante, cons, sup_xy, lev))
+        # leverage(X -> Y) = P(X) * (conf(X -> Y) - P(Y)) and P(X) <= 1, so a non-negative minLev needs a confidence of
+        # at least minLev plus the smallest support; the consequents are grown level-wise by RuleEngine under that bound
+        engine = RuleEngine(self._frequentPatterns, dbSize=1, sep=self._sep)
+        minConf = (self._minLev + min(self._frequentPatterns.values(), default=0)) * (1 - 1e-9)
+        self._associationRules = [(ante, cons, sup_xy, lev)
+                                  for ante, cons, sup_xy, _, _, lev, _ in engine.mine(minConf if self._minLev >= 0 else 0)
+                                  if lev >= self._minLev]
 
         self._endTime = time.time()
         proc = psutil.Process(os.getpid())
@@ -51,13 +51,12 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.AssociationRules.basic import abstract as _ab
+from PAMI.AssociationRules.basic.ruleEngine import RuleEngine
 from deprecated import deprecated
 # increase reucursion depth
 import os
 import sys
 sys.setrecursionlimit(10**4)
-from itertools import combinations
-from itertools import combinations
 import os, time, psutil, pandas as pd, validators, urllib.request as urlopen
 
 
@@ -223,18 +222,13 @@ class lift:
         self._startTime = time.time()
         self._readPatterns()
 
-        for itemset, sup_xy in self._frequentPatterns.items():
-            if len(itemset) < 2:
-                continue
-            for r in range(1, len(itemset)):
-                for ante in combinations(itemset, r):
-                    ante = tuple(sorted(ante))
-                    cons = tuple(sorted(set(itemset) - set(ante)))
-                    pa   = self._frequentPatterns[ante]
-                    pb   = self._frequentPatterns[cons]
-                    lift_val = sup_xy / (pa * pb)          # ← correct formula
-                    if lift_val >= self._minLift:
-                        self._associationRules.append((ante, cons, sup_xy, lift_val))
+        # lift(X -> Y) = conf(X -> Y) / P(Y) and P(Y) is at least the smallest support, so the consequents are grown
+        # level-wise by RuleEngine under that confidence bound and the lift is checked on the rules it returns
+        engine = RuleEngine(self._frequentPatterns, dbSize=1, sep=self._sep)
+        minConf = self._minLift * min(self._frequentPatterns.values(), default=0) * (1 - 1e-9)
+        self._associationRules = [(ante, cons, sup_xy, lift_val)
+                                  for ante, cons, sup_xy, _, lift_val, _, _ in engine.mine(max(minConf, 0))
+                                  if lift_val >= self._minLift]
 
         self._endTime   = time.time()
         proc            = psutil.Process(os.getpid())
@@ -0,0 +1,214 @@
+# RuleEngine derives association rules directly from the patterns of a frequent pattern mining algorithm.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.frequentPattern.basic import FPGrowth as fp
+#
+#             from PAMI.AssociationRules.basic import ruleEngine as alg
+#
+#             miner = fp.FPGrowth(iFile, minSup)
+#
+#             miner.mine()
+#
+#             obj = alg.RuleEngine(miner)
+#
+#             rules = obj.mine(minConf=0.5)
+#
+#             print("Total number of Association Rules:", len(rules))
+#
+#             Df = obj.getRulesAsDataFrame()
+#
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from itertools import combinations, groupby, repeat
+from math import comb
+import numpy as np
+import pandas as pd
+
+
+def _join(consequents):
+    """
+    Apriori join of the consequents of one itemset: two consequents sharing all but their last item are merged and
+    the merged consequent is kept if all its subsets with one item less are consequents as well.
+
+    :param consequents: sorted consequents of the same length
+    :type consequents: list
+    :return: the consequents with one item more
+    :rtype: list
+    """
+    level = set(consequents)
+    joined = []
+    for _, group in groupby(consequents, key=lambda x: x[:-1]):
+        group = list(group)
+        for i in range(len(group)):
+            for j in range(i + 1, len(group)):
+                candidate = group[i] + group[j][-1:]
+                if all(candidate[:k] + candidate[k + 1:] in level for k in range(len(candidate) - 2)):
+                    joined.append(candidate)
+    return joined
+
+
+class RuleEngine:
+    """
+    :**Description**:  RuleEngine derives association rules from frequent patterns without reading them from a file.
+                       The supports are indexed in a hash map keyed by the sorted item-id tuple of every pattern. The
+                       consequents of the rules of an itemset are grown level-wise as in ap-genrules: since the
+                       confidence of X - Y -> Y cannot increase when Y grows, only consequents whose rules reach minConf
+                       are joined into longer consequents. The confidences of a whole level are computed in one NumPy
+                       operation, and confidence, lift, leverage and conviction of all the rules in a single pass.
+
+    :**Reference**:    R. Agrawal and R. Srikant. Fast Algorithms for Mining Association Rules. VLDB 1994.
+
+    :**Parameters**:    - **patterns** (*object, dict or DataFrame*) -- *A frequent pattern mining algorithm after mine(), a dictionary of patterns and supports, or a dataframe with pattern and support columns.*
+                        - **dbSize** (*int*) -- *Number of transactions of the database, used by lift, leverage and conviction. It is taken from getDatabaseSize() of a miner by default. Supports are treated as proportions if they are all at most 1; otherwise a ValueError is raised when the size is unknown.*
+                        - **sep** (*str*) -- *Separator of the items of a pattern given as a string.*
+
+    :**Attributes**:    - **items** (*list*) -- *Name of every item id.*
+                        - **supports** (*dict*) -- *Support of every pattern keyed by its sorted item-id tuple.*
+                        - **rules** (*list*) -- *(antecedent, consequent, support, confidence, lift, leverage, conviction) of every rule.*
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            from PAMI.AssociationRules.basic import ruleEngine as alg
+
+            obj = alg.RuleEngine(miner, dbSize=1000)
+
+            rules = obj.mine(minConf=0.5)
+
+            Df = obj.getRulesAsDataFrame()
+
+    **Credits**
+
+    The complete program was written by Tarun Sreepada under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    def __init__(self, patterns, dbSize=None, sep="\t"):
+        self._sep = sep
+        if hasattr(patterns, 'getPatterns'):
+            if dbSize is None and hasattr(patterns, 'getDatabaseSize'):
+                dbSize = patterns.getDatabaseSize()
+            patterns = patterns.getPatterns()
+        elif isinstance(patterns, pd.DataFrame):
+            patternColumn = next(c for c in patterns.columns if 'pattern' in c.lower())
+            supportColumn = next(c for c in patterns.columns if 'support' in c.lower())
+            patterns = dict(zip(patterns[patternColumn], patterns[supportColumn]))
+        patterns = [([x for x in pattern.strip().split(sep) if x] if isinstance(pattern, str) else pattern,
+                     support[0] if isinstance(support, (list, tuple)) else support)
+                    for pattern, support in patterns.items()]
+        # ids follow the order of the item names, so that a sorted id tuple is a sorted name tuple
+        self.items = sorted(set(item for pattern, _ in patterns for item in pattern), key=str)
+        ids = {item: i for i, item in enumerate(self.items)}
+        self.supports = {tuple(sorted(ids[item] for item in pattern)): support for pattern, support in patterns}
+        if dbSize is None:
+            if max(self.supports.values(), default=1) > 1:
+                raise ValueError("The number of transactions is unknown, please give dbSize")
+            dbSize = 1
+        self.dbSize = dbSize
+        self.rules = []
+
+    def _lookup(self, keys):
+        """
+        :param keys: sorted item-id tuples
+        :type keys: list
+        :return: the supports of the keys, NaN for the keys that are not patterns
+        :rtype: numpy.ndarray
+        """
+        supports = self.supports
+        try:
+            return np.fromiter(map(supports.__getitem__, keys), dtype=np.float64, count=len(keys))
+        except KeyError:
+            return np.fromiter((supports.get(key, np.nan) for key in keys), dtype=np.float64, count=len(keys))
+
+    def mine(self, minConf=0.0):
+        """
+        Generates all the rules whose confidence is at least minConf.
+
+        :param minConf: minimum confidence
+        :type minConf: float
+        :return: the rules
+        :rtype: list
+        """
+        supports = self.supports
+        rules, levelConfidences = [], []
+        # level 1: the consequent is one item and the antecedent the rest of the itemset
+        current = [(itemset, itemset[i:i + 1], itemset[:i] + itemset[i + 1:])
+                   for itemset in supports if len(itemset) > 1 for i in range(len(itemset))]
+        while current:
+            supXY = self._lookup([itemset for itemset, _, _ in current])
+            supX = self._lookup([antecedent for _, _, antecedent in current])
+            with np.errstate(invalid='ignore', divide='ignore'):
+                conf = supXY / supX
+            accepted = np.flatnonzero(conf >= minConf)
+            levelConfidences.append(conf[accepted])
+            accepted = [current[i] for i in accepted.tolist()]
+            nextLevel = []
+            for itemset, group in groupby(accepted, key=lambda x: x[0]):
+                level = [consequent for _, consequent, antecedent in group]
+                size = len(level[0])
+                if size + 1 >= len(itemset):
+                    continue
+                if len(level) == comb(len(itemset), size):
+                    # no consequent was pruned: the next level holds all the combinations of the itemset, and the
+                    # complements of the combinations in lexicographic order are the combinations in reverse order
+                    nextLevel.extend(zip(repeat(itemset), combinations(itemset, size + 1),
+                                         reversed(list(combinations(itemset, len(itemset) - size - 1)))))
+                else:
+                    for consequent in _join(level):
+                        nextLevel.append((itemset, consequent, tuple(x for x in itemset if x not in consequent)))
+            rules.extend(accepted)
+            current = nextLevel
+
+        itemsets, consequents, antecedents = zip(*rules) if rules else ((), (), ())
+        confidence = np.concatenate(levelConfidences)
+        supXY = self._lookup(itemsets)
+        n = float(self.dbSize)
+        pXY, pX, pY = supXY / n, supXY / confidence / n, self._lookup(consequents) / n
+        with np.errstate(invalid='ignore', divide='ignore'):
+            lift = pXY / (pX * pY)
+            leverage = pXY - pX * pY
+            conviction = np.where(confidence < 1, (1 - pY) / (1 - confidence), np.inf)
+        # antecedents and consequents are patterns themselves, their names are built once per pattern
+        names = self.items.__getitem__
+        patternNames = {key: tuple(map(names, key)) for key in supports}
+        nameOf = lambda key: patternNames[key] if key in patternNames else tuple(map(names, key))
+        self.rules = list(zip(map(nameOf, antecedents), map(nameOf, consequents), map(supports.__getitem__, itemsets),
+                              confidence.tolist(), lift.tolist(), leverage.tolist(), conviction.tolist()))
+        return self.rules
+
+    def getRules(self):
+        """
+        :return: (antecedent, consequent, support, confidence, lift, leverage, conviction) of every rule
+        :rtype: list
+        """
+        return self.rules
+
+    def getRulesAsDataFrame(self):
+        """
+        :return: the rules, one row per rule
+        :rtype: pandas.DataFrame
+        """
+        return pd.DataFrame([(self._sep.join(a), self._sep.join(c), s, conf, l, lev, conv)
+                             for a, c, s, conf, l, lev, conv in self.rules],
+                            columns=['Antecedent', 'Consequent', 'Support', 'Confidence', 'Lift', 'Leverage',
+                                     'Conviction'])
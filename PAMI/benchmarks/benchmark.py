@@ -0,0 +1,310 @@
+# Benchmark runs the algorithms of PAMI.benchmarks.suites on fixed-seed synthetic databases, records the runtime, the
+# peak RSS and the number of patterns of every run in a JSON file and compares them against a stored baseline.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.benchmarks.benchmark import Benchmark
+#
+#             obj = Benchmark(families=['frequent', 'periodic'])
+#
+#             obj.run()
+#
+#             obj.save('results.json')
+#
+#             regressions = obj.compare('baseline.json', tolerance=0.2)
+#
+#             print("Total number of regressions:", len(regressions))
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import contextlib as _contextlib
+import importlib as _importlib
+import io as _io
+import json as _json
+import multiprocessing as _multiprocessing
+import os as _os
+import platform as _platform
+import sys as _sys
+import time as _time
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from typing import Dict, List, Optional, Union
+import psutil as _psutil
+from PAMI.benchmarks import datasets as _datasets
+from PAMI.benchmarks import suites as _suites
+
+try:
+    import resource as _resource
+except ImportError:
+    _resource = None
+
+
+def _peakRSS() -> int:
+    """
+    :return: the peak resident set size of the current process in bytes, or its current RSS where the peak is not
+             available
+    :rtype: int
+    """
+    if _resource is not None:
+        peak = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
+        return peak if _sys.platform == 'darwin' else peak * 1024
+    return _psutil.Process(_os.getpid()).memory_info().rss
+
+
+def _runCase(module: str, name: str, iFile: str, parameters: tuple, count: str) -> Dict[str, Union[float, int]]:
+    """
+    Runs one algorithm once. The output printed by the algorithm is discarded.
+
+    :param module: module of the algorithm
+    :type module: str
+    :param name: class of the algorithm
+    :type name: str
+    :param iFile: the input file
+    :type iFile: str
+    :param parameters: the arguments of the algorithm after the input file
+    :type parameters: tuple
+    :param count: the attribute or method whose length is the number of patterns
+    :type count: str
+    :return: the runtime in seconds, the peak RSS in bytes and the number of patterns
+    :rtype: dict
+    """
+    algorithm = getattr(_importlib.import_module(module), name)
+    obj = algorithm(iFile, *parameters)
+    with _contextlib.redirect_stdout(_io.StringIO()):
+        start = _time.perf_counter()
+        obj.mine()
+        runtime = _time.perf_counter() - start
+    patterns = getattr(obj, count)
+    if callable(patterns):
+        patterns = patterns()
+    return {'runtime': runtime, 'peakRSS': _peakRSS(), 'patterns': len(patterns)}
+
+
+class Benchmark:
+    """
+    **About this algorithm**
+
+    :**Description**:  Benchmark sweeps the thresholds of every algorithm family listed in PAMI.benchmarks.suites over
+                       fixed-seed synthetic databases. It records the runtime, the peak RSS and the number of patterns
+                       of every run and compares them against a baseline recorded earlier, so that performance
+                       regressions are found before a new version of PAMI is used.
+
+    :**Parameters**:    - **families** (*list*) -- *Names of the families to run. All the families of suites are run by default.*
+                        - **workDir** (*str*) -- *Directory in which the synthetic databases are created.*
+                        - **seed** (*int*) -- *Seed of the synthetic databases.*
+                        - **repeat** (*int*) -- *Number of runs of every case, the fastest one is recorded.*
+                        - **isolate** (*bool*) -- *If True, every run is executed in a new process so that its peak RSS is not affected by the previous runs.*
+
+    :**Attributes**:    - **results** (*list*) -- *One record per case with the family, algorithm, dataset, parameters, runtime, peakRSS and patterns.*
+
+    :**Methods**:       - **run()** -- *Runs all the cases.*
+                        - **save(oFile)** -- *Stores the results in a JSON file.*
+                        - **load(iFile)** -- *Reads results stored with save.*
+                        - **compare(baseline, tolerance, memoryTolerance)** -- *Returns the cases that are slower, use more memory or find a different number of patterns than in the baseline.*
+                        - **printResults()** -- *Prints the results.*
+
+
+    **Execution methods**
+
+    **Terminal command**
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 -m PAMI.benchmarks.benchmark <outputFile> [<baselineFile> [<tolerance>]]
+
+      Example Usage:
+
+      (.venv) $ python3 -m PAMI.benchmarks.benchmark results.json baseline.json 0.2
+
+    .. note:: the command exits with status 1 if a regression is found.
+
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            from PAMI.benchmarks.benchmark import Benchmark
+
+            obj = Benchmark(families=['frequent'])
+
+            obj.run()
+
+            obj.save('results.json')
+
+            for regression in obj.compare('baseline.json', tolerance=0.2):
+
+                print(regression)
+
+
+    **Credits**
+
+    The complete program was written by Tarun Sreepada under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    def __init__(self, families: Optional[List[str]] = None, workDir: str = 'benchmarkData', seed: int = 1,
+                 repeat: int = 1, isolate: bool = True) -> None:
+        self.families = list(_suites.families) if families is None else list(families)
+        for family in self.families:
+            if family not in _suites.families:
+                raise ValueError("Unknown family " + family + ", choose from " + ", ".join(_suites.families))
+        self.workDir = workDir
+        self.seed = seed
+        self.repeat = repeat
+        self.isolate = isolate
+        self.results = []
+
+    def _dataset(self, family: str) -> str:
+        """
+        Creates the database of a family unless it already exists in the working directory.
+
+        :param family: the family
+        :type family: str
+        :return: the name of the database file
+        :rtype: str
+        """
+        name, arguments = _suites.families[family]['dataset']
+        suffix = "_".join(str(arguments[x]) for x in sorted(arguments))
+        iFile = _os.path.join(self.workDir, name + "_" + suffix + "_" + str(self.seed) + ".txt")
+        if not _os.path.exists(iFile):
+            _os.makedirs(self.workDir, exist_ok=True)
+            getattr(_datasets, name)(iFile, seed=self.seed, **arguments)
+        return iFile
+
+    def _execute(self, *case) -> Dict[str, Union[float, int]]:
+        """
+        Runs a case, in a new (spawned) process if isolate is True.
+
+        :return: the measures of the run
+        :rtype: dict
+        """
+        if not self.isolate:
+            return _runCase(*case)
+        with _ProcessPoolExecutor(max_workers=1, mp_context=_multiprocessing.get_context('spawn')) as executor:
+            return executor.submit(_runCase, *case).result()
+
+    def run(self) -> List[dict]:
+        """
+        Runs every algorithm of the selected families with every parameter of the family.
+
+        :return: the results
+        :rtype: list
+        """
+        self.results = []
+        for family in self.families:
+            suite = _suites.families[family]
+            iFile = self._dataset(family)
+            count = suite.get('count', 'getPatterns')
+            for module, name in suite['algorithms']:
+                for parameters in suite['parameters']:
+                    runs = [self._execute(module, name, iFile, parameters, count) for _ in range(self.repeat)]
+                    record = min(runs, key=lambda x: x['runtime'])
+                    record['peakRSS'] = max(x['peakRSS'] for x in runs)
+                    self.results.append({'family': family, 'algorithm': name, 'dataset': _os.path.basename(iFile),
+                                         'parameters': list(parameters), **record})
+        return self.results
+
+    def save(self, oFile: str) -> None:
+        """
+        Stores the results, together with a description of the machine, in a JSON file.
+
+        :param oFile: name of the output file
+        :type oFile: str
+        :return: None
+        """
+        data = {'python': _platform.python_version(), 'machine': _platform.platform(), 'seed': self.seed,
+                'results': self.results}
+        with open(oFile, 'w') as f:
+            _json.dump(data, f, indent=2)
+
+    @staticmethod
+    def load(iFile: str) -> List[dict]:
+        """
+        :param iFile: a file written by save
+        :type iFile: str
+        :return: the results stored in the file
+        :rtype: list
+        """
+        with open(iFile, 'r') as f:
+            return _json.load(f)['results']
+
+    @staticmethod
+    def _key(record: dict) -> tuple:
+        return record['family'], record['algorithm'], record['dataset'], tuple(record['parameters'])
+
+    def compare(self, baseline: Union[str, List[dict]], tolerance: float = 0.2,
+                memoryTolerance: Optional[float] = None) -> List[dict]:
+        """
+        Compares the results with a baseline. A case regresses if its runtime exceeds the baseline by more than
+        tolerance, if its peak RSS exceeds the baseline by more than memoryTolerance or if it finds a different number
+        of patterns. Cases missing from the baseline are ignored.
+
+        :param baseline: a file written by save or a list of results
+        :type baseline: str or list
+        :param tolerance: allowed relative increase of the runtime, e.g., 0.2 for 20%
+        :type tolerance: float
+        :param memoryTolerance: allowed relative increase of the peak RSS, tolerance by default
+        :type memoryTolerance: float
+        :return: one record per regression with the case, the measure, the baseline value and the new value
+        :rtype: list
+        """
+        if isinstance(baseline, str):
+            baseline = self.load(baseline)
+        if memoryTolerance is None:
+            memoryTolerance = tolerance
+        reference = {self._key(record): record for record in baseline}
+        regressions = []
+        for record in self.results:
+            old = reference.get(self._key(record))
+            if old is None:
+                continue
+            checks = [('patterns', record['patterns'] != old['patterns']),
+                      ('runtime', record['runtime'] > old['runtime'] * (1 + tolerance)),
+                      ('peakRSS', record['peakRSS'] > old['peakRSS'] * (1 + memoryTolerance))]
+            for measure, regressed in checks:
+                if regressed:
+                    regressions.append({'family': record['family'], 'algorithm': record['algorithm'],
+                                        'parameters': record['parameters'], 'measure': measure,
+                                        'baseline': old[measure], 'value': record[measure]})
+        return regressions
+
+    def printResults(self) -> None:
+        """
+        This function is used to print the results
+        """
+        for record in self.results:
+            print(record['family'], record['algorithm'], record['parameters'], "Runtime:", round(record['runtime'], 4),
+                  "Peak RSS:", record['peakRSS'], "Patterns:", record['patterns'])
+
+
+if __name__ == '__main__':
+    if 2 <= len(_sys.argv) <= 4:
+        _ap = Benchmark()
+        _ap.run()
+        _ap.save(_sys.argv[1])
+        _ap.printResults()
+        if len(_sys.argv) >= 3:
+            _regressions = _ap.compare(_sys.argv[2], float(_sys.argv[3]) if len(_sys.argv) == 4 else 0.2)
+            for _regression in _regressions:
+                print("Regression:", _regression)
+            if _regressions:
+                _sys.exit(1)
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
@@ -0,0 +1,177 @@
+# datasets creates the fixed-seed synthetic databases used by the benchmarks. Every function seeds python's and
+# NumPy's random generators, calls the matching generator of PAMI.extras.syntheticDataGenerator and writes the
+# database to a file, so that the same arguments always give the same database.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.benchmarks import datasets
+#
+#             iFile = datasets.transactional('transactional.txt', databaseSize=2000, seed=1)
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import random as _random
+import numpy as _np
+
+
+def setSeed(seed: int) -> None:
+    """
+    Seeds the random generators used by the synthetic data generators.
+
+    :param seed: the seed
+    :type seed: int
+    :return: None
+    """
+    _random.seed(seed)
+    _np.random.seed(seed)
+
+
+def transactional(oFile: str, databaseSize: int = 2000, avgItemsPerTransaction: int = 10, numItems: int = 100,
+                  seed: int = 1) -> str:
+    """
+    Creates a transactional database with TransactionalDatabase.
+
+    :param oFile: name of the output file
+    :type oFile: str
+    :param databaseSize: number of transactions
+    :type databaseSize: int
+    :param avgItemsPerTransaction: average number of items per transaction
+    :type avgItemsPerTransaction: int
+    :param numItems: number of distinct items
+    :type numItems: int
+    :param seed: seed of the random generators
+    :type seed: int
+    :return: the name of the output file
+    :rtype: str
+    """
+    from PAMI.extras.syntheticDataGenerator.TransactionalDatabase import TransactionalDatabase
+    setSeed(seed)
+    database = TransactionalDatabase(databaseSize, avgItemsPerTransaction, numItems)
+    database.create()
+    database.save(oFile)
+    return oFile
+
+
+def temporal(oFile: str, databaseSize: int = 2000, avgItemsPerTransaction: int = 10, numItems: int = 100,
+             seed: int = 1) -> str:
+    """
+    Creates a temporal database with TemporalDatabase.
+
+    :param oFile: name of the output file
+    :type oFile: str
+    :param databaseSize: number of transactions
+    :type databaseSize: int
+    :param avgItemsPerTransaction: average number of items per transaction
+    :type avgItemsPerTransaction: int
+    :param numItems: number of distinct items
+    :type numItems: int
+    :param seed: seed of the random generators
+    :type seed: int
+    :return: the name of the output file
+    :rtype: str
+    """
+    from PAMI.extras.syntheticDataGenerator.TemporalDatabase import TemporalDatabase
+    setSeed(seed)
+    database = TemporalDatabase(databaseSize, avgItemsPerTransaction, numItems)
+    database.create()
+    database.save(oFile)
+    return oFile
+
+
+def utility(oFile: str, databaseSize: int = 2000, avgItemsPerTransaction: int = 10, numItems: int = 100,
+            seed: int = 1) -> str:
+    """
+    Creates a utility database, in the items:transaction utility:utilities format, with generateUtilityTransactional.
+
+    :param oFile: name of the output file
+    :type oFile: str
+    :param databaseSize: number of transactions
+    :type databaseSize: int
+    :param avgItemsPerTransaction: average number of items per transaction
+    :type avgItemsPerTransaction: int
+    :param numItems: number of distinct items
+    :type numItems: int
+    :param seed: seed of the random generators
+    :type seed: int
+    :return: the name of the output file
+    :rtype: str
+    """
+    from PAMI.extras.syntheticDataGenerator.generateUtilityTransactional import generateUtilityTransactional
+    setSeed(seed)
+    database = generateUtilityTransactional(databaseSize, numItems, avgItemsPerTransaction, 1, 100, 1, 10)
+    database.generate()
+    database.save(oFile)
+    return oFile
+
+
+def sequential(oFile: str, databaseSize: int = 500, avgItemsPerTransaction: int = 3, numItems: int = 50,
+               avgTransactionsPerSequence: int = 4, seed: int = 1) -> str:
+    """
+    Creates a sequence database with SequentialDatabase. The itemsets of a sequence are separated by -1.
+
+    :param oFile: name of the output file
+    :type oFile: str
+    :param databaseSize: number of itemsets, which are grouped into sequences
+    :type databaseSize: int
+    :param avgItemsPerTransaction: number of items per itemset
+    :type avgItemsPerTransaction: int
+    :param numItems: number of distinct items
+    :type numItems: int
+    :param avgTransactionsPerSequence: average number of itemsets per sequence
+    :type avgTransactionsPerSequence: int
+    :param seed: seed of the random generators
+    :type seed: int
+    :return: the name of the output file
+    :rtype: str
+    """
+    from PAMI.extras.syntheticDataGenerator.SequentialDatabase import SequentialDatabase
+    setSeed(seed)
+    database = SequentialDatabase(databaseSize, numItems, avgItemsPerTransaction, avgTransactionsPerSequence,
+                                  seqSep='\t-1\t')
+    database.create()
+    database.save(oFile)
+    return oFile
+
+
+def graph(oFile: str, databaseSize: int = 100, avgNumVertices: int = 8, avgNumEdges: int = 7, numVertexLabels: int = 3,
+          numEdgeLabels: int = 2, seed: int = 1) -> str:
+    """
+    Creates a graph transaction database with certainGraphTransactions.
+
+    :param oFile: name of the output file
+    :type oFile: str
+    :param databaseSize: number of graphs
+    :type databaseSize: int
+    :param avgNumVertices: average number of vertices per graph
+    :type avgNumVertices: int
+    :param avgNumEdges: average number of edges per graph
+    :type avgNumEdges: int
+    :param numVertexLabels: number of distinct vertex labels
+    :type numVertexLabels: int
+    :param numEdgeLabels: number of distinct edge labels
+    :type numEdgeLabels: int
+    :param seed: seed of the random generators
+    :type seed: int
+    :return: the name of the output file
+    :rtype: str
+    """
+    from PAMI.extras.syntheticDataGenerator.certainGraphTransactions import certainGraphTransactions
+    setSeed(seed)
+    certainGraphTransactions(databaseSize, avgNumVertices, avgNumEdges, numVertexLabels, numEdgeLabels, oFile)
+    return oFile
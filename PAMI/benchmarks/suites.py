@@ -0,0 +1,76 @@
+# suites lists the benchmark cases of every algorithm family: the synthetic database a family is mined on, the
+# algorithms that are run and the thresholds that are swept. A case is identified by its family, its algorithm and
+# its parameters, which are the arguments given to the algorithm after the input file.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.benchmarks import suites
+#
+#             for family, suite in suites.families.items():
+#
+#                 print(family, [name for _, name in suite['algorithms']], suite['parameters'])
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+#: Every family maps to
+#:   - dataset: the name of a function of PAMI.benchmarks.datasets and its keyword arguments,
+#:   - algorithms: (module, class) of every algorithm,
+#:   - parameters: the arguments swept, one tuple per run,
+#:   - count: the attribute or method whose length is the number of patterns (getPatterns by default).
+families = {
+    'frequent': {
+        'dataset': ('transactional', {'databaseSize': 2000, 'avgItemsPerTransaction': 10, 'numItems': 100}),
+        'algorithms': [('PAMI.frequentPattern.basic.FPGrowth', 'FPGrowth'),
+                       ('PAMI.frequentPattern.basic.ECLAT', 'ECLAT'),
+                       ('PAMI.frequentPattern.basic.ECLATbitset', 'ECLATbitset'),
+                       ('PAMI.frequentPattern.basic.Apriori', 'Apriori')],
+        'parameters': [(0.05,), (0.02,), (0.01,)],
+    },
+    'periodic': {
+        'dataset': ('temporal', {'databaseSize': 2000, 'avgItemsPerTransaction': 10, 'numItems': 100}),
+        'algorithms': [('PAMI.periodicFrequentPattern.basic.PFPGrowth', 'PFPGrowth'),
+                       ('PAMI.periodicFrequentPattern.basic.PFECLAT', 'PFECLAT')],
+        'parameters': [(0.05, 0.05), (0.02, 0.05), (0.01, 0.1)],
+    },
+    'utility': {
+        'dataset': ('utility', {'databaseSize': 2000, 'avgItemsPerTransaction': 10, 'numItems': 100}),
+        'algorithms': [('PAMI.highUtilityPattern.basic.EFIM', 'EFIM'),
+                       ('PAMI.highUtilityPattern.basic.HMiner', 'HMiner'),
+                       ('PAMI.highUtilityPattern.basic.UPGrowth', 'UPGrowth')],
+        'parameters': [(100000,), (60000,)],
+    },
+    'sequential': {
+        'dataset': ('sequential', {'databaseSize': 500, 'avgItemsPerTransaction': 3, 'numItems': 50}),
+        'algorithms': [('PAMI.sequentialPattern.basic.SPADE', 'SPADE'),
+                       ('PAMI.sequentialPattern.basic.PrefixSpan', 'PrefixSpan')],
+        'parameters': [(0.05,), (0.02,)],
+    },
+    'subgraph': {
+        'dataset': ('graph', {'databaseSize': 100, 'avgNumVertices': 8, 'avgNumEdges': 7}),
+        'algorithms': [('PAMI.subgraphMining.basic.gspan', 'GSpan')],
+        'parameters': [(0.5,), (0.3,)],
+        'count': 'frequentSubgraphs',
+    },
+    'topKSubgraph': {
+        'dataset': ('graph', {'databaseSize': 100, 'avgNumVertices': 8, 'avgNumEdges': 7}),
+        'algorithms': [('PAMI.subgraphMining.topK.tkg', 'TKG')],
+        'parameters': [(10,), (30,)],
+        'count': 'getSubgraphsList',
+    },
+}
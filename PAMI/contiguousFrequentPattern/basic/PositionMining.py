@@ -55,12 +55,22 @@ class PositionMining:
     About this algorithm
     ====================
 
-    :Description:  describe the algorithm
+    :Description:  PositionMining discovers the contiguous substrings that occur at least minsup times in a database of
+                   sequences over any alphabet. The sequences are concatenated into one array of symbol ids, with a
+                   separator after every sequence, and every pattern is stored with the sorted array of its start
+                   positions. The patterns of length k + 1 are found by reading, for all the positions of all the
+                   patterns of length k at once, the symbol that follows the pattern and grouping the positions by
+                   (pattern, next symbol) with one stable sort. Every level costs a sort of the positions of the
+                   frequent patterns, so no pair of patterns is ever compared.
 
     :Reference: provide the reference of the algorithm with URL of the paper, if possible
 
-    :param  parameter: parameterType :
-                    description of the parameters. Parameters are the variables used in problem definition of the model.
+    :param  minsup: int :
+                    minimum number of occurrences of a pattern.
+    :param  datapath: str :
+                    .csv file with the sequences in its second column.
+    :param  maxlength: int :
+                    the patterns are shorter than maxlength.
 
     :Attributes:
 
@@ -86,6 +96,8 @@ class PositionMining:
         self.seq_prefixes = None
         self.data = None
         self.symbol_freq = None
+        self.alphabet = None
+        self._codes = None
         self.total_length = None
         self._startTime = None
         self._endTime = None
@@ -111,26 +123,25 @@ class PositionMining:
         """
         Initial scan of database where frequent length one candidate will be mined
         """
-        self.symbol_freq={"A":set(),"G":set(),"C":set(),"T":set()}
-        self.total_length=0
-        curr_pos=0
-        # print(self.data)
+        separator = _ab._np.array([0xFFFFFFFF], dtype=_ab._np.uint32)
+        parts = []
+        self.total_length = 0
         for i in range(len(self.data)):
-            seq=self.data[i][1]
-            for j in range(len(seq)):
-                self.symbol_freq[seq[j]].add(curr_pos)
-                curr_pos+=1
-            curr_pos+=1
-            self.total_length+=len(seq)
-
-        temp={}
-        for i in self.symbol_freq:
-            if len(self.symbol_freq[i])>=self.min_sup:
-                temp.update({i:self.symbol_freq[i]})
-        self.symbol_freq=temp
-
-    
-    
+            seq = self.data[i][1] if isinstance(self.data[i][1], str) else ''
+            parts.append(_ab._np.frombuffer(seq.encode('utf-32-le'), dtype=_ab._np.uint32))
+            parts.append(separator)
+            self.total_length += len(seq)
+        text = _ab._np.concatenate(parts) if parts else separator[:0]
+        # symbol ids follow the order of the code points, the separator is the largest code and becomes -1
+        symbols, codes = _ab._np.unique(text, return_inverse=True)
+        dtype = _ab._np.int32 if len(text) < 2 ** 31 else _ab._np.int64
+        self._codes = codes.reshape(-1).astype(dtype)
+        if len(symbols) > 0 and symbols[-1] == separator[0]:
+            symbols = symbols[:-1]
+            self._codes[self._codes == len(symbols)] = -1
+        self.alphabet = [chr(x) for x in symbols.tolist()]
+        self.join({'': _ab._np.arange(len(self._codes), dtype=dtype)}, 0)
+        self.symbol_freq = self.table[1]
 
     def getPatterns(self):
         """
@@ -234,41 +245,43 @@ class PositionMining:
         print("Total ExecutionTime in seconds:", self.getRuntime())
 
 
-    def join(self,db,length):
+    def join(self, db, length):
         """
-        Generating l+1 frequent patterns using two l length frequent patterns
+        Generating l+1 frequent patterns by extending every l length frequent pattern with the symbol following each
+        of its positions
 
         :param db:current l length frequent patterns table consisting of their positions
         :type db: HashTable
         :param length:current length of the frequent candidates generated
         :type length: positive integer
         """
-        for seq1 in db:
-            for seq2 in db:
-                if seq1!=seq2:
-                    if length==1:
-                        word=seq1+seq2
-                        # print(seq1,seq2,db[seq1],db[seq2])
-                        minus_1={i-1 for i in db[seq2]}
-                        positions=db[seq1].intersection(minus_1)
-                        if len(positions)>=self.min_sup:
-                            self.table[length+1].update({word:positions})
-
-
-                    else:
-                        if seq1[1:]== seq2[:-1]:
-                            word=seq1+seq2[-1]
-                            minus_1={i-1 for i in db[seq2]}
-                            positions=db[seq1].intersection(minus_1)
-                            if len(positions)>=self.min_sup:
-                                self.table[length+1].update({word:positions})
-        
+        names = list(db)
+        if not names:
+            return
+        starts = _ab._np.concatenate([db[name] for name in names])
+        pattern = _ab._np.repeat(_ab._np.arange(len(names)), [len(db[name]) for name in names])
+        following = self._codes[starts + length]
+        valid = following >= 0
+        keys = pattern[valid] * len(self.alphabet) + following[valid]
+        starts = starts[valid]
+        # the positions of every pattern are sorted, so a stable sort keeps them sorted within every extension
+        order = _ab._np.argsort(keys, kind='stable')
+        keys, starts = keys[order], starts[order]
+        bounds = _ab._np.flatnonzero(keys[1:] != keys[:-1]) + 1
+        firsts = _ab._np.concatenate(([0], bounds))
+        counts = _ab._np.diff(_ab._np.concatenate((firsts, [len(keys)])))
+        frequent = _ab._np.flatnonzero(counts >= self.min_sup)
+        level = self.table.setdefault(length + 1, {})
+        size = len(self.alphabet)
+        for key, first, count in zip(keys[firsts[frequent]].tolist(), firsts[frequent].tolist(),
+                                     counts[frequent].tolist()):
+            level[names[key // size] + self.alphabet[key % size]] = starts[first:first + count]
 
     def mineNext_candidates(self):
         """
         Mining frequent patterns along with their positions from length 1 frequent candidates
         """
-        while self.current_candidate<self.maxlength-1:
+        while self.current_candidate<self.maxlength-1 and self.table[self.current_candidate]:
             curr=self.table[self.current_candidate]
             self.join(curr,self.current_candidate)
             self.current_candidate+=1
@@ -291,8 +304,6 @@ class PositionMining:
         self.readData()
 
         self.getfreqs()
-        temp = self.symbol_freq
-        self.table.update({1: temp})
         self.current_candidate = 1
         self.mineNext_candidates()
         self.frequentPatterns = {}
@@ -20,6 +20,7 @@ import validators as _validators
 from urllib.request import urlopen as _urlopen
 import csv as _csv
 import pandas as _pd
+import numpy as _np
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
@@ -57,6 +57,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.coveragePattern.basic import abstract as _ab
+from PAMI.extras import bitset as _bs
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecation import deprecated
 
@@ -66,7 +67,11 @@ class CMine(_ab._coveragePatterns):
     About this algorithm
     ====================
 
-    :Description:  CMine algorithms aims to discover the coverage patterns in transactional databases.
+    :Description:  CMine algorithms aims to discover the coverage patterns in transactional databases. The
+                   transactions of every coverage item are stored as a bitset of np.uint64 words. The coverage of a
+                   pattern is the union of the bitsets of its items, and the overlap of an extension is the
+                   intersection of that union with the bitset of the new item. All the candidate extensions of a
+                   pattern are evaluated in one batched AND and popcount over the bitset matrix of the candidates.
 
     :Reference:    Bhargav Sripada, Polepalli Krishna Reddy, Rage Uday Kiran:
                    Coverage patterns for efficient banner advertisement placement. WWW (Companion Volume) 2011: 131-132
@@ -209,7 +214,8 @@ class CMine(_ab._coveragePatterns):
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
             if 'Transactions' in i:
-                self._Database = self._iFile['Transactions'].tolist()
+                self._Database = [[x for x in str(line).strip().split(self._sep) if x]
+                                  for line in self._iFile['Transactions'].tolist()]
 
         if isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
@@ -231,81 +237,75 @@ class CMine(_ab._coveragePatterns):
                 except IOError:
                     print("File Not Found")
 
-    def creatingCoverageItems(self) -> Dict[str, List[str]]:
+    def creatingCoverageItems(self) -> Dict[str, List[int]]:
         """
         This function creates coverage items from _database.
 
-        :return: coverageTidData that stores coverage items and their tid list.
+        :return: coverageTidData that stores coverage items and their tid list, by decreasing frequency.
         :rtype: dict
         """
         tidData = {}
-        self._lno = 0
-        for transaction in self._Database:
-            self._lno = self._lno + 1
-            for item in transaction[1:]:
+        for tid, transaction in enumerate(self._Database):
+            for item in transaction:
                 if item not in tidData:
-                    tidData[item] = [self._lno]
-                else:
-                    tidData[item].append(self._lno)
-        coverageTidData = {k: v for k, v in tidData.items() if len(v) / len(self._Database) >= self._minRF}
+                    tidData[item] = [tid]
+                elif tidData[item][-1] != tid:
+                    tidData[item].append(tid)
+        coverageTidData = {k: v for k, v in tidData.items() if len(v) >= self._minRFCount}
         coverageTidData = dict(sorted(coverageTidData.items(), reverse=True, key=lambda x: len(x[1])))
         return coverageTidData
 
-    def tidToBitset(self,item_set: Dict[str, int]) -> Dict[str, int]:
+    def tidToBitset(self, item_set: Dict[str, List[int]]) -> Tuple[List[str], _ab._np.ndarray, _ab._np.ndarray]:
         """
-        This function converts tid list to bitset.
+        This function converts tid lists to bitsets.
 
-        :param item_set:
-        :return: Dictionary
-        :rtype: dict[str,int]
+        :param item_set: the tid list of every item
+        :type item_set: dict
+        :return: the items, one bitset row per item and the number of transactions of every item
+        :rtype: tuple
         """
-        bitset = {}
-
-        for k,v in item_set.items():
-            bitset[k] = 0b1
-            bitset[k] = (bitset[k] << int(v[0])) | 0b1
-            for i in range(1,len(v)):
-                diff = int(v[i]) - int(v[i-1])
-                bitset[k] = (bitset[k] << diff) | 0b1
-            bitset[k] = (bitset[k] << (self._lno - int(v[-1])))
-        return bitset
-
-    def genPatterns(self,prefix: Tuple[str, int],tidData: List[Tuple[str, int]]) -> None:
+        items = list(item_set)
+        rows = _bs.packLists([item_set[item] for item in items], len(self._Database))
+        return items, rows, _ab._np.array([len(item_set[item]) for item in items], dtype=_ab._np.int64)
+
+    def genPatterns(self, prefix: Tuple[str, _ab._np.ndarray, int], tidData: Tuple[List[str], _ab._np.ndarray, _ab._np.ndarray]) -> None:
         """
         This function generate coverage pattern about prefix.
 
-        :param prefix: String
-        :param tidData: list
+        :param prefix: the pattern, the bitset of the transactions it covers and their number
+        :type prefix: tuple
+        :param tidData: the items that can extend the pattern, their bitsets and their number of transactions
+        :type tidData: tuple
         :return: None
         """
-        # variables to store coverage item set and
-        item_set = prefix[0]
-
-        # Get the length of tidData
-        length = len(tidData)
-        for i in range(length):
-            tid = prefix[1] & tidData[i][1]
-            tid1 = prefix[1] | tidData[i][1]
-            andCount = bin(tid).count("1") - 1
-            orCount = bin(tid1).count("1") - 1
-            if orCount/len(self._Database) >= self._minCS and andCount / len(str(prefix[1])) <= self._maxOR:
-                coverageItem_set = item_set + '\t' + tidData[i][0]
-                if orCount / len(self._Database) >= self._minRF:
-                    self._finalPatterns[coverageItem_set] = andCount
-                self.genPatterns((coverageItem_set,tid),tidData[i+1:length])
-
-    def generateAllPatterns(self,coverageItems: Dict[str, int]) -> None:
+        item_set, coverage, coverageCount = prefix
+        items, rows, supports = tidData
+        if len(items) == 0:
+            return
+        overlaps = _bs.popcount(rows & coverage)
+        accepted = _ab._np.flatnonzero(overlaps <= self._maxOR * supports)
+        coverageCounts = (coverageCount + supports - overlaps).tolist()
+        unions = rows[accepted] | coverage
+        for row, i in enumerate(accepted.tolist()):
+            coverageItem_set = item_set + '\t' + items[i]
+            if coverageCounts[i] >= self._minCSCount:
+                self._finalPatterns[coverageItem_set] = coverageCounts[i]
+            self.genPatterns((coverageItem_set, unions[row], coverageCounts[i]),
+                             (items[i + 1:], rows[i + 1:], supports[i + 1:]))
+
+    def generateAllPatterns(self, coverageItems: Tuple[List[str], _ab._np.ndarray, _ab._np.ndarray]) -> None:
         """
         This function generates all coverage patterns.
 
-        :param coverageItems: coverage items
+        :param coverageItems: coverage items, their bitsets and their number of transactions
+        :type coverageItems: tuple
         :return: None
         """
-        tidData = list(coverageItems.items())
-        length = len(tidData)
-        for i in range(length):
-            #print(i,tidData[i][0])
-            self.genPatterns(tidData[i],tidData[i+1:length])
+        items, rows, supports = coverageItems
+        for i in range(len(items)):
+            if supports[i] >= self._minCSCount:
+                self._finalPatterns[items[i]] = int(supports[i])
+            self.genPatterns((items[i], rows[i], int(supports[i])), (items[i + 1:], rows[i + 1:], supports[i + 1:]))
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self) -> None:
@@ -321,13 +321,14 @@ class CMine(_ab._coveragePatterns):
             raise Exception("Please enter the file path or file name:")
         self._creatingItemSets()
         self._minCS = self._convert(self._minCS)
-        self._minRF =  self._convert(self._minRF)
+        self._minRF = self._convert(self._minRF)
         self._maxOR = self._convert(self._maxOR)
+        # minRF and minCS are compared with numbers of transactions, proportions are converted once per run
+        self._minRFCount = self._minRF * len(self._Database) if type(self._minRF) is float else self._minRF
+        self._minCSCount = self._minCS * len(self._Database) if type(self._minCS) is float else self._minCS
+        self._finalPatterns = {}
         coverageItems = self.creatingCoverageItems()
-        self._finalPatterns = {k: len(v) for k, v in coverageItems.items()}
-        coverageItemsBitset = self.tidToBitset(coverageItems)
-        self.generateAllPatterns(coverageItemsBitset)
-        self.save('output.txt')
+        self.generateAllPatterns(self.tidToBitset(coverageItems))
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
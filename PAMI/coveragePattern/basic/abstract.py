@@ -18,6 +18,7 @@ import time as _time
 import math as _math
 import csv as _csv
 import pandas as _pd
+import numpy as _np
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
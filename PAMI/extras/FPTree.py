@@ -0,0 +1,305 @@
+# FPTree stores a frequent pattern tree in NumPy arrays instead of node objects. The nodes are numbered in depth-first
+# order and every node is described by its item, its count and the index of its parent; the nodes of an item are linked
+# in a header table. Conditional pattern bases are read with a vectorised walk over the parent array.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.extras.FPTree import FPTree
+#
+#             tree = FPTree.fromTransactions([(0, 1), (0, 2), (0, 1, 2)], numItems=3)
+#
+#             print(tree.support)
+#
+#             conditional, ids = tree.conditionalTree(2, minSup=1)
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from array import array
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+
+
+def _ranges(low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    """
+    :param low: start of every range
+    :type low: numpy.ndarray
+    :param high: end of every range
+    :type high: numpy.ndarray
+    :return: the concatenation of np.arange(low[i], high[i]) over all i
+    :rtype: numpy.ndarray
+    """
+    lengths = high - low
+    ends = np.cumsum(lengths)
+    return np.repeat(low - ends + lengths, lengths) + np.arange(ends[-1] if len(ends) else 0)
+
+
+class FPTree:
+    """
+    **About this algorithm**
+
+    :**Description**:  FPTree is an array-backed frequent pattern tree. Node 0 is the root and the other nodes are
+                       numbered in depth-first order, each node being described by its entry in the arrays item, count
+                       and parent. The nodes of every item are linked by next, starting at first[item], and are also
+                       available as one slice of nodeOrder, so that all the prefix paths of an item are extracted at once
+                       by repeatedly replacing a vector of nodes by their parents. A node takes about 24 bytes instead
+                       of the few hundred bytes of a node object with a children dictionary.
+
+                       The items of a tree are integers from 0 to numItems - 1 and a transaction is inserted with its
+                       items in ascending order, so item 0 should be the most frequent item. The tree is built by
+                       sorting the transactions, after which every node is created once and its count is the total
+                       weight of a contiguous run of transactions. A tree can carry a payload, e.g., the timestamps of
+                       the transactions: the payload of a node is then the slice payload[low[node]:high[node]], and the
+                       payload of its prefix paths is carried into a conditional tree.
+
+    :**Parameters**:    - **item** (*numpy.ndarray*) -- *Item of every node, -1 for the root.*
+                        - **count** (*numpy.ndarray*) -- *Count (or weight) of every node.*
+                        - **parent** (*numpy.ndarray*) -- *Index of the parent of every node, -1 for the root.*
+                        - **numItems** (*int*) -- *Number of items of the tree.*
+                        - **payload** (*numpy.ndarray*) -- *Optional payload of the transactions, ordered so that the payload of every node is contiguous.*
+                        - **low** (*numpy.ndarray*) -- *Start of the payload of every node, if there is a payload.*
+                        - **high** (*numpy.ndarray*) -- *End of the payload of every node, if there is a payload.*
+
+    :**Attributes**:    - **first** (*numpy.ndarray*) -- *Header table: first node of every item, -1 if the item has no node.*
+                        - **next** (*numpy.ndarray*) -- *Next node of the same item, -1 for the last one.*
+                        - **nodeOrder** (*numpy.ndarray*) -- *Nodes grouped by item, the nodes of item i are nodeOrder[offsets[i]:offsets[i + 1]].*
+                        - **offsets** (*numpy.ndarray*) -- *Start of the nodes of every item in nodeOrder.*
+                        - **support** (*numpy.ndarray*) -- *Total count of every item.*
+
+    :**Methods**:       - **fromTransactions(transactions, weights, numItems, payload)** -- *Builds a tree from transactions of ascending item ids.*
+                        - **nodes(item)** -- *Returns the nodes of an item.*
+                        - **nodePayload(nodes)** -- *Returns the concatenated payload of some nodes.*
+                        - **prefixPaths(item)** -- *Returns the prefix paths of all the nodes of an item.*
+                        - **path(node)** -- *Returns the items on the path from the root to a node.*
+                        - **conditionalTree(item, minSup, keep)** -- *Builds the conditional tree of an item.*
+
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            from PAMI.extras.FPTree import FPTree
+
+            tree = FPTree.fromTransactions([(0, 1), (0, 2), (0, 1, 2)], numItems=3)
+
+            conditional, ids = tree.conditionalTree(2, minSup=1)
+
+
+    **Credits**
+
+    The complete program was written by Tarun Sreepada under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    __slots__ = ('item', 'count', 'parent', 'numItems', 'payload', 'low', 'high', 'first', 'next', 'nodeOrder',
+                 'offsets', 'support')
+
+    def __init__(self, item: np.ndarray, count: np.ndarray, parent: np.ndarray, numItems: int,
+                 payload: Optional[np.ndarray] = None, low: Optional[np.ndarray] = None,
+                 high: Optional[np.ndarray] = None) -> None:
+        self.item = item
+        self.count = count
+        self.parent = parent
+        self.numItems = numItems
+        self.payload = payload
+        self.low = low
+        self.high = high
+        # nodes grouped by item, in depth-first order inside a group
+        self.nodeOrder = (np.argsort(item[1:], kind='stable') + 1).astype(np.int32)
+        self.offsets = np.zeros(numItems + 1, dtype=np.int64)
+        np.cumsum(np.bincount(item[1:], minlength=numItems), out=self.offsets[1:])
+        self.first = np.full(numItems, -1, dtype=np.int32)
+        present = self.offsets[1:] > self.offsets[:-1]
+        self.first[present] = self.nodeOrder[self.offsets[:-1][present]]
+        self.next = np.full(len(item), -1, dtype=np.int32)
+        if len(self.nodeOrder) > 1:
+            sameItem = item[self.nodeOrder[1:]] == item[self.nodeOrder[:-1]]
+            self.next[self.nodeOrder[:-1][sameItem]] = self.nodeOrder[1:][sameItem]
+        support = np.bincount(item[1:], weights=count[1:], minlength=numItems)
+        self.support = support.astype(count.dtype) if count.dtype.kind in 'iu' else support
+
+    def __len__(self) -> int:
+        return len(self.item) - 1
+
+    def __getstate__(self):
+        return self.item, self.count, self.parent, self.numItems, self.payload, self.low, self.high
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    @classmethod
+    def fromTransactions(cls, transactions: Sequence[Sequence[int]], weights: Optional[Sequence] = None,
+                         numItems: Optional[int] = None, payload: Optional[np.ndarray] = None) -> 'FPTree':
+        """
+        Builds a tree. The transactions are sorted, so that the transactions sharing a prefix are adjacent: every node
+        is created when the first of them is reached and its count is the total weight of the run.
+
+        :param transactions: transactions of item ids in ascending order, as lists or as tuples
+        :type transactions: list
+        :param weights: count of every transaction, 1 by default
+        :type weights: list or numpy.ndarray
+        :param numItems: number of items, one more than the largest item id by default
+        :type numItems: int
+        :param payload: payload of the transactions, one after another, where the weight of a transaction is the size
+                        of its payload
+        :type payload: numpy.ndarray
+        :return: the tree
+        :rtype: FPTree
+        """
+        if not isinstance(transactions, list):
+            transactions = list(transactions)
+        if weights is None:
+            weights = np.ones(len(transactions), dtype=np.int64)
+        weights = np.asarray(weights)
+        if weights.dtype.kind in 'iub':
+            weights = weights.astype(np.int64)
+        if numItems is None:
+            numItems = max((transaction[-1] for transaction in transactions if transaction), default=-1) + 1
+        order = sorted(range(len(transactions)), key=transactions.__getitem__)
+        items, parents, starts, ends = array('q', [-1]), array('q', [-1]), array('q', [0]), array('q', [len(order)])
+        stack, previous = [0], ()
+        for position, index in enumerate(order):
+            transaction = transactions[index]
+            common, limit = 0, min(len(previous), len(transaction))
+            while common < limit and previous[common] == transaction[common]:
+                common += 1
+            for node in stack[common + 1:]:
+                ends[node] = position
+            del stack[common + 1:]
+            for item in transaction[common:]:
+                items.append(item)
+                parents.append(stack[-1])
+                starts.append(position)
+                ends.append(0)
+                stack.append(len(items) - 1)
+            previous = transaction
+        for node in stack[1:]:
+            ends[node] = len(order)
+        order = np.asarray(order, dtype=np.int64)
+        cumulative = np.zeros(len(order) + 1, dtype=weights.dtype)
+        np.cumsum(weights[order], out=cumulative[1:])
+        low = cumulative[np.frombuffer(starts, dtype=np.int64)]
+        high = cumulative[np.frombuffer(ends, dtype=np.int64)]
+        items = np.frombuffer(items, dtype=np.int64).astype(np.int32)
+        parents = np.frombuffer(parents, dtype=np.int64).astype(np.int32)
+        if payload is None:
+            return cls(items, high - low, parents, numItems)
+        # the payload follows the sorted transactions, so that the payload of a node is one slice
+        offsets = np.zeros(len(weights) + 1, dtype=np.int64)
+        np.cumsum(weights, out=offsets[1:])
+        payload = np.asarray(payload)[_ranges(offsets[order], offsets[order + 1])]
+        return cls(items, high - low, parents, numItems, payload, low, high)
+
+    def nodes(self, item: int) -> np.ndarray:
+        """
+        :param item: an item
+        :type item: int
+        :return: the nodes of the item
+        :rtype: numpy.ndarray
+        """
+        return self.nodeOrder[self.offsets[item]:self.offsets[item + 1]]
+
+    def nodePayload(self, nodes: np.ndarray) -> np.ndarray:
+        """
+        :param nodes: nodes of a tree with a payload
+        :type nodes: numpy.ndarray
+        :return: the payloads of the nodes, one after another
+        :rtype: numpy.ndarray
+        """
+        return self.payload[_ranges(self.low[nodes], self.high[nodes])]
+
+    def path(self, node: int) -> List[int]:
+        """
+        :param node: a node
+        :type node: int
+        :return: the items on the path from the root to the node, the node excluded
+        :rtype: list
+        """
+        path = []
+        node = int(self.parent[node])
+        while node > 0:
+            path.append(int(self.item[node]))
+            node = int(self.parent[node])
+        return path[::-1]
+
+    def prefixPaths(self, item: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Extracts the prefix paths of all the nodes of an item by replacing the vector of the nodes by their parents
+        until every path has reached the root.
+
+        :param item: an item
+        :type item: int
+        :return: the path index and the item of every entry of the paths, and the count of every path
+        :rtype: tuple
+        """
+        nodes = self.nodes(item)
+        counts = self.count[nodes]
+        current = self.parent[nodes]
+        paths = np.arange(len(nodes), dtype=np.int32)
+        pathIndices, pathItems = [], []
+        while len(current):
+            inner = current > 0
+            current, paths = current[inner], paths[inner]
+            pathIndices.append(paths)
+            pathItems.append(self.item[current])
+            current = self.parent[current]
+        if not pathIndices:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32), counts
+        return np.concatenate(pathIndices), np.concatenate(pathItems), counts
+
+    def conditionalTree(self, item: int, minSup=None, keep: Optional[np.ndarray] = None) -> Tuple['FPTree', np.ndarray]:
+        """
+        Builds the conditional tree of an item from its prefix paths. The items that are not frequent in the paths,
+        or that are not kept, are removed and the remaining ones are renumbered by decreasing support. The payload of
+        the nodes of the item becomes the payload of the conditional tree.
+
+        :param item: an item
+        :type item: int
+        :param minSup: the minimum support of an item of the conditional tree
+        :type minSup: int or float
+        :param keep: if given instead of minSup, the items of this tree that are kept in the conditional tree
+        :type keep: numpy.ndarray
+        :return: the conditional tree and the item of this tree of every item of the conditional tree
+        :rtype: tuple
+        """
+        pathIndices, pathItems, counts = self.prefixPaths(item)
+        support = np.bincount(pathItems, weights=counts[pathIndices], minlength=self.numItems)
+        ids = np.flatnonzero(support >= minSup) if keep is None else np.asarray(keep, dtype=np.int64)
+        ids = ids[np.argsort(-support[ids], kind='stable')].astype(np.int32)
+        if len(ids) <= 1 and self.payload is None:
+            # a tree of at most one item is the root and at most one node
+            count = support[ids].astype(counts.dtype)
+            return FPTree(np.arange(-1, len(ids), dtype=np.int32), np.concatenate(([count.sum()], count)),
+                          np.arange(-1, len(ids), dtype=np.int32), len(ids)), ids
+        rename = np.full(self.numItems, -1, dtype=np.int32)
+        rename[ids] = np.arange(len(ids), dtype=np.int32)
+        newItems = rename[pathItems]
+        kept = newItems >= 0
+        pathIndices, newItems = pathIndices[kept], newItems[kept]
+        order = np.lexsort((newItems, pathIndices))
+        pathIndices, newItems = pathIndices[order], newItems[order]
+        bounds = np.flatnonzero(pathIndices[1:] != pathIndices[:-1]) + 1
+        starts = np.concatenate(([0], bounds)).astype(np.int64) if len(newItems) else np.zeros(0, dtype=np.int64)
+        ends = np.concatenate((bounds, [len(newItems)])).astype(np.int64) if len(newItems) else starts
+        paths = pathIndices[starts]
+        newItems = newItems.tolist()
+        transactions = [newItems[start:end] for start, end in zip(starts.tolist(), ends.tolist())]
+        payload = None
+        if self.payload is not None:
+            payload = self.nodePayload(self.nodes(item)[paths])
+        return FPTree.fromTransactions(transactions, counts[paths], len(ids), payload), ids
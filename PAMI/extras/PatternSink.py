@@ -0,0 +1,283 @@
+# PatternSink receives the patterns of a mining algorithm while they are being discovered, so that a run does not have
+# to keep the complete set of patterns in memory before it is written out.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.extras.PatternSink import FileSink
+#
+#             from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#             obj = alg.FPGrowth('sampleDB.txt', 10)
+#
+#             obj.setSink(FileSink('patterns.txt'))
+#
+#             obj.mine()
+#
+#             print("Total number of Frequent Patterns:", len(obj.getPatterns()))
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Any, Callable, Dict, List, Sequence
+import heapq as _heapq
+import numbers as _numbers
+
+
+class PatternSink:
+    """
+    **About this algorithm**
+
+    :**Description**:  PatternSink is the base class of all pattern sinks. A sink takes the place of the dictionary in
+                       which an algorithm collects its patterns: every discovered pattern is handed over with
+                       ``sink[pattern] = value`` and the sink decides whether to keep, write or forward it. Patterns are
+                       tuples of items; values are the support or, for example, a [support, periodicity] list.
+
+    :**Attributes**:    - **count** (*int*) -- *Number of patterns received.*
+                        - **decoder** (*function*) -- *Optional function applied to every pattern before it is stored, set by the algorithms that mine over integer item ids.*
+
+    :**Methods**:       - **add(pattern, value)** -- *Receives one pattern.*
+                        - **update(patterns)** -- *Receives every pattern of a dictionary.*
+                        - **items()** -- *Returns the patterns kept in memory, if any.*
+                        - **getPatterns()** -- *Returns the patterns kept in memory as a dictionary.*
+                        - **close()** -- *Flushes and releases the resources of the sink.*
+
+
+    **Credits**
+
+    The complete program was written by Tarun Sreepada under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.decoder = None
+
+    def __setitem__(self, pattern: tuple, value: Any) -> None:
+        if self.decoder is not None:
+            pattern = self.decoder(pattern)
+        self.count += 1
+        self.add(pattern, value)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, pattern: tuple, value: Any) -> None:
+        """
+        Receives one pattern.
+
+        :param pattern: the items of the pattern
+        :type pattern: tuple
+        :param value: the support (or other measures) of the pattern
+        :type value: any
+        :return: None
+        """
+        pass
+
+    def update(self, patterns: Dict[tuple, Any]) -> None:
+        """
+        Receives every pattern of a dictionary.
+
+        :param patterns: dictionary of patterns and their values
+        :type patterns: dict
+        :return: None
+        """
+        for pattern, value in patterns.items():
+            self[pattern] = value
+
+    def items(self):
+        """
+        :return: the (pattern, value) pairs kept in memory. Sinks that do not keep patterns return nothing.
+        :rtype: iterable
+        """
+        return iter(())
+
+    def getPatterns(self) -> Dict[tuple, Any]:
+        """
+        :return: the patterns kept in memory as a dictionary
+        :rtype: dict
+        """
+        return dict(self.items())
+
+    def close(self) -> None:
+        """
+        Flushes and releases the resources of the sink.
+
+        :return: None
+        """
+        pass
+
+    @staticmethod
+    def _values(value: Any) -> List[Any]:
+        """
+        Converts a value into the list of its numeric measures. Non-numeric entries, such as retained timestamp sets,
+        are dropped.
+
+        :param value: the value of a pattern
+        :type value: any
+        :return: list of numbers
+        :rtype: list
+        """
+        if isinstance(value, (list, tuple)):
+            return [v for v in value if isinstance(v, _numbers.Number)]
+        return [value]
+
+
+class CallbackSink(PatternSink):
+    """
+    :Description:   CallbackSink calls a user function with every pattern and its value.
+
+    :param callback: function called as callback(pattern, value)
+    :type callback: function
+    """
+
+    def __init__(self, callback: Callable[[tuple, Any], None]) -> None:
+        super().__init__()
+        self.callback = callback
+
+    def add(self, pattern: tuple, value: Any) -> None:
+        self.callback(pattern, value)
+
+
+class FileSink(PatternSink):
+    """
+    :Description:   FileSink writes every pattern to a text file in the format used by save(), i.e., the items joined
+                    by the separator followed by the measures separated with ':'. Lines are buffered and written in
+                    blocks.
+
+    :param oFile: name of the output file
+    :type oFile: str
+    :param sep: separator used between the items of a pattern
+    :type sep: str
+    :param bufferSize: number of patterns buffered before they are written
+    :type bufferSize: int
+    """
+
+    def __init__(self, oFile: str, sep: str = '\t', bufferSize: int = 100000) -> None:
+        super().__init__()
+        self.oFile = oFile
+        self.sep = sep
+        self.bufferSize = bufferSize
+        self._buffer = []
+        self._writer = open(oFile, 'w')
+
+    def add(self, pattern: tuple, value: Any) -> None:
+        line = self.sep.join(str(x) for x in pattern)
+        for v in self._values(value):
+            line += ":" + str(v)
+        self._buffer.append(line)
+        if len(self._buffer) >= self.bufferSize:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._buffer:
+            self._writer.write("\n".join(self._buffer) + "\n")
+            self._buffer = []
+
+    def close(self) -> None:
+        if not self._writer.closed:
+            self._flush()
+            self._writer.close()
+
+
+class ParquetSink(PatternSink):
+    """
+    :Description:   ParquetSink writes the patterns to a Parquet file, one row group per rowGroupSize patterns. The
+                    items of a pattern are joined by the separator in the 'Patterns' column and every measure gets its
+                    own column. Requires pyarrow.
+
+    :param oFile: name of the output file
+    :type oFile: str
+    :param columns: names of the measure columns, e.g., ['Support'] or ['Support', 'Periodicity']
+    :type columns: list
+    :param sep: separator used between the items of a pattern
+    :type sep: str
+    :param rowGroupSize: number of patterns in a row group
+    :type rowGroupSize: int
+    """
+
+    def __init__(self, oFile: str, columns: Sequence[str] = ('Support',), sep: str = '\t', rowGroupSize: int = 100000) -> None:
+        super().__init__()
+        try:
+            import pyarrow as _pa
+            import pyarrow.parquet as _pq
+        except ImportError:
+            raise ImportError("ParquetSink requires pyarrow, please install it with 'pip install pyarrow'")
+        self._pa = _pa
+        self._pq = _pq
+        self.oFile = oFile
+        self.columns = list(columns)
+        self.sep = sep
+        self.rowGroupSize = rowGroupSize
+        self._patterns = []
+        self._measures = [[] for _ in self.columns]
+        self._writer = None
+
+    def add(self, pattern: tuple, value: Any) -> None:
+        self._patterns.append(self.sep.join(str(x) for x in pattern))
+        values = self._values(value)
+        for i in range(len(self.columns)):
+            self._measures[i].append(values[i] if i < len(values) else None)
+        if len(self._patterns) >= self.rowGroupSize:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._patterns and self._writer is not None:
+            return
+        data = {'Patterns': self._patterns}
+        for name, measures in zip(self.columns, self._measures):
+            data[name] = measures
+        table = self._pa.Table.from_pydict(data)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self.oFile, table.schema)
+        self._writer.write_table(table.cast(self._writer.schema))
+        self._patterns = []
+        self._measures = [[] for _ in self.columns]
+
+    def close(self) -> None:
+        if self._writer is None or self._patterns:
+            self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class BoundedSink(PatternSink):
+    """
+    :Description:   BoundedSink keeps at most maxPatterns patterns in memory, namely the ones with the highest first
+                    measure (the support). The memory used by a run therefore does not grow with the number of
+                    patterns.
+
+    :param maxPatterns: maximum number of patterns kept
+    :type maxPatterns: int
+    """
+
+    def __init__(self, maxPatterns: int) -> None:
+        super().__init__()
+        self.maxPatterns = maxPatterns
+        self._heap = []
+
+    def add(self, pattern: tuple, value: Any) -> None:
+        values = self._values(value)
+        entry = (values[0] if values else 0, self.count, pattern, value)
+        if len(self._heap) < self.maxPatterns:
+            _heapq.heappush(self._heap, entry)
+        elif entry[0] > self._heap[0][0]:
+            _heapq.heapreplace(self._heap, entry)
+
+    def items(self):
+        return ((pattern, value) for _, _, pattern, value in sorted(self._heap, key=lambda x: (-x[0], x[1])))
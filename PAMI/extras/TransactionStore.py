@@ -0,0 +1,494 @@
+# TransactionStore reads a transactional database once and keeps it as integer-encoded, CSR-style NumPy arrays so that
+# the same database can be handed to several mining algorithms (and thresholds) without parsing it again.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.extras.TransactionStore import TransactionStore
+#
+#             from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#             store = TransactionStore.load('sampleDB.txt', sep='\t')
+#
+#             for minSup in [100, 200, 300]:
+#
+#                 obj = alg.FPGrowth(store, minSup)
+#
+#                 obj.mine()
+#
+#                 print(minSup, len(obj.getPatterns()))
+#
+#             store.save('sampleDB.pami')  # binary copy that later runs memory-map instead of parsing
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.request import urlopen as _urlopen
+import json as _json
+import os as _os
+import tempfile as _tempfile
+import weakref as _weakref
+import numpy as np
+import pandas as pd
+import validators as _validators
+
+
+class TransactionStore:
+    """
+    **About this algorithm**
+
+    :**Description**:  TransactionStore holds a transactional database in a compact, integer-encoded form. Every distinct
+                       item is renamed to an integer id (in order of first appearance) and the transactions are stored as
+                       one flat array of item ids together with an offsets array, i.e., the items of transaction ``tid``
+                       are ``indices[offsets[tid]:offsets[tid + 1]]``. Miners that receive a TransactionStore instead of
+                       a file name mine over the integer ids and translate the patterns back to item names at the end.
+                       Temporal, utility and uncertain databases additionally keep their timestamps, utilities or
+                       probabilities as NumPy arrays. A store can be saved in a binary container that is memory-mapped
+                       when it is loaded again, so repeated runs skip parsing and several processes share one page cache.
+
+    :**Parameters**:    - **items** (*list*) -- *Item names, where the position of a name is its integer id.*
+                        - **offsets** (*numpy.ndarray*) -- *Start position of every transaction in indices (length is number of transactions + 1).*
+                        - **indices** (*numpy.ndarray*) -- *Item ids of all transactions, stored one transaction after another.*
+                        - **timestamps** (*numpy.ndarray*) -- *Optional timestamp of every transaction.*
+                        - **utilities** (*numpy.ndarray*) -- *Optional utility of every entry of indices.*
+                        - **transactionUtilities** (*numpy.ndarray*) -- *Optional utility of every transaction.*
+                        - **probabilities** (*numpy.ndarray*) -- *Optional existential probability of every entry of indices.*
+
+    :**Attributes**:    - **items** (*list*) -- *Item names indexed by item id.*
+                        - **itemIds** (*dict*) -- *Mapping of item names to item ids.*
+                        - **offsets** (*numpy.ndarray*) -- *Transaction offsets into indices.*
+                        - **indices** (*numpy.ndarray*) -- *Flat array of item ids.*
+
+    :**Methods**:       - **load(iFile, sep, dbType)** -- *Builds a store from a file, binary file, URL, DataFrame or returns an existing store.*
+                        - **save(oFile)** -- *Writes the store to a binary file that can be memory-mapped.*
+                        - **fromBinary(iFile)** -- *Memory-maps a binary file written by save().*
+                        - **toFile(oFile, sep, dbType)** -- *Writes the database back to a text file.*
+                        - **toTemporaryFile(owner, sep, dbType)** -- *Writes the database to a text file that lives as long as owner.*
+                        - **transaction(tid)** -- *Returns the item ids of a transaction.*
+                        - **transactionLists()** -- *Returns the database as a list of lists of item ids.*
+                        - **temporalLists()** -- *Returns the database as a list of [timestamp, item ids...] lists.*
+                        - **itemSupports()** -- *Returns the support of every item id.*
+                        - **tidLists()** -- *Returns the sorted transaction ids of every item id.*
+                        - **decode(pattern)** -- *Translates a tuple of item ids back into item names.*
+                        - **decodePatterns(patterns)** -- *Translates the keys of a pattern dictionary back into item names.*
+
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            from PAMI.extras.TransactionStore import TransactionStore
+
+            from PAMI.frequentPattern.basic import ECLAT as alg
+
+            store = TransactionStore.load('sampleDB.txt', sep='\t')
+
+            obj = alg.ECLAT(store, 10)
+
+            obj.mine()
+
+            print(len(obj.getPatterns()))
+
+
+    **Credits**
+
+    The complete program was written by Tarun Sreepada under the supervision of Professor Rage Uday Kiran.
+
+    """
+
+    _magic = b'PAMIDB\x00\x01'
+    _alignment = 64
+    _sections = ['offsets', 'indices', 'timestamps', 'utilities', 'transactionUtilities', 'probabilities']
+
+    def __init__(self, items: List[str], offsets: np.ndarray, indices: np.ndarray, timestamps: Optional[np.ndarray] = None,
+                 utilities: Optional[np.ndarray] = None, transactionUtilities: Optional[np.ndarray] = None,
+                 probabilities: Optional[np.ndarray] = None) -> None:
+        self.items = list(items)
+        self.itemIds = {item: i for i, item in enumerate(self.items)}
+        self.offsets = offsets if isinstance(offsets, np.memmap) else np.asarray(offsets, dtype=np.int64)
+        self.indices = indices if isinstance(indices, np.memmap) else np.asarray(indices, dtype=np.int32)
+        self.timestamps = timestamps
+        self.utilities = utilities
+        self.transactionUtilities = transactionUtilities
+        self.probabilities = probabilities
+
+    @staticmethod
+    def _numbers(values: list) -> np.ndarray:
+        """
+        Converts parsed numbers to an int64 array when all of them are integral and to a float64 array otherwise.
+
+        :param values: list of numbers
+        :type values: list
+        :return: the numbers as an array
+        :rtype: numpy.ndarray
+        """
+        values = np.array(values, dtype=np.float64)
+        if np.array_equal(values, np.floor(values)):
+            return values.astype(np.int64)
+        return values
+
+    @classmethod
+    def _encode(cls, lines, sep: str, dbType: str = 'transactional') -> dict:
+        """
+        Renames the items of every line to integer ids.
+
+        :param lines: iterable of transactions given as strings
+        :type lines: iterable
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :param dbType: format of the lines, one of 'transactional', 'temporal', 'utility' or 'uncertain'
+        :type dbType: str
+        :return: keyword arguments for the constructor
+        :rtype: dict
+        """
+        if dbType not in ('transactional', 'temporal', 'utility', 'uncertain'):
+            raise ValueError("dbType should be one of 'transactional', 'temporal', 'utility' or 'uncertain'")
+        itemIds = {}
+        offsets = [0]
+        indices = []
+        timestamps, values, transactionUtilities = [], [], []
+        for line in lines:
+            if dbType in ('utility', 'uncertain'):
+                line = line.strip()
+                if not line:
+                    continue
+                fields = line.split(':')
+                names = [x for x in fields[0].strip().split(sep) if x]
+                numbers = [x for x in fields[-1].strip().split(sep) if x]
+                for item, number in zip(names, numbers):
+                    if item not in itemIds:
+                        itemIds[item] = len(itemIds)
+                    indices.append(itemIds[item])
+                    values.append(float(number))
+                if dbType == 'utility':
+                    transactionUtilities.append(float(fields[1]))
+                offsets.append(len(indices))
+                continue
+            transaction = {}
+            names = line.split(sep)
+            if dbType == 'temporal':
+                names = [x for x in (i.rstrip() for i in names) if x]
+                if not names:
+                    continue
+                timestamps.append(int(names[0]))
+                names = names[1:]
+            for item in names:
+                item = item.rstrip()
+                if item and item not in transaction:
+                    if item not in itemIds:
+                        itemIds[item] = len(itemIds)
+                    transaction[item] = itemIds[item]
+            indices.extend(transaction.values())
+            offsets.append(len(indices))
+        store = {'items': list(itemIds), 'offsets': np.array(offsets, dtype=np.int64),
+                 'indices': np.array(indices, dtype=np.int32)}
+        if dbType == 'temporal':
+            store['timestamps'] = np.array(timestamps, dtype=np.int64)
+        if dbType == 'utility':
+            store['utilities'] = cls._numbers(values)
+            store['transactionUtilities'] = cls._numbers(transactionUtilities)
+        if dbType == 'uncertain':
+            store['probabilities'] = np.array(values, dtype=np.float64)
+        return store
+
+    @classmethod
+    def fromFile(cls, iFile: str, sep: str = '\t', dbType: str = 'transactional') -> 'TransactionStore':
+        """
+        Reads a text file (or URL) and encodes it.
+
+        :param iFile: name or URL of the input file
+        :type iFile: str
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :param dbType: format of the file, one of 'transactional', 'temporal', 'utility' or 'uncertain'
+        :type dbType: str
+        :return: the encoded database
+        :rtype: TransactionStore
+        """
+        if _validators.url(iFile):
+            lines = (line.decode("utf-8") for line in _urlopen(iFile))
+            return cls(**cls._encode(lines, sep, dbType))
+        with open(iFile, 'r', encoding='utf-8') as f:
+            return cls(**cls._encode(f, sep, dbType))
+
+    @classmethod
+    def fromDataFrame(cls, dataFrame: pd.DataFrame, sep: str = '\t') -> 'TransactionStore':
+        """
+        Encodes a DataFrame whose 'Transactions' column holds the transactions as separated strings. The timestamps
+        are taken from the 'TS' column when it exists.
+
+        :param dataFrame: the input data frame
+        :type dataFrame: pd.DataFrame
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :return: the encoded database
+        :rtype: TransactionStore
+        """
+        if 'Transactions' not in dataFrame.columns:
+            raise ValueError("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
+        store = cls._encode(dataFrame['Transactions'].tolist(), sep)
+        if 'TS' in dataFrame.columns:
+            store['timestamps'] = dataFrame['TS'].to_numpy(dtype=np.int64)
+        return cls(**store)
+
+    @classmethod
+    def load(cls, iFile: Union[str, pd.DataFrame, 'TransactionStore'], sep: str = '\t',
+             dbType: str = 'transactional') -> 'TransactionStore':
+        """
+        Builds a store from a file name, binary file, URL or DataFrame. An existing store is returned unchanged.
+
+        :param iFile: the input database
+        :type iFile: str or pd.DataFrame or TransactionStore
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :param dbType: format of a text file, one of 'transactional', 'temporal', 'utility' or 'uncertain'
+        :type dbType: str
+        :return: the encoded database
+        :rtype: TransactionStore
+        """
+        if isinstance(iFile, cls):
+            return iFile
+        if isinstance(iFile, pd.DataFrame):
+            return cls.fromDataFrame(iFile, sep)
+        if cls.isBinary(iFile):
+            return cls.fromBinary(iFile)
+        return cls.fromFile(iFile, sep, dbType)
+
+    @classmethod
+    def isBinary(cls, iFile) -> bool:
+        """
+        Checks whether iFile names a binary file written by save().
+
+        :param iFile: the input database
+        :type iFile: any
+        :return: True if iFile is a binary database
+        :rtype: bool
+        """
+        if not isinstance(iFile, str) or _validators.url(iFile):
+            return False
+        try:
+            with open(iFile, 'rb') as f:
+                return f.read(len(cls._magic)) == cls._magic
+        except OSError:
+            return False
+
+    def save(self, oFile: str) -> None:
+        """
+        Writes the store to a binary file. The file starts with a magic string and a JSON header that records the
+        dtype, position and length of every array, followed by the arrays themselves aligned to 64 bytes.
+
+        :param oFile: name of the output file
+        :type oFile: str
+        :return: None
+        """
+        names = [item.encode('utf-8') for item in self.items]
+        arrays = {'itemNames': np.frombuffer(b''.join(names), dtype=np.uint8),
+                  'itemOffsets': np.cumsum([0] + [len(x) for x in names], dtype=np.int64)}
+        for name in self._sections:
+            if getattr(self, name) is not None:
+                arrays[name] = np.ascontiguousarray(getattr(self, name))
+        sections = {}
+        position = 0
+        for name, array in arrays.items():
+            sections[name] = {'dtype': array.dtype.str, 'offset': position, 'count': int(array.size)}
+            position += -(-array.nbytes // self._alignment) * self._alignment
+        header = _json.dumps({'version': 1, 'sections': sections}).encode('utf-8')
+        start = len(self._magic) + 8 + len(header)
+        start = -(-start // self._alignment) * self._alignment
+        with open(oFile, 'wb') as f:
+            f.write(self._magic)
+            f.write(np.uint64(len(header)).tobytes())
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(start + sections[name]['offset'])
+                f.write(array.tobytes())
+            f.truncate(start + position)
+
+    @classmethod
+    def fromBinary(cls, iFile: str) -> 'TransactionStore':
+        """
+        Memory-maps a binary file written by save(). Only the item names are decoded; every other array is a
+        read-only view of the file.
+
+        :param iFile: name of the binary file
+        :type iFile: str
+        :return: the encoded database
+        :rtype: TransactionStore
+        """
+        with open(iFile, 'rb') as f:
+            if f.read(len(cls._magic)) != cls._magic:
+                raise ValueError("%s is not a binary PAMI database" % iFile)
+            length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            header = _json.loads(f.read(length).decode('utf-8'))
+        start = len(cls._magic) + 8 + length
+        start = -(-start // cls._alignment) * cls._alignment
+        arrays = {}
+        for name, section in header['sections'].items():
+            if section['count'] == 0:
+                arrays[name] = np.empty(0, dtype=section['dtype'])
+            else:
+                arrays[name] = np.memmap(iFile, dtype=section['dtype'], mode='r',
+                                         offset=start + section['offset'], shape=(section['count'],))
+        blob = arrays.pop('itemNames').tobytes()
+        bounds = arrays.pop('itemOffsets').tolist()
+        items = [blob[bounds[i]:bounds[i + 1]].decode('utf-8') for i in range(len(bounds) - 1)]
+        return cls(items, **arrays)
+
+    def _dbType(self) -> str:
+        """
+        :return: the format in which the store was encoded
+        :rtype: str
+        """
+        if self.utilities is not None:
+            return 'utility'
+        if self.probabilities is not None:
+            return 'uncertain'
+        if self.timestamps is not None:
+            return 'temporal'
+        return 'transactional'
+
+    def toFile(self, oFile: str, sep: str = '\t', dbType: Optional[str] = None) -> None:
+        """
+        Writes the database back to a text file in the format read by the miners, so that it can be given to a miner
+        that only parses text files.
+
+        :param oFile: name of the output file
+        :type oFile: str
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :param dbType: format of the file, one of 'transactional', 'temporal', 'utility' or 'uncertain'. The format in
+            which the store was encoded is used by default. Transactions are numbered from 1 when a temporal file is
+            written from a store without timestamps.
+        :type dbType: str
+        :return: None
+        """
+        dbType = dbType or self._dbType()
+        if dbType not in ('transactional', 'temporal', 'utility', 'uncertain'):
+            raise ValueError("dbType should be one of 'transactional', 'temporal', 'utility' or 'uncertain'")
+        items = self.items
+        offsets = self.offsets.tolist()
+        indices = self.indices.tolist()
+        if dbType in ('utility', 'uncertain'):
+            values = (self.utilities if dbType == 'utility' else self.probabilities)
+            if values is None:
+                raise ValueError("The store holds no %s values" % dbType)
+            values = values.tolist()
+        if dbType == 'utility':
+            transactionUtilities = self.transactionUtilities.tolist()
+        if dbType == 'temporal':
+            timestamps = range(1, len(self) + 1) if self.timestamps is None else self.timestamps.tolist()
+        with open(oFile, 'w', encoding='utf-8') as f:
+            for i in range(len(self)):
+                start, end = offsets[i], offsets[i + 1]
+                names = [items[x] for x in indices[start:end]]
+                if dbType == 'temporal':
+                    names.insert(0, str(timestamps[i]))
+                line = sep.join(names)
+                if dbType == 'utility':
+                    line += ':' + str(transactionUtilities[i]) + ':' + sep.join(str(x) for x in values[start:end])
+                elif dbType == 'uncertain':
+                    line += ':' + sep.join(str(x) for x in values[start:end])
+                f.write(line + '\n')
+
+    def toTemporaryFile(self, owner: object, sep: str = '\t', dbType: Optional[str] = None) -> str:
+        """
+        Writes the database to a temporary text file (see toFile) that is removed once owner is garbage collected.
+
+        :param owner: the object reading the file
+        :type owner: object
+        :param sep: separator used to distinguish items from each other
+        :type sep: str
+        :param dbType: format of the file, one of 'transactional', 'temporal', 'utility' or 'uncertain'
+        :type dbType: str
+        :return: name of the temporary file
+        :rtype: str
+        """
+        handle, oFile = _tempfile.mkstemp(suffix='.txt', prefix='pami_')
+        _os.close(handle)
+        _weakref.finalize(owner, _os.remove, oFile)
+        self.toFile(oFile, sep, dbType)
+        return oFile
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def transaction(self, tid: int) -> np.ndarray:
+        """
+        :param tid: transaction id
+        :type tid: int
+        :return: item ids of the transaction
+        :rtype: numpy.ndarray
+        """
+        return self.indices[self.offsets[tid]:self.offsets[tid + 1]]
+
+    def transactionLists(self) -> List[List[int]]:
+        """
+        :return: the database as a list of transactions, each one a list of item ids
+        :rtype: list
+        """
+        indices = self.indices.tolist()
+        offsets = self.offsets.tolist()
+        return [indices[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+    def temporalLists(self) -> List[list]:
+        """
+        :return: the database as a list of transactions, each one a list holding the timestamp followed by item ids.
+            Transactions are numbered from 1 when the store has no timestamps.
+        :rtype: list
+        """
+        if self.timestamps is None:
+            timestamps = range(1, len(self) + 1)
+        else:
+            timestamps = self.timestamps.tolist()
+        return [[ts] + line for ts, line in zip(timestamps, self.transactionLists())]
+
+    def itemSupports(self) -> np.ndarray:
+        """
+        :return: support of every item id
+        :rtype: numpy.ndarray
+        """
+        return np.bincount(self.indices, minlength=len(self.items))
+
+    def tidLists(self) -> List[np.ndarray]:
+        """
+        :return: sorted transaction ids of every item id
+        :rtype: list
+        """
+        tids = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.offsets))
+        order = np.argsort(self.indices, kind='stable')
+        bounds = np.cumsum(self.itemSupports())[:-1]
+        return np.split(tids[order], bounds)
+
+    def decode(self, pattern: Tuple[int, ...]) -> Tuple[str, ...]:
+        """
+        :param pattern: tuple of item ids
+        :type pattern: tuple
+        :return: tuple of item names
+        :rtype: tuple
+        """
+        return tuple(self.items[i] for i in pattern)
+
+    def decodePatterns(self, patterns: Dict[Tuple[int, ...], object]) -> Dict[Tuple[str, ...], object]:
+        """
+        :param patterns: dictionary whose keys are tuples of item ids
+        :type patterns: dict
+        :return: the same dictionary with keys translated into item names
+        :rtype: dict
+        """
+        items = self.items
+        return {tuple(items[i] for i in pattern): value for pattern, value in patterns.items()}
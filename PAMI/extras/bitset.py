@@ -0,0 +1,153 @@
+# bitset provides the NumPy word-array bitsets used by the bitset based mining algorithms. A set of transaction ids is
+# stored as an array of np.uint64 words and a collection of such sets as a two-dimensional array with one row per set,
+# so that intersections, unions and support counts of many sets are computed in one vectorised call.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.extras import bitset as bs
+#
+#             rows = bs.packLists([[0, 2, 5], [2, 5, 7]], 8)
+#
+#             print(bs.popcount(rows[0] & rows[1]))
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List, Sequence
+import numpy as np
+
+_byteCounts = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def words(nBits: int) -> int:
+    """
+    :param nBits: number of bits to store
+    :type nBits: int
+    :return: number of 64-bit words needed to store nBits bits
+    :rtype: int
+    """
+    return (nBits + 63) >> 6
+
+
+def packLists(tidLists: Sequence[Sequence[int]], nBits: int) -> np.ndarray:
+    """
+    Packs several lists of bit positions (transaction ids) into one bitset per list.
+
+    :param tidLists: lists of bit positions, each one smaller than nBits
+    :type tidLists: list
+    :param nBits: number of bits of every bitset
+    :type nBits: int
+    :return: array of shape (len(tidLists), words(nBits)) and dtype np.uint64
+    :rtype: numpy.ndarray
+    """
+    packed = np.zeros((len(tidLists), words(nBits)), dtype=np.uint64)
+    one = np.uint64(1)
+    for row, tids in zip(packed, tidLists):
+        tids = np.asarray(tids, dtype=np.uint64)
+        np.bitwise_or.at(row, (tids >> np.uint64(6)).astype(np.intp), one << (tids & np.uint64(63)))
+    return packed
+
+
+def pack(tids: Sequence[int], nBits: int) -> np.ndarray:
+    """
+    Packs one list of bit positions into a bitset.
+
+    :param tids: bit positions, each one smaller than nBits
+    :type tids: list
+    :param nBits: number of bits of the bitset
+    :type nBits: int
+    :return: array of words(nBits) words
+    :rtype: numpy.ndarray
+    """
+    return packLists([tids], nBits)[0]
+
+
+if hasattr(np, 'bitwise_count'):
+    def popcount(bits: np.ndarray) -> np.ndarray:
+        """
+        Counts the set bits of every bitset.
+
+        :param bits: one bitset (1-d) or one bitset per row (2-d)
+        :type bits: numpy.ndarray
+        :return: the number of set bits, a scalar for one bitset or one count per row
+        :rtype: int or numpy.ndarray
+        """
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+else:
+    def popcount(bits: np.ndarray) -> np.ndarray:
+        """
+        Counts the set bits of every bitset.
+
+        :param bits: one bitset (1-d) or one bitset per row (2-d)
+        :type bits: numpy.ndarray
+        :return: the number of set bits, a scalar for one bitset or one count per row
+        :rtype: int or numpy.ndarray
+        """
+        bits = np.ascontiguousarray(bits)
+        counts = _byteCounts[bits.view(np.uint8)]
+        return counts.reshape(bits.shape[:-1] + (-1,)).sum(axis=-1, dtype=np.int64)
+
+
+def andCount(bits: np.ndarray, rows: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    Intersects one bitset with every row of a bitset matrix and counts the result.
+
+    :param bits: the bitset
+    :type bits: numpy.ndarray
+    :param rows: one bitset per row
+    :type rows: numpy.ndarray
+    :return: the intersections (one per row) and their number of set bits
+    :rtype: tuple
+    """
+    intersections = rows & bits
+    return intersections, popcount(intersections)
+
+
+def orCount(bits: np.ndarray, rows: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    Unites one bitset with every row of a bitset matrix and counts the result.
+
+    :param bits: the bitset
+    :type bits: numpy.ndarray
+    :param rows: one bitset per row
+    :type rows: numpy.ndarray
+    :return: the unions (one per row) and their number of set bits
+    :rtype: tuple
+    """
+    unions = rows | bits
+    return unions, popcount(unions)
+
+
+def positions(bits: np.ndarray) -> np.ndarray:
+    """
+    :param bits: one bitset
+    :type bits: numpy.ndarray
+    :return: the sorted positions of the set bits
+    :rtype: numpy.ndarray
+    """
+    return np.flatnonzero(np.unpackbits(np.ascontiguousarray(bits, dtype='<u8').view(np.uint8), bitorder='little'))
+
+
+def toList(bits: np.ndarray) -> List[int]:
+    """
+    :param bits: one bitset
+    :type bits: numpy.ndarray
+    :return: the sorted positions of the set bits as a list
+    :rtype: list
+    """
+    return positions(bits).tolist()
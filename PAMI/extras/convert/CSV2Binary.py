@@ -0,0 +1,172 @@
+# CSV2Binary converts a transactional, temporal, utility or uncertain database into PAMI's binary format, which the
+# mining algorithms memory-map instead of parsing.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.extras.convert import CSV2Binary as cb
+#
+#             obj = cb.CSV2Binary("sampleDB.csv", "sampleDB.pami", "\t", "transactional")
+#
+#             obj.convert()
+#
+#             obj.printStats()
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import sys
+import os
+import psutil
+import time
+from PAMI.extras.TransactionStore import TransactionStore
+
+
+class CSV2Binary:
+    """
+        **About this algorithm**
+
+        :**Description**:  This class is to convert CSV files into PAMI's binary database format. The binary file keeps
+                           the item dictionary, the transaction offsets, the item ids and, depending on the database type,
+                           the timestamps, utilities or probabilities. Passing the binary file to an algorithm as iFile
+                           memory-maps it, so no line is parsed again.
+
+        :**Reference**:
+
+        :**Parameters**:    - **inputFile** (*str*) -- *Path to the input CSV file.*
+                            - **outputFile** (*str*) -- *Path to the output binary file.*
+                            - **sep** (*str*) -- *This variable is used to distinguish items from one another. The default seperator is tab space. However, the users can override their default separator.*
+                            - **dbType** (*str*) -- *Format of the input file: 'transactional', 'temporal', 'utility' or 'uncertain'.*
+
+        :**Attributes**:    - **getMemoryUSS** (*float*) -- *Returns the memory used by the process in USS.*
+                            - **getMemoryRSS** (*float*) -- *Returns the memory used by the process in RSS.*
+                            - **getRuntime()** (*float*) -- *Returns the time taken to execute the conversion.*
+                            - **printStats()** -- *Prints statistics about memory usage and runtime.*
+
+        :**Methods**:       - **convert()** -- *Reads the input file, writes the binary file, and tracks memory usage and runtime.*
+
+
+        **Execution methods**
+
+        **Terminal command**
+
+        .. code-block:: console
+
+          Format:
+
+          (.venv) $ python3 CSV2Binary.py <inputFile> <outputFile> <sep> <dbType>
+
+          Example Usage:
+
+          (.venv) $ python3 CSV2Binary.py sampleDB.csv sampleDB.pami \t transactional
+
+
+        **Calling from a python program**
+
+        .. code-block:: python
+
+                import PAMI.extras.convert.CSV2Binary as cb
+
+                from PAMI.frequentPattern.basic import FPGrowth as alg
+
+                obj = cb.CSV2Binary('sampleDB.csv', 'sampleDB.pami', '\t', 'transactional')
+
+                obj.convert()
+
+                obj.printStats()
+
+                fp = alg.FPGrowth('sampleDB.pami', 10)
+
+                fp.mine()
+
+
+        **Credits**
+
+        The complete program was written by Tarun Sreepada under the supervision of Professor Rage Uday Kiran.
+
+    """
+    def __init__(self, inputFile, outputFile, sep='\t', dbType='transactional'):
+        self.inputFile = inputFile
+        self.outputFile = outputFile
+        self.sep = sep
+        self.dbType = dbType
+        self.start = None
+        self.end = None
+        self.pid = None
+        self.memoryUSS = float()
+        self.memoryRSS = float()
+
+    def convert(self):
+        """
+        This function reads the input CSV file once and writes it to the binary format.
+        """
+        self.start = time.time()
+
+        store = TransactionStore.fromFile(self.inputFile, self.sep, self.dbType)
+        store.save(self.outputFile)
+
+        self.end = time.time()
+
+        self.pid = os.getpid()
+        process = psutil.Process(self.pid)
+        self.memoryUSS = process.memory_full_info().uss
+        self.memoryRSS = process.memory_info().rss
+
+    def getMemoryUSS(self):
+        """
+        Returns the memory used by the process in USS (Unique Set Size).
+
+        :return: The amount of memory (in bytes) used exclusively by the process
+        :rtype: int
+        """
+        return self.memoryUSS
+
+    def getMemoryRSS(self):
+        """
+        Returns the memory used by the process in RSS (Resident Set Size).
+
+        :return: The total memory (in bytes) used by the process in RAM.
+        :rtype: int
+        """
+        return self.memoryRSS
+
+    def getRuntime(self):
+        """
+        Returns the time taken to complete the CSV to binary conversion.
+
+        :return: The runtime of the conversion process in seconds.
+        :rtype: float
+        """
+        return self.end - self.start
+
+    def printStats(self):
+        """
+        Prints the resource usage statistics including memory consumption (USS and RSS) and the runtime.
+
+        :return: Prints memory usage and runtime to the console.
+        """
+        print("Memory usage (USS):", self.memoryUSS)
+        print("Memory usage (RSS):", self.memoryRSS)
+        print("Runtime:", self.end - self.start)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4 or len(sys.argv) == 5:
+        obj = CSV2Binary(*sys.argv[1:])
+        obj.convert()
+        obj.printStats()
+    else:
+        raise ValueError("Invalid number of arguments. Args: <inputFile> <outputFile> <separator> [dbType]")
@@ -0,0 +1,181 @@
+# parallel runs the partitions of the parallel (pyspark) mining algorithms on a local concurrent.futures process pool
+# instead of a Spark cluster. The inputs of the partitions are NumPy arrays that are copied once into shared memory,
+# so every worker process maps the same buffers instead of receiving a pickled copy of the database with every task.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.extras import parallel
+#
+#             items, offsets = parallel.encode(transactions, rank)
+#
+#             with parallel.SharedArrays(items=items, offsets=offsets) as shared:
+#
+#                 results = parallel.run(minePartition, shared, [(p, 4) for p in range(4)], numWorkers=4)
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory as _shared_memory
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+
+class SharedArrays:
+    """
+    Copies NumPy arrays into shared memory blocks that live until close() is called, or until the end of a with
+    block. handles maps the name of every array to the (block name, shape, dtype) from which a worker process maps it
+    again.
+
+    :param arrays: the arrays, given as keyword arguments
+    :type arrays: numpy.ndarray
+    """
+
+    def __init__(self, **arrays: np.ndarray) -> None:
+        self.handles = {}
+        self._blocks = []
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            block = _shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            self._blocks.append(block)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+            self.handles[name] = (block.name, array.shape, array.dtype.str)
+
+    def close(self) -> None:
+        """
+        Releases the shared memory blocks.
+        """
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> 'SharedArrays':
+        return self
+
+    def __exit__(self, *exception) -> None:
+        self.close()
+
+
+def _call(function: Callable, handles: Dict[str, tuple], task: tuple):
+    """
+    Maps the shared arrays and calls function(arrays, *task).
+
+    :param function: a module level function, so that it can be sent to a worker process
+    :type function: Callable
+    :param handles: the handles of SharedArrays
+    :type handles: dict
+    :param task: the remaining arguments of the function
+    :type task: tuple
+    :return: the result of the function
+    """
+    blocks = {name: _shared_memory.SharedMemory(name=handle[0]) for name, handle in handles.items()}
+    try:
+        arrays = {name: np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf)
+                  for name, (_, shape, dtype) in handles.items()}
+        return function(arrays, *task)
+    finally:
+        arrays = None
+        for block in blocks.values():
+            try:
+                block.close()
+            except BufferError:
+                # a view of the block is still referenced, the mapping is released together with the view
+                pass
+
+
+def run(function: Callable, shared: SharedArrays, tasks: Sequence[tuple], numWorkers: int = 1,
+        executor: Optional[Executor] = None) -> List:
+    """
+    Calls function(arrays, *task) for every task, where arrays maps the names of the shared arrays to the arrays.
+    The tasks run in the calling process if numWorkers is at most 1 and no executor is given.
+
+    :param function: a module level function, so that it can be sent to a worker process
+    :type function: Callable
+    :param shared: the inputs of the tasks
+    :type shared: SharedArrays
+    :param tasks: the remaining arguments of every call
+    :type tasks: list
+    :param numWorkers: number of worker processes
+    :type numWorkers: int
+    :param executor: an existing pool to run the tasks with. It is not shut down by run.
+    :type executor: concurrent.futures.Executor
+    :return: the result of every task, in the order of the tasks
+    :rtype: list
+    """
+    if executor is None and numWorkers <= 1:
+        return [_call(function, shared.handles, task) for task in tasks]
+    pool = executor if executor is not None else ProcessPoolExecutor(max_workers=numWorkers)
+    try:
+        futures = [pool.submit(_call, function, shared.handles, task) for task in tasks]
+        return [future.result() for future in futures]
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+
+def encode(transactions: Sequence[Sequence], rank: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Replaces the items of every transaction by their rank, drops the items without a rank and stores the transactions
+    one after another as ascending rank sequences.
+
+    :param transactions: the transactions
+    :type transactions: list
+    :param rank: the rank of every item that is kept
+    :type rank: dict
+    :return: the ranks of all the transactions and the offset of every transaction, where transaction i is
+             items[offsets[i]:offsets[i + 1]]
+    :rtype: tuple(numpy.ndarray, numpy.ndarray)
+    """
+    ranked = [sorted(set(rank[item] for item in transaction if item in rank)) for transaction in transactions]
+    offsets = np.zeros(len(ranked) + 1, dtype=np.int64)
+    np.cumsum([len(x) for x in ranked], out=offsets[1:])
+    items = np.fromiter((item for x in ranked for item in x), dtype=np.int32, count=int(offsets[-1]))
+    return items, offsets
+
+
+def conditionalTransactions(items: np.ndarray, offsets: np.ndarray, group: int,
+                            numGroups: int) -> Tuple[List[List[int]], np.ndarray]:
+    """
+    Group-dependent conditional transactions of parallel FP-growth: item i belongs to group i % numGroups and every
+    transaction holding an item of the group contributes its prefix up to its last item of the group, which holds
+    everything the group needs to mine the patterns that end with its items.
+
+    :param items: the ranks of all the transactions, as returned by encode
+    :type items: numpy.ndarray
+    :param offsets: the offset of every transaction, as returned by encode
+    :type offsets: numpy.ndarray
+    :param group: the group
+    :type group: int
+    :param numGroups: the number of groups
+    :type numGroups: int
+    :return: the conditional transactions and the index of the transaction each one was taken from
+    :rtype: tuple(list, numpy.ndarray)
+    """
+    positions = np.flatnonzero(items % numGroups == group)
+    if len(positions) == 0:
+        return [], np.zeros(0, dtype=np.int64)
+    owners = np.searchsorted(offsets, positions, side='right') - 1
+    last = np.flatnonzero(np.append(owners[1:] != owners[:-1], True))
+    owners, ends = owners[last], positions[last] + 1
+    starts = offsets[owners]
+    lengths = ends - starts
+    bounds = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=bounds[1:])
+    flat = items[np.arange(bounds[-1]) + np.repeat(starts - bounds[:-1], lengths)].tolist()
+    return [flat[s:e] for s, e in zip(bounds[:-1].tolist(), bounds[1:].tolist())], owners
@@ -0,0 +1,240 @@
+# tidset provides the sorted NumPy array tidsets used by the tidset and diffset based mining algorithms. A set of
+# transaction ids (or timestamps) is stored as a sorted array without duplicates, which takes 4 or 8 bytes per id
+# instead of the ~30 bytes of an entry in a python set.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.extras import tidset as ts
+#
+#             a = ts.fromList([1, 4, 9, 12])
+#
+#             b = ts.fromList([4, 5, 12])
+#
+#             print(ts.intersect(a, b), ts.difference(a, b))
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from bisect import bisect_left as _bisect_left
+from typing import Sequence, Set, Tuple, Union
+import numpy as np
+
+
+def fromList(tids: Sequence[int], dtype=np.int32) -> np.ndarray:
+    """
+    :param tids: transaction ids in ascending order
+    :type tids: list
+    :param dtype: data type of the array, np.int32 for transaction ids and np.int64 for timestamps
+    :type dtype: numpy.dtype
+    :return: the tidset as a sorted array
+    :rtype: numpy.ndarray
+    """
+    return np.asarray(tids, dtype=dtype)
+
+
+def isin(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Marks the elements of a that also occur in b. Both arrays are first narrowed to the range they have in common
+    and the smaller array is then binary searched in the larger one, so the cost depends on the smaller array when
+    the sizes are skewed.
+
+    :param a: a sorted tidset
+    :type a: numpy.ndarray
+    :param b: a sorted tidset
+    :type b: numpy.ndarray
+    :return: boolean mask over a
+    :rtype: numpy.ndarray
+    """
+    mask = np.zeros(len(a), dtype=bool)
+    if len(a) == 0 or len(b) == 0 or a[-1] < b[0] or b[-1] < a[0]:
+        return mask
+    aStart, aEnd = np.searchsorted(a, b[0], side='left'), np.searchsorted(a, b[-1], side='right')
+    bStart, bEnd = np.searchsorted(b, a[0], side='left'), np.searchsorted(b, a[-1], side='right')
+    window, other = a[aStart:aEnd], b[bStart:bEnd]
+    if len(window) == 0 or len(other) == 0:
+        return mask
+    if len(window) <= len(other):
+        positions = np.minimum(np.searchsorted(other, window), len(other) - 1)
+        mask[aStart:aEnd] = other[positions] == window
+    else:
+        positions = np.minimum(np.searchsorted(window, other), len(window) - 1)
+        hits = positions[window[positions] == other]
+        mask[aStart + hits] = True
+    return mask
+
+
+def intersect(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    :param a: a sorted tidset
+    :type a: numpy.ndarray
+    :param b: a sorted tidset
+    :type b: numpy.ndarray
+    :return: the sorted elements of a that occur in b
+    :rtype: numpy.ndarray
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    return a[isin(a, b)]
+
+
+def difference(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    :param a: a sorted tidset
+    :type a: numpy.ndarray
+    :param b: a sorted tidset
+    :type b: numpy.ndarray
+    :return: the sorted elements of a that do not occur in b
+    :rtype: numpy.ndarray
+    """
+    return a[~isin(a, b)]
+
+
+def maxGap(tids: np.ndarray, start: int, end: int, limit=None, blockSize: int = 4096):
+    """
+    Computes the largest gap between start, the consecutive elements of a sorted tidset and end, i.e., the
+    periodicity of a pattern occurring at the timestamps tids of a database spanning [start, end]. The gaps are
+    computed block by block, so the computation stops as soon as a gap larger than limit is found.
+
+    :param tids: a sorted tidset
+    :type tids: numpy.ndarray
+    :param start: the first timestamp of the database
+    :type start: int
+    :param end: the last timestamp of the database
+    :type end: int
+    :param limit: if given, the computation stops once a gap exceeds it
+    :type limit: int or float
+    :param blockSize: number of gaps computed at once
+    :type blockSize: int
+    :return: the largest gap, or a gap larger than limit if one exists
+    :rtype: int
+    """
+    if len(tids) == 0:
+        return end - start
+    result = max(int(tids[0]) - start, end - int(tids[-1]))
+    for i in range(0, len(tids) - 1, blockSize):
+        if limit is not None and result > limit:
+            break
+        block = tids[i:i + blockSize + 1]
+        result = max(result, int((block[1:] - block[:-1]).max()))
+    return result
+
+
+def localPeriods(tids: np.ndarray, maxPer: Union[int, float], maxSoPer: Union[int, float], minDur: Union[int, float],
+                 end: int, blockSize: int = 64) -> Set[Tuple[int, int]]:
+    """
+    Computes the periodic time-intervals of a pattern occurring at the timestamps tids, as defined by LPPM. An
+    interval opens at a gap of at most maxPer. Its spillover soPer starts at maxSoPer and accumulates the excess of
+    every gap over maxPer, floored at 0. The interval closes at the gap that raises soPer above maxSoPer, and an
+    interval still open after the last timestamp extends to end. Intervals shorter than minDur are dropped.
+    The spillovers of a block of gaps are the cumulative sum of the excesses minus its running minimum. The block
+    doubles until the interval closes, so the cost is proportional to the number of timestamps.
+
+    :param tids: a sorted tidset
+    :type tids: numpy.ndarray
+    :param maxPer: the largest periodic gap
+    :type maxPer: int or float
+    :param maxSoPer: the largest spillover of an interval
+    :type maxSoPer: int or float
+    :param minDur: the shortest interval
+    :type minDur: int or float
+    :param end: the last timestamp of the database
+    :type end: int
+    :param blockSize: number of gaps of the first block of every interval
+    :type blockSize: int
+    :return: the (start, end) of every periodic interval
+    :rtype: set
+    """
+    periods = set()
+    excess = (tids[1:] - tids[:-1]) - maxPer
+    cumulative = np.cumsum(excess)
+    openings = np.flatnonzero(excess <= 0).tolist()
+    gaps, k = len(excess), 0
+    while k < len(openings):
+        first = openings[k]
+        start, closed, size = int(tids[first]), -1, blockSize
+        # the spillover after gap j is cumulative[j] minus the running minimum of cumulative since the opening,
+        # floored at the value that makes the spillover maxSoPer at the opening
+        floor = (cumulative[first - 1] if first > 0 else 0) - maxSoPer
+        while first < gaps:
+            last = min(gaps, first + size)
+            block = cumulative[first:last]
+            running = np.minimum(np.minimum.accumulate(block), floor)
+            over = block - running > maxSoPer
+            j = int(over.argmax())
+            if over[j]:
+                closed = first + j
+                break
+            floor, first, size = running[-1], last, size * 2
+        if closed == -1:
+            soPer = max(0, cumulative[-1] - floor + end - int(tids[-1]) - maxPer)
+            if soPer > maxSoPer:
+                if int(tids[-1]) - start >= minDur:
+                    periods.add((start, int(tids[-1])))
+            elif end - start >= minDur:
+                periods.add((start, end))
+            return periods
+        if int(tids[closed]) - start >= minDur:
+            periods.add((start, int(tids[closed])))
+        k = _bisect_left(openings, closed + 1, k)
+    return periods
+
+def periodicIntersect(a: np.ndarray, b: np.ndarray, period: Union[int, float], minimum=None, blockSize: int = 4096):
+    """
+    Intersects two sorted timestamp arrays and counts the periodic gaps of the intersection, i.e., the gaps between
+    its consecutive timestamps that are at most period, in the same pass. The smaller array is merged into the
+    larger one block by block with a binary search, so the intersection keeps the order of its inputs and is never
+    sorted again. After every block the periodic gaps found so far plus the timestamps left in the smaller array
+    bound the periodic support of the intersection, and the pass stops as soon as the bound falls below minimum.
+
+    :param a: a sorted tidset
+    :type a: numpy.ndarray
+    :param b: a sorted tidset
+    :type b: numpy.ndarray
+    :param period: the largest gap counted as periodic
+    :type period: int or float
+    :param minimum: if given, the intersection is rejected once its periodic support cannot reach it
+    :type minimum: int or float
+    :param blockSize: number of timestamps of the smaller array merged at once
+    :type blockSize: int
+    :return: the intersection and its number of periodic gaps, or None if it was rejected
+    :rtype: tuple or None
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    if minimum is not None and max(0, len(a) - 1) < minimum:
+        return None
+    blocks, count, last, start = [], 0, None, 0
+    for i in range(0, len(a), blockSize):
+        window = b[start:]
+        if len(window) == 0:
+            break
+        block = a[i:i + blockSize]
+        positions = np.minimum(np.searchsorted(window, block), len(window) - 1)
+        hits = block[window[positions] == block]
+        # the next block only holds larger timestamps, so the part of b before the last position is done
+        start += int(positions[-1])
+        if len(hits):
+            count += int(np.count_nonzero(hits[1:] - hits[:-1] <= period))
+            if last is not None and hits[0] - last <= period:
+                count += 1
+            last = hits[-1]
+            blocks.append(hits)
+        if minimum is not None and count + len(a) - min(i + blockSize, len(a)) < minimum:
+            return None
+    tids = np.concatenate(blocks) if len(blocks) > 1 else (blocks[0] if blocks else a[:0])
+    return tids, count
@@ -52,6 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.basic import abstract as _ab
+from PAMI.extras import tidset as _ts
 from typing import Dict, Union
 from deprecated import deprecated
 
@@ -136,6 +137,9 @@ class Apriori(_ab._frequentPatterns):
 
     """
 
+    _readsStore = True
+    _emitsToSink = True
+
     _minSup = float()
     _startTime = float()
     _endTime = float()
@@ -152,6 +156,8 @@ class Apriori(_ab._frequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
+        if isinstance(self._iFile, _ab._TransactionStore):
+            self._Database = [set(line) for line in self._iFile.transactionLists()]
         if isinstance(self._iFile, _ab._pd.DataFrame):
             #temp = []
             if self._iFile.empty:
@@ -211,82 +217,225 @@ class Apriori(_ab._frequentPatterns):
         """
         self.mine()
 
+    @staticmethod
+    def _join(level: list) -> list:
+        """
+        Generates the candidates of the next level. Itemsets of a level are sorted, so the itemsets sharing a prefix
+        form a contiguous group and only the members of a group are joined. A candidate is kept only if all its
+        subsets with one item less are frequent.
+
+        :param level: the frequent itemsets of a level as sorted tuples of item ranks, in lexicographic order
+        :type level: list
+        :return: (candidate, i, j) for every candidate, where level[i] and level[j] are the joined itemsets
+        :rtype: list
+        """
+        frequent = set(level)
+        cands = []
+        start = 0
+        for end in range(1, len(level) + 1):
+            if end < len(level) and level[end][:-1] == level[start][:-1]:
+                continue
+            for i in range(start, end):
+                for j in range(i + 1, end):
+                    cand = level[i] + (level[j][-1],)
+                    if all(cand[:x] + cand[x + 1:] in frequent for x in range(len(cand) - 2)):
+                        cands.append((cand, i, j))
+            start = end
+        return cands
+
+    @staticmethod
+    def _countPairs(transactions: list, nItems: int, limit: int = 1 << 22) -> tuple:
+        """
+        Counts the support of every pair of items that occurs in a transaction. The pairs of a transaction are mapped
+        to their position in the upper triangle of an nItems x nItems matrix, and the positions of a block of
+        transactions are counted with np.unique. The counts are kept in a dense triangle when it has at most limit
+        entries, and otherwise in a sorted array of the positions seen so far, so that the memory grows with the number
+        of distinct pairs instead of the square of the number of items.
+
+        :param transactions: the transactions as sorted arrays of item ranks
+        :type transactions: list
+        :param nItems: number of frequent items
+        :type nItems: int
+        :param limit: largest number of entries of the dense triangle
+        :type limit: int
+        :return: the positions of the pairs (a, b), a < b, in lexicographic order and their supports
+        :rtype: tuple(numpy.ndarray, numpy.ndarray)
+        """
+        rowStart = _ab._np.arange(nItems, dtype=_ab._np.int64)
+        rowStart = rowStart * nItems - rowStart * (rowStart + 1) // 2 - rowStart - 1
+        size = nItems * (nItems - 1) // 2
+        dense = _ab._np.zeros(size, dtype=_ab._np.int64) if size <= limit else None
+        positions = _ab._np.zeros(0, dtype=_ab._np.int64)
+        counts = _ab._np.zeros(0, dtype=_ab._np.int64)
+
+        def flush(block):
+            nonlocal positions, counts
+            keys, values = _ab._np.unique(_ab._np.concatenate(block), return_counts=True)
+            if dense is not None:
+                dense[keys] += values
+                return
+            keys, inverse = _ab._np.unique(_ab._np.concatenate([positions, keys]), return_inverse=True)
+            counts = _ab._np.bincount(inverse, weights=_ab._np.concatenate([counts, values]),
+                                      minlength=len(keys)).astype(_ab._np.int64)
+            positions = keys
+
+        pairs = {}
+        block = []
+        blockSize = 0
+        for transaction in transactions:
+            if len(transaction) not in pairs:
+                pairs[len(transaction)] = _ab._np.triu_indices(len(transaction), 1)
+            first, second = pairs[len(transaction)]
+            block.append(rowStart[transaction[first]] + transaction[second])
+            blockSize += len(first)
+            if blockSize >= 1 << 20:
+                flush(block)
+                block = []
+                blockSize = 0
+        if block:
+            flush(block)
+        if dense is not None:
+            positions = _ab._np.flatnonzero(dense)
+            counts = dense[positions]
+        return positions, counts
+
+    def _countTrie(self, cands: list, transactions: list) -> list:
+        """
+        Counts the support of the candidates by walking every transaction down a prefix trie of the candidates.
+
+        :param cands: the candidates as sorted tuples of item ranks, all of the same length
+        :type cands: list
+        :param transactions: the transactions as sorted tuples of item ranks
+        :type transactions: list
+        :return: the support of every candidate
+        :rtype: list
+        """
+        trie = {}
+        for index, cand in enumerate(cands):
+            node = trie
+            for item in cand[:-1]:
+                node = node.setdefault(item, {})
+            node[cand[-1]] = index
+        counts = [0] * len(cands)
+        depth = len(cands[0])
+        for transaction in transactions:
+            self.__walk(trie, transaction, 0, depth, counts)
+        return counts
+
+    def __walk(self, node: dict, transaction: tuple, start: int, depth: int, counts: list) -> None:
+        """
+        Increments the counts of the candidates below node that are contained in transaction[start:].
+
+        :param node: a node of the prefix trie
+        :type node: dict
+        :param transaction: a sorted tuple of item ranks
+        :type transaction: tuple
+        :param start: first position of the transaction that may extend the path of node
+        :type start: int
+        :param depth: number of items still to match
+        :type depth: int
+        :param counts: supports of the candidates
+        :type counts: list
+        :return: None
+        """
+        if depth == 1:
+            for item in transaction[start:]:
+                index = node.get(item)
+                if index is not None:
+                    counts[index] += 1
+            return
+        for i in range(start, len(transaction) - depth + 1):
+            child = node.get(transaction[i])
+            if child is not None:
+                self.__walk(child, transaction, i + 1, depth - 1, counts)
+
     def mine(self, memorySaver = True) -> None:
         """
         Frequent pattern mining process will start from here
 
+        Candidates are generated level by level by joining the frequent itemsets that share a prefix, and are pruned
+        when one of their subsets is infrequent.
+
         Attributes
         ----------
         memorySaver : bool
             This attribute is used to enable or disable memory saving mode. By default, it is enabled.
-            It saves the memory by deleting the intermediate results after the completion of the mining process.
+            If enabled, no tidsets are kept: pairs are counted in a triangular array, or in a sorted array of the
+            pairs that occur when there are too many items, and longer candidates with a prefix trie walked by every
+            transaction, and transactions are reduced to the items still frequent.
+            Otherwise, the tidsets of the previous level are kept as sorted arrays and intersected.
         """
         self._Database = []
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._patternSink()
 
         self._creatingItemSets()
+        self._dbSize = len(self._Database)
 
         self._minSup = self._convert(self._minSup)
 
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
-
-        # sort by length in descending order
-        items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
+        tids = {}
+        for index, line in enumerate(self._Database):
+            for item in set(line):
+                if item not in tids:
+                    tids[item] = []
+                tids[item].append(index)
 
-        cands = []
-        fileData = {}
-        for key in items:
-            if len(items[key]) >= self._minSup:
-                cands.append(key)
-                # self._finalPatterns["\t".join(key)] = len(items[key])
-                self._finalPatterns[key] = len(items[key])
-                fileData[key] = set(items[key])
-            else:
-                break
+        # items are ranked by descending support
+        items = sorted([x for x in tids if len(tids[x]) >= self._minSup], key=lambda x: len(tids[x]), reverse=True)
+        ranks = {item: rank for rank, item in enumerate(items)}
+        for item in items:
+            self._finalPatterns[(item,)] = len(tids[item])
+        level = [(rank,) for rank in range(len(items))]
 
         if memorySaver:
-            while cands:
-                newKeys = []
-                for i in range(len(cands)):
-                    for j in range(i + 1, len(cands)):
-                        if cands[i][:-1] == cands[j][:-1]:
-                            newCand = cands[i] + tuple([cands[j][-1]])
-                            intersection = fileData[tuple([newCand[0]])]
-                            for k in range(1, len(newCand)):
-                                intersection = intersection.intersection(fileData[tuple([newCand[k]])])
-                            if len(intersection) >= self._minSup:
-                                newKeys.append(newCand)
-                                self._finalPatterns[newCand] = len(intersection)
-                del cands
-                cands = newKeys
-                del newKeys
+            transactions = []
+            for line in self._Database:
+                transaction = sorted(ranks[item] for item in set(line) if item in ranks)
+                if len(transaction) > 1:
+                    transactions.append(_ab._np.array(transaction, dtype=_ab._np.int64))
+            positions, counts = self._countPairs(transactions, len(items))
+            keep = counts >= self._minSup
+            frequent, counts = positions[keep], counts[keep]
+            rowStart = _ab._np.arange(len(items), dtype=_ab._np.int64)
+            rowStart = rowStart * len(items) - rowStart * (rowStart + 1) // 2
+            first = _ab._np.searchsorted(rowStart, frequent, side='right') - 1
+            second = frequent - rowStart[first] + first + 1
+            level = list(zip(first.tolist(), second.tolist()))
+            for cand, count in zip(level, counts.tolist()):
+                self._finalPatterns[tuple(items[x] for x in cand)] = count
+            transactions = [tuple(x.tolist()) for x in transactions]
+            while len(level) > 1:
+                cands = [cand for cand, _, _ in self._join(level)]
+                if not cands:
+                    break
+                used = set(x for cand in cands for x in cand)
+                depth = len(cands[0])
+                transactions = [t for t in (tuple(x for x in t if x in used) for t in transactions) if len(t) >= depth]
+                counts = self._countTrie(cands, transactions)
+                level = []
+                for cand, count in zip(cands, counts):
+                    if count >= self._minSup:
+                        level.append(cand)
+                        self._finalPatterns[tuple(items[x] for x in cand)] = count
         else:
-            while cands:
-                newKeys = []
-                for i in range(len(cands)):
-                    for j in range(i + 1, len(cands)):
-                        if cands[i][:-1] == cands[j][:-1]:
-                            newCand = cands[i] + tuple([cands[j][-1]])
-                            intersection = fileData[cands[i]] & fileData[cands[j]]
-                            # intersection = fileData[tuple([newCand[0]])]
-                            # for k in range(1, len(newCand)):
-                                # intersection = intersection.intersection(fileData[tuple([newCand[k]])])
-                            if len(intersection) >= self._minSup:
-                                newKeys.append(newCand)
-                                self._finalPatterns[newCand] = len(intersection)
-                                fileData[newCand] = intersection
-                del cands
-                cands = newKeys
-                del newKeys
-        
+            tidsets = [_ts.fromList(tids[item]) for item in items]
+            while len(level) > 1:
+                newLevel = []
+                newTidsets = []
+                for cand, i, j in self._join(level):
+                    intersection = _ts.intersect(tidsets[i], tidsets[j])
+                    if len(intersection) >= self._minSup:
+                        newLevel.append(cand)
+                        newTidsets.append(intersection)
+                        self._finalPatterns[tuple(items[x] for x in cand)] = len(intersection)
+                level = newLevel
+                tidsets = newTidsets
+
+        if self._sink is not None:
+            self._sink.close()
+        elif isinstance(self._iFile, _ab._TransactionStore):
+            self._finalPatterns = self._iFile.decodePatterns(self._finalPatterns)
 
         process = _ab._psutil.Process(_ab._os.getpid())
         self._endTime = _ab._time.time()
@@ -52,6 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.basic import abstract as _ab
+from PAMI.extras import bitset as _bs
 from deprecated import deprecated
 
 
@@ -136,6 +137,9 @@ class Aprioribitset(_ab._frequentPatterns):
 
     """
 
+    _readsStore = True
+    _emitsToSink = True
+
     _startTime = float()
     _endTime = float()
     _finalPatterns = {}
@@ -176,6 +180,9 @@ class Aprioribitset(_ab._frequentPatterns):
         """
         self._Database = []
         self._mapSupport = {}
+        if isinstance(self._iFile, _ab._TransactionStore):
+            # the tid lists are taken from the arrays of the store, len() gives the number of transactions
+            self._Database = self._iFile
         if isinstance(self._iFile, _ab._pd.DataFrame):
             #temp = []
             if self._iFile.empty:
@@ -213,91 +220,104 @@ class Aprioribitset(_ab._frequentPatterns):
     def startMine(self):
         self.mine()
 
-    def _bitPacker(self, data, maxIndex):
+    def _tidLists(self):
         """
-        It takes the data and maxIndex as input and generates integer as output value.
+        Collects the transaction ids of every item and keeps the frequent items, ordered by descending support.
 
-        :param data: it takes data as input.
-        :type data: int or float
-        :param maxIndex: It converts the data into bits By taking the maxIndex value as condition.
-        :type maxIndex: int
+        :return: the frequent items and their lists of transaction ids
+        :rtype: tuple
+        """
+        if isinstance(self._iFile, _ab._TransactionStore):
+            tids = dict(enumerate(self._iFile.tidLists()))
+        else:
+            tids = {}
+            for index, line in enumerate(self._Database):
+                for item in line:
+                    if item not in tids:
+                        tids[item] = [index]
+                    elif tids[item][-1] != index:
+                        tids[item].append(index)
+        frequent = sorted([x for x in tids if len(tids[x]) >= self._minSup], key=lambda x: len(tids[x]), reverse=True)
+        return frequent, [tids[x] for x in frequent]
+
+    @staticmethod
+    def _groups(cands):
         """
-        packed_bits = 0
-        for i in data:
-            packed_bits |= 1 << (maxIndex - i)
+        Splits the candidates of a level into runs sharing the same prefix. Candidates are generated in prefix order,
+        so every run is contiguous.
 
-        return packed_bits
+        :param cands: candidates of a level as tuples of item indices
+        :type cands: list
+        :return: (start, end) of every run
+        :rtype: list
+        """
+        groups = []
+        start = 0
+        for i in range(1, len(cands) + 1):
+            if i == len(cands) or cands[i][:-1] != cands[start][:-1]:
+                groups.append((start, i))
+                start = i
+        return groups
 
     def mine(self, memorySaver = True) -> None:
         """
         Frequent pattern mining process will start from here
+
+        The transaction ids of every frequent item are packed into a bitset of np.uint64 words. At every level the
+        candidates sharing a prefix are joined together: each member is intersected with all the following members
+        in one vectorised call.
+
+        :param memorySaver: if True, only the bitsets of single items are kept and the bitset of a prefix is computed
+                            once per group of candidates. Otherwise, the bitsets of the previous level are kept.
+        :type memorySaver: bool
+        :return: None
         """
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._patternSink()
 
         self._Database = []
 
         self._creatingItemSets()
-
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
-
-        # sort by length in descending order
-        items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
-        cands = []
-        for key in items:
-            if len(items[key]) >= self._minSup:
-                self._finalPatterns[key] = len(items[key])
-                cands.append(key)
-                items[key] = self._bitPacker(items[key], index)
-                # print(key, items[key])
-            else:
-                break
-
-        if memorySaver:
-            while cands:
-                newCands = []
-                for i in range(len(cands)):
-                    for j in range(i + 1, len(cands)):
-                        if cands[i][:-1] == cands[j][:-1]:
-                            newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                            intersection = items[tuple([newCand[0]])]
-                            for k in range(1, len(newCand)):
-                                intersection &= items[tuple([newCand[k]])]
-                            count = int.bit_count(intersection)
-                            if count >= self._minSup:
-                                newCands.append(newCand)
-                                self._finalPatterns[newCand] = count
-                        else:
-                            break
-
-                cands = newCands
-        else:
-            while cands:
-                newCands = []
-                for i in range(len(cands)):
-                    for j in range(i + 1, len(cands)):
-                        if cands[i][:-1] == cands[j][:-1]:
-                            newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                            # intersection = items[tuple([newCand[0]])]
-                            # for k in range(1, len(newCand)):
-                            #     intersection &= items[tuple([newCand[k]])]
-                            intersection = items[cands[i]] & items[cands[j]]
-                            count = int.bit_count(intersection)
-                            if count >= self._minSup:
-                                newCands.append(newCand)
-                                self._finalPatterns[newCand] = count
-                                items[newCand] = intersection
-                        else:
-                            break
-
-                cands = newCands
+        self._dbSize = len(self._Database)
+
+        items, tidLists = self._tidLists()
+        single = _bs.packLists(tidLists, len(self._Database))
+        for item, tids in zip(items, tidLists):
+            self._finalPatterns[(item,)] = len(tids)
+
+        cands = [(i,) for i in range(len(items))]
+        bits = single
+        while cands:
+            newCands = []
+            newBits = []
+            for start, end in self._groups(cands):
+                last = [cand[-1] for cand in cands[start:end]]
+                if memorySaver:
+                    prefixBits = None
+                    for k in cands[start][:-1]:
+                        prefixBits = single[k] if prefixBits is None else prefixBits & single[k]
+                    rows = single[last]
+                for i in range(end - start - 1):
+                    if memorySaver:
+                        member = rows[i] if prefixBits is None else prefixBits & rows[i]
+                        intersections, counts = _bs.andCount(member, rows[i + 1:])
+                    else:
+                        intersections, counts = _bs.andCount(bits[start + i], bits[start + i + 1:end])
+                    keep = _ab._np.flatnonzero(counts >= self._minSup)
+                    for k, count in zip(keep.tolist(), counts[keep].tolist()):
+                        newCand = cands[start + i] + (last[i + 1 + k],)
+                        newCands.append(newCand)
+                        self._finalPatterns[tuple(items[x] for x in newCand)] = count
+                    if not memorySaver and len(keep):
+                        newBits.append(intersections[keep])
+            cands = newCands
+            if not memorySaver:
+                bits = _ab._np.concatenate(newBits) if newBits else None
+
+        if self._sink is not None:
+            self._sink.close()
+        elif isinstance(self._iFile, _ab._TransactionStore):
+            self._finalPatterns = self._iFile.decodePatterns(self._finalPatterns)
 
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -417,7 +437,3 @@ if __name__ == "__main__":
     else:
         print("Error! The number of input parameters do not match the total number of parameters provided")
 
-
-    obj = Aprioribitset("/Users/tarunsreepada/Downloads/Transactional_T10I4D100K.csv", 75)
-    obj.mine(memorySaver=True)
-    print(obj.printResults())
\ No newline at end of file
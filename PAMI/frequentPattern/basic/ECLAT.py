@@ -52,6 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.basic import abstract as _ab
+from PAMI.extras import tidset as _ts
 from deprecated import deprecated
 
 class ECLAT(_ab._frequentPatterns):
@@ -133,6 +134,9 @@ class ECLAT(_ab._frequentPatterns):
 
     """
 
+    _readsStore = True
+    _emitsToSink = True
+
     _minSup = float()
     _startTime = float()
     _endTime = float()
@@ -153,6 +157,9 @@ class ECLAT(_ab._frequentPatterns):
         :rtype: float
         """
         self._Database = []
+        if isinstance(self._iFile, _ab._TransactionStore):
+            # the tid lists are taken from the arrays of the store, len() gives the number of transactions
+            self._Database = self._iFile
         if isinstance(self._iFile, _ab._pd.DataFrame):
             if self._iFile.empty:
                 print("its empty..")
@@ -251,29 +258,90 @@ class ECLAT(_ab._frequentPatterns):
                 if len(newCands) > 1:
                     self.__recursive(items, newCands, memorySaver)
 
-    def mine(self, memorySaver = True) -> None:
+    def __hybrid(self, prefix, items, sets, supports, diffsets):
+        """
+
+        Mines the equivalence class of prefix over sorted array tidsets. A class is stored either with tidsets or with
+        diffsets (the transactions of the prefix missing from the member). A tidset class switches its children to
+        diffsets as soon as these are smaller in total than the tidsets; diffset classes stay diffsets.
+
+        :param prefix: the items shared by all the members of the class
+        :type prefix: tuple
+        :param items: the last item of every member of the class
+        :type items: list
+        :param sets: the tidset or diffset of every member
+        :type sets: list
+        :param supports: the support of every member
+        :type supports: list
+        :param diffsets: True if the members are stored as diffsets
+        :type diffsets: bool
+        :return: None
+        """
+        for i in range(len(items) - 1):
+            newItems, newSets, newSupports = [], [], []
+            tidsetSize, diffsetSize = 0, 0
+            for j in range(i + 1, len(items)):
+                if diffsets:
+                    newSet = _ts.difference(sets[j], sets[i])
+                    support = supports[i] - len(newSet)
+                else:
+                    newSet = _ts.isin(sets[i], sets[j])
+                    support = int(_ab._np.count_nonzero(newSet))
+                if support >= self._minSup:
+                    newItems.append(items[j])
+                    newSets.append(newSet)
+                    newSupports.append(support)
+                    tidsetSize += support
+                    diffsetSize += supports[i] - support
+            if not newItems:
+                continue
+            newPrefix = prefix + (items[i],)
+            for item, support in zip(newItems, newSupports):
+                self._finalPatterns[newPrefix + (item,)] = support
+            if len(newItems) < 2:
+                continue
+            childDiffsets = diffsets
+            if not diffsets:
+                childDiffsets = diffsetSize < tidsetSize
+                newSets = [sets[i][~mask] if childDiffsets else sets[i][mask] for mask in newSets]
+            self.__hybrid(newPrefix, newItems, newSets, newSupports, childDiffsets)
+
+    def mine(self, memorySaver = True, hybrid = False) -> None:
         """
         Frequent pattern mining process will start from here
+
+        :param memorySaver: if True, the tidset of a candidate is recomputed from the tidsets of its items instead of
+                            keeping the tidsets of the depth first search path
+        :type memorySaver: bool
+        :param hybrid: if True, tidsets are stored as sorted np.int32 arrays and every branch switches to diffsets once
+                       they are smaller than the tidsets, which suits databases with both dense and sparse regions
+        :type hybrid: bool
+        :return: None
         """
 
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._patternSink()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
         self._creatingItemSets()
+        self._dbSize = len(self._Database)
 
         self._minSup = self._convert(self._minSup)
 
     
         items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if item not in items:
-                    items[item] = []
-                items[item].append(index)
-            index += 1
+        if isinstance(self._iFile, _ab._TransactionStore):
+            items = {k: v.tolist() for k, v in enumerate(self._iFile.tidLists())}
+        else:
+            index = 0
+            for line in self._Database:
+                for item in line:
+                    if item not in items:
+                        items[item] = []
+                    items[item].append(index)
+                index += 1
         
         items = {tuple([k]): set(v) for k, v in items.items() if len(v) >= self._minSup}
         items = {k: v for k, v in sorted(items.items(), key=lambda item_: len(item_[1]), reverse=False)}
@@ -282,8 +350,16 @@ class ECLAT(_ab._frequentPatterns):
 
         cands = list(items.keys())
 
-        self.__recursive(items, cands, memorySaver)
+        if hybrid:
+            self.__hybrid((), [k[0] for k in cands], [_ts.fromList(sorted(v)) for v in items.values()],
+                          [len(v) for v in items.values()], False)
+        else:
+            self.__recursive(items, cands, memorySaver)
 
+        if self._sink is not None:
+            self._sink.close()
+        elif isinstance(self._iFile, _ab._TransactionStore):
+            self._finalPatterns = self._iFile.decodePatterns(self._finalPatterns)
 
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
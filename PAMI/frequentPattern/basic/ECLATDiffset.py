@@ -136,6 +136,9 @@ class ECLATDiffset(_ab._frequentPatterns):
 
     """
 
+    _readsStore = True
+    _emitsToSink = True
+
     _minSup = float()
     _startTime = float()
     _endTime = float()
@@ -158,6 +161,9 @@ class ECLATDiffset(_ab._frequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
+        if isinstance(self._iFile, _ab._TransactionStore):
+            # the tid lists are taken from the arrays of the store, len() gives the number of transactions
+            self._Database = self._iFile
         if isinstance(self._iFile, _ab._pd.DataFrame):
             if self._iFile.empty:
                 print("its empty..")
@@ -247,7 +253,7 @@ class ECLATDiffset(_ab._frequentPatterns):
 
         self._startTime = _ab._time.time()
         self._Database = []
-        self._finalPatterns = {}
+        self._finalPatterns = self._patternSink()
         self._diffSets = {}
         self._trans_set = set()
 
@@ -256,17 +262,21 @@ class ECLATDiffset(_ab._frequentPatterns):
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
         self._creatingItemSets()
+        self._dbSize = len(self._Database)
         #print(len(self._Database))
         self._minSup = self._convert(self._minSup)
 
         items = {}
         db = set([i for i in range(len(self._Database))])
-        for i in range(len(self._Database)):
-            for item in self._Database[i]:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(i)
-                else:
-                    items[tuple([item])] = [i]
+        if isinstance(self._iFile, _ab._TransactionStore):
+            items = {tuple([k]): v.tolist() for k, v in enumerate(self._iFile.tidLists())}
+        else:
+            for i in range(len(self._Database)):
+                for item in self._Database[i]:
+                    if tuple([item]) in items:
+                        items[tuple([item])].append(i)
+                    else:
+                        items[tuple([item])] = [i]
         
         items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
 
@@ -285,6 +295,11 @@ class ECLATDiffset(_ab._frequentPatterns):
 
         self.__recursive(items, keys)
 
+        if self._sink is not None:
+            self._sink.close()
+        elif isinstance(self._iFile, _ab._TransactionStore):
+            self._finalPatterns = self._iFile.decodePatterns(self._finalPatterns)
+
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -52,6 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.basic import abstract as _ab
+from PAMI.extras import bitset as _bs
 from deprecated import deprecated
 
 
@@ -133,6 +134,9 @@ class ECLATbitset(_ab._frequentPatterns):
 
     """
 
+    _readsStore = True
+    _emitsToSink = True
+
     _startTime = float()
     _endTime = float()
     _finalPatterns = {}
@@ -174,6 +178,9 @@ class ECLATbitset(_ab._frequentPatterns):
         """
         self._Database = []
         self._mapSupport = {}
+        if isinstance(self._iFile, _ab._TransactionStore):
+            # the tid lists are taken from the arrays of the store, len() gives the number of transactions
+            self._Database = self._iFile
         if isinstance(self._iFile, _ab._pd.DataFrame):
             if self._iFile.empty:
                 print("its empty..")
@@ -215,97 +222,85 @@ class ECLATbitset(_ab._frequentPatterns):
         """
         self.mine()
 
-    def _bitPacker(self, data, maxIndex):
+    def _tidLists(self):
         """
+        Collects the transaction ids of every item and keeps the frequent items, ordered by descending support.
 
-        It takes the data and maxIndex as input and generates integer as output value.
-
-        :param data: it takes data as input.
-        :type data: int or float
-        :param maxIndex: It converts the data into bits By taking the maxIndex value as condition.
-        :type maxIndex: int
+        :return: the frequent items and their lists of transaction ids
+        :rtype: tuple
         """
-        packed_bits = 0
-        for i in data:
-            packed_bits |= 1 << (maxIndex - i)
-
-        return packed_bits
-    
-    def __recursive(self, items, cands, memorySaver):
+        if isinstance(self._iFile, _ab._TransactionStore):
+            tids = dict(enumerate(self._iFile.tidLists()))
+        else:
+            tids = {}
+            for index, line in enumerate(self._Database):
+                for item in line:
+                    if item not in tids:
+                        tids[item] = [index]
+                    elif tids[item][-1] != index:
+                        tids[item].append(index)
+        frequent = sorted([x for x in tids if len(tids[x]) >= self._minSup], key=lambda x: len(tids[x]), reverse=True)
+        return frequent, [tids[x] for x in frequent]
+
+    def __recursive(self, prefix, items, bits):
         """
 
-        This function generates new candidates by taking input as original candidates.
+        Mines the equivalence class of prefix. The bitset of every member is the intersection of the prefix with the
+        member item, so each extension costs a single AND. All the extensions of a member are intersected and counted
+        in one vectorised call, and only the frequent ones are kept for the next level of the depth first search.
 
-        :param items: A dictionary containing items and their corresponding support values.
-        :type items: dict
-        :param cands: A list of candidate itemsets.
-        :type cands: list
+        :param prefix: the items shared by all the members of the class
+        :type prefix: tuple
+        :param items: the last item of every member of the class
+        :type items: list
+        :param bits: the bitset of every member of the class, one row per member
+        :type bits: numpy.ndarray
         :return: None
         """
 
-        if memorySaver:
-            for i in range(len(cands)):
-                newCands = []
-                for j in range(i + 1, len(cands)):
-                    newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                    intersection = items[tuple([newCand[0]])]
-                    for k in newCand[1:]:
-                        intersection &= items[tuple([k])]
-                    count = int.bit_count(intersection)
-                    if count >= self._minSup:
-                        newCands.append(newCand)
-                        self._finalPatterns[newCand] = count
-                if len(newCands) > 1:
-                    self.__recursive(items, newCands, memorySaver)
-        else:
-            for i in range(len(cands)):
-                newCands = []
-                for j in range(i + 1, len(cands)):
-                    newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                    intersection = items[cands[i]] & items[cands[j]]
-                    count = int.bit_count(intersection)
-                    if count >= self._minSup:
-                        newCands.append(newCand)
-                        self._finalPatterns[newCand] = count
-                        items[newCand] = intersection
-                if len(newCands) > 1:
-                    self.__recursive(items, newCands, memorySaver)
+        for i in range(len(items) - 1):
+            intersections, counts = _bs.andCount(bits[i], bits[i + 1:])
+            keep = _ab._np.flatnonzero(counts >= self._minSup)
+            if len(keep) == 0:
+                continue
+            newPrefix = prefix + (items[i],)
+            newItems = [items[i + 1 + k] for k in keep]
+            for item, count in zip(newItems, counts[keep].tolist()):
+                self._finalPatterns[newPrefix + (item,)] = count
+            if len(keep) > 1:
+                self.__recursive(newPrefix, newItems, intersections[keep])
 
     def mine(self, memorySaver = True) -> None:
         """
         Frequent pattern mining process will start from here
-        # Bitset implementation
+
+        The transaction ids of every frequent item are packed into a bitset of np.uint64 words, and the equivalence
+        classes are mined depth first over these bitsets.
+
+        :param memorySaver: kept for compatibility. The bitsets of the current depth first search path are always
+                            cached, and only the intersections of frequent patterns are kept.
+        :type memorySaver: bool
+        :return: None
         """
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._patternSink()
 
         self._Database = []
 
         self._creatingItemSets()
+        self._dbSize = len(self._Database)
 
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
-
-        # sort by length in descending order
-        items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
-        cands = []
-        for key in list(items.keys()):
-            if len(items[key]) >= self._minSup:
-                self._finalPatterns[key] = len(items[key])
-                cands.append(key)
-                items[key] = self._bitPacker(items[key], index)
-            else:
-                break
+        items, tidLists = self._tidLists()
+        bits = _bs.packLists(tidLists, len(self._Database))
+        for item, tids in zip(items, tidLists):
+            self._finalPatterns[(item,)] = len(tids)
 
+        self.__recursive((), items, bits)
 
-        self.__recursive(items, cands, memorySaver)
-        
+        if self._sink is not None:
+            self._sink.close()
+        elif isinstance(self._iFile, _ab._TransactionStore):
+            self._finalPatterns = self._iFile.decodePatterns(self._finalPatterns)
 
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -55,62 +55,32 @@ from PAMI.frequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Any
 from deprecated import deprecated
 from itertools import combinations
+from math import comb
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 _minSup = str()
 _fp._sys.setrecursionlimit(20000)
 
 
-class _Node:
+def _mineConditionalBase(prefix, tree, names, minSup):
     """
-    A class used to represent the node of frequentPatternTree
-
-    :**Attributes**:    - **itemId** (*int*) -- *storing item of a node.*
-                        - **counter** (*int*) -- *To maintain the support of node.*
-                        - **parent** (*node*) -- *To maintain the parent of node.*
-                        - **children** (*list*) -- *To maintain the children of node.*
-
-    :**Methods**:   - **addChild(node)** -- *Updates the nodes children list and parent for the given node.*
+    Mines one conditional tree in a worker process.
+
+    :param prefix: The items of the pattern whose conditional tree is given.
+    :type prefix: List
+    :param tree: The conditional tree.
+    :type tree: FPTree
+    :param names: The name of every item of the tree.
+    :type names: List
+    :param minSup: The minimum support threshold in count.
+    :type minSup: int
+    :return: The frequent patterns that extend the prefix.
+    :rtype: Dict
     """
-
-    def __init__(self, item, count, parent) -> None:
-        self.item = item
-        self.count = count
-        self.parent = parent
-        self.children = {}
-
-    def addChild(self, item, count = 1) -> Any:
-        """
-
-        Adds a child node to the current node with the specified item and count.
-
-        :param item: The item associated with the child node.
-        :type item: List
-        :param count: The count or support of the item. Default is 1.
-        :type count: int
-        :return: The child node added.
-        :rtype: List
-        """
-        if item not in self.children:
-            self.children[item] = _Node(item, count, self)
-        else:
-            self.children[item].count += count
-        return self.children[item]
-    
-    def traverse(self) -> Tuple[List[int], int]:
-        """
-        Traversing the tree to get the transaction
-
-        :return: transaction and count of each item in transaction
-        :rtype: Tuple, List and int
-        """
-        transaction = []
-        count = self.count
-        node = self.parent
-        while node.parent is not None:
-            transaction.append(node.item)
-            node = node.parent
-        return transaction[::-1], count
+    miner = FPGrowth(None, minSup)
+    miner._recursive(tree, names, prefix, minSup)
+    return miner._finalPatterns
 
 
 class FPGrowth(_fp._frequentPatterns):
@@ -126,6 +96,8 @@ class FPGrowth(_fp._frequentPatterns):
                         - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
                         - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
                         - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **nJobs** (*int*) -- *Number of worker processes that mine the conditional pattern bases. The default value 1 mines in the calling process.*
+                        - **executor** (*concurrent.futures.Executor*) -- *An existing pool to mine the conditional pattern bases with, e.g., one ProcessPoolExecutor shared by several runs. It is not shut down by FPGrowth.*
 
     :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
                         - **endTime** (*float*) -- *To record the completion time of the mining process.*
@@ -135,6 +107,11 @@ class FPGrowth(_fp._frequentPatterns):
                         - **Database** (*list*) -- *To store the transactions of a database in list.*
                         - **mapSupport** (*Dictionary*) -- *To maintain the information of item and their frequency.*
                         - **tree** (*class*) --  *it represents the Tree class.*
+                        - **patternCounts** (*dict*) -- *Number of frequent patterns of every length found by a count-only run.*
+
+    :**Methods**:       - **mine(countOnly)** -- *Mining process will start from here. If countOnly is True, the patterns are only counted by length.*
+                        - **countPatterns(minSups)** -- *Counts the patterns of every length for several minimum supports from one FP-tree.*
+                        - **getPatternCounts()** -- *Number of frequent patterns of every length found by the last run.*
 
 
     **Execution methods**
@@ -195,6 +172,9 @@ class FPGrowth(_fp._frequentPatterns):
 
     """
 
+    _readsStore = True
+    _emitsToSink = True
+
     __startTime = float()
     __endTime = float()
     _minSup = str()
@@ -209,15 +189,20 @@ class FPGrowth(_fp._frequentPatterns):
     __lno = 0
     __rank = {}
     __rankDup = {}
+    _patternCounts = {}
 
-    def __init__(self, iFile, minSup, sep='\t') -> None:
+    def __init__(self, iFile, minSup, sep='\t', nJobs=1, executor=None) -> None:
         super().__init__(iFile, minSup, sep)
+        self._nJobs = nJobs
+        self._executor = executor
 
     def __creatingItemSets(self) -> None:
         """
         Storing the complete transactions of the database/input file in a database variable
         """
         self.__Database = []
+        if isinstance(self._iFile, _fp._TransactionStore):
+            self.__Database = self._iFile.transactionLists()
         if isinstance(self._iFile, _fp._pd.DataFrame):
             if self._iFile.empty:
                 print("its empty..")
@@ -274,7 +259,8 @@ class FPGrowth(_fp._frequentPatterns):
     
     def _construct(self, items, data, minSup):
         """
-        Constructs the FP-tree from the given transactions.
+        Constructs the FP-tree from the given transactions. The frequent items are numbered in the order given by
+        _rank, so that every transaction is inserted as an ascending sequence of item numbers.
 
         :param items: A dictionary containing item frequencies.
         :type items: Dict
@@ -282,26 +268,15 @@ class FPGrowth(_fp._frequentPatterns):
         :type data: List
         :param minSup: The minimum support threshold.
         :type minSup: int
-        :return: The root node of the constructed FP-tree and a dictionary containing information about nodes associated with each item.
-        :rtype: Tuple[_Node, Dict]
+        :return: The FP-tree and the name of every item number.
+        :rtype: Tuple[FPTree, List]
         """
 
         items = {k: v for k, v in items.items() if v >= minSup}
-
-        root = _Node([], 0, None)
-        itemNodes = {}
-        for line in data:
-            currNode = root
-            line = sorted([item for item in line if item in items], key = lambda x: items[x], reverse = True)
-            for item in line:
-                currNode = currNode.addChild(item)
-                if item in itemNodes:
-                    itemNodes[item][0].add(currNode)
-                    itemNodes[item][1] += 1
-                else:
-                    itemNodes[item] = [set([currNode]), 1]
-
-        return root, itemNodes
+        rank = self._rank(items)
+        names = sorted(rank, key = rank.__getitem__)
+        transactions = [sorted([rank[item] for item in line if item in rank]) for line in data]
+        return _fp._FPTree.fromTransactions(transactions, numItems = len(names)), names
 
     def _all_combinations(self, arr):
         """
@@ -319,98 +294,189 @@ class FPGrowth(_fp._frequentPatterns):
             all_combinations_list.extend(combinations(arr, r))
         return all_combinations_list
     
-    def _recursive(self, root, itemNode, minSup, patterns):
+    def _rank(self, items):
         """
 
-         Recursively explores the FP-tree to generate frequent patterns.
+        Orders the items by decreasing support, breaking ties by the item itself, so that every transaction is
+        inserted into a tree in the same global order.
+
+        :param items: A dictionary containing item frequencies.
+        :type items: Dict
+        :return: A dictionary mapping every item to its position in the order.
+        :rtype: Dict
+        """
+        return {item: i for i, item in enumerate(sorted(items, key = lambda x: (-items[x], x)))}
+
+    def _conditionalBases(self, tree, names, prefix, minSup, items = None):
+        """
+
+         Records the patterns formed by every item of a tree and yields the conditional tree of every item that still
+         has to be mined. An item with a single node only forms patterns with the items of its path, which are
+         recorded directly.
 
-         :param root: The root node of the current subtree.
-         :type root: _Node
-         :param itemNode: A dictionary containing information about the nodes associated with each item.
-         :type itemNode: Dict
+         :param tree: The current FP-tree.
+         :type tree: FPTree
+         :param names: The name of every item of the tree.
+         :type names: List
+         :param prefix: The items of the pattern whose conditional tree is given.
+         :type prefix: List
          :param minSup: The minimum support threshold.
          :type minSup: int
-         :param patterns: A dictionary to store the generated frequent patterns.
-         :type patterns: Dict
-        """
-        itemNode = {k: v for k, v in sorted(itemNode.items(), key = lambda x: x[1][1])}
-
-        for item in itemNode:
-            if itemNode[item][1] < self._minSup:
-                break 
-
-            newRoot = _Node(root.item + [item], 0, None)
-            # pat = "\t".join([str(i) for i in newRoot.item])
-            # self.__finalPatterns[pat] = itemNode[item][1]
-            self._finalPatterns[tuple(newRoot.item)] = itemNode[item][1]
-            newItemNode = {}
-
-            if len(itemNode[item][0]) == 1:
-                transaction, count = itemNode[item][0].pop().traverse()
-                if len(transaction) == 0:
-                    continue
-                combination = self._all_combinations(transaction)
-                for comb in combination:
-                    # pat = "\t".join([str(i) for i in comb])
-                    # pat = pat + "\t" + "\t".join([str(i) for i in newRoot.item])
-                    # self.__finalPatterns[pat] = count
-                    self._finalPatterns[tuple(list(comb) + newRoot.item)] = count
-                pass
-
-
-            itemCount = {}
-            transactions = {}
-            for node in itemNode[item][0]:
-                transaction, count = node.traverse()
-                if len(transaction) == 0:
-                    continue
-                if tuple(transaction) in transactions:
-                    transactions[tuple(transaction)] += count
-                else:
-                    transactions[tuple(transaction)] = count
-
-
-                for transaction_item in transaction:
-                    if transaction_item in itemCount:
-                        itemCount[transaction_item] += count
-                    else:
-                        itemCount[transaction_item] = count
-
-
-            # remove items that are below minSup
-            itemCount = {k: v for k, v in itemCount.items() if v >= minSup}
-            if len(itemCount) == 0:
+         :param items: The items to visit, in the order of the visit. All the items of the tree by default.
+         :type items: Iterable
+         :return: A generator of (prefix, tree, names) tuples of the conditional trees.
+         :rtype: Generator
+        """
+        support = tree.support.tolist()
+        # the items are numbered by decreasing support, the least frequent items are mined first
+        for item in (range(tree.numItems - 1, -1, -1) if items is None else items):
+            if support[item] < minSup:
                 continue
 
-            for transaction, count in transactions.items():
-                transaction = sorted([item for item in transaction if item in itemCount], key = lambda x: itemCount[x], reverse = True)
-                currNode = newRoot
-                for item_ in transaction:
-                    currNode = currNode.addChild(item_, count)
-                    if item_ in newItemNode:
-                        newItemNode[item_][0].add(currNode)
-                        newItemNode[item_][1] += count
-                    else:
-                        newItemNode[item_] = [set([currNode]), count]
-
-            if len(newItemNode) < 1:
+            newPrefix = prefix + [names[item]]
+            self._finalPatterns[tuple(newPrefix)] = support[item]
+
+            nodes = tree.nodes(item)
+            if len(nodes) == 1:
+                count = int(tree.count[nodes[0]])
+                for comb in self._all_combinations([names[x] for x in tree.path(nodes[0])]):
+                    self._finalPatterns[tuple(list(comb) + newPrefix)] = count
+                continue
+
+            newTree, ids = tree.conditionalTree(item, minSup)
+            if len(newTree) == 0:
                 continue
 
-            # mine(newRoot, newItemNode, minSup, patterns)
-            self._recursive(newRoot, newItemNode, minSup, patterns)
+            yield newPrefix, newTree, [names[x] for x in ids.tolist()]
+
+    def _recursive(self, tree, names, prefix, minSup):
+        """
+
+         Recursively explores the FP-tree to generate frequent patterns.
 
+         :param tree: The current FP-tree.
+         :type tree: FPTree
+         :param names: The name of every item of the tree.
+         :type names: List
+         :param prefix: The items of the pattern whose conditional tree is given.
+         :type prefix: List
+         :param minSup: The minimum support threshold.
+         :type minSup: int
+        """
+        for newPrefix, newTree, newNames in self._conditionalBases(tree, names, prefix, minSup):
+            self._recursive(newTree, newNames, newPrefix, minSup)
 
-    def mine(self) -> None:
+    def _countPatterns(self, tree, depth, minSup, counts):
+        """
+
+         Counts the frequent patterns of a tree by length without generating them. The frequent items of a tree that
+         is a single path form a pattern with every subset of these items, so the patterns of l items are counted at
+         once as the binomial coefficient of the number of items and l. In the same way, an item with a single node
+         forms a pattern with every subset of the items of its path.
+
+         :param tree: The current FP-tree.
+         :type tree: FPTree
+         :param depth: The number of items of the pattern whose conditional tree is given.
+         :type depth: int
+         :param minSup: The minimum support threshold.
+         :type minSup: int
+         :param counts: A dictionary collecting the number of patterns of every length.
+         :type counts: Dict
+        """
+        if _fp._np.array_equal(tree.parent, _fp._np.arange(-1, len(tree), dtype=tree.parent.dtype)):
+            # the counts of a path do not increase, so its frequent items are the first ones
+            length = int(_fp._np.count_nonzero(tree.count[1:] >= minSup))
+            for size in range(1, length + 1):
+                counts[depth + size] = counts.get(depth + size, 0) + comb(length, size)
+            return
+        frequent = _fp._np.flatnonzero(tree.support >= minSup).tolist()
+        if not frequent:
+            return
+        numNodes = _fp._np.diff(tree.offsets).tolist()
+        counts[depth + 1] = counts.get(depth + 1, 0) + len(frequent)
+        for item in frequent:
+            if numNodes[item] == 1:
+                length = len(tree.path(int(tree.nodes(item)[0])))
+                for size in range(1, length + 1):
+                    counts[depth + 1 + size] = counts.get(depth + 1 + size, 0) + comb(length, size)
+                continue
+
+            newTree, _ = tree.conditionalTree(item, minSup)
+            if len(newTree) > 0:
+                self._countPatterns(newTree, depth + 1, minSup, counts)
+
+    def _partition(self, tree, names, prefix, minSup, budget, tasks):
+        """
+
+         Splits the mining of a tree into independent conditional trees. A conditional tree with more nodes than the
+         budget is split further by partitioning that tree, so that the few items with a very large conditional tree
+         do not end up as single long-running tasks.
+
+         :param tree: The current FP-tree.
+         :type tree: FPTree
+         :param names: The name of every item of the tree.
+         :type names: List
+         :param prefix: The items of the pattern whose conditional tree is given.
+         :type prefix: List
+         :param minSup: The minimum support threshold.
+         :type minSup: int
+         :param budget: The largest number of nodes of a conditional tree that is not split.
+         :type budget: int
+         :param tasks: A list collecting (size, prefix, tree, names) tuples.
+         :type tasks: List
+        """
+        for newPrefix, newTree, newNames in self._conditionalBases(tree, names, prefix, minSup):
+            if len(newTree) > budget:
+                self._partition(newTree, newNames, newPrefix, minSup, budget, tasks)
+            else:
+                tasks.append((len(newTree), newPrefix, newTree, newNames))
+
+    def _parallel(self, tree, names, minSup):
+        """
+
+         Mines the conditional trees of the tree with a pool of worker processes and merges their patterns.
+         The trees are submitted largest first; idle workers keep taking the next tree from the shared queue.
+
+         :param tree: The FP-tree.
+         :type tree: FPTree
+         :param names: The name of every item of the tree.
+         :type names: List
+         :param minSup: The minimum support threshold.
+         :type minSup: int
+        """
+        nJobs = self._nJobs if self._executor is None else getattr(self._executor, '_max_workers', self._nJobs)
+        tasks = []
+        self._partition(tree, names, [], minSup, max(1, len(tree) // (max(1, nJobs) * 8)), tasks)
+        tasks.sort(key = lambda x: x[0], reverse = True)
+
+        executor = self._executor if self._executor is not None else ProcessPoolExecutor(max_workers = self._nJobs)
+        try:
+            futures = [executor.submit(_mineConditionalBase, prefix, newTree, newNames, minSup)
+                       for _, prefix, newTree, newNames in tasks]
+            for future in as_completed(futures):
+                self._finalPatterns.update(future.result())
+        finally:
+            if self._executor is None:
+                executor.shutdown()
+
+    def mine(self, countOnly = False) -> None:
         """
         Main program to start the operation
+
+        :param countOnly: If True, only the number of patterns of every length is computed (see getPatternCounts) and
+                          no pattern is generated. Count-only mining runs in the calling process.
+        :type countOnly: bool
         """
         global _minSup
         self.__startTime = _fp._time.time()
+        self._finalPatterns = {} if countOnly else self._patternSink()
+        self._patternCounts = {}
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
         self.__creatingItemSets()
+        self._dbSize = len(self.__Database)
         self._minSup = self.__convert(self._minSup)
         _minSup = self._minSup
 
@@ -418,9 +484,21 @@ class FPGrowth(_fp._frequentPatterns):
         for line in self.__Database:
             itemCount.update(line)
 
-        root, itemNode = self._construct(itemCount, self.__Database, self._minSup)
-        self._recursive(root, itemNode, self._minSup, self.__finalPatterns)
-        
+        tree, names = self._construct(itemCount, self.__Database, self._minSup)
+        if countOnly:
+            self._countPatterns(tree, 0, self._minSup, self._patternCounts)
+            self._patternCounts = dict(sorted(self._patternCounts.items()))
+        elif self._nJobs > 1 or self._executor is not None:
+            self._parallel(tree, names, self._minSup)
+        else:
+            self._recursive(tree, names, [], self._minSup)
+        if countOnly:
+            pass
+        elif self._sink is not None:
+            self._sink.close()
+        elif isinstance(self._iFile, _fp._TransactionStore):
+            self._finalPatterns = self._iFile.decodePatterns(self._finalPatterns)
+
         print("Frequent patterns were generated successfully using frequentPatternGrowth algorithm")
         self.__endTime = _fp._time.time()
         self.__memoryUSS = float()
@@ -429,6 +507,45 @@ class FPGrowth(_fp._frequentPatterns):
         self.__memoryUSS = process.memory_full_info().uss
         self.__memoryRSS = process.memory_info().rss
 
+    def countPatterns(self, minSups) -> Dict:
+        """
+        Counts the frequent patterns of every length for several minimum supports. The database is read and the
+        FP-tree is built once for the lowest minimum support; the items of the tree are numbered by decreasing support,
+        so the tree can be mined with any higher minimum support as well.
+
+        :param minSups: The minimum supports, in count or proportion of the database size like minSup.
+        :type minSups: List
+        :return: A dictionary mapping every minimum support to the number of patterns of every length.
+        :rtype: Dict
+        """
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        self.__creatingItemSets()
+        self._dbSize = len(self.__Database)
+        thresholds = {minSup: self.__convert(minSup) for minSup in minSups}
+
+        itemCount = Counter()
+        for line in self.__Database:
+            itemCount.update(line)
+
+        tree, _ = self._construct(itemCount, self.__Database, min(thresholds.values()))
+        result = {}
+        for minSup, threshold in thresholds.items():
+            counts = {}
+            self._countPatterns(tree, 0, threshold, counts)
+            result[minSup] = dict(sorted(counts.items()))
+        return result
+
+    def getPatternCounts(self) -> Dict[int, int]:
+        """
+
+        Function to send the number of frequent patterns of every length after a count-only mining process
+
+        :return: returning the number of patterns of every length
+        :rtype: dict
+        """
+        return self._patternCounts
+
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
         """
@@ -519,7 +636,7 @@ class FPGrowth(_fp._frequentPatterns):
         """
         This function is used to print the results
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", sum(self._patternCounts.values()) or len(self.getPatterns()))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
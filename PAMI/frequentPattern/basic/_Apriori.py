@@ -280,6 +280,7 @@ class Apriori(_ab._frequentPatterns):
         self._Database = []
         self._startTime = _ab._time.time()
         self._creatingItemSets()
+        self._dbSize = len(self._Database)
         itemsList = sorted(list(set.union(*self._Database)))  # because Database is list
         items = [{i} for i in itemsList]
         itemsCount = len(items)
@@ -310,6 +311,7 @@ class Apriori(_ab._frequentPatterns):
         self._Database = []
         self._startTime = _ab._time.time()
         self._creatingItemSets()
+        self._dbSize = len(self._Database)
         itemsList = sorted(list(set.union(*self._Database)))  # because Database is list
         items = [{i} for i in itemsList]
         itemsCount = len(items)
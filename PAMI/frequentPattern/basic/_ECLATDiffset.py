@@ -284,6 +284,7 @@ class ECLATDiffset(_ab._frequentPatterns):
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
         self._creatingItemSets()
+        self._dbSize = len(self._Database)
         #print(len(self._Database))
         self._minSup = self._convert(self._minSup)
         #uniqueItemList = []
@@ -541,6 +541,7 @@ class FPGrowth(_fp._frequentPatterns):
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
         self.__creatingItemSets()
+        self._dbSize = len(self.__Database)
         self._minSup = self.__convert(self._minSup)
         _minSup = self._minSup
         itemSet = self.__frequentOneItem()
@@ -573,6 +574,7 @@ class FPGrowth(_fp._frequentPatterns):
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
         self.__creatingItemSets()
+        self._dbSize = len(self.__Database)
         self._minSup = self.__convert(self._minSup)
         _minSup = self._minSup
         itemSet = self.__frequentOneItem()
@@ -31,6 +31,7 @@ from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import csv as _csv
 import pandas as _pd
+import numpy as _np
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
@@ -40,6 +41,8 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import functools as _functools
+from PAMI.extras.TransactionStore import TransactionStore as _TransactionStore
+from PAMI.extras.FPTree import FPTree as _FPTree
 
 
 class _frequentPatterns(_ABC):
@@ -49,8 +52,11 @@ class _frequentPatterns(_ABC):
 
     :Attributes:
 
-        iFile : str
-            Input file name or path of the input file
+        iFile : str or DataFrame or TransactionStore
+            Input file name or path of the input file. An already loaded TransactionStore can be given instead so that
+            the database is parsed only once across several runs, and a binary database written by
+            TransactionStore.save() is memory-mapped instead of being parsed.
+            Miners that cannot read a TransactionStore (_readsStore is False) receive it decoded into a temporary text file
         minSup: integer or float or str
             The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
@@ -63,8 +69,8 @@ class _frequentPatterns(_ABC):
             To record the start time of the algorithm
         endTime:float
             To record the completion time of the algorithm
-        finalPatterns: dict
-            Storing the complete set of patterns in a dictionary variable
+        finalPatterns: dict or PatternSink
+            Storing the complete set of patterns in a dictionary variable, or the sink set with setSink()
         oFile : str
             Name of the output file to store complete set of frequent patterns
         memoryUSS : float
@@ -88,13 +94,22 @@ class _frequentPatterns(_ABC):
             This function outputs the total amount of RSS memory consumed by a mining algorithm
         getRuntime()
             This function outputs the total runtime of a mining algorithm
+        setSink(sink)
+            This function makes the algorithm emit its patterns to a sink (callback, file, Parquet or bounded collector)
+            while mining instead of keeping all of them in memory. Algorithms that do not set _emitsToSink raise
+            NotImplementedError
+        getDatabaseSize()
+            This function outputs the number of transactions of the database mined by the last run
 
     """
 
+    _readsStore = False
+    _emitsToSink = False
+
     def __init__(self, iFile, minSup, sep="\t"):
         """
-        :param iFile: Input file name or path of the input file
-        :type iFile: str or DataFrame
+        :param iFile: Input file name or path of the input file, a binary database or an already loaded TransactionStore
+        :type iFile: str or DataFrame or TransactionStore
         :param minSup: The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
             Otherwise, it will be treated as float.
@@ -104,6 +119,11 @@ class _frequentPatterns(_ABC):
         :type sep: str
         """
 
+        if _TransactionStore.isBinary(iFile):
+            iFile = _TransactionStore.fromBinary(iFile)
+        if isinstance(iFile, _TransactionStore) and not self._readsStore:
+            # miners that only parse text files read the store decoded into a temporary file
+            iFile = iFile.toTemporaryFile(self, sep, 'transactional')
         self._iFile = iFile
         self._sep = sep
         self._minSup = minSup
@@ -113,6 +133,45 @@ class _frequentPatterns(_ABC):
         self._memoryRSS = float()
         self._startTime = float()
         self._endTime = float()
+        self._sink = None
+        self._dbSize = None
+
+    def setSink(self, sink):
+        """
+        Sends the patterns to a sink while they are being mined instead of collecting them in a dictionary
+
+        :param sink: the sink receiving the patterns (see PAMI.extras.PatternSink), or None to collect them in a dictionary
+        :type sink: PatternSink
+        :raises NotImplementedError: if the algorithm only collects its patterns in a dictionary
+        """
+
+        if sink is not None and not self._emitsToSink:
+            raise NotImplementedError("%s does not send its patterns to a sink" % type(self).__name__)
+        self._sink = sink
+
+    def getDatabaseSize(self):
+        """
+        Number of transactions of the database mined by the last run
+
+        :return: the number of transactions, None before the first run
+        :rtype: int
+        """
+
+        return self._dbSize
+
+    def _patternSink(self):
+        """
+        Returns the object that collects the patterns of a run: the sink given to setSink() or a new dictionary
+
+        :return: the sink or an empty dictionary
+        :rtype: PatternSink or dict
+        """
+
+        if self._sink is None:
+            return {}
+        if isinstance(self._iFile, _TransactionStore):
+            self._sink.decoder = self._iFile.decode
+        return self._sink
 
     @_abstractmethod
     def startMine(self):
@@ -11,7 +11,13 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import functools as _functools
-from pyspark import SparkConf as _SparkConf, SparkContext as _SparkContext
+import numpy as _np
+from PAMI.extras import parallel as _parallel
+
+try:
+    from pyspark import SparkConf as _SparkConf, SparkContext as _SparkContext
+except ImportError:
+    _SparkConf = _SparkContext = None
 
 class _frequentPatterns(_ABC):
     """
@@ -32,6 +38,10 @@ class _frequentPatterns(_ABC):
         sep : str
             This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
             However, the users can override their default separator
+        backend : str
+            'local' mines the partitions on a pool of local worker processes, 'spark' on a Spark context (requires pyspark)
+        executor : concurrent.futures.Executor
+            An existing pool to mine the partitions of the local backend with. It is not shut down by the algorithm.
         startTime:float
             To record the start time of the algorithm
         endTime:float
@@ -65,7 +75,7 @@ class _frequentPatterns(_ABC):
 
 
 
-    def __init__(self, iFile, minSup, numPartitions, sep="\t"):
+    def __init__(self, iFile, minSup, numPartitions, sep="\t", backend="local", executor=None):
         """
         :param iFile: Input file name or path of the input file
         :type iFile: str or DataFrame
@@ -78,7 +88,15 @@ class _frequentPatterns(_ABC):
         :type numPartitions: int
         :param sep: separator used to distinguish items from each other. The default separator is tab space. However, users can override the default separator
         :type sep: str
+        :param backend: 'local' to mine the partitions on a pool of local worker processes, 'spark' to mine them with Spark
+        :type backend: str
+        :param executor: An existing pool to mine the partitions of the local backend with
+        :type executor: concurrent.futures.Executor
         """
+        if backend not in ('local', 'spark'):
+            raise ValueError("Unknown backend " + str(backend) + ", choose 'local' or 'spark'")
+        if backend == 'spark' and _SparkContext is None:
+            raise ImportError("The spark backend requires pyspark, please install it with 'pip install pyspark'")
 
         self._iFile = iFile
         self._sep = sep
@@ -90,6 +108,40 @@ class _frequentPatterns(_ABC):
         self._memoryRSS = float()
         self._startTime = float()
         self._endTime = float()
+        self._backend = backend
+        self._executor = executor
+
+    def _creatingItemSets(self):
+        """
+        Storing the complete transactions of the database/input file in a database variable
+        """
+        self._Database = []
+        if isinstance(self._iFile, _pd.DataFrame):
+            if self._iFile.empty:
+                print("its empty..")
+            i = self._iFile.columns.values.tolist()
+            if 'Transactions' in i:
+                self._Database = self._iFile['Transactions'].tolist()
+        if isinstance(self._iFile, str):
+            if _validators.url(self._iFile):
+                data = _urlopen(self._iFile)
+                for line in data:
+                    line.strip()
+                    line = line.decode("utf-8")
+                    temp = [i.rstrip() for i in line.split(self._sep)]
+                    temp = [x for x in temp if x]
+                    self._Database.append(temp)
+            else:
+                try:
+                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            line.strip()
+                            temp = [i.rstrip() for i in line.split(self._sep)]
+                            temp = [x for x in temp if x]
+                            self._Database.append(temp)
+                except IOError:
+                    print("File Not Found")
+                    quit()
 
     @_abstractmethod
     def startMine(self):
@@ -53,9 +53,37 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.pyspark import abstract as _ab
+from PAMI.extras import bitset as _bs
+from concurrent.futures import ProcessPoolExecutor
 from deprecated import deprecated
 
 
+def _countCandidates(arrays, candidates, start, end):
+    """
+    Counts the candidate itemsets in one range of transactions in a worker process of the local backend.
+
+    :param arrays: the bitset of every frequent item over all the transactions, rows
+    :type arrays: dict
+    :param candidates: the items of every candidate, one row per candidate
+    :type candidates: numpy.ndarray
+    :param start: the first word of the range of transactions
+    :type start: int
+    :param end: the word after the last word of the range of transactions
+    :type end: int
+    :return: the support of every candidate in the range
+    :rtype: numpy.ndarray
+    """
+    rows = arrays['rows'][:, start:end]
+    counts = _ab._np.zeros(len(candidates), dtype=_ab._np.int64)
+    for block in range(0, len(candidates), 4096):
+        items = candidates[block:block + 4096]
+        bits = rows[items[:, 0]]
+        for column in range(1, items.shape[1]):
+            bits &= rows[items[:, column]]
+        counts[block:block + len(items)] = _bs.popcount(bits)
+    return counts
+
+
 class parallelApriori(_ab._frequentPatterns):
     """
 
@@ -75,6 +103,10 @@ class parallelApriori(_ab._frequentPatterns):
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
     :param  numPartitions: int :
                    The number of partitions. On each worker node, an executor process is started and this process performs processing.The processing unit of worker node is partition
+    :param  backend: str :
+                   'local' (default) counts the candidates of every partition of the transactions on a pool of numWorkers local processes that share the bitsets of the frequent items through shared memory, 'spark' counts them with Spark (requires pyspark).
+    :param  executor: concurrent.futures.Executor :
+                   An existing pool to count the candidates of the local backend with. It is not shut down by the algorithm.
 
 
 
@@ -167,41 +199,9 @@ class parallelApriori(_ab._frequentPatterns):
     _numPartitions = int()
     _lno = int()
 
-    def __init__(self, iFile, minSup, numWorkers, sep='\t'):
-        super().__init__(iFile, minSup, int(numWorkers), sep)
-
-    def _creatingItemSets(self):
-        """
-        Storing the complete transactions of the database/input file in a database variable
-        """
-        self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self._Database = self._iFile['Transactions'].tolist()
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            #print(line)
-                            self._Database.append(temp)
-                except IOError:
-                    print("File Not Found")
-                    quit()
+    def __init__(self, iFile, minSup, numWorkers, sep='\t', backend='local', executor=None):
+        super().__init__(iFile, minSup, int(numWorkers), sep, backend, executor)
+
     def getMemoryUSS(self):
         """
         Total amount of USS memory consumed by the mining process will be retrieved from this function
@@ -372,6 +372,61 @@ class parallelApriori(_ab._frequentPatterns):
         Frequent pattern mining process will start from here
         """
         self._startTime = _ab._time.time()
+        if self._backend == 'spark':
+            self._mineSpark()
+        else:
+            self._mineLocal()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using Parallel Apriori algorithm")
+
+    def _mineLocal(self):
+        """
+        Counts the candidates of every level on local worker processes. The transactions are split into numWorkers
+        ranges of the bitsets of the frequent items, which are stored in shared memory, and the counts of the ranges
+        are summed up.
+        """
+        self._creatingItemSets()
+        self._lno = len(self._Database)
+        self._minSup = self._convert(self._minSup)
+
+        tidLists = _ab._defaultdict(list)
+        for tid, trans in enumerate(self._Database):
+            for item in set(trans):
+                tidLists[item].append(tid)
+        frequentItems = sorted((item for item, tids in tidLists.items() if len(tids) >= self._minSup),
+                               key=lambda x: (-len(tidLists[x]), x))
+        self._finalPatterns = {item: len(tidLists[item]) for item in frequentItems}
+        rows = _bs.packLists([tidLists[item] for item in frequentItems], self._lno)
+        bounds = _ab._np.unique(_ab._np.linspace(0, rows.shape[1], self._numPartitions + 1).astype(int)).tolist()
+
+        executor = self._executor
+        if executor is None and self._numPartitions > 1:
+            executor = ProcessPoolExecutor(max_workers=self._numPartitions)
+        try:
+            with _ab._parallel.SharedArrays(rows=rows) as shared:
+                candidates = list(_ab._c(range(len(frequentItems)), 2))
+                length = 3
+                while len(candidates) != 0:
+                    array = _ab._np.array(candidates, dtype=_ab._np.int64).reshape(len(candidates), -1)
+                    tasks = [(array, start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+                    counts = sum(_ab._parallel.run(_countCandidates, shared, tasks, 1, executor))
+                    frequentPatterns = []
+                    for i in _ab._np.flatnonzero(counts >= self._minSup).tolist():
+                        frequentPatterns.append(candidates[i])
+                        self._finalPatterns[tuple(frequentItems[x] for x in candidates[i])] = int(counts[i])
+                    candidates = sorted(tuple(sorted(x)) for x in self._genCandidateItemsets(frequentPatterns, length))
+                    length += 1
+        finally:
+            if executor is not None and self._executor is None:
+                executor.shutdown()
+
+    def _mineSpark(self):
+        """
+        Counts the candidates of every level with Spark
+        """
 
         # setting SparkConf and SparkContext to process in parallel
         conf = _ab._SparkConf().setAppName("parallelApriori").setMaster("local[*]")
@@ -388,12 +443,6 @@ class parallelApriori(_ab._frequentPatterns):
         oneFrequentItems = self._genFrequentItems(database)
         self._finalPatterns = oneFrequentItems
         self._getAllFrequentPatterns(database, oneFrequentItems)
-
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Frequent patterns were generated successfully using Parallel Apriori algorithm")
         sc.stop()
 
 
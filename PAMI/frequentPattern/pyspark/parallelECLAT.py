@@ -52,13 +52,66 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pyspark import SparkConf, SparkContext
 # import abstract as _ab
 from PAMI.frequentPattern.pyspark import abstract as _ab
+from PAMI.extras import tidset as _ts
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 from deprecated import deprecated
 
 
+def _extend(pattern, tids, index, names, tidsets, minSup, patterns):
+    """
+    Extends a pattern by every item that follows its last item, depth first.
+
+    :param pattern: the pattern, items separated by a space
+    :type pattern: str
+    :param tids: the tidset of the pattern
+    :type tids: numpy.ndarray
+    :param index: the index of the last item of the pattern
+    :type index: int
+    :param names: the name of every item
+    :type names: list
+    :param tidsets: the tidset of every item
+    :type tidsets: list
+    :param minSup: minimum support in count
+    :type minSup: int or float
+    :param patterns: the dictionary collecting the patterns
+    :type patterns: dict
+    """
+    for i in range(index + 1, len(names)):
+        tid = _ts.intersect(tids, tidsets[i])
+        if len(tid) >= minSup:
+            freqPattern = pattern + ' ' + names[i]
+            patterns[freqPattern] = len(tid)
+            _extend(freqPattern, tid, i, names, tidsets, minSup, patterns)
+
+
+def _minePartition(arrays, partition, numPartitions, names, minSup):
+    """
+    Mines one partition of the local backend in a worker process: the patterns starting with the items whose index
+    is the partition id modulo numPartitions.
+
+    :param arrays: the tidsets of the frequent items one after another, tids and offsets
+    :type arrays: dict
+    :param partition: the partition id
+    :type partition: int
+    :param numPartitions: the number of partitions
+    :type numPartitions: int
+    :param names: the name of every item, by increasing support
+    :type names: list
+    :param minSup: minimum support in count
+    :type minSup: int or float
+    :return: the patterns with more than one item
+    :rtype: dict
+    """
+    tids, offsets = arrays['tids'], arrays['offsets'].tolist()
+    tidsets = [tids[offsets[i]:offsets[i + 1]] for i in range(len(names))]
+    patterns = {}
+    for i in range(partition, len(names), numPartitions):
+        _extend(names[i], tidsets[i], i, names, tidsets, minSup, patterns)
+    return patterns
+
+
 class parallelECLAT(_ab._frequentPatterns):
     """
     :Description: ParallelEclat is an algorithm to discover frequent patterns in a transactional database.
@@ -76,6 +129,10 @@ class parallelECLAT(_ab._frequentPatterns):
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
     :param  numPartitions: int :
                    The number of partitions. On each worker node, an executor process is started and this process performs processing.The processing unit of worker node is partition
+    :param  backend: str :
+                   'local' (default) mines the partitions on a pool of numWorkers local processes that share the tidsets of the frequent items through shared memory, 'spark' mines them with Spark (requires pyspark).
+    :param  executor: concurrent.futures.Executor :
+                   An existing pool to mine the partitions of the local backend with. It is not shut down by the algorithm.
 
 
     :Attributes:
@@ -165,8 +222,8 @@ class parallelECLAT(_ab._frequentPatterns):
     _memoryRSS = float()
     _lno = int()
 
-    def __init__(self, iFile, minSup, numWorkers, sep="\t"):
-        super().__init__(iFile, minSup, int(numWorkers), sep)
+    def __init__(self, iFile, minSup, numWorkers, sep="\t", backend='local', executor=None):
+        super().__init__(iFile, minSup, int(numWorkers), sep, backend, executor)
 
     def getMemoryUSS(self):
         """
@@ -308,8 +365,48 @@ class parallelECLAT(_ab._frequentPatterns):
         """
 
         self._startTime = _ab._time.time()
-        conf = SparkConf().setAppName("Parallel ECLAT").setMaster("local[*]")
-        sc = SparkContext(conf=conf)
+        if self._backend == 'spark':
+            self._mineSpark()
+        else:
+            self._mineLocal()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using Parallel ECLAT algorithm")
+
+    def _mineLocal(self):
+        """
+        Mines the partitions on local worker processes. The tidsets of the frequent items, ordered by increasing
+        support as in the Spark backend, are stored one after another in shared memory.
+        """
+        self._creatingItemSets()
+        self._lno = len(self._Database)
+        self._minSup = self._convert(self._minSup)
+
+        tidLists = _ab._defaultdict(list)
+        for tid, trans in enumerate(self._Database):
+            for item in set(trans):
+                tidLists[item].append(tid)
+        names = sorted((item for item, tids in tidLists.items() if len(tids) >= self._minSup),
+                       key=lambda x: (len(tidLists[x]), x))
+        self._finalPatterns = {item: len(tidLists[item]) for item in names}
+
+        offsets = _ab._np.zeros(len(names) + 1, dtype=_ab._np.int64)
+        _ab._np.cumsum([len(tidLists[item]) for item in names], out=offsets[1:])
+        tids = _ab._np.fromiter((tid for item in names for tid in tidLists[item]), dtype=_ab._np.int64,
+                                count=int(offsets[-1]))
+        tasks = [(partition, self._numPartitions, names, self._minSup) for partition in range(self._numPartitions)]
+        with _ab._parallel.SharedArrays(tids=tids, offsets=offsets) as shared:
+            for patterns in _ab._parallel.run(_minePartition, shared, tasks, self._numPartitions, self._executor):
+                self._finalPatterns.update(patterns)
+
+    def _mineSpark(self):
+        """
+        Mines the partitions with Spark
+        """
+        conf = _ab._SparkConf().setAppName("Parallel ECLAT").setMaster("local[*]")
+        sc = _ab._SparkContext(conf=conf)
 
         data = sc.textFile(self._iFile, self._numPartitions) \
             .map(lambda line: [int(y) for y in line.rstrip().split(self._sep)]).persist()
@@ -344,12 +441,6 @@ class parallelECLAT(_ab._frequentPatterns):
                             .filter(lambda x: len(x) != 0).collect())
         for value in freqPatterns:
             self._finalPatterns.update(value)
-
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Frequent patterns were generated successfully using Parallel ECLAT algorithm")
         sc.stop()
 
 
@@ -55,13 +55,42 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 # from pyspark import SparkConf, SparkContext
-from collections import defaultdict
+from collections import defaultdict, Counter
 from PAMI.frequentPattern.pyspark import abstract as _ab
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth as _FPGrowth
+from PAMI.extras.FPTree import FPTree as _FPTree
 from operator import add
-from pyspark import SparkConf as _SparkConf, SparkContext as _SparkContext
 from deprecated import deprecated
 
 
+def _minePartition(arrays, partition, numPartitions, names, minSup):
+    """
+    Mines one partition of the local backend in a worker process: the FP-tree of the group-dependent conditional
+    transactions of the partition is built and the items of the partition are mined from it with FPGrowth.
+
+    :param arrays: the encoded transactions, items and offsets (see PAMI.extras.parallel.encode)
+    :type arrays: dict
+    :param partition: the partition id
+    :type partition: int
+    :param numPartitions: the number of partitions
+    :type numPartitions: int
+    :param names: the name of every rank
+    :type names: list
+    :param minSup: minimum support in count
+    :type minSup: int or float
+    :return: the patterns with more than one item whose last (least frequent) item belongs to the partition
+    :rtype: dict
+    """
+    transactions, _ = _ab._parallel.conditionalTransactions(arrays['items'], arrays['offsets'], partition,
+                                                           numPartitions)
+    tree = _FPTree.fromTransactions(transactions, numItems=len(names))
+    miner = _FPGrowth(None, minSup)
+    responsible = range(partition, len(names), numPartitions)[::-1]
+    for prefix, newTree, newNames in miner._conditionalBases(tree, names, [], minSup, responsible):
+        miner._recursive(newTree, newNames, prefix, minSup)
+    return {pattern: support for pattern, support in miner._finalPatterns.items() if len(pattern) > 1}
+
+
 class Node:
     """
     :Attribute:
@@ -167,6 +196,10 @@ class parallelFPGrowth(_ab._frequentPatterns):
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
     :param  numPartitions: int :
                    The number of partitions. On each worker node, an executor process is started and this process performs processing.The processing unit of worker node is partition
+    :param  backend: str :
+                   'local' (default) mines the partitions on a pool of numWorkers local processes that share the encoded database through shared memory, 'spark' mines them with Spark (requires pyspark).
+    :param  executor: concurrent.futures.Executor :
+                   An existing pool to mine the partitions of the local backend with. It is not shut down by the algorithm.
 
 
     :Attributes:
@@ -257,8 +290,8 @@ class parallelFPGrowth(_ab._frequentPatterns):
     _lno = int()
 
 
-    def __init__(self, iFile, minSup, numWorkers, sep='\t'):
-        super().__init__(iFile, minSup, int(numWorkers), sep)
+    def __init__(self, iFile, minSup, numWorkers, sep='\t', backend='local', executor=None):
+        super().__init__(iFile, minSup, int(numWorkers), sep, backend, executor)
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
@@ -273,9 +306,46 @@ class parallelFPGrowth(_ab._frequentPatterns):
         """
 
         self._startTime = _ab._time.time()
+        if self._backend == 'spark':
+            self._mineSpark()
+        else:
+            self._mineLocal()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+
+        print("Frequent patterns were generated successfully using Parallel FPGrowth algorithm")
+
+    def _mineLocal(self):
+        """
+        Mines the partitions on local worker processes. The transactions are encoded as rank arrays in shared memory and
+        every partition builds its group-dependent conditional transactions from them.
+        """
+        self._creatingItemSets()
+        self._lno = len(self._Database)
+        self._minSup = self._convert(self._minSup)
+
+        itemCount = Counter(item for trans in self._Database for item in set(trans))
+        freqItems = {item: count for item, count in itemCount.items() if count >= self._minSup}
+        self._FPList = sorted(freqItems, key=lambda x: (-freqItems[x], x))
+        self._finalPatterns = {item: freqItems[item] for item in self._FPList}
+        rank = dict([(item, index) for (index, item) in enumerate(self._FPList)])
+
+        items, offsets = _ab._parallel.encode(self._Database, rank)
+        tasks = [(partition, self._numPartitions, self._FPList, self._minSup)
+                 for partition in range(self._numPartitions)]
+        with _ab._parallel.SharedArrays(items=items, offsets=offsets) as shared:
+            for patterns in _ab._parallel.run(_minePartition, shared, tasks, self._numPartitions, self._executor):
+                self._finalPatterns.update(patterns)
+
+    def _mineSpark(self):
+        """
+        Mines the partitions with Spark
+        """
 
-        conf = _SparkConf().setAppName("Parallel FPGrowth").setMaster("local[*]")
-        sc = _SparkContext(conf=conf)
+        conf = _ab._SparkConf().setAppName("Parallel FPGrowth").setMaster("local[*]")
+        sc = _ab._SparkContext(conf=conf)
 
         rdd = sc.textFile(self._iFile, self._numPartitions)\
             .map(lambda x: x.rstrip().split(self._sep))\
@@ -301,15 +371,8 @@ class parallelFPGrowth(_ab._frequentPatterns):
             .collect()
 
         self._finalPatterns.update(dict(result))
-
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
         sc.stop()
 
-        print("Frequent patterns were generated successfully using Parallel FPGrowth algorithm")
-
 
     def getPartitionId(self, value):
         """
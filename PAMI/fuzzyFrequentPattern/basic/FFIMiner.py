@@ -55,6 +55,31 @@ from PAMI.fuzzyFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
 
+
+def _intersect(tids, values, otherTids, otherValues):
+    """
+    Min-intersection of two fuzzy lists: the tids occurring in both lists with the smaller of their two memberships.
+    The tids of the first list are merged into the second one with a binary search.
+
+    :param tids: sorted unique tids of the first list
+    :type tids: numpy.ndarray
+    :param values: memberships of the first list
+    :type values: numpy.ndarray
+    :param otherTids: sorted unique tids of the second list
+    :type otherTids: numpy.ndarray
+    :param otherValues: memberships of the second list
+    :type otherValues: numpy.ndarray
+    :return: the tids and the memberships of the intersection
+    :rtype: tuple
+    """
+    if len(tids) == 0 or len(otherTids) == 0:
+        return tids[:0], values[:0]
+    positions = _ab._np.searchsorted(otherTids, tids)
+    positions[positions == len(otherTids)] = 0
+    mask = otherTids[positions] == tids
+    return tids[mask], _ab._np.minimum(values[mask], otherValues[positions[mask]])
+
+
 class FFIMiner(_ab._fuzzyFrequentPattenrs):
     """
     **About this algorithm**
@@ -248,33 +273,32 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
         """
         Perform depth-first search (DFS) to find frequent patterns in a database.
 
-        This method recursively combines candidate patterns and calculates their support
-        in the database, storing frequent patterns and their support counts.
+        Every candidate carries its fuzzy list, i.e., the sorted transaction ids in which it occurs and its membership
+        in each of them. The fuzzy list of an extension is the min-intersection of the lists of the two candidates it
+        is built from. The lists of the extensions of a candidate only live while its branch is searched, so the
+        memory held depends on the depth of the search and not on the number of patterns.
 
-        :param cands: List of candidate patterns represented as tuples.
+        :param cands: List of (pattern, tids, memberships) of the candidates sharing a prefix.
         :type cands: list
         :return: None
 
-        This method does not return anything explicitly, but it updates internal
-        attributes `_finalPatterns` and `_Database` with frequent patterns and their
-        support counts.
+        This method does not return anything explicitly, but it updates the internal attribute `_finalPatterns` with
+        frequent patterns and their support counts.
         """
         for i in range(len(cands)):
+            pattern, tids, values = cands[i]
             newCands = []
             for j in range(i + 1, len(cands)):
-                newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                # print(items[cands[i]], items[cands[j]])
-                newCandItems = {}
-                keys = self._Database[cands[i]].keys() & self._Database[cands[j]].keys()
-                for k in keys:
-                    newCandItems[k] = min(self._Database[cands[i]][k], self._Database[cands[j]][k])
-                count = sum(newCandItems.values())
+                newTids, newValues = _intersect(tids, values, cands[j][1], cands[j][2])
+                count = float(newValues.sum(dtype=_ab._np.float64))
                 if count >= self._minSup:
-                    newCands.append(newCand)
+                    newCand = pattern + cands[j][0][-1:]
+                    newCands.append((newCand, newTids, newValues))
                     self._finalPatterns[newCand] = count
-                    self._Database[newCand] = newCandItems
             if len(newCands) > 1:
                 self.dfs(newCands)
+            # the fuzzy lists of the branch are released once it is searched
+            del newCands
 
     def mine(self):
         """
@@ -290,21 +314,26 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
             for item, fuzzyValue in zip(transactions, fuzzyValues):
                 item = tuple([item])
                 if item not in items:
-                    items[item] = {}
-                items[item][lineNo] = fuzzyValue
+                    items[item] = ([], [])
+                if items[item][0] and items[item][0][-1] == lineNo:
+                    # an item repeated in a transaction keeps its last membership, so that the tids stay unique
+                    items[item][1][-1] = fuzzyValue
+                    continue
+                items[item][0].append(lineNo)
+                items[item][1].append(fuzzyValue)
             lineNo += 1
 
         self._minSup = self._convert(self._minSup)
-        self._Database = items.copy()
-
-        supports = {k:sum(v.values()) for k,v in items.items()}
-        supports = {k:v for k,v in supports.items() if v >= self._minSup}
-        self._Database = {k:v for k,v in items.items() if k in supports}
-        self._Database = {k:v for k,v in sorted(self._Database.items(), key=lambda x: sum(x[1].values()), reverse=True)}
 
+        # the fuzzy list of an item: parallel arrays of the tids in ascending order and of the memberships
+        items = {k: (_ab._np.array(v[0], dtype=_ab._np.int32), _ab._np.array(v[1], dtype=_ab._np.float32))
+                 for k, v in items.items()}
+        supports = {k: float(v[1].sum(dtype=_ab._np.float64)) for k, v in items.items()}
+        supports = {k: v for k, v in supports.items() if v >= self._minSup}
+        self._Database = {k: items[k] for k in sorted(supports, key=supports.get, reverse=True)}
         self._finalPatterns = supports.copy()
 
-        cands = list(self._Database.keys())
+        cands = [(k, v[0], v[1]) for k, v in self._Database.items()]
         self.dfs(cands)
 
         self._endTime = _ab._time.time()
@@ -57,151 +57,118 @@ from typing import List, Dict, Tuple, Set, Union, Any, Generator
 from deprecated import deprecated
 
 
-class _Transaction:
+def _segments(starts: '_ab._np.ndarray', ends: '_ab._np.ndarray') -> Tuple['_ab._np.ndarray', '_ab._np.ndarray']:
     """
-        A class to store Transaction of a database
+    Lists the entries of several slices of the flat arrays of a database
+
+    :param starts: start of every slice
+    :type starts: numpy.ndarray
+    :param ends: end of every slice
+    :type ends: numpy.ndarray
+    :return: the entries of all the slices one after another, and the slice of every entry
+    :rtype: tuple
+    """
+    lengths = ends - starts
+    slices = _ab._np.repeat(_ab._np.arange(len(lengths)), lengths)
+    firsts = _ab._np.cumsum(lengths) - lengths
+    return _ab._np.arange(int(lengths.sum())) + (starts - firsts)[slices], slices
+
+
+class _Database:
+    """
+    A (projected) database stored as flat arrays: the items of all the transactions one after another, ascending
+    within a transaction, their utilities and the start of every transaction. Projecting a transaction on an item
+    only moves its start after the item.
 
     :Attributes:
 
-        items: list
-            A list of items in transaction 
-        utilities: list
-            A list of utilities of items in transaction
-        transactionUtility: int
-            represent total sum of all utilities in the database
-        prefixUtility:
-            prefix Utility values of item
-        offset:
-            an offset pointer, used by projected transactions
+        items: numpy.ndarray
+            item of every entry
+        utilities: numpy.ndarray
+            utility of every entry
+        offsets: numpy.ndarray
+            start of every transaction, followed by the number of entries
+        prefixUtilities: numpy.ndarray
+            utility of the prefix of the projection in every transaction
+        owners: numpy.ndarray
+            transaction of every entry
+        remaining: numpy.ndarray
+            utility of every entry plus the utilities of the entries after it in its transaction
+
     :Methods:
 
-        projectedTransaction(offsetE):
-            A method to create new Transaction from existing starting from offsetE until the end
-        getItems():
-            return items in transaction
-        getUtilities():
-            return utilities in transaction
-        getLastPosition():
-            return last position in a transaction
-        removeUnpromisingItems():
-            A method to remove items which are having low values when compared with minUtil
-        insertionSort():
-            A method to sort all items in the transaction
+        positions(item):
+            return the entries of an item
     """
-    offset = 0
-    prefixUtility = 0
 
-    def __init__(self, items: list, utilities: list, transactionUtility: int) -> None:
+    def __init__(self, items, utilities, offsets, prefixUtilities) -> None:
         self.items = items
         self.utilities = utilities
-        self.transactionUtility = transactionUtility
-
-    def projectTransaction(self, offsetE: int) -> '_Transaction':
-        """
-        A method to create new Transaction from existing transaction starting from offsetE until the end
-        :param offsetE: an offset over the original transaction for projecting the transaction
-        :type offsetE: int
-        :return: a new transaction after projecting the transaction starting from offsetE until the end of the transaction
-        :rtype: _Transaction
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
-    def getItems(self) -> list:
-        """
-        A method to return items in transaction
-        :return: list of items in transaction after projecting the transaction starting from offsetE until the end of the transaction
-        :rtype: list
-        """
-        return self.items
-
-    def getUtilities(self) -> list:
-        """
-        A method to return utilities in transaction
-        :return: list of utilities in transaction
-        :rtype: list
-        """
-        return self.utilities
-
-    def getLastPosition(self) -> int:
-        """
-        A method to return last position in a transaction
-        :return: last position in a transaction after projecting the transaction starting from offsetE until the end of the transaction
-        :rtype: int
-        """
-
-        return len(self.items) - 1
-
-    def removeUnpromisingItems(self, oldNamesToNewNames: dict) -> None:
-        """
-        A method to remove items which are not present in the map passed to the function
-        :param oldNamesToNewNames: A map represent old names to new names
-        :type oldNamesToNewNames: map
-        :return: None
-        """
-        tempItems = []
-        tempUtilities = []
-        for idx, item in enumerate(self.items):
-            if item in oldNamesToNewNames:
-                tempItems.append(oldNamesToNewNames[item])
-                tempUtilities.append(self.utilities[idx])
-            else:
-                self.transactionUtility -= self.utilities[idx]
-        self.items = tempItems
-        self.utilities = tempUtilities
-        self.insertionSort()
+        self.offsets = offsets
+        self.prefixUtilities = prefixUtilities
+        self.owners = _ab._np.repeat(_ab._np.arange(len(offsets) - 1), _ab._np.diff(offsets))
+        cumulative = _ab._np.cumsum(utilities)
+        self.remaining = cumulative[offsets[1:][self.owners] - 1] - cumulative + utilities
+        self._order = None
+        self._sortedItems = None
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def positions(self, item: int) -> '_ab._np.ndarray':
+        """
+        A method to return the entries of an item
+        :param item: an item
+        :type item: int
+        :return: the entries of the item, at most one per transaction, in ascending order
+        :rtype: numpy.ndarray
+        """
+        if self._order is None:
+            # the database is sorted once and then projected on every item to explore
+            self._order = _ab._np.argsort(self.items, kind='stable')
+            self._sortedItems = self.items[self._order]
+        start = _ab._np.searchsorted(self._sortedItems, item)
+        end = _ab._np.searchsorted(self._sortedItems, item, side='right')
+        return self._order[start:end]
 
-    def insertionSort(self) -> None:
-        """
-        A method to sort items in order
-        :return: None
-        """
-        for i in range(1, len(self.items)):
-            key = self.items[i]
-            utilityJ = self.utilities[i]
-            j = i - 1
-            while j >= 0 and key < self.items[j]:
-                self.items[j + 1] = self.items[j]
-                self.utilities[j + 1] = self.utilities[j]
-                j -= 1
-            self.items[j + 1] = key
-            self.utilities[j + 1] = utilityJ
-        
 
 class _Dataset:
     """
-    A class represent the list of transactions in this dataset
+    A class represent the transactions of this dataset as flat arrays
 
     :Attributes:
 
-        transactions :
-            the list of transactions in this dataset
+        items :
+            the item of every entry, one transaction after another
+        utilities :
+            the utility of every entry
+        lengths :
+            the number of items of every transaction
+        transactionUtilities :
+            the utility of every transaction
         maxItem:
             the largest item name
         
     :methods:
 
-        createTransaction(line):
-            Create a transaction object from a line from the input file
+        addTransaction(itemsString, utilityString, transactionUtility):
+            Appends a transaction of the input file to the dataset
         getMaxItem():
             return Maximum Item
-        getTransactions():
-            return transactions in database
+        getArrays():
+            return the items, utilities, offsets and transaction utilities as NumPy arrays
 
     """
-    transactions = []
     maxItem = 0
     
     def __init__(self,datasetPath: Union[str, _ab._pd.DataFrame], sep: str) -> None:
         self.strToInt = {}
         self.intToStr = {}
-        self.transactions = []
+        self.items = _ab.array('q')
+        self.utilities = _ab.array('q')
+        self.lengths = _ab.array('q')
+        self.transactionUtilities = _ab.array('q')
+        self._arrays = None
         self.maxItem = 0
         self.cnt = 1
         self.sep = sep
@@ -216,6 +183,15 @@ class _Dataset:
         :return: None
         """
 
+        if isinstance(datasetPath, _ab._TransactionStore):
+            self.intToStr = {i + 1: item for i, item in enumerate(datasetPath.items)}
+            self.strToInt = {item: i for i, item in self.intToStr.items()}
+            self.maxItem = len(datasetPath.items)
+            self.cnt = self.maxItem + 1
+            self._arrays = (_ab._np.asarray(datasetPath.indices, dtype=_ab._np.int32) + 1,
+                            _ab._np.asarray(datasetPath.utilities, dtype=_ab._np.int64),
+                            _ab._np.asarray(datasetPath.offsets, dtype=_ab._np.int64),
+                            _ab._np.asarray(datasetPath.transactionUtilities, dtype=_ab._np.int64))
         if isinstance(datasetPath, _ab._pd.DataFrame):
             utilities, data, transactionUtility = [], [], []
             if datasetPath.empty:
@@ -227,7 +203,11 @@ class _Dataset:
                 utilities = datasetPath['Utilities'].tolist()
             if 'UtilitySum' in i:
                 transactionUtility = datasetPath['UtilitySum'].tolist()
-            self.transactions.append(self.createTransaction(data, utilities, transactionUtility))
+            for itemsString, utilityString, utilitySum in zip(data, utilities, transactionUtility):
+                if isinstance(itemsString, str):
+                    itemsString = [x for x in itemsString.split(self.sep) if x]
+                    utilityString = [x for x in str(utilityString).split(self.sep) if x]
+                self.addTransaction(itemsString, utilityString, int(utilitySum))
         if isinstance(datasetPath, str):
             if _ab._validators.url(datasetPath):
                 data = _ab._urlopen(datasetPath)
@@ -239,7 +219,7 @@ class _Dataset:
                     itemsString = [x for x in itemsString if x]
                     utilityString = trans_list[2].strip().split(self.sep)
                     utilityString = [x for x in utilityString if x]
-                    self.transactions.append(self.createTransaction(itemsString, utilityString, transactionUtility))
+                    self.addTransaction(itemsString, utilityString, transactionUtility)
             else:
                 try:
                     with open(datasetPath, 'r', encoding='utf-8') as f:
@@ -250,46 +230,34 @@ class _Dataset:
                             itemsString = [x for x in itemsString if x]
                             utilityString = trans_list[2].strip().split(self.sep)
                             utilityString = [x for x in utilityString if x]
-                            self.transactions.append(
-                                self.createTransaction(itemsString, utilityString, transactionUtility))
+                            self.addTransaction(itemsString, utilityString, transactionUtility)
 
                 except IOError:
                     print("File Not Found")
                     quit()
 
-    def createTransaction(self, itemsString: list, utilityString: list, transactionUtility: int) -> '_Transaction':
+    def addTransaction(self, itemsString: list, utilityString: list, transactionUtility: int) -> None:
         """
-        A method to create Transaction from dataset given
-        :param itemsString: List of strings representing transactions
+        A method to append a transaction to the flat arrays of the dataset
+        :param itemsString: List of strings representing the items of the transaction
         :type itemsString: list
-        :param utilityString: List of strings representing utility
+        :param utilityString: List of strings representing the utilities of the items
         :type utilityString: list
         :param transactionUtility: Integer representing transaction utility
         :type transactionUtility: int
-        :return: created Transaction from the given dataset
-        :rtype: _Transaction
+        :return: None
         """
-
-
-        '''trans_list = line.strip().split(':')
-        transactionUtility = int(trans_list[1])
-        itemsString = trans_list[0].strip().split(self.sep)
-        itemsString = [x for x in itemsString if x]
-        utilityString = trans_list[2].strip().split(self.sep)
-        utilityString = [x for x in utilityString if x]'''
-        items = []
-        utilities = []
         for idx, item in enumerate(itemsString):
-            if self.strToInt.get(item) is None:
-                self.strToInt[item] = self.cnt
+            item_int = self.strToInt.get(item)
+            if item_int is None:
+                item_int = self.strToInt[item] = self.cnt
                 self.intToStr[self.cnt] = item
                 self.cnt += 1
-            item_int = self.strToInt.get(item)
-            if item_int > self.maxItem:
                 self.maxItem = item_int
-            items.append(item_int)
-            utilities.append(int(utilityString[idx]))
-        return _Transaction(items, utilities, transactionUtility)
+            self.items.append(item_int)
+            self.utilities.append(int(utilityString[idx]))
+        self.lengths.append(len(itemsString))
+        self.transactionUtilities.append(transactionUtility)
 
     def getMaxItem(self) -> int:
         """
@@ -299,13 +267,19 @@ class _Dataset:
         """
         return self.maxItem
 
-    def getTransactions(self) -> list:
+    def getArrays(self) -> tuple:
         """
-        A method to return transactions from database
-        :return: the list of transactions from database
-        :rtype: list
+        A method to return the transactions of the dataset as NumPy arrays
+        :return: the item and the utility of every entry, the start of every transaction followed by the number of entries, and the utility of every transaction
+        :rtype: tuple
         """
-        return self.transactions
+        if self._arrays is None:
+            offsets = _ab._np.zeros(len(self.lengths) + 1, dtype=_ab._np.int64)
+            _ab._np.cumsum(_ab._np.frombuffer(self.lengths, dtype=_ab._np.int64), out=offsets[1:])
+            self._arrays = (_ab._np.frombuffer(self.items, dtype=_ab._np.int64).astype(_ab._np.int32),
+                            _ab._np.frombuffer(self.utilities, dtype=_ab._np.int64).copy(), offsets,
+                            _ab._np.frombuffer(self.transactionUtilities, dtype=_ab._np.int64).copy())
+        return self._arrays
 
 
 class EFIM(_ab._utilityPatterns):
@@ -347,10 +321,10 @@ class EFIM(_ab._utilityPatterns):
             set of high utility itemSets
         candidateCount: int
              Number of candidates 
-        utilityBinArrayLU: list
-             A map to hold the local utility values of the items in database
-        utilityBinArraySU: list
-            A map to hold the subtree utility values of the items is database
+        utilityBinArrayLU: numpy.ndarray
+             A vector holding the local utility value of every item of the database, indexed by item name
+        utilityBinArraySU: numpy.ndarray
+            A vector holding the subtree utility value of every item of the database, indexed by item name
         oldNamesToNewNames: list
             A map which contains old names, new names of items as key value pairs
         newNamesToOldNames: list
@@ -382,19 +356,17 @@ class EFIM(_ab._utilityPatterns):
                Total amount of runtime taken by the mining process will be retrieved from this function
         backTrackingEFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
                A method to mine the HUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep)
+        projectDatabase(transactionsOfP, e, secondary)
+               A method to project a database stored as flat arrays on an item by moving the start of its transactions
+        mergeTransactions(items, utilities, lengths, prefixUtilities)
+               A method to merge identical transactions, grouped by a hash of their items
+        useUtilityBinArraysToCalculateUpperBounds(transactionsPe)
                A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
         output(tempPosition, utility)
                A method to output a high-utility itemSet to file or memory depending on what the user chose
-        is_equal(transaction1, transaction2)
-               A method to Check if two transaction are identical
         useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
               A method to calculate the sub tree utility values for single items
-        sortDatabase(self, transactions)
-              A Method to sort transaction
-        sort_transaction(self, trans1, trans2)
-              A Method to sort transaction
-        useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
+        useUtilityBinArrayToCalculateLocalUtilityFirstTime(items, transactionUtilities)
              A method to calculate local utility values for single itemsets
 
     **Executing the code on terminal:**
@@ -446,6 +418,8 @@ class EFIM(_ab._utilityPatterns):
      
     """
 
+    _readsStore = True
+
     _highUtilityitemSets = []
     _candidateCount = 0
     _utilityBinArrayLU = {}
@@ -507,34 +481,37 @@ class EFIM(_ab._utilityPatterns):
         :return: None
         """
         self._startTime = _ab._time.time()
+        self._finalPatterns = {}
+        self._patternCount = 0
+        self._candidateCount = 0
         self._dataset = _Dataset(self._iFile, self._sep)
-        self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
         self._minUtil = int(self._minUtil)
-        itemsToKeep = []
-        for key in self._utilityBinArrayLU.keys():
-            if self._utilityBinArrayLU[key] >= self._minUtil:
-                itemsToKeep.append(key)
-        itemsToKeep = sorted(itemsToKeep, key=lambda x: self._utilityBinArrayLU[x])
-        currentName = 1
-        for idx, item in enumerate(itemsToKeep):
-            self._oldNamesToNewNames[item] = currentName
-            self._newNamesToOldNames[currentName] = item
-            itemsToKeep[idx] = currentName
-            currentName += 1
-        for transaction in self._dataset.getTransactions():
-            transaction.removeUnpromisingItems(self._oldNamesToNewNames)
-        self._sortDatabase(self._dataset.getTransactions())
-        emptyTransactionCount = 0
-        for transaction in self._dataset.getTransactions():
-            if len(transaction.getItems()) == 0:
-                emptyTransactionCount += 1
-        self._dataset.transactions = self._dataset.transactions[emptyTransactionCount:]
-        self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self._dataset)
-        itemsToExplore = []
-        for item in itemsToKeep:
-            if self._utilityBinArraySU[item] >= self._minUtil:
-                itemsToExplore.append(item)
-        self._backTrackingEFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        items, utilities, offsets, transactionUtilities = self._dataset.getArrays()
+        owners = _ab._np.repeat(_ab._np.arange(len(offsets) - 1), _ab._np.diff(offsets))
+        self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(items, transactionUtilities[owners])
+        itemsToKeep = _ab._np.flatnonzero(self._utilityBinArrayLU >= self._minUtil)
+        itemsToKeep = itemsToKeep[itemsToKeep > 0]
+        # the promising items are renamed 1, 2, ... by increasing local utility, ties by their name
+        itemsToKeep = itemsToKeep[_ab._np.argsort(self._utilityBinArrayLU[itemsToKeep], kind='stable')]
+        self._maxName = len(itemsToKeep)
+        rename = _ab._np.zeros(len(self._utilityBinArrayLU), dtype=_ab._np.int32)
+        rename[itemsToKeep] = _ab._np.arange(1, self._maxName + 1, dtype=_ab._np.int32)
+        self._newNamesToOldNames = dict(enumerate(itemsToKeep.tolist(), 1))
+        self._oldNamesToNewNames = {old: new for new, old in self._newNamesToOldNames.items()}
+
+        newItems = rename[items]
+        kept = _ab._np.flatnonzero(newItems > 0)
+        kept = kept[_ab._np.lexsort((newItems[kept], owners[kept]))]
+        lengths = _ab._np.bincount(owners[kept], minlength=len(offsets) - 1)
+        lengths = lengths[lengths > 0]
+        self._multipliers = _ab._np.random.default_rng(0).integers(1, 2 ** 63, size=int(lengths.max(initial=0)),
+                                                                   dtype=_ab._np.uint64) | _ab._np.uint64(1)
+        database = self._mergeTransactions(newItems[kept], utilities[kept], lengths,
+                                           _ab._np.zeros(len(lengths), dtype=_ab._np.int64))
+        self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(database)
+        itemsToKeep = list(range(1, self._maxName + 1))
+        itemsToExplore = [item for item in itemsToKeep if self._utilityBinArraySU[item] >= self._minUtil]
+        self._backTrackingEFIM(database, itemsToKeep, itemsToExplore, 0)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -543,11 +520,11 @@ class EFIM(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print("High Utility patterns were generated successfully using EFIM algorithm")
 
-    def _backTrackingEFIM(self, transactionsOfP: list, itemsToKeep: list, itemsToExplore: list, prefixLength: int) -> None:
+    def _backTrackingEFIM(self, transactionsOfP: '_Database', itemsToKeep: list, itemsToExplore: list, prefixLength: int) -> None:
         """
         A method to mine the HUIs Recursively
-        :param transactionsOfP: the list of transactions containing the current prefix P
-        :type transactionsOfP: list
+        :param transactionsOfP: the projected database of the current prefix P
+        :type transactionsOfP: _Database
         :param itemsToKeep: the list of secondary items in the p-projected database
         :type itemsToKeep: list
         :param itemsToExplore: the list of primary items in the p-projected database
@@ -557,97 +534,113 @@ class EFIM(_ab._utilityPatterns):
         :return: None
         """
         self._candidateCount += len(itemsToExplore)
-        for idx, e in enumerate(itemsToExplore):
-            transactionsPe = []
-            utilityPe = 0
-            previousTransaction = transactionsOfP[0]
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == transactionsOfP[0]:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != transactionsOfP[0]:
-                transactionsPe.append(previousTransaction)
+        secondary = _ab._np.zeros(self._maxName + 1, dtype=bool)
+        secondary[itemsToKeep] = True
+        itemsToKeep = _ab._np.asarray(itemsToKeep, dtype=_ab._np.int64)
+        for e in itemsToExplore:
+            utilityPe, transactionsPe = self._projectDatabase(transactionsOfP, e, secondary)
             self._temp[prefixLength] = self._newNamesToOldNames[e]
             if utilityPe >= self._minUtil:
                 self._output(prefixLength, utilityPe)
-            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep)
-            newItemsToKeep = []
-            newItemsToExplore = []
-            for l in range(idx + 1, len(itemsToKeep)):
-                itemK = itemsToKeep[l]
-                if self._utilityBinArraySU[itemK] >= self._minUtil:
-                    newItemsToExplore.append(itemK)
-                    newItemsToKeep.append(itemK)
-                elif self._utilityBinArrayLU[itemK] >= self._minUtil:
-                    newItemsToKeep.append(itemK)
-            if len(transactionsPe) != 0:
-                self._backTrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
-
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: list, j: int, itemsToKeep: list) -> None:
+            if len(transactionsPe) == 0:
+                continue
+            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe)
+            candidates = itemsToKeep[itemsToKeep > e]
+            subtree = self._utilityBinArraySU[candidates] >= self._minUtil
+            local = self._utilityBinArrayLU[candidates] >= self._minUtil
+            newItemsToExplore = candidates[subtree].tolist()
+            if newItemsToExplore:
+                self._backTrackingEFIM(transactionsPe, candidates[subtree | local].tolist(), newItemsToExplore,
+                                       prefixLength + 1)
+
+    def _projectDatabase(self, transactionsOfP: '_Database', e: int, secondary: '_ab._np.ndarray') -> Tuple[int, '_Database']:
+        """
+        A method to project a database on an item: every transaction containing the item starts after it and keeps
+        only its secondary items, and identical projected transactions are merged
+        :param transactionsOfP: the projected database of the current prefix P
+        :type transactionsOfP: _Database
+        :param e: the item appended to P
+        :type e: int
+        :param secondary: mask of the secondary items of P
+        :type secondary: numpy.ndarray
+        :return: the utility of P U {e} and the projected database of P U {e}
+        :rtype: tuple
+        """
+        positions = transactionsOfP.positions(e)
+        owners = transactionsOfP.owners[positions]
+        prefixUtilities = transactionsOfP.prefixUtilities[owners] + transactionsOfP.utilities[positions]
+        utilityPe = int(prefixUtilities.sum())
+        entries, slices = _segments(positions + 1, transactionsOfP.offsets[owners + 1])
+        kept = secondary[transactionsOfP.items[entries]]
+        entries, slices = entries[kept], slices[kept]
+        lengths = _ab._np.bincount(slices, minlength=len(positions))
+        nonEmpty = lengths > 0
+        return utilityPe, self._mergeTransactions(transactionsOfP.items[entries], transactionsOfP.utilities[entries],
+                                                  lengths[nonEmpty], prefixUtilities[nonEmpty])
+
+    def _mergeTransactions(self, items: '_ab._np.ndarray', utilities: '_ab._np.ndarray', lengths: '_ab._np.ndarray',
+                           prefixUtilities: '_ab._np.ndarray') -> '_Database':
+        """
+        A method to merge the identical transactions of a projected database. The transactions are grouped by a hash
+        of their items, the items of every transaction are compared with the first one of its group, and the
+        utilities and prefix utilities of the transactions of a group are added
+        :param items: the items of the transactions, one transaction after another
+        :type items: numpy.ndarray
+        :param utilities: the utility of every entry
+        :type utilities: numpy.ndarray
+        :param lengths: the number of items of every transaction, all positive
+        :type lengths: numpy.ndarray
+        :param prefixUtilities: the utility of the prefix in every transaction
+        :type prefixUtilities: numpy.ndarray
+        :return: the database of the merged transactions
+        :rtype: _Database
+        """
+        np = _ab._np
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        if len(lengths) < 2:
+            return _Database(items, utilities, offsets, prefixUtilities)
+        slices = np.repeat(np.arange(len(lengths)), lengths)
+        columns = np.arange(len(items)) - offsets[slices]
+        keys = np.add.reduceat((items.astype(np.uint64) + np.uint64(1)) * self._multipliers[columns], offsets[:-1])
+        keys = keys * np.uint64(0x9E3779B97F4A7C15) + lengths.astype(np.uint64)
+        order = np.argsort(keys, kind='stable')
+        first = np.concatenate(([True], keys[order[1:]] != keys[order[:-1]]))
+        if first.all():
+            return _Database(items, utilities, offsets, prefixUtilities)
+        groups = np.empty(len(lengths), dtype=np.int64)
+        groups[order] = np.cumsum(first) - 1
+        representatives = order[first]
+        # a hash collision leaves a transaction in a group of its own
+        same = lengths == lengths[representatives[groups]]
+        entries = np.where(same[slices], offsets[representatives[groups]][slices] + columns, np.arange(len(items)))
+        same &= np.bincount(slices, weights=items[entries] != items, minlength=len(lengths)) == 0
+        if not same.all():
+            different = np.flatnonzero(~same)
+            groups[different] = len(representatives) + np.arange(len(different))
+            representatives = np.concatenate((representatives, different))
+        newOffsets = np.zeros(len(representatives) + 1, dtype=np.int64)
+        np.cumsum(lengths[representatives], out=newOffsets[1:])
+        targets = newOffsets[groups][slices] + columns
+        newItems = np.empty(newOffsets[-1], dtype=items.dtype)
+        newItems[targets] = items
+        newUtilities = np.bincount(targets, weights=utilities, minlength=newOffsets[-1]).astype(np.int64)
+        newPrefixUtilities = np.bincount(groups, weights=prefixUtilities, minlength=len(representatives)).astype(np.int64)
+        return _Database(newItems, newUtilities, newOffsets, newPrefixUtilities)
+
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: '_Database') -> None:
         """
         A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
-        :param transactionsPe: transactions the projected database for P U {e}
-        :type transactionsPe: list
-        :param j:the position of j in the list of promising items
-        :type j:int
-        :param itemsToKeep :the list of promising items
-        :type itemsToKeep: list
+        :param transactionsPe: the projected database for P U {e}
+        :type transactionsPe: _Database
         :return: None
         """
-        for i in range(j + 1, len(itemsToKeep)):
-            item = itemsToKeep[i]
-            self._utilityBinArrayLU[item] = 0
-            self._utilityBinArraySU[item] = 0
-        for transaction in transactionsPe:
-            sumRemainingUtility = 0
-            i = len(transaction.getItems()) - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    sumRemainingUtility += transaction.getUtilities()[i]
-                    self._utilityBinArraySU[item] += sumRemainingUtility + transaction.prefixUtility
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
+        prefixUtilities = transactionsPe.prefixUtilities[transactionsPe.owners]
+        transactionUtilities = transactionsPe.remaining[transactionsPe.offsets[:-1]][transactionsPe.owners]
+        self._utilityBinArraySU = _ab._np.bincount(transactionsPe.items, weights=prefixUtilities + transactionsPe.remaining,
+                                                   minlength=self._maxName + 1)
+        self._utilityBinArrayLU = _ab._np.bincount(transactionsPe.items, weights=prefixUtilities + transactionUtilities,
+                                                   minlength=self._maxName + 1)
 
     def _output(self, tempPosition: int, utility: int) -> None:
         """
@@ -666,110 +659,25 @@ class EFIM(_ab._utilityPatterns):
                 s1 += "\t"
         self._finalPatterns[s1] = str(utility)
 
-    def _isEqual(self, transaction1: '_Transaction', transaction2: '_Transaction') -> bool:
-        """
-         A method to Check if two transaction are identical
-         :param  transaction1: the first transaction
-         :type  transaction1: Trans
-         :param  transaction2:    the second transaction
-         :type  transaction2: Trans
-         :return : whether both are identical or not
-         :rtype: bool
-        """
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-
-    def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: '_Dataset') -> None:
+    def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: '_Database') -> None:
         """
         Scan the initial database to calculate the subtree utility of each item using a utility-bin array
         :param dataset: the transaction database
-        :type dataset: list
+        :type dataset: _Database
         :return: None
         """
-        for transaction in dataset.getTransactions():
-            sumSU = 0
-            i = len(transaction.getItems()) - 1
-            while i >= 0:
-                item = transaction.getItems()[i]
-                sumSU += transaction.getUtilities()[i]
-                if item in self._utilityBinArraySU.keys():
-                    self._utilityBinArraySU[item] += sumSU
-                else:
-                    self._utilityBinArraySU[item] = sumSU
-                i -= 1
-
-    def _sortDatabase(self, transactions: list) -> None:
-        """
-        A Method to sort transactions
-        :param transactions: transaction of items
-        :type transactions: Transaction
-        :return: None
-        """
-        cmp_items = _ab._functools.cmp_to_key(self.sort_transaction)
-        transactions.sort(key=cmp_items)
+        self._utilityBinArraySU = _ab._np.bincount(dataset.items, weights=dataset.remaining, minlength=self._maxName + 1)
 
-    def sort_transaction(self, trans1: '_Transaction', trans2: '_Transaction') -> int:
-        """
-        A Method to sort transaction
-        :param trans1: the first transaction
-        :type trans1: Trans
-        :param trans2:the second transaction
-        :type trans2: Trans
-        :return: sorted transaction
-        :rtype: int
-        """
-        trans1_items = trans1.getItems()
-        trans2_items = trans2.getItems()
-        pos1 = len(trans1_items) - 1
-        pos2 = len(trans2_items) - 1
-        if len(trans1_items) < len(trans2_items):
-            while pos1 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(trans1_items) > len(trans2_items):
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = trans2_items[pos2] - trans1_items[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
-
-    def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset: '_Dataset') -> None:
+    def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, items: '_ab._np.ndarray', transactionUtilities: '_ab._np.ndarray') -> None:
         """
         A method to calculate local utility of single itemset
-        :param dataset: the transaction database
-        :type dataset: dataset
+        :param items: the item of every entry of the database
+        :type items: numpy.ndarray
+        :param transactionUtilities: the utility of the transaction of every entry
+        :type transactionUtilities: numpy.ndarray
         :return: None
         """
-        for transaction in dataset.getTransactions():
-            for item in transaction.getItems():
-                if item in self._utilityBinArrayLU:
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility
-                else:
-                    self._utilityBinArrayLU[item] = transaction.transactionUtility
+        self._utilityBinArrayLU = _ab._np.bincount(items, weights=transactionUtilities, minlength=self._dataset.getMaxItem() + 1)
 
     def getPatternsAsDataFrame(self) -> '_pd.DataFrame':
         """
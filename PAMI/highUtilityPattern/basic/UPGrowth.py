@@ -528,6 +528,10 @@ class UPGrowth(_ab._utilityPatterns):
         tree = _UPTree()
         self._creatingItemSets()
         self._finalPatterns = {}
+        self._MapItemToTwu = {}
+        self._MapItemToMinimumUtility = {}
+        self._MapItemsetsToUtilities = _ab._defaultdict(int)
+        self._phuis = []
         for line in self._Database:
             line = line.split("\n")[0]
             transaction = line.strip().split(':')
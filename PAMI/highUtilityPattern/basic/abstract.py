@@ -18,6 +18,7 @@ from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.TransactionStore import TransactionStore as _TransactionStore
 import csv as _csv
 import pandas as _pd
 from collections import defaultdict as _defaultdict
@@ -25,6 +26,7 @@ from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
 import psutil as _psutil
+import numpy as _np
 from array import *
 import functools as _functools
 import sys as _sys
@@ -36,8 +38,10 @@ class _utilityPatterns(_ABC):
 
     :Attributes:
 
-        iFile : str
-            Input file name or path of the input file
+        iFile : str or TransactionStore
+            Input file name or path of the input file. A binary database written by TransactionStore.save() is
+            memory-mapped instead of being parsed.
+            Miners that cannot read a TransactionStore (_readsStore is False) receive it decoded into a temporary text file
         minUtil: integer 
             The user can specify minUtil either in count
         sep : str
@@ -75,16 +79,23 @@ class _utilityPatterns(_ABC):
 
     """
 
+    _readsStore = False
+
     def __init__(self, iFile, minUtil, sep = "\t"):
         """
-        :param iFile: Input file name or path of the input file
-        :type iFile: str
+        :param iFile: Input file name or path of the input file, a binary database or an already loaded TransactionStore
+        :type iFile: str or TransactionStore
         :param minUtil: The user can specify minUtil in count 
         :type minUtil: int 
         :param sep: separator used to distinguish items from each other. The default separator is tab space. However, users can override the default separator
         :type sep: str
         """
 
+        if _TransactionStore.isBinary(iFile):
+            iFile = _TransactionStore.fromBinary(iFile)
+        if isinstance(iFile, _TransactionStore) and not self._readsStore:
+            # miners that only parse text files read the store decoded into a temporary file
+            iFile = iFile.toTemporaryFile(self, sep, 'utility')
         self._iFile = iFile
         self._sep = sep
         self._oFile = " "
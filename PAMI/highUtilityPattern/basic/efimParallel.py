@@ -33,7 +33,8 @@ import os
 import mmap
 import time
 import psutil
-from joblib import Parallel, delayed
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from deprecated import deprecated
 
 __copyright__ = """
@@ -57,6 +58,140 @@ __copyright__ = """
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
 
+# The base database of a worker process: set once per process by _initWorker, either inherited copy-on-write when
+# the pool forks or received once per worker when it spawns.
+_database = {}
+
+
+def _initWorker(items, utilities, offsets, minUtil):
+    """
+    Stores the base database in the worker process and builds the owner of every position and the positions of
+    every item.
+
+    :param items: item ids of all the transactions, one transaction after the other, ascending within a transaction
+    :type items: numpy.ndarray
+    :param utilities: utility of every entry of items
+    :type utilities: numpy.ndarray
+    :param offsets: start of every transaction in items, followed by len(items)
+    :type offsets: numpy.ndarray
+    :param minUtil: the minimum utility
+    :type minUtil: int
+    """
+    owner = np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))
+    order = np.argsort(items, kind='stable')
+    bounds = np.searchsorted(items[order], np.arange(int(items.max(initial=0)) + 2))
+    _database.update(items=items, utilities=utilities, offsets=offsets, owner=owner, minUtil=minUtil,
+                     positions=[order[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)])
+
+
+def _prefixUtilities(prefix, tids):
+    """
+    :param prefix: item ids of a pattern
+    :type prefix: tuple
+    :param tids: the sorted transactions containing the pattern
+    :type tids: numpy.ndarray
+    :return: the utility of the pattern in every transaction
+    :rtype: numpy.ndarray
+    """
+    result = np.zeros(len(tids), dtype=np.int64)
+    for item in prefix:
+        positions = _database['positions'][item]
+        result += _database['utilities'][positions[np.searchsorted(_database['owner'][positions], tids)]]
+    return result
+
+
+def _extend(tids, positions, prefixUtils, item, secondary):
+    """
+    Projects the database of a pattern on one more item and computes the utilities of the projection. A projected
+    transaction is a transaction id and the position of the last item of the pattern in it.
+
+    :param tids: the sorted transactions containing the pattern
+    :type tids: numpy.ndarray
+    :param positions: position of the last item of the pattern in every transaction
+    :type positions: numpy.ndarray
+    :param prefixUtils: utility of the pattern in every transaction
+    :type prefixUtils: numpy.ndarray
+    :param item: the item appended to the pattern
+    :type item: int
+    :param secondary: mask of the items that may extend the pattern
+    :type secondary: numpy.ndarray
+    :return: utility of the new pattern, its projection, its utilities, its primary items and its secondary mask
+    :rtype: tuple
+    """
+    items, utilities, offsets = _database['items'], _database['utilities'], _database['offsets']
+    occurrences = _database['positions'][item]
+    owners = _database['owner'][occurrences]
+    index = np.minimum(np.searchsorted(tids, owners), max(len(tids) - 1, 0))
+    valid = (tids[index] == owners) & (occurrences > positions[index]) if len(tids) else owners < 0
+    newTids, newPositions = owners[valid], occurrences[valid]
+    newUtils = prefixUtils[index[valid]] + utilities[newPositions]
+    utility = int(newUtils.sum())
+
+    lengths = offsets[newTids + 1] - newPositions - 1
+    segments = np.repeat(np.arange(len(newTids)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    remaining = np.arange(int(lengths.sum())) - np.repeat(starts - newPositions - 1, lengths)
+    keep = secondary[items[remaining]]
+    remaining, segments = remaining[keep], segments[keep]
+    remainingItems, values = items[remaining], utilities[remaining]
+    if len(values) == 0:
+        return utility, newTids, newPositions, newUtils, [], secondary
+
+    rest = np.bincount(segments, weights=values, minlength=len(newTids)).astype(np.int64)
+    cumulative = np.cumsum(values)
+    first = np.searchsorted(segments, segments)
+    before = cumulative - values - (cumulative[first] - values[first])
+    total = newUtils[segments] + rest[segments]
+    local = np.bincount(remainingItems, weights=total, minlength=len(secondary))
+    subtree = np.bincount(remainingItems, weights=total - before, minlength=len(secondary))
+    present = np.bincount(remainingItems, minlength=len(secondary)) > 0
+    primary = np.flatnonzero(present & (subtree >= _database['minUtil'])).tolist()
+    return utility, newTids, newPositions, newUtils, primary, present & (local >= _database['minUtil'])
+
+
+def _mineTask(prefix, tids, positions, primary, secondary, budget):
+    """
+    Mines the subtrees of the extensions prefix + item, item in primary, depth first. Once budget projections are
+    done, the remaining subtrees are not mined but returned as new tasks.
+
+    :param prefix: item ids of the pattern
+    :type prefix: tuple
+    :param tids: the sorted transactions containing the pattern
+    :type tids: numpy.ndarray
+    :param positions: position of the last item of the pattern in every transaction
+    :type positions: numpy.ndarray
+    :param primary: items whose extensions are mined
+    :type primary: list
+    :param secondary: items that may extend the pattern
+    :type secondary: list
+    :param budget: maximum number of projections, None for no limit
+    :type budget: int
+    :return: the high utility patterns found, as item id tuples, and the tasks not mined
+    :rtype: tuple
+    """
+    mask = np.zeros(len(_database['positions']), dtype=bool)
+    mask[secondary] = True
+    patterns = {}
+    tasks = []
+    done = [0]
+
+    def search(prefix, tids, positions, prefixUtils, primary, secondary):
+        for item in primary:
+            if budget is not None and done[0] >= budget:
+                tasks.append((prefix, tids, positions, [item], np.flatnonzero(secondary).tolist()))
+                continue
+            done[0] += 1
+            utility, newTids, newPositions, newUtils, newPrimary, newSecondary = _extend(tids, positions, prefixUtils,
+                                                                                         item, secondary)
+            if utility >= _database['minUtil']:
+                patterns[prefix + (item,)] = utility
+            if newPrimary:
+                search(prefix + (item,), newTids, newPositions, newUtils, newPrimary, newSecondary)
+
+    search(prefix, tids, positions, _prefixUtilities(prefix, tids), primary, mask)
+    return patterns, tasks
+
+
 class efimParallel(_ab._utilityPatterns):
     """
     :Description:  EFIM is one of the fastest algorithm to mine High Utility ItemSets from transactional databases.
@@ -86,7 +221,9 @@ class efimParallel(_ab._utilityPatterns):
         sep (str):
             The separator used in the input file.
         threads (int):
-            The number of threads to use.
+            The number of worker processes to use.
+        splitBudget (int):
+            The number of projections a worker does on a task before it hands the subtrees left back as new tasks.
         Patterns (dict):
             A dictionary containing the discovered patterns.
         rename (dict):
@@ -102,12 +239,8 @@ class efimParallel(_ab._utilityPatterns):
 
         read_file():
             Read the input file and return the filtered transactions, primary items, and secondary items.
-        binarySearch(arr, item):
-            Perform a binary search on the given array to find the given item.
-        project(beta, file_data, secondary):
-            Project the given beta itemset on the given database.
-        search(collections):
-            Search for high utility itemsets in the given collections.
+        search(fileData, primary, secondary):
+            Search for high utility itemsets depth first, one task per subtree, on a pool of worker processes.
         mine():
             Start the EFIM algorithm.
         savePatterns(outputFile):
@@ -172,19 +305,20 @@ class efimParallel(_ab._utilityPatterns):
             The complete program was written by Tarun Sreepada under the supervision of Professor Rage Uday Kiran.
     """
 
-    def __init__(self, iFile, minUtil, sep="\t", threads=1):
+    def __init__(self, iFile, minUtil, sep="\t", threads=1, splitBudget=1000):
         super().__init__(iFile, minUtil, sep)
         self.memoryUSS = None
         self.runtime = None
         self.oFile = None
         self.memoryRSS = None
         self.start = None
-        self.inputFile = iFile
+        self.inputFile = self._iFile
         self.minUtil = minUtil
         self.sep = sep
         self.Patterns = {}
         self.rename = {}
         self.threads = threads
+        self.splitBudget = splitBudget
 
     # Read input file
     def _read_file(self):
@@ -270,163 +404,57 @@ class efimParallel(_ab._utilityPatterns):
         return filtered_transactions, primary, secondary
     
 
-    def _binarySearch(self, arr, item):
+    def _search(self, fileData, primary, secondary):
         """
-        Do a binary search on the given array to find the given item.
-
-        :param arr: The array to search in.
-
-        :type arr: list
-
-        :param item: The item to search for
-
-        :type item: int
-        """
-
-        low = 0
-        high = len(arr) - 1
-        mid = 0
-
-        while low <= high:
-            mid = (high + low) // 2
-            if arr[mid] < item:
-                low = mid + 1
-            elif arr[mid] > item:
-                high = mid - 1
-            else:
-                return mid
-
-        return -1
-
-    def _project(self, beta, file_data, secondary):
-        """
-        Project the given beta itemset on the given database.
-
-        :param beta: The beta itemset to be projected
-
-        :type beta: list
-
-        :param file_data: The database to project on.
-
-        :type file_data: list
-
-        :param secondary: The set of secondary items
-
+        Search for high utility patterns depth first.
+
+        The base database is stored once in every worker. A task is the item ids of a pattern, the transactions
+        containing it with the position of its last item, and the items extending it. Every task is mined for at most
+        splitBudget projections; the subtrees left are sent back and submitted as new tasks, so that workers that run
+        out of work pick up parts of large subtrees.
+
+        :param fileData: the transactions, as [items, utilities, prefix utility]
+        :type fileData: dict
+        :param primary: the items whose subtrees are mined
+        :type primary: list
+        :param secondary: the items that may appear in a pattern
         :type secondary: set
-
-        :return:
-
-            projected_db (dict):
-                The projected database.
-            local_utils (dict):
-                The local utilities of the projected database.
-            subtree_utils (dict):
-                The subtree utilities of the projected database.
-            utility (int):
-                The utility of the projected database.
         """
-
-
-        projected_db = {}
-        local_utils = {}
-        subtree_utils = {}
-        utility = 0     
-
-        added = set()
-
-        item = beta[-1]
-
-        temp = [v for k, v in file_data.items() if item in k]
-        start = time.time()
-
-        for v in temp:
-            index = self._binarySearch(v[0], item)
-
-            curr = v[1][index] + v[2]
-            utility += curr
-
-            newKey = []
-            newVal = []
-
-            for i in range(index+1, len(v[0])):
-                if v[0][i] in secondary:
-                    newKey.append(v[0][i])
-                    newVal.append(v[1][i])
-
-            if len(newKey) == 0:
-                continue
-
-            s = sum(newVal)
-            temp = 0
-
-            for i in range(len(newKey)):
-                if newKey[i] in added:
-                    local_utils[newKey[i]] += s + curr
-                    subtree_utils[newKey[i]] += s + curr - temp
-                else:
-                    local_utils[newKey[i]] = s + curr
-                    subtree_utils[newKey[i]] = s + curr - temp
-                    added.add(newKey[i])
-                
-                temp += newVal[i]
-            
-            fs = frozenset(newKey)
-
-            if fs not in projected_db:
-                projected_db[fs] = [newKey, newVal, curr]
-            else:
-                projected_db[fs][1] = [x + y for x, y in zip(projected_db[fs][1], newVal)]
-                projected_db[fs][2] += curr
-
-        nprimary = [key for key in subtree_utils.keys() if subtree_utils[key] >= self.minUtil]
-        nsecondary = set([key for key in local_utils.keys() if local_utils[key] >= self.minUtil])
-
-        return beta, projected_db, nsecondary, nprimary, utility
-    
-
-    def _search(self, collections):
-
+        transactions = list(fileData.values())
+        lengths = [len(t[0]) for t in transactions]
+        offsets = np.zeros(len(transactions) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(lengths)
+        items = np.array([x for t in transactions for x in t[0]], dtype=np.int64)
+        utilities = np.array([x for t in transactions for x in t[1]], dtype=np.int64)
+        initargs = (items, utilities, offsets, self.minUtil)
+        tids = np.arange(len(transactions), dtype=np.int64)
+        tasks = [((), tids, offsets[:-1] - 1, [item], sorted(secondary)) for item in primary]
+
+        if self.threads <= 1:
+            _initWorker(*initargs)
+            for task in tasks:
+                self._collect(_mineTask(*task, None)[0])
+            return
+
+        with ProcessPoolExecutor(max_workers=self.threads, initializer=_initWorker, initargs=initargs) as executor:
+            pending = set(executor.submit(_mineTask, *task, self.splitBudget) for task in tasks)
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    patterns, newTasks = future.result()
+                    self._collect(patterns)
+                    for task in newTasks:
+                        pending.add(executor.submit(_mineTask, *task, self.splitBudget))
+
+    def _collect(self, patterns):
         """
-        Search for frequent patterns in the given collections.
+        Stores the patterns found by a task under their item names.
 
-        :param collections: list of collections to search in
-
-        :type collections: list
+        :param patterns: utility of every pattern, keyed by item id tuples
+        :type patterns: dict
         """
-
-        if self.threads > 1:
-            with Parallel(n_jobs=self.threads) as parallel:
-                while len(collections) > 0:
-                    new_collections = []
-
-                    # print("Num of tasks:", sum(len(collections[i][2]) for i in range(len(collections))))
-                    results = parallel(delayed(self._project)(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3]) for i in range(len(collections)) for j in range(len(collections[i][2])))
-
-                    for i in range(len(results)):
-                        beta, projected_db, secondary, primary, utility = results[i]
-                        if utility >= self.minUtil:
-                            pattern = "\t".join([self.rename[x] for x in beta])
-                            # self.Patterns[tuple(beta)] = utility
-                            self.Patterns[pattern] = utility
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-                    
-                    collections = new_collections
-
-        else:
-            while len(collections) > 0:
-                new_collections = []
-                for i in range(len(collections)):
-                    for j in range(len(collections[i][2])):
-                        beta, projected_db, secondary, primary, utility = self._project(collections[i][0] + [collections[i][2][j]], collections[i][1], collections[i][3])
-                        if utility >= self.minUtil:
-                            pattern = "\t".join([self.rename[x] for x in beta])
-                            # self.Patterns[tuple(beta)] = utility
-                            self.Patterns[pattern] = utility
-                        if len(primary) > 0:
-                            new_collections.append([beta, projected_db, primary, secondary])
-
-                collections = new_collections
+        for beta, utility in patterns.items():
+            self.Patterns["\t".join([self.rename[x] for x in beta])] = utility
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
@@ -445,11 +473,13 @@ class efimParallel(_ab._utilityPatterns):
 
         self.start = time.time()
 
-        fileData, primary, secondary = self._read_file()
+        self.Patterns = {}
+        self.rename = {}
 
-        collection = [[[], fileData, primary, secondary]]
+        fileData, primary, secondary = self._read_file()
 
-        self._search(collection)
+        self._search(fileData, primary, secondary)
+        self._finalPatterns = self.Patterns
 
         self.memoryRSS = ps.memory_info().rss
         self.memoryUSS = ps.memory_full_info().uss
@@ -570,13 +600,5 @@ if __name__ == "__main__":
         print("Total Memory in RSS",  _ap.getMemoryRSS())
         print("Total ExecutionTime in seconds:", _ap.getRuntime())
     else:
-        _ap = efimParallel('/Users/likhitha/Downloads/Utility_T10I4D100K.csv', 50000, '\t')
-        _ap.mine()
-        _ap.mine()
-        print("Total number of High Utility Patterns:", len(_ap.getPatterns()))
-        _ap.save('/Users/likhitha/Downloads/UPGrowth_output.txt')
-        print("Total Memory in USS:", _ap.getMemoryUSS())
-        print("Total Memory in RSS", _ap.getMemoryRSS())
-        print("Total ExecutionTime in ms:", _ap.getRuntime())
         print("Error! The number of input parameters do not match the total number of parameters provided")
 
@@ -22,7 +22,7 @@
 #
 
 
-import abstract as _hus
+from PAMI.highUtilityPatternsInStreams import abstract as _hus
 import pandas as pd
 from functools import reduce
 from operator import and_
@@ -540,6 +540,9 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         save()
             Saves the patterns generated from each window in a file
 
+        add_transaction(transaction), add_pane(transactions), add_stream(stream, callback), current_patterns()
+            Mine a live stream pushed transaction by transaction, see _highUtilityPatternStreamMining
+
 
     ** Executing the code on terminal:**
     ---------------------------------------
@@ -650,6 +653,38 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         return minUtil
         
 
+    def _newTree(self):
+        """
+        :return: an empty tree holding windowSize panes
+
+        :rtype: _SHUTree
+        """
+
+        return _SHUTree(int(self._windowSize), int(self._paneSize))
+
+    def _insertTransaction(self, tree, items, utilities, utilitySum):
+        """
+        Inserts a transaction into the current pane of the tree
+
+        :param tree: the tree of the window
+
+        :type tree: _SHUTree
+
+        :param items: items of the transaction
+
+        :type items: list
+
+        :param utilities: utilities of the items
+
+        :type utilities: list
+
+        :param utilitySum: utility of the transaction
+
+        :type utilitySum: float
+        """
+
+        tree.addTransaction(items, utilitySum, utilities)
+
     def createPrefixBranch(self, root):
         """
         Creates the prefix branch of the node
@@ -833,12 +868,18 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         """
         self.mine()
 
-    def mine(self):
+    def mine(self, incremental=True):
         """
         This function will start the mining process
+
+        :param incremental: if True, the utility of every candidate is accumulated pane by pane, so that a slide only
+                            computes the utilities of the candidates in the added pane; otherwise every candidate is
+                            verified by scanning all the transactions of the window
+        :type incremental: bool
         """
         #global _minUtil
         self.__startTime = _hus._time.time()
+        self.__finalPatterns = {}
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minUtil is None:
@@ -869,6 +910,11 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
                                            self._utilitySum[i * self.__paneSize + j],
                                            self._utilities[i * self.__paneSize + j])
 
+        self._resetPanes()
+        if incremental:
+            for i in range(0, self.__windowSize):
+                self._addPane(transactionwiseUtility[i * self.__paneSize:(i + 1) * self.__paneSize])
+
         startIndex = 0
         endIndex = self.__windowSize * self.__paneSize
 
@@ -876,21 +922,28 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
 
             filteredItemsets = {}
 
-            self.treeGenerations(self.__tree, self._minUtil, filteredItemsets)
+            self.treeGenerations(self.__tree, self._minUtil, filteredItemsets, [])
 
             results = []
 
-            for itemSetLen in filteredItemsets:
-                for itemSet in filteredItemsets[itemSetLen]:
-                    itemSetUtility = 0
-                    for transId in range(startIndex, endIndex):
-                        if self.contains(list(transactionwiseUtility[transId].keys()), itemSet):
-                            for item in itemSet:
-                                itemSetUtility += transactionwiseUtility[transId][item]
-
+            if incremental:
+                candidates = [itemSet for itemSetLen in filteredItemsets for itemSet in filteredItemsets[itemSetLen]]
+                for itemSet, itemSetUtility in zip(candidates, self._windowUtilities(candidates)):
                     if itemSetUtility >= self._minUtil:
                         results.append([itemSet, itemSetUtility])
 
+            else:
+                for itemSetLen in filteredItemsets:
+                    for itemSet in filteredItemsets[itemSetLen]:
+                        itemSetUtility = 0
+                        for transId in range(startIndex, endIndex):
+                            if self.contains(list(transactionwiseUtility[transId].keys()), itemSet):
+                                for item in itemSet:
+                                    itemSetUtility += transactionwiseUtility[transId][item]
+
+                        if itemSetUtility >= self._minUtil:
+                            results.append([itemSet, itemSetUtility])
+
             self.__finalPatterns[(startIndex, endIndex)] = results
 
             if endIndex >= len(self._transactions):
@@ -898,6 +951,10 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
 
             self.__tree.removeBatch()
 
+            if incremental:
+                self._evictPane()
+                self._addPane(transactionwiseUtility[endIndex:endIndex + self.__paneSize])
+
             for i in range(0, self.__paneSize):
                 self.__tree.addTransaction(self._transactions[endIndex + i], self._utilitySum[endIndex + i],
                                            self._utilities[endIndex + i])
@@ -22,6 +22,7 @@ from urllib.request import urlopen as _urlopen
 import csv as _csv
 import pandas as _pd
 from collections import defaultdict as _defaultdict
+from collections import deque as _deque
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
@@ -73,6 +74,20 @@ class _highUtilityPatternStreamMining(_ABC):
             This function outputs the total amount of RSS memory consumed by a mining algorithm
         getRuntime()
             This function outputs the total runtime of a mining algorithm
+        _addPane(transactions)
+            Appends a pane of transactions to the panes of the current window
+        _evictPane()
+            Removes the oldest pane of the current window
+        _windowUtilities(candidates)
+            Computes the utilities of the candidates in the current window from their per-pane utility accumulators
+        add_transaction(transaction)
+            Pushes a transaction of a live stream, the window slides every paneSize transactions
+        add_pane(transactions)
+            Pushes a pane of a live stream and slides the window
+        add_stream(stream, callback)
+            Pushes every transaction of an iterator or of an asyncio async iterator
+        current_patterns()
+            Returns the high utility patterns of the current window of the live stream
 
     """
 
@@ -98,6 +113,226 @@ class _highUtilityPatternStreamMining(_ABC):
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._finalPatterns = {}
+        self._resetPanes()
+
+    def _resetPanes(self):
+        """
+        Empties the panes of the current window and the utility accumulators of the candidates
+        """
+
+        self._panes = _deque()
+        self._nextPaneId = 0
+        self._accumulators = {}
+        self._streamTree = None
+        self._pendingPane = []
+        self._windowStart = 0
+        self._windowEnd = 0
+        self._currentPatterns = None
+        self._callback = None
+
+    def _addPane(self, transactions):
+        """
+        Appends a pane to the current window. The transactions of the pane are indexed by item, so that the utility
+        of a candidate in the pane is computed from the transactions containing all its items only.
+
+        :param transactions: the transactions of the pane, every transaction maps its items to their utilities
+        :type transactions: list
+        """
+
+        index = {}
+        for tid, transaction in enumerate(transactions):
+            for item in transaction:
+                index.setdefault(item, []).append(tid)
+        self._panes.append((self._nextPaneId, transactions, index))
+        self._nextPaneId += 1
+
+    def _evictPane(self):
+        """
+        Removes the oldest pane of the current window. The accumulators drop its utility the next time they are read.
+        """
+
+        self._panes.popleft()
+
+    def _paneUtility(self, pane, itemSet):
+        """
+        :param pane: a pane of the current window
+        :type pane: tuple
+        :param itemSet: the items of a candidate
+        :type itemSet: list
+        :return: the utility of the candidate in the pane
+        :rtype: float
+        """
+
+        transactions, index = pane[1], pane[2]
+        tidLists = [index.get(item) for item in itemSet]
+        if any(tids is None for tids in tidLists):
+            return 0
+        tidLists.sort(key=len)
+        tids = set(tidLists[0]).intersection(*tidLists[1:])
+        return sum(transactions[tid][item] for tid in sorted(tids) for item in itemSet)
+
+    def _windowUtilities(self, candidates):
+        """
+        Computes the utilities of the candidates in the current window. Every candidate keeps the id of its first pane
+        and its utility in every pane since then. A candidate already known from the previous window only drops the
+        panes evicted since and computes its utility in the panes added since, instead of rescanning the window.
+        The accumulators of the candidates that are not given are released.
+
+        :param candidates: the items of every candidate
+        :type candidates: list
+        :return: the utility of every candidate in the current window
+        :rtype: list
+        """
+
+        if not self._panes:
+            return [0 for _ in candidates]
+        firstPaneId = self._panes[0][0]
+        accumulators, utilities = {}, []
+        for itemSet in candidates:
+            key = tuple(itemSet)
+            if key in accumulators:
+                startId, values = accumulators[key]
+            else:
+                startId, values = self._accumulators.get(key, (firstPaneId, []))
+                if startId < firstPaneId:
+                    values = values[firstPaneId - startId:]
+                    startId = firstPaneId
+                for position in range(startId + len(values) - firstPaneId, len(self._panes)):
+                    values.append(self._paneUtility(self._panes[position], itemSet))
+                accumulators[key] = (startId, values)
+            utilities.append(sum(values))
+        self._accumulators = accumulators
+        return utilities
+
+    @_abstractmethod
+    def _newTree(self):
+        """Returns an empty tree holding the panes of a window"""
+
+        pass
+
+    @_abstractmethod
+    def _insertTransaction(self, tree, items, utilities, utilitySum):
+        """Inserts a transaction into the current pane of a tree"""
+
+        pass
+
+    @_abstractmethod
+    def treeGenerations(self, root, netUtil, candidatePattern, curItem):
+        """Generates the candidate patterns of a tree"""
+
+        pass
+
+    def _toTransaction(self, transaction):
+        """
+        :param transaction: a dictionary of items and utilities, a pair of lists of items and of utilities optionally
+                            followed by the transaction utility, or a line of the input file
+        :type transaction: dict or tuple or str
+        :return: the items, their utilities and the transaction utility
+        :rtype: tuple
+        """
+
+        if isinstance(transaction, str):
+            parts = transaction.strip().split(":")
+            items = [x for x in parts[0].split(self._sep) if x]
+            utilities = [float(x) for x in parts[2].split(self._sep) if x]
+            return items, utilities, float(parts[1])
+        if isinstance(transaction, dict):
+            items, utilities = list(transaction.keys()), list(transaction.values())
+            return items, utilities, sum(utilities)
+        items, utilities = list(transaction[0]), list(transaction[1])
+        return items, utilities, transaction[2] if len(transaction) > 2 else sum(utilities)
+
+    def add_transaction(self, transaction):
+        """
+        Pushes a transaction of a live stream. The transactions are buffered until a pane of paneSize transactions is
+        complete, which is then added with add_pane.
+
+        :param transaction: a dictionary of items and utilities, a pair of lists of items and of utilities optionally
+                            followed by the transaction utility, or a line of the input file
+        :type transaction: dict or tuple or str
+        """
+
+        self._pendingPane.append(self._toTransaction(transaction))
+        if len(self._pendingPane) >= int(self._paneSize):
+            pane, self._pendingPane = self._pendingPane, []
+            self.add_pane(pane)
+
+    def add_pane(self, transactions):
+        """
+        Pushes a pane of a live stream. Once the window holds windowSize panes, the oldest pane is removed from the
+        tree and from the utility accumulators before the new one is inserted, so the memory held is bounded by the
+        window. If a callback is set, the patterns of every complete window are passed to it together with the
+        (start, end) transaction indices of the window.
+
+        :param transactions: the transactions of the pane, in any of the forms accepted by add_transaction
+        :type transactions: list
+        """
+
+        windowSize = int(self._windowSize)
+        if self._streamTree is None:
+            self._streamTree = self._newTree()
+        transactions = [self._toTransaction(x) for x in transactions]
+        if len(self._panes) == windowSize:
+            self._windowStart += len(self._panes[0][1])
+            self._streamTree.removeBatch()
+            self._evictPane()
+        self._streamTree.batchIndex = len(self._panes)
+        for items, utilities, utilitySum in transactions:
+            self._insertTransaction(self._streamTree, list(items), list(utilities), utilitySum)
+        self._addPane([dict(zip(items, utilities)) for items, utilities, _ in transactions])
+        self._windowEnd += len(transactions)
+        self._currentPatterns = None
+        if self._callback is not None and len(self._panes) == windowSize:
+            self._callback((self._windowStart, self._windowEnd), self.current_patterns())
+
+    def add_stream(self, stream, callback=None):
+        """
+        Pushes every transaction of a stream. An asyncio async iterator is consumed by the returned coroutine, which
+        has to be awaited. The transactions of an incomplete last pane stay buffered until the pane is completed.
+
+        :param stream: an iterator or an async iterator of transactions, in any of the forms accepted by add_transaction
+        :type stream: iterator
+        :param callback: called with the (start, end) transaction indices and the patterns of every complete window
+        :type callback: function
+        :return: None, or a coroutine for an async iterator
+        """
+
+        if callback is not None:
+            self._callback = callback
+        if hasattr(stream, '__aiter__'):
+            return self._addAsyncStream(stream)
+        for transaction in stream:
+            self.add_transaction(transaction)
+
+    async def _addAsyncStream(self, stream):
+        """
+        :param stream: an async iterator of transactions
+        :type stream: async iterator
+        """
+
+        async for transaction in stream:
+            self.add_transaction(transaction)
+
+    def current_patterns(self):
+        """
+        Mines the current window of the live stream, unless it was already mined since its last slide.
+
+        :return: the items and the utility of every high utility pattern of the current window
+        :rtype: list
+        """
+
+        if self._currentPatterns is None:
+            minUtil = float(self._minUtil)
+            results = []
+            if self._streamTree is not None:
+                filteredItemsets = {}
+                self.treeGenerations(self._streamTree, minUtil, filteredItemsets, [])
+                candidates = [itemSet for itemSetLen in filteredItemsets for itemSet in filteredItemsets[itemSetLen]]
+                for itemSet, itemSetUtility in zip(candidates, self._windowUtilities(candidates)):
+                    if itemSetUtility >= minUtil:
+                        results.append([itemSet, itemSetUtility])
+            self._currentPatterns = results
+        return self._currentPatterns
 
     @_abstractmethod
     def startMine(self):
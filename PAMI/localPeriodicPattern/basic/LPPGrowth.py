@@ -579,16 +579,17 @@ class LPPGrowth(_ab._localPeriodicPatterns):
                     bitVector = bitVector << different
                     self.tsList[item] = self.tsList[item] | bitVector"""
         self.__PTL = {k: v for k, v in PTL.items() if len(v) > 0}
-        self.__items = list(self.__PTL.keys())
+        # one order for all the transactions of the tree, so that the tids of a pattern are not split between paths
+        self.__items = sorted(self.__PTL, key=lambda x: len(self.__PTL[x]), reverse=True)
 
     def __createLPPTree(self) -> None:
         """
         Create transaction tree of local periodic item from input data.
         """
+        rank = {item: i for i, item in enumerate(self.__items)}
         for line in self.__Database:
             ts = int(line[0])
-            tempTransaction = [item for item in line[1:] if item in self.__items]
-            transaction = sorted(tempTransaction, key=lambda x: len(self.__PTL[x]), reverse=True)
+            transaction = sorted((item for item in line[1:] if item in rank), key=rank.get)
             self.__root.addTransaction(transaction, ts)
             # for line in self.__Database:
             #     tid = int(transaction[0])
@@ -736,7 +737,7 @@ class LPPGrowth(_ab._localPeriodicPatterns):
             if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
                 PTL.add((start, tsPre))
             if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
+                PTL.add((start, self.__tsMax))
         return PTL
 
     def __convert(self, value: Any) -> float:
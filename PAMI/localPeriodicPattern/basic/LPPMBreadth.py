@@ -59,6 +59,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.localPeriodicPattern.basic import abstract as _ab
+from PAMI.extras import tidset as _ts
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
 from deprecated import deprecated
@@ -118,18 +119,18 @@ class LPPMBreadth(_ab._localPeriodicPatterns):
         finalPatterns : dict
             To store local periodic patterns and its PTL.
         tsList : dict
-            To store items and its time stamp as bit vector.
+            To store items and their time stamps as sorted arrays.
         sep: str
             separator used to distinguish items from each other. The default separator is tab space.
 
     :Methods:
 
         createTSList()
-            Create the tsList as bit vector from input data.
+            Create the tsList as sorted timestamp arrays from input data.
         generateLPP()
             Generate 1 length local periodic pattens by tsList and execute depth first search.
         calculatePTL(tsList)
-            Calculate PTL from input tsList as bit vector
+            Calculate PTL from the sorted timestamps of a pattern
         LPPMBreathSearch(extensionOfP)
             Mining local periodic patterns using breadth first search.
         mine()
@@ -250,160 +251,45 @@ class LPPMBreadth(_ab._localPeriodicPatterns):
 
     def __createTSList(self) -> None:
         """
-        Create tsList as bit vector from temporal data.
+        Create tsList as a sorted array of the timestamps of every item.
         """
-        # for line in self.Database:
-        #     count = 1
-        #     bitVector = 0b1 << count
-        #     bitVector = bitVector | 0b1
-        #     self.tsMin = int(line.pop(0))
-        #     self.tsList = {item: bitVector for item in line}
-        #     count += 1
-        #     ts = ' '
-        count = 1
-        bitVector = None
+        tsList = {}
         for line in self.__Database:
-            bitVector = 0b1 << count
-            bitVector = bitVector | 0b1
-            ts = line[0]
+            ts = int(line[0])
             for item in line[1:]:
-                if self.__tsList.get(item):
-                    different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-                    self.__tsList[item] = self.__tsList[item] << different
-                    self.__tsList[item] = self.__tsList[item] | 0b1
-                else:
-                    self.__tsList[item] = bitVector
-            count += 1
-            self.__tsMax = int(ts)
-
-        for item in self.__tsList:
-            different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-            self.__tsList[item] = self.__tsList[item] << different
-        self._localPeriodicPatterns__maxPer = self.__convert(self._localPeriodicPatterns__maxPer)
-        self._localPeriodicPatterns__maxSoPer = self.__convert(self._localPeriodicPatterns__maxSoPer)
-        self._localPeriodicPatterns__minDur = self.__convert(self._localPeriodicPatterns__minDur)
+                timestamps = tsList.setdefault(item, [])
+                if not timestamps or timestamps[-1] != ts:
+                    timestamps.append(ts)
+            self.__tsMax = ts
+        self.__tsList = {item: _ts.fromList(timestamps, _ab._np.int64) for item, timestamps in tsList.items()}
 
     def __generateLPP(self) -> None:
         """
-        Generate local periodic items from bit vector tsList.
-        When finish generating local periodic items, execute mining depth first search.
+        Generate local periodic items from tsList.
+        When finish generating local periodic items, execute mining breadth first search.
         """
         I = set()
-        PTL = {}
         for item in self.__tsList:
-            PTL[item] = set()
-            ts = list(bin(self.__tsList[item]))
-            ts = ts[2:]
-            start = -1
-            currentTs = 1
-            tsPre = ' '
-            soPer = ' '
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    tsPre = currentTs
-                    currentTs += 1
-                    break
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    per = currentTs - tsPre
-                    if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                        start = tsPre
-                        soPer = self._localPeriodicPatterns__maxSoPer
-                    if start != -1:
-                        soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                        if soPer > self._localPeriodicPatterns__maxSoPer:
-                            if tsPre - start >= self._localPeriodicPatterns__minDur:
-                                PTL[item].add((start, tsPre))
-                            """else:
-                                bitVector = 0b1 << currentTs
-                                different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                                bitVector = bitVector | 0b1
-                                bitVector = bitVector << different
-                                self.tsList[item] = self.tsList[item] | bitVector"""
-                            start = -1
-                    tsPre = currentTs
-                    currentTs += 1
-            if start != -1:
-                soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, tsPre))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
-                if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, self.__tsMax))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
-            if len(PTL[item]) > 0:
+            PTL = self.__calculatePTL(self.__tsList[item])
+            if len(PTL) > 0:
                 I |= {item}
-                self._localPeriodicPatterns__finalPatterns[item] = PTL[item]
+                self._localPeriodicPatterns__finalPatterns[item] = PTL
         I = sorted(list(I))
         _map = {-1 : I}
-        #I = set(I)
         while len(_map) > 0:
             _map = self.__LPPMBreadthSearch(_map)
 
-    def __calculatePTL(self, tsList: int) -> Set[Tuple[int, int]]:
+    def __calculatePTL(self, tsList: _ab._np.ndarray) -> Set[Tuple[int, int]]:
         """
-        calculate PTL from tsList as bit vector.
+        calculate PTL from the sorted timestamps of a pattern.
 
-        :param tsList: it is one item's tsList which is used bit vector.
-        :type tsList: int
-        :return: it is PTL of input item.
+        :param tsList: it is one pattern's tsList.
+        :type tsList: numpy.ndarray
+        :return: it is PTL of input pattern.
         :rtype: set
         """
-        tsList = list(bin(tsList))
-        tsList = tsList[2:]
-        start = -1
-        currentTs = 1
-        PTL = set()
-        tsPre = ' '
-        soPer = ' '
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                tsPre = currentTs
-                currentTs += 1
-                break
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                per = currentTs - tsPre
-                if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                    start = tsPre
-                    soPer = self._localPeriodicPatterns__maxSoPer
-                if start != -1:
-                    soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                    if soPer > self._localPeriodicPatterns__maxSoPer:
-                        if tsPre - start >= self._localPeriodicPatterns__minDur:
-                            PTL.add((start, tsPre))
-                        start = -1
-                tsPre = currentTs
-                currentTs += 1
-        if start != -1:
-            soPer = max(0, soPer + self.__tsMax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsMax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-        return PTL
+        return _ts.localPeriods(tsList, self._localPeriodicPatterns__maxPer, self._localPeriodicPatterns__maxSoPer,
+                                self._localPeriodicPatterns__minDur, self.__tsMax)
 
     def __LPPMBreadthSearch(self, wMap: Dict[Union[int, str], List[Union[int, str]]]) -> Dict[Union[int, str], List[Union[int, str]]]:
         """
@@ -425,13 +311,12 @@ class LPPMBreadth(_ab._localPeriodicPatterns):
                     listP = [p]
                 tsp = self.__tsList[listP[0]]
                 for item in listP[1:]:
-                    tsp = tsp & self.__tsList[item]
+                    tsp = _ts.intersect(tsp, self.__tsList[item])
             for x in range(len(wMap[p])-1):
                 for y in range(x+1, len(wMap[p])):
-                    if p == -1:
-                        tspxy = self.__tsList[wMap[p][x]] & self.__tsList[wMap[p][y]]
-                    else:
-                        tspxy = tsp & self.__tsList[wMap[p][x]] & self.__tsList[wMap[p][y]]
+                    tspxy = _ts.intersect(self.__tsList[wMap[p][x]], self.__tsList[wMap[p][y]])
+                    if p != -1:
+                        tspxy = _ts.intersect(tsp, tspxy)
                     PTL = self.__calculatePTL(tspxy)
                     if len(PTL) > 0:
                         if p == -1:
@@ -58,6 +58,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.localPeriodicPattern.basic import abstract as _ab
+from PAMI.extras import tidset as _ts
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
 from deprecated import deprecated
@@ -116,18 +117,18 @@ class LPPMDepth(_ab._localPeriodicPatterns):
         finalPatterns : dict
             To store local periodic patterns and its PTL.
         tsList : dict
-            To store items and its time stamp as bit vector.
+            To store items and their time stamps as sorted arrays.
         sep : str
             separator used to distinguish items from each other. The default separator is tab space.
 
     :Methods:
 
         createTSlist()
-            Create the TSlist as bit vector from input data.
+            Create the TSlist as sorted timestamp arrays from input data.
         generateLPP()
             Generate 1 length local periodic pattens by TSlist and execute depth first search.
         calculatePTL(tsList)
-            Calculate PTL from input tsList as bit vector
+            Calculate PTL from the sorted timestamps of a pattern
         LPPMDepthSearch(extensionOfP)
             Mining local periodic patterns using depth first search.
         mine()
@@ -249,149 +250,43 @@ class LPPMDepth(_ab._localPeriodicPatterns):
 
     def __createTSlist(self) -> None:
         """
-        Create tsList as bit vector from temporal data.
+        Create tsList as a sorted array of the timestamps of every item.
         """
-        count = 1
-        bitVector = None
+        tsList = {}
         for line in self.__Database:
-            bitVector = 0b1 << count
-            bitVector = bitVector | 0b1
-            ts = line[0]
+            ts = int(line[0])
             for item in line[1:]:
-                if self.__tsList.get(item):
-                    different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-                    self.__tsList[item] = self.__tsList[item] << different
-                    self.__tsList[item] = self.__tsList[item] | 0b1
-                else:
-                    self.__tsList[item] = bitVector
-            count += 1
-            self.__tsmax = int(ts)
-        for item in self.__tsList:
-            different = abs(bitVector.bit_length() - self.__tsList[item].bit_length())
-            self.__tsList[item] = self.__tsList[item] << different
-        self._localPeriodicPatterns__maxPer = self.__convert(self._localPeriodicPatterns__maxPer)
-        self._localPeriodicPatterns__maxSoPer = self.__convert(self._localPeriodicPatterns__maxSoPer)
-        self._localPeriodicPatterns__minDur = self.__convert(self._localPeriodicPatterns__minDur)
+                timestamps = tsList.setdefault(item, [])
+                if not timestamps or timestamps[-1] != ts:
+                    timestamps.append(ts)
+            self.__tsmax = ts
+        self.__tsList = {item: _ts.fromList(timestamps, _ab._np.int64) for item, timestamps in tsList.items()}
 
     def __generateLPP(self) -> None:
         """
-        Generate local periodic items from bit vector tsList.
+        Generate local periodic items from tsList.
         When finish generating local periodic items, execute mining depth first search.
         """
         I = set()
-        PTL = {}
         for item in self.__tsList:
-            PTL[item] = set()
-            ts = list(bin(self.__tsList[item]))
-            ts = ts[2:]
-            start = -1
-            currentTs = 1
-            tsPre = ' '
-            soPer = ' '
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    tsPre = currentTs
-                    currentTs += 1
-                    break
-            for t in ts[currentTs:]:
-                if t == '0':
-                    currentTs += 1
-                    continue
-                else:
-                    per = currentTs - tsPre
-                    if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                        start = tsPre
-                        soPer = self._localPeriodicPatterns__maxSoPer
-                    if start != -1:
-                        soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                        if soPer > self._localPeriodicPatterns__maxSoPer:
-                            if tsPre - start >= self._localPeriodicPatterns__minDur:
-                                PTL[item].add((start, tsPre))
-                            """else:
-                                bitVector = 0b1 << currentTs
-                                different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                                bitVector = bitVector | 0b1
-                                bitVector = bitVector << different
-                                self.tsList[item] = self.tsList[item] | bitVector"""
-                            start = -1
-                    tsPre = currentTs
-                    currentTs += 1
-            if start != -1:
-                soPer = max(0, soPer + self.__tsmax - tsPre - self._localPeriodicPatterns__maxPer)
-                if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, tsPre))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
-                if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsmax - start >= self._localPeriodicPatterns__minDur:
-                    PTL[item].add((start, self.__tsmax))
-                """else:
-                    bitVector = 0b1 << currentTs+1
-                    different = abs(self.tsList[item].bit_length() - bitVector.bit_length())
-                    bitVector = bitVector | 0b1
-                    bitVector = bitVector << different
-                    self.tsList[item] = self.tsList[item] | bitVector"""
-            if len(PTL[item]) > 0:
+            PTL = self.__calculatePTL(self.__tsList[item])
+            if len(PTL) > 0:
                 I |= {item}
-                self._localPeriodicPatterns__finalPatterns[item] = PTL[item]
+                self._localPeriodicPatterns__finalPatterns[item] = PTL
         I = sorted(list(I))
-        # I = set(I)
         self.__LPPMDepthSearch(I)
 
-    def __calculatePTL(self, tsList: int) -> Set[Tuple[int, int]]:
+    def __calculatePTL(self, tsList: _ab._np.ndarray) -> Set[Tuple[int, int]]:
         """
-        calculate PTL from tsList as bit vector.
+        calculate PTL from the sorted timestamps of a pattern.
 
-        :param tsList: it is one item's tsList which is used bit vector.
-        :type tsList: int
-        :return: it is PTL of input item.
+        :param tsList: it is one pattern's tsList.
+        :type tsList: numpy.ndarray
+        :return: it is PTL of input pattern.
         :rtype: set
         """
-        tsList = list(bin(tsList))
-        tsList = tsList[2:]
-        start = -1
-        currentTs = 1
-        PTL = set()
-        tsPre = ' '
-        soPer = ' '
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                tsPre = currentTs
-                currentTs += 1
-                break
-        for ts in tsList[currentTs:]:
-            if ts == '0':
-                currentTs += 1
-                continue
-            else:
-                per = currentTs - tsPre
-                if per <= self._localPeriodicPatterns__maxPer and start == -1:
-                    start = tsPre
-                    soPer = self._localPeriodicPatterns__maxSoPer
-                if start != -1:
-                    soPer = max(0, soPer + per - self._localPeriodicPatterns__maxPer)
-                    if soPer > self._localPeriodicPatterns__maxSoPer:
-                        if tsPre - start >= self._localPeriodicPatterns__minDur:
-                            PTL.add((start, tsPre))
-                        start = -1
-                tsPre = currentTs
-                currentTs += 1
-        if start != -1:
-            soPer = max(0, soPer + self.__tsmax - tsPre - self._localPeriodicPatterns__maxPer)
-            if soPer > self._localPeriodicPatterns__maxSoPer and tsPre - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-            if soPer <= self._localPeriodicPatterns__maxSoPer and self.__tsmax - start >= self._localPeriodicPatterns__minDur:
-                PTL.add((start, tsPre))
-        return PTL
+        return _ts.localPeriods(tsList, self._localPeriodicPatterns__maxPer, self._localPeriodicPatterns__maxSoPer,
+                                self._localPeriodicPatterns__minDur, self.__tsmax)
 
     def __LPPMDepthSearch(self, extensionsOfP: List[Union[Tuple[str, ...], str]]) -> None:
         """
@@ -404,7 +299,7 @@ class LPPMDepth(_ab._localPeriodicPatterns):
         for x in range(len(extensionsOfP)-1):
             extensionsOfPx = set()
             for y in range(x+1,len(extensionsOfP)):
-                tspxy = self.__tsList[extensionsOfP[x]] & self.__tsList[extensionsOfP[y]]
+                tspxy = _ts.intersect(self.__tsList[extensionsOfP[x]], self.__tsList[extensionsOfP[y]])
                 PTL = self.__calculatePTL(tspxy)
                 if len(PTL) > 0:
                     if type(extensionsOfP[x]) == str:
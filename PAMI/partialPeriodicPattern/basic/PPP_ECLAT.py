@@ -53,6 +53,7 @@ __copyright__ = """
 
 
 from PAMI.partialPeriodicPattern.basic import abstract as _ab
+from PAMI.extras import tidset as _ts
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
 import numpy as np
@@ -311,33 +312,41 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         self.mine()
 
     def _getPerSup(self, arr):
-        arr = list(arr)
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-        locs = len(np.where(arr <= self._period)[0])
+        """
+        Counts the periodic gaps of a pattern, i.e., the gaps between its consecutive timestamps that are at most period.
+
+        :param arr: sorted timestamps of a pattern
+        :type arr: numpy.ndarray
+        :return: periodic support of the pattern
+        :rtype: int
+        """
+        return int(np.count_nonzero(arr[1:] - arr[:-1] <= self._period))
 
-        return locs
-    
     def _recursive(self, cands, items):
+        """
+        Extends every candidate with the candidates that follow it. The timestamps of an extension are the
+        intersection of the sorted timestamps of the two candidates, whose periodic support is counted while they are
+        merged; a pair is rejected as soon as its periodic support cannot reach minPS.
+
+        :param cands: candidates sharing a prefix
+        :type cands: list
+        :param items: sorted timestamps of every candidate
+        :type items: dict
+        :return: None
+        """
         for i in range(len(cands)):
             newCands = []
             nitems = {}
             for j in range(i + 1, len(cands)):
-                intersection = items[cands[i]].intersection(items[cands[j]])
-                perSup = self._getPerSup(intersection)
+                result = _ts.periodicIntersect(items[cands[i]], items[cands[j]], self._period, self._minPS)
+                if result is None:
+                    continue
+                intersection, perSup = result
                 if perSup >= self._minPS:
                     nCand = cands[i] + tuple([cands[j][-1]])
                     newCands.append(nCand)
                     nitems[nCand] = intersection
                     self._finalPatterns[nCand] = perSup
-                # if len(intersection) >= self._min:
-                #     perSup = self._getPerSup(intersection)
-                #     ratio = perSup / (len(intersection) + 1)
-                #     if ratio >= self._partialPeriodicPatterns__minPR:
-                #         nCand = cands[i] + tuple([cands[j][-1]])
-                #         newCands.append(nCand)
-                #         nitems[nCand] = intersection
-                #         self._finalPatterns[nCand] = [len(intersection), ratio]
             if len(newCands) > 1:
                 self._recursive(newCands, nitems)
 
@@ -361,8 +370,8 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
             maxTS = max(maxTS, index)
             for item in line[1:]:
                 if tuple([item]) not in items:
-                    items[tuple([item])] = set()
-                items[tuple([item])].add(index)
+                    items[tuple([item])] = []
+                items[tuple([item])].append(index)
 
         self._dbSize = maxTS
 
@@ -373,6 +382,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         nitems = {}
 
         for k, v in items.items():
+            v = np.unique(np.array(v, dtype=np.int64))
             perSup = self._getPerSup(v)
             if perSup >= self._minPS:
                 self._finalPatterns[k] = perSup
@@ -11,6 +11,14 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+import numpy as _np
+from PAMI.extras import parallel as _parallel
+from PAMI.extras.FPTree import FPTree as _FPTree
+
+try:
+    from pyspark import SparkContext, SparkConf
+except ImportError:
+    SparkContext = SparkConf = None
 
 
 class _partialPeriodicPatterns(_ABC):
@@ -25,6 +33,10 @@ class _partialPeriodicPatterns(_ABC):
         minPS: float
             UserSpecified minimum period-support value. It has to be given in terms of count of total number of transactions
             in the input database/file
+        backend : str
+            'local' mines the partitions on a pool of local worker processes, 'spark' on a Spark context (requires pyspark)
+        executor : concurrent.futures.Executor
+            An existing pool to mine the partitions of the local backend with. It is not shut down by the algorithm.
         startTime:float
             To record the start time of the algorithm
         endTime:float
@@ -56,14 +68,22 @@ class _partialPeriodicPatterns(_ABC):
             Total amount of runtime taken by the program will be retrieved from this function
     """
 
-    def __init__(self, iFile, minPS, period, numWorkers=1,sep='\t'):
+    def __init__(self, iFile, minPS, period, numWorkers=1,sep='\t', backend='local', executor=None):
         """
         :param iFile: Input file name or path of the input file
         :type iFile: str
         :param minPS: UserSpecified minimum period-support value. It has to be given in terms of count of total number of
         transactions in the input database/file
         :type minPS: float
+        :param backend: 'local' to mine the partitions on a pool of local worker processes, 'spark' to mine them with Spark
+        :type backend: str
+        :param executor: An existing pool to mine the partitions of the local backend with
+        :type executor: concurrent.futures.Executor
         """
+        if backend not in ('local', 'spark'):
+            raise ValueError("Unknown backend " + str(backend) + ", choose 'local' or 'spark'")
+        if backend == 'spark' and SparkContext is None:
+            raise ImportError("The spark backend requires pyspark, please install it with 'pip install pyspark'")
 
         self._iFile = iFile
         self._minPS = minPS
@@ -76,6 +96,8 @@ class _partialPeriodicPatterns(_ABC):
         self._endTime = float()
         self._memoryUSS = float()
         self._memoryRSS = float()
+        self._backend = backend
+        self._executor = executor
 
     '''@abstractmethod
     def iFile(self):
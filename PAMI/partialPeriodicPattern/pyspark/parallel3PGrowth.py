@@ -54,7 +54,6 @@ from PAMI.partialPeriodicPattern.pyspark import abstract as _ab
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import sys as _sys
-from pyspark import SparkContext, SparkConf
 import pandas as pd
 from deprecated import deprecated
 
@@ -62,6 +61,93 @@ _periodicSupport = float()
 _period = float()
 _lno = int()
 
+
+def _periodicSupports(tree, item, period):
+    """
+    Computes the periodic support, i.e., the number of gaps between consecutive timestamps that are at most period,
+    of every item of the prefix paths of an item from the timestamps of the nodes of the item.
+
+    :param tree: a tree whose payload holds the timestamps of the transactions
+    :type tree: FPTree
+    :param item: an item of the tree
+    :type item: int
+    :param period: the largest periodic gap
+    :type period: int or float
+    :return: the periodic support of every item of the tree together with item
+    :rtype: numpy.ndarray
+    """
+    pathIndices, pathItems, _ = tree.prefixPaths(item)
+    owners = tree.nodes(item)[pathIndices]
+    stamps = tree.nodePayload(owners)
+    keys = _ab._np.repeat(pathItems, tree.high[owners] - tree.low[owners])
+    order = _ab._np.lexsort((stamps, keys))
+    stamps, keys = stamps[order], keys[order]
+    periodic = (keys[1:] == keys[:-1]) & (_ab._np.diff(stamps) <= period)
+    return _ab._np.bincount(keys[1:][periodic], minlength=tree.numItems)
+
+
+def _recursive(tree, names, prefix, minPS, period, patterns, items=None):
+    """
+    Mines the conditional trees of the items of a tree. The items of the prefix paths of an item that are partial
+    periodic together with the item are recorded as patterns, and only these items are kept in the conditional tree
+    of the item.
+
+    :param tree: a tree whose payload holds the timestamps of the transactions
+    :type tree: FPTree
+    :param names: the name of every item of the tree
+    :type names: list
+    :param prefix: the items of the pattern whose conditional tree is given
+    :type prefix: list
+    :param minPS: minimum periodic support
+    :type minPS: int or float
+    :param period: the largest periodic gap
+    :type period: int or float
+    :param patterns: the dictionary collecting the patterns
+    :type patterns: dict
+    :param items: the items of the tree to mine, all the items by default
+    :type items: Iterable
+    """
+    for item in (range(tree.numItems) if items is None else items):
+        supports = _periodicSupports(tree, item, period)
+        keep = _ab._np.flatnonzero(supports >= minPS)
+        if len(keep) == 0:
+            continue
+        newPrefix = prefix + [names[item]]
+        for other, periodicSupport in zip(keep.tolist(), supports[keep].tolist()):
+            patterns["\t".join(newPrefix + [names[other]])] = periodicSupport
+        newTree, ids = tree.conditionalTree(item, keep=keep)
+        _recursive(newTree, [names[x] for x in ids.tolist()], newPrefix, minPS, period, patterns)
+
+
+def _minePartition(arrays, partition, numPartitions, names, minPS, period):
+    """
+    Mines one partition of the local backend in a worker process: the tree of the group-dependent conditional
+    transactions of the partition, whose payload holds the timestamps of the transactions, is built and the items of
+    the partition are mined from it.
+
+    :param arrays: the encoded transactions, items and offsets (see PAMI.extras.parallel.encode), and the timestamp of
+                   every transaction, stamps
+    :type arrays: dict
+    :param partition: the partition id
+    :type partition: int
+    :param numPartitions: the number of partitions
+    :type numPartitions: int
+    :param names: the name of every rank
+    :type names: list
+    :param minPS: minimum periodic support
+    :type minPS: int or float
+    :param period: the largest periodic gap
+    :type period: int or float
+    :return: the patterns with more than one item whose last item belongs to the partition
+    :rtype: dict
+    """
+    transactions, owners = _ab._parallel.conditionalTransactions(arrays['items'], arrays['offsets'], partition,
+                                                                numPartitions)
+    tree = _ab._FPTree.fromTransactions(transactions, numItems=len(names), payload=arrays['stamps'][owners])
+    patterns = {}
+    _recursive(tree, names, [], minPS, period, patterns, range(partition, len(names), numPartitions))
+    return patterns
+
 class Node(object):
     """
     A class to represent the node of a tree
@@ -342,6 +428,10 @@ class parallel3PGrowth(_ab._partialPeriodicPatterns):
 
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'local' (default) mines the numPartitions partitions on a pool of numWorkers local processes that share the encoded database through shared memory, 'spark' mines them with Spark (requires pyspark).
+    :param  executor: concurrent.futures.Executor :
+                   An existing pool to mine the partitions of the local backend with. It is not shut down by the algorithm.
 
     :Attributes:
 
@@ -494,18 +584,68 @@ class parallel3PGrowth(_ab._partialPeriodicPatterns):
         if self._minPS is None:
             raise Exception("Please enter the Minimum Period-Support")
 
+        self._startTime = _ab._time.time()
+        if self._backend == 'spark':
+            self._mineSpark()
+        else:
+            self._mineLocal()
+        self._endTime = _ab._time.time()
+
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Partial Periodic Patterns were generated successfully using 4PGrowth algorithm ")
+
+    def _mineLocal(self):
+        """
+        Mines the numPartitions partitions on numWorkers local worker processes. The first item of every transaction is
+        its timestamp; the transactions are encoded as rank arrays in shared memory together with their timestamps.
+        """
+        with open(self._iFile, 'r', encoding='utf-8') as f:
+            database = [[x for x in line.strip().split(self._sep) if x] for line in f]
+        database = [line for line in database if line]
+        self._dbSize = len(database)
         self._period = self._convert(self._period)
         self._minPS = self._convert(self._minPS)
-        #minPS = self._minPS
-        #period = self._period
 
+        stamps = _ab._np.array([int(line[0]) for line in database], dtype=_ab._np.int64)
+        tsLists = _ab._defaultdict(list)
+        for ts, line in zip(stamps.tolist(), database):
+            for item in set(line[1:]):
+                tsLists[item].append(ts)
+        RecItems = {}
+        for item, ts in tsLists.items():
+            periodicSupport = int(_ab._np.count_nonzero(_ab._np.diff(_ab._np.sort(ts)) <= self._period))
+            if periodicSupport >= self._minPS:
+                RecItems[item] = periodicSupport
+
+        perFreqItems = sorted(RecItems, key=lambda x: (-RecItems[x], x))
+        self._finalPatterns = {item: RecItems[item] for item in perFreqItems}
+        rank = dict([(item, index) for (index, item) in enumerate(perFreqItems)])
+
+        items, offsets = _ab._parallel.encode([line[1:] for line in database], rank)
+        tasks = [(partition, self.numPartitions, perFreqItems, self._minPS, self._period)
+                 for partition in range(self.numPartitions)]
+        with _ab._parallel.SharedArrays(items=items, offsets=offsets, stamps=stamps) as shared:
+            for patterns in _ab._parallel.run(_minePartition, shared, tasks, int(self._numWorkers), self._executor):
+                self._finalPatterns.update(patterns)
+
+    def _mineSpark(self):
+        """
+        Mines the partitions with Spark
+        """
+        global minPS, period
         APP_NAME = "4PGrowth"
-        conf = SparkConf().setAppName(APP_NAME)
-        sc = SparkContext(conf=conf).getOrCreate()
-
-        self._startTime = _ab._time.time()
+        conf = _ab.SparkConf().setAppName(APP_NAME)
+        sc = _ab.SparkContext(conf=conf).getOrCreate()
 
         data = sc.textFile(self._iFile, self.numPartitions).map(lambda x: [y for y in x.strip().split(self._sep)])
+        self._dbSize = data.count()
+        self._period = self._convert(self._period)
+        self._minPS = self._convert(self._minPS)
+        minPS, period = self._minPS, self._period
         # self.numPartitions = data.getNumPartitions()
         # numPartitions = 50
         freqItems, RecItems = self.getFrequentItems(data)
@@ -519,33 +659,8 @@ class parallel3PGrowth(_ab._partialPeriodicPatterns):
             string = "\t".join(k)
             # print(string,":",v)
             self._finalPatterns[string] = v
-
-        # print(self._finalPatterns)
-        #     print(k,":",v)
-        # trans.saveAsTextFile('temp')
-        self._endTime = _ab._time.time()
         sc.stop()
 
-        # self._creatingItemSets()
-        # generatedItems, pfList = self._partialPeriodicOneItem()
-        # _minPS, _period, _lno = self._minPS, self._period, len(self._Database)
-        # updatedTransactions = self._updateTransactions(generatedItems)
-        # for x, y in self._rank.items():
-        #     self._rankdup[y] = x
-        # info = {self._rank[k]: v for k, v in generatedItems.items()}
-        # Tree = self._buildTree(updatedTransactions, info)
-        # patterns = Tree._generatePatterns([])
-        # self._finalPatterns = {}
-        # for i in patterns:
-        #     s = self._savePeriodic(i[0])
-        #     self._finalPatterns[s] = i[1]
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Partial Periodic Patterns were generated successfully using 4PGrowth algorithm ")
-
     def _convert(self, value):
         """
         To convert the given user specified value
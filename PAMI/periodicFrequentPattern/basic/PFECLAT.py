@@ -60,6 +60,7 @@ from deprecated import deprecated
 import numpy as np
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
+from PAMI.extras import tidset as _ts
 
 
 class PFECLAT(_ab._periodicFrequentPatterns):
@@ -159,6 +160,9 @@ class PFECLAT(_ab._periodicFrequentPatterns):
     The complete program was written by P. Likhitha  and revised by Tarun Sreepada under the supervision of Professor Rage Uday Kiran.
 
     """
+
+    _readsStore = True
+    _emitsToSink = True
     
     _iFile = " "
     _oFile = " "
@@ -203,6 +207,9 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         :return: None
         """
         self._Database = []
+        if isinstance(self._iFile, _ab._TransactionStore):
+            # the timestamp lists are taken from the arrays of the store in mine()
+            return
         if isinstance(self._iFile, _ab._pd.DataFrame):
             data, ts = [], []
             if self._iFile.empty:
@@ -244,31 +251,54 @@ class PFECLAT(_ab._periodicFrequentPatterns):
     def startMine(self) -> None:
         self.mine()
 
-    def _getMaxPer(self, arr, maxTS):
-        arr = np.append(list(arr), [0, maxTS])
-        arr = np.sort(arr)
-        arr = np.diff(arr)
-
-        return np.max(arr)
+    def _getMaxPer(self, timestamps, maxTS):
+        """
+        Computes the periodicity of a pattern from its sorted timestamps. The computation stops as soon as the
+        periodicity is known to exceed maxPer: the support + 1 periods add up to maxTS, so the periodicity is at least
+        maxTS / (support + 1), and the periods are otherwise checked block by block.
+
+        :param timestamps: the sorted timestamps of the pattern
+        :type timestamps: numpy.ndarray
+        :param maxTS: the last timestamp of the database
+        :type maxTS: int
+        :return: the periodicity, or a value larger than maxPer if the pattern is not periodic
+        :rtype: int or float
+        """
+        bound = maxTS / (len(timestamps) + 1)
+        if bound > self._maxPer:
+            return bound
+        return _ts.maxGap(timestamps, 0, maxTS, self._maxPer)
 
-    def mine(self) -> None:
+    def mine(self, retainTimestamps = False) -> None:
         """
         Mining process will start from this function
+
+        The timestamps of every pattern are kept in a sorted np.int64 array. Only the arrays of the current level are
+        kept in memory.
+
+        :param retainTimestamps: if True, the value of every pattern is [support, periodicity, timestamps], where
+                                 timestamps is the sorted array of its timestamps. Otherwise, it is [support, periodicity].
+        :type retainTimestamps: bool
         :return: None
         """
         self._startTime = _ab._time.time()
-        self._finalPatterns = {}
-        frequentSets = self._creatingItemSets()
+        self._finalPatterns = self._patternSink()
+        self._creatingItemSets()
 
         items = {}
         maxTS = 0
+        if isinstance(self._iFile, _ab._TransactionStore):
+            store = self._iFile
+            stamps = np.arange(1, len(store) + 1, dtype=np.int64) if store.timestamps is None else np.asarray(store.timestamps)
+            maxTS = int(stamps.max()) if len(stamps) else 0
+            items = {tuple([k]): stamps[v] for k, v in enumerate(store.tidLists())}
         for line in self._Database:
             index = int(line[0])
             maxTS = max(maxTS, index)
             for item in line[1:]:
                 if tuple([item]) not in items:
-                    items[tuple([item])] = set()
-                items[tuple([item])].add(index)
+                    items[tuple([item])] = []
+                items[tuple([item])].append(index)
 
         self._dbSize = maxTS
 
@@ -277,7 +307,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         minSup = self._minSup
         maxPer = self._maxPer
 
-
+        items = {k: np.unique(np.array(v, dtype=np.int64)) for k, v in items.items()}
         items = {k: v for k, v in items.items() if len(v) >= minSup}
         items = {k: v for k, v in sorted(items.items(), key = lambda x: len(x[1]), reverse = True)}
 
@@ -286,31 +316,39 @@ class PFECLAT(_ab._periodicFrequentPatterns):
             per = self._getMaxPer(items[item], maxTS)
             if per <= maxPer:
                 keys.append(item)
-                self._finalPatterns[item] = [len(items[item]), per, set(items[item])]
+                self._finalPatterns[item] = [len(items[item]), per, items[item]] if retainTimestamps else [len(items[item]), per]
 
         while keys:
             newKeys = []
+            newItems = {}
             for i in range(len(keys)):
                 for j in range(i + 1, len(keys)):
                     if keys[i][:-1] == keys[j][:-1] and keys[i][-1] != keys[j][-1]:
-                        # print(keys[i], keys[j])
                         newKey = tuple(keys[i] + (keys[j][-1],))
-                        intersect = items[keys[i]].intersection(items[keys[j]])
-                        per = self._getMaxPer(intersect, maxTS)
+                        intersect = _ts.intersect(items[keys[i]], items[keys[j]])
                         sup = len(intersect)
-                        if sup >= minSup and per <= maxPer:
-                            items[newKey] = intersect
+                        if sup < minSup:
+                            continue
+                        per = self._getMaxPer(intersect, maxTS)
+                        if per <= maxPer:
+                            newItems[newKey] = intersect
                             newKeys.append(newKey)
-                            self._finalPatterns[newKey] = [sup, per, set(intersect)]
+                            self._finalPatterns[newKey] = [sup, per, intersect] if retainTimestamps else [sup, per]
                     else:
                         break
             keys = newKeys
-
-        newPattern = {}
-        for k, v in self._finalPatterns.items():
-            newPattern["\t".join([str(x) for x in k])] = v
-
-        self._finalPatterns = newPattern
+            items = newItems
+
+        if self._sink is not None:
+            self._sink.close()
+        else:
+            if isinstance(self._iFile, _ab._TransactionStore):
+                self._finalPatterns = self._iFile.decodePatterns(self._finalPatterns)
+            newPattern = {}
+            for k, v in self._finalPatterns.items():
+                newPattern["\t".join([str(x) for x in k])] = v
+
+            self._finalPatterns = newPattern
 
         # self._generateEclat(frequentSets)
         self._endTime = _ab._time.time()
@@ -66,58 +66,37 @@ _minSup = float()
 _lno = int()
 
 
-class _Node(object):
+def _periodicities(tree, item, maxTS):
     """
-    A class used to represent the node of frequentPatternTree
-
-    :**Attributes**:    - **item** (*int or None*) -- *Storing item of a node.*
-                        - **timeStamps** (*list*) -- *To maintain the timestamps of a database at the end of the branch.*
-                        - **parent** (*list*) -- *To maintain the parent of every node.*
-                        - **children** (*list*) -- *To maintain the children of a node.*
-
-    :**Methods**:    -**addChild(itemName)** -- *Storing the children to their respective parent nodes.*
+    Computes the support and the periodicity of every item of the prefix paths of an item from the timestamps of the
+    nodes of the item.
+
+    :param tree: A tree whose payload holds the timestamps of the transactions.
+    :type tree: FPTree
+    :param item: An item of the tree.
+    :type item: int
+    :param maxTS: The maximum timestamp.
+    :type maxTS: int
+    :return: The support and the periodicity of every item of the tree, maxTS + 1 as periodicity of an item that does not occur.
+    :rtype: tuple(numpy.ndarray, numpy.ndarray)
     """
-
-    def __init__(self, item, locations, parent=None):
-        self.item = item
-        self.locations = locations
-        self.parent = parent
-        self.children = {}
-
-    def addChild(self, item, locations):
-        """
-        This method takes an item and locations as input, adds a new child node
-        if the item does not already exist among the current node's children, or
-        updates the locations of the existing child node if the item is already present.
-
-        :param item: Represents the distinct item to be added as a child node.
-        :type item: Any
-        :param locations: Represents the locations associated with the item.
-        :type locations: list
-        :return: The child node associated with the item.
-        :rtype: _Node
-        """
-        if item not in self.children:
-            self.children[item] = _Node(item, locations, self)
-        else:
-            self.children[item].locations = locations + self.children[item].locations
-            
-        return self.children[item]
-
-    def traverse(self):
-        """
-        This method constructs a transaction by traversing from the current node to the root node, collecting items along the way.
-
-        :return: A tuple containing the transaction and the locations associated with the current node.
-        :rtype: tuple(list, Any)
-        """
-        transaction = []
-        locs = self.locations
-        node = self.parent
-        while node.parent is not None:
-            transaction.append(node.item)
-            node = node.parent
-        return transaction[::-1], locs
+    nodes = tree.nodes(item)
+    pathIndices, pathItems, _ = tree.prefixPaths(item)
+    owners = nodes[pathIndices]
+    stamps = tree.nodePayload(owners)
+    keys = np.repeat(pathItems, tree.high[owners] - tree.low[owners])
+    order = np.lexsort((stamps, keys))
+    stamps, keys = stamps[order], keys[order]
+    support = np.bincount(keys, minlength=tree.numItems)
+    periods = np.full(tree.numItems, maxTS + 1, dtype=np.int64)
+    if len(keys) == 0:
+        return support, periods
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ends = np.append(starts[1:], len(keys)) - 1
+    gaps = np.diff(stamps, prepend=0)
+    gaps[starts] = stamps[starts]
+    periods[keys[starts]] = np.maximum(np.maximum.reduceat(gaps, starts), maxTS - stamps[ends])
+    return support, periods
 
 
 class PFPGrowth(_ab._periodicFrequentPatterns):
@@ -219,6 +198,9 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
     The complete program was written by P. Likhitha  and revised by Tarun Sreepada under the supervision of Professor Rage Uday Kiran.
 
     """
+
+    _readsStore = True
+    _emitsToSink = True
     _startTime = float()
     _endTime = float()
     _minSup = str()
@@ -241,6 +223,8 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         :return: None
         """
         self._Database = []
+        if isinstance(self._iFile, _ab._TransactionStore):
+            self._Database = self._iFile.temporalLists()
         if isinstance(self._iFile, _ab._pd.DataFrame):
             data, ts = [], []
             if self._iFile.empty:
@@ -322,8 +306,8 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
         """
         This method filters the items based on the minimum support (minSup) and
-        maximum period (maxPer). It then constructs a tree structure from the
-        filtered items and data.
+        maximum period (maxPer). It then constructs a tree from the filtered items
+        and data, whose payload holds the timestamp of every transaction.
 
         :param items: A dictionary where keys are items and values are lists of timestamps.
         :type items: dict
@@ -338,50 +322,34 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         :type maxTS: int or float
         :param patterns: A dictionary to store the patterns discovered during the construction.
         :type patterns: dict
-        :return: A tuple containing the root node of the constructed tree and a dictionary
-                 of item nodes.
-        :rtype: tuple(_Node, dict)
+        :return: The tree and the name of every item number.
+        :rtype: tuple(FPTree, list)
         """
 
-        # maxPerItems = {k: self.getMaxPer(v, maxTS) for k, v in items.items() if len(v) >= minSup}
-
         items = {k: v for k, v in items.items() if len(v) >= minSup and self._getMaxPer(v, maxTS) <= maxPer}
 
-        #tested ok
         for item, ts in items.items():
-            # pat = "\t".join(item)
-            # self.patCount += 1
-            # patterns[pat] = (len(ts), self.getMaxPer(ts, maxTS))
             patterns[tuple([item])] = [len(ts), self._getMaxPer(ts, maxTS)]
 
-        root = _Node([], None, None)
-        itemNodes = {}
-        for line in data:
-            currNode = root
-            index = int(line[0])
-            line = line[1:]
-            line = sorted([item for item in line if item in items], key = lambda x: len(items[x]), reverse = True)
-            for item in line:
-                currNode = currNode.addChild(item, [index])   # heavy
-                if item in itemNodes:
-                    itemNodes[item].add(currNode)
-                else:
-                    itemNodes[item] = set([currNode])
-
-        return root, itemNodes
-
+        # items are numbered by decreasing support, so that every transaction is an ascending sequence of numbers
+        names = sorted(items, key = lambda x: (-len(items[x]), x))
+        rank = {item: i for i, item in enumerate(names)}
+        transactions = [sorted([rank[item] for item in line[1:] if item in rank]) for line in data]
+        stamps = np.array([int(line[0]) for line in data], dtype=np.int64)
+        return _ab._FPTree.fromTransactions(transactions, numItems = len(names), payload = stamps), names
 
-    def _recursive(self, root, itemNode, minSup, maxPer, patterns, maxTS):
+    def _recursive(self, tree, names, prefix, minSup, maxPer, patterns, maxTS, items = None):
         """
-        This method recursively constructs a pattern tree from the given root node,
-        filtering items based on the minimum support (minSup) and maximum period (maxPer).
-        It updates the patterns dictionary with the discovered patterns.
-
-        :param root: The current root node of the pattern tree.
-        :type root: _Node
-        :param itemNode: A dictionary where keys are items and values are sets of nodes
-                         associated with those items.
-        :type itemNode: dict
+        This method recursively mines the conditional trees of the items of a tree. The items of the prefix paths of
+        an item that are periodic-frequent together with the item are recorded as patterns, and only these items
+        are kept in the conditional tree of the item.
+
+        :param tree: The current tree.
+        :type tree: FPTree
+        :param names: The name of every item of the tree.
+        :type names: list
+        :param prefix: The items of the pattern whose conditional tree is given.
+        :type prefix: list
         :param minSup: The minimum support threshold.
         :type minSup: int
         :param maxPer: The maximum period threshold.
@@ -390,60 +358,22 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         :type patterns: dict
         :param maxTS: The maximum timestamp.
         :type maxTS: int or float
+        :param items: The items of the tree to mine. All the items by default.
+        :type items: Iterable
         """
 
-        for item in itemNode:
-            newRoot = _Node(root.item + [item], None, None)
-
-            itemLocs = {}
-            transactions = {}
-            for node in itemNode[item]:
-                transaction, locs = node.traverse()
-                if len(transaction) < 1:
-                    continue
-                # transactions.append((transaction, locs))
-                if tuple(transaction) in transactions:
-                    transactions[tuple(transaction)].extend(locs)
-                else:
-                    transactions[tuple(transaction)] = locs
-
-                for item in transaction:
-                    if item in itemLocs:
-                        itemLocs[item] += locs
-                    else:
-                        itemLocs[item] = list(locs)
-
-            # Precompute getMaxPer results for itemLocs
-            maxPerResults = {item: self._getMaxPer(itemLocs[item], maxTS) for item in itemLocs if len(itemLocs[item]) >= minSup}
-
-            # Filter itemLocs based on minSup and maxPer
-            itemLocs = {k: len(v) for k, v in itemLocs.items() if k in maxPerResults and maxPerResults[k] <= maxPer}
-
-            # Iterate over filtered itemLocs
-            for item in itemLocs:
-                # pat = "\t".join([str(x) for x in newRoot.item + [item]])
-                # self.patCount += 1
-                # patterns[pat] = [itemLocs[item], maxPerResults[item]]
-                patterns[tuple(newRoot.item + [item])] = [itemLocs[item], maxPerResults[item]]
-            
-            if not itemLocs:
+        for item in (range(tree.numItems) if items is None else items):
+            support, periods = _periodicities(tree, item, maxTS)
+            keep = np.flatnonzero((support >= minSup) & (periods <= maxPer))
+            if len(keep) == 0:
                 continue
 
-            newItemNodes = {}
+            newPrefix = prefix + [names[item]]
+            for other, count, period in zip(keep.tolist(), support[keep].tolist(), periods[keep].tolist()):
+                patterns[tuple(newPrefix + [names[other]])] = [count, period]
 
-            for transaction, locs in transactions.items():
-                transaction = sorted([item for item in transaction if item in itemLocs], key = lambda x: itemLocs[x], reverse = True)
-                if len(transaction) < 1:
-                    continue
-                currNode = newRoot
-                for item in transaction:
-                    currNode = currNode.addChild(item, locs)
-                    if item in newItemNodes:
-                        newItemNodes[item].add(currNode)
-                    else:
-                        newItemNodes[item] = set([currNode])
-
-            self._recursive(newRoot, newItemNodes, minSup, maxPer, patterns, _lno)
+            newTree, ids = tree.conditionalTree(item, keep = keep)
+            self._recursive(newTree, [names[x] for x in ids.tolist()], newPrefix, minSup, maxPer, patterns, maxTS)
 
     def mine(self) -> None:
         """
@@ -454,6 +384,7 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
         global _minSup, _maxPer, _lno
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._patternSink()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
@@ -482,15 +413,20 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
                     items[item] = []
                 items[item].append(index)
 
-        root, itemNodes = self._construct(items, self._Database, _minSup, _maxPer, _lno, self._finalPatterns)
+        tree, names = self._construct(items, self._Database, _minSup, _maxPer, _lno, self._finalPatterns)
 
-        self._recursive(root, itemNodes, _minSup, _maxPer, self._finalPatterns, _lno)
+        self._recursive(tree, names, [], _minSup, _maxPer, self._finalPatterns, _lno)
 
-        newPattern = {}
-        for k, v in self._finalPatterns.items():
-            newPattern["\t".join([str(x) for x in k])] = v
+        if self._sink is not None:
+            self._sink.close()
+        else:
+            if isinstance(self._iFile, _ab._TransactionStore):
+                self._finalPatterns = self._iFile.decodePatterns(self._finalPatterns)
+            newPattern = {}
+            for k, v in self._finalPatterns.items():
+                newPattern["\t".join([str(x) for x in k])] = v
 
-        self._finalPatterns = newPattern
+            self._finalPatterns = newPattern
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
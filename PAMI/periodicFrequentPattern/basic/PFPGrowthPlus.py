@@ -422,6 +422,8 @@ class PFPGrowthPlus(_ab._periodicFrequentPatterns):
             The complete program was written by  P.Likhitha  under the supervision of Professor Rage Uday Kiran.
     """
 
+    _emitsToSink = True
+
     _minSup = str()
     _maxPer = str()
     _startTime = float()
@@ -592,6 +594,7 @@ class PFPGrowthPlus(_ab._periodicFrequentPatterns):
         """
         global _minSup, _maxPer, _lno
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._patternSink()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
@@ -607,10 +610,13 @@ class PFPGrowthPlus(_ab._periodicFrequentPatterns):
         info = {self._rank[k]: v for k, v in generatedItems.items()}
         Tree = self._buildTree(updatedTransactions, info)
         patterns = Tree.generatePatterns([])
-        self._finalPatterns = {}
         for i in patterns:
-            x = self._savePeriodic(i[0])
-            self._finalPatterns[x] = i[1]
+            if self._sink is not None:
+                self._finalPatterns[tuple(self._rankedUp[x] for x in i[0])] = i[1]
+            else:
+                self._finalPatterns[self._savePeriodic(i[0])] = i[1]
+        if self._sink is not None:
+            self._sink.close()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryRSS = float()
@@ -199,6 +199,8 @@ class PFPMC(_ab._periodicFrequentPatterns):
 
     """
 
+    _emitsToSink = True
+
     _iFile = " "
     _oFile = " "
     _sep = " "
@@ -364,9 +366,19 @@ class PFPMC(_ab._periodicFrequentPatterns):
             sup = len(tids)
             if sup >= self._minSup and per <= self._maxPer:
                 candidates.append(item)
-                self._finalPatterns[item] = [sup, per, diff]
+                self._diffSets[item] = diff
+                self._finalPatterns[self._key(item)] = [sup, per, diff]
         return candidates
 
+    def _key(self, pattern: str):
+        """
+        :param pattern: the items of a pattern joined by tab space
+        :type pattern: str
+        :return: the key of the pattern, a tuple of items when the patterns are sent to a sink
+        :rtype: str or tuple
+        """
+        return pattern if self._sink is None else tuple(pattern.split("\t"))
+
     def _generateDiffsetEclat(self, candidates: list) -> None:
         new_freqList = []
         for i in range(0, len(candidates)):
@@ -376,13 +388,14 @@ class PFPMC(_ab._periodicFrequentPatterns):
                 item2 = candidates[j]
                 i2_list = item2.split()
                 if i1_list[:-1] == i2_list[:-1]:
-                    union_DiffSet = self._finalPatterns[item2][2].union(self._finalPatterns[item1][2])
+                    union_DiffSet = self._diffSets[item2].union(self._diffSets[item1])
                     sorted(union_DiffSet)
                     union_supp = self._dbSize - len(union_DiffSet)
                     period = self._getPeriodic(union_DiffSet)
                     if union_supp >= self._minSup and period <= self._maxPer:
                         newKey = item1 + "\t" + i2_list[-1]
-                        self._finalPatterns[newKey] = [union_supp, period, union_DiffSet]
+                        self._diffSets[newKey] = union_DiffSet
+                        self._finalPatterns[self._key(newKey)] = [union_supp, period, union_DiffSet]
                         new_freqList.append(newKey)
                 else:
                     break
@@ -397,9 +410,13 @@ class PFPMC(_ab._periodicFrequentPatterns):
         """
         # print(f"Optimized {type(self).__name__}")
         self._startTime = _ab._time.time()
-        self._finalPatterns = {}
+        self._finalPatterns = self._patternSink()
+        self._diffSets = {}
+        self._tidSet = set()
         frequentSets = self._creatingOneItemSets()
         self._generateDiffsetEclat(frequentSets)
+        if self._sink is not None:
+            self._sink.close()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryRSS = float()
@@ -702,6 +702,8 @@ class PSGrowth(_ab._periodicFrequentPatterns):
 
     """
 
+    _emitsToSink = True
+
     _startTime = float()
     _endTime = float()
     _minSup = str()
@@ -836,30 +838,7 @@ class PSGrowth(_ab._periodicFrequentPatterns):
         Mining process will start from this function
         :return: None
         """
-        global _minSup, _maxPer, _lno, _pfList
-        self._startTime = _ab._time.time()
-        if self._iFile is None:
-            raise Exception("Please enter the file path or file name:")
-        if self._minSup is None:
-            raise Exception("Please enter the Minimum Support")
-        self._creatingItemSets()
-        OneLengthPeriodicItems, _pfList = self._OneLengthItems()
-        info = {self._rank[k]: v for k, v in OneLengthPeriodicItems.items()}
-        Tree = self._buildTree(info, OneLengthPeriodicItems)
-        patterns = Tree.generatePatterns([])
-        self._finalPatterns = {}
-        for i in patterns:
-            sample = str()
-            for k in i[0]:
-                sample = sample + k + "\t"
-            self._finalPatterns[sample] = i[1]
-        self._endTime = _ab._time.time()
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Periodic-Frequent patterns were generated successfully using PS-Growth algorithm ")
+        self.mine()
 
     def mine(self) -> None:
         """
@@ -868,6 +847,7 @@ class PSGrowth(_ab._periodicFrequentPatterns):
         """
         global _minSup, _maxPer, _lno, _pfList
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._patternSink()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
@@ -877,12 +857,16 @@ class PSGrowth(_ab._periodicFrequentPatterns):
         info = {self._rank[k]: v for k, v in OneLengthPeriodicItems.items()}
         Tree = self._buildTree(info, OneLengthPeriodicItems)
         patterns = Tree.generatePatterns([])
-        self._finalPatterns = {}
         for i in patterns:
+            if self._sink is not None:
+                self._finalPatterns[tuple(i[0])] = i[1]
+                continue
             sample = str()
             for k in i[0]:
                 sample = sample + k + "\t"
             self._finalPatterns[sample] = i[1]
+        if self._sink is not None:
+            self._sink.close()
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
         self._memoryRSS = float()
@@ -26,6 +26,8 @@ import psutil as _psutil
 import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
+from PAMI.extras.TransactionStore import TransactionStore as _TransactionStore
+from PAMI.extras.FPTree import FPTree as _FPTree
 
 
 class _periodicFrequentPatterns(_ABC):
@@ -35,8 +37,10 @@ class _periodicFrequentPatterns(_ABC):
 
     :Attributes:
 
-        iFile : str
-            Input file name or path of the input file
+        iFile : str or TransactionStore
+            Input file name or path of the input file. A binary database written by TransactionStore.save() is
+            memory-mapped instead of being parsed.
+            Miners that cannot read a TransactionStore (_readsStore is False) receive it decoded into a temporary text file
         minSup : int or float or str
             The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
@@ -54,8 +58,8 @@ class _periodicFrequentPatterns(_ABC):
             To record the start time of the algorithm
         endTime : float
             To record the completion time of the algorithm
-        finalPatterns : dict
-            Storing the complete set of patterns in a dictionary variable
+        finalPatterns : dict or PatternSink
+            Storing the complete set of patterns in a dictionary variable, or the sink set with setSink()
         oFile : str
             Name of the output file to store complete set of periodic-frequent patterns
         memoryUSS : float
@@ -79,12 +83,18 @@ class _periodicFrequentPatterns(_ABC):
             Total amount of RSS memory consumed by the program will be retrieved from this function
         getRuntime()
             Total amount of runtime taken by the program will be retrieved from this function
+        setSink(sink)
+            Patterns will be emitted to a sink (callback, file, Parquet or bounded collector) while mining instead of
+            being kept in memory. Algorithms that do not set _emitsToSink raise NotImplementedError
     """
 
+    _readsStore = False
+    _emitsToSink = False
+
     def __init__(self, iFile, minSup, maxPer, sep = '\t'):
         """
-        :param iFile: Input file name or path of the input file
-        :type iFile: str
+        :param iFile: Input file name or path of the input file, a binary database or an already loaded TransactionStore
+        :type iFile: str or TransactionStore
         :param minSup: The user can specify minSup either in count or proportion of database size.
             If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
             Otherwise, it will be treated as float.
@@ -99,6 +109,11 @@ class _periodicFrequentPatterns(_ABC):
         :type sep: str
         """
 
+        if _TransactionStore.isBinary(iFile):
+            iFile = _TransactionStore.fromBinary(iFile)
+        if isinstance(iFile, _TransactionStore) and not self._readsStore:
+            # miners that only parse text files read the store decoded into a temporary file
+            iFile = iFile.toTemporaryFile(self, sep, 'temporal')
         self._iFile = iFile
         self._minSup = minSup
         self._maxPer = maxPer
@@ -109,6 +124,34 @@ class _periodicFrequentPatterns(_ABC):
         self._memoryRSS = float()
         self._memoryUSS = float()
         self._oFile = " "
+        self._sink = None
+
+    def setSink(self, sink):
+        """
+        Sends the patterns to a sink while they are being mined instead of collecting them in a dictionary
+
+        :param sink: the sink receiving the patterns (see PAMI.extras.PatternSink), or None to collect them in a dictionary
+        :type sink: PatternSink
+        :raises NotImplementedError: if the algorithm only collects its patterns in a dictionary
+        """
+
+        if sink is not None and not self._emitsToSink:
+            raise NotImplementedError("%s does not send its patterns to a sink" % type(self).__name__)
+        self._sink = sink
+
+    def _patternSink(self):
+        """
+        Returns the object that collects the patterns of a run: the sink given to setSink() or a new dictionary
+
+        :return: the sink or an empty dictionary
+        :rtype: PatternSink or dict
+        """
+
+        if self._sink is None:
+            return {}
+        if isinstance(self._iFile, _TransactionStore):
+            self._sink.decoder = self._iFile.decode
+        return self._sink
 
     @_abstractmethod
     def startMine(self):
@@ -473,7 +473,8 @@ class parallelPFPGrowth(_ab._periodicFrequentPatterns):
     _perFreqItems = None
 
     def __init__(self, iFile, minSup, maxPer, numWorker):
-        super().__init__(iFile, minSup, maxPer, numWorker)
+        super().__init__(iFile, minSup, maxPer)
+        self._numWorkers = numWorker
 
     def func1(self, ps1, tid):
         """
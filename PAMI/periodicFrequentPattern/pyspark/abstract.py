@@ -11,7 +11,14 @@ import sys as _sys
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import functools as _functools
-from pyspark import SparkContext, SparkConf
+import numpy as _np
+from PAMI.extras import parallel as _parallel
+from PAMI.extras.FPTree import FPTree as _FPTree
+
+try:
+    from pyspark import SparkContext, SparkConf
+except ImportError:
+    SparkContext = SparkConf = None
 
 class _periodicFrequentPatterns(_ABC):
     """
@@ -54,12 +54,46 @@ _copyright_ = """
 import sys
 from collections import defaultdict
 from operator import add
-from pyspark.sql import SparkSession
-from pyspark import SparkConf, SparkContext
 import time
 import psutil
 import os
 import pandas as pd
+from PAMI.periodicFrequentPattern.pyspark import abstract as _ab
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth as _PFPGrowth
+
+
+def _minePartition(arrays, partition, numPartitions, names, minSup, maxPer, maxTS):
+    """
+    Mines one partition of the local backend in a worker process: the tree of the group-dependent conditional
+    transactions of the partition, whose payload holds the timestamps of the transactions, is built and the items of
+    the partition are mined from it with PFPGrowth.
+
+    :param arrays: the encoded transactions, items and offsets (see PAMI.extras.parallel.encode), and the timestamp of
+                   every transaction, stamps
+    :type arrays: dict
+    :param partition: the partition id
+    :type partition: int
+    :param numPartitions: the number of partitions
+    :type numPartitions: int
+    :param names: the name of every rank
+    :type names: list
+    :param minSup: minimum support in count
+    :type minSup: int or float
+    :param maxPer: maximum periodicity
+    :type maxPer: int or float
+    :param maxTS: the last timestamp of the database
+    :type maxTS: int
+    :return: the patterns with more than one item whose last (least frequent) item belongs to the partition, with
+             their support and periodicity
+    :rtype: dict
+    """
+    transactions, owners = _ab._parallel.conditionalTransactions(arrays['items'], arrays['offsets'], partition,
+                                                                numPartitions)
+    tree = _ab._FPTree.fromTransactions(transactions, numItems=len(names), payload=arrays['stamps'][owners])
+    patterns = {}
+    _PFPGrowth(None, minSup, maxPer)._recursive(tree, names, [], minSup, maxPer, patterns, maxTS,
+                                                range(partition, len(names), numPartitions))
+    return patterns
 
 
 class Node:
@@ -87,7 +121,7 @@ class Node:
             To print the node
     """
 
-    def _init_(self, item, prefix):
+    def __init__(self, item, prefix):
         """
         Initializing the Node class
 
@@ -103,7 +137,7 @@ class Node:
 
 
 class Tree:
-    def _init_(self):
+    def __init__(self):
         """
         Initializes the Tree class with a root node, a dictionary to keep track of node links, and
         a defaultdict to store item counts.
@@ -189,14 +223,38 @@ class Parallel_PPFP:
         extract(minCount, maxPer, numTrans, isResponsible = lambda x:True)
             To extract the periodic frequent patterns
 
+    :Parameters:
+
+        inputData : str or RDD
+            Name of the input file. The first item of every transaction is its timestamp. The spark backend also
+            accepts an RDD of lines.
+        minSup : int or float or str
+            Minimum support, in count or as a proportion of the number of transactions
+        maxPeriod : int or float or str
+            Maximum periodicity, in count or as a proportion of the number of transactions
+        numWorkers : int
+            Number of partitions
+        sep : str
+            Separator of the items of a transaction
+        backend : str
+            'local' (default) mines the partitions on a pool of numWorkers local processes that share the encoded
+            database through shared memory, 'spark' mines them with Spark (requires pyspark)
+        executor : concurrent.futures.Executor
+            An existing pool to mine the partitions of the local backend with. It is not shut down by the algorithm.
 
     """
 
-    def __init__(self, inputData, minSup, maxPeriod, numWorkers, sep='\t'):
+    def __init__(self, inputData, minSup, maxPeriod, numWorkers, sep='\t', backend='local', executor=None):
+        if backend not in ('local', 'spark'):
+            raise ValueError("Unknown backend " + str(backend) + ", choose 'local' or 'spark'")
+        if backend == 'spark' and _ab.SparkContext is None:
+            raise ImportError("The spark backend requires pyspark, please install it with 'pip install pyspark'")
         self._oFile = None
         self._minSup = minSup
-        self._maxPeriod = int(maxPeriod)
+        self._maxPeriod = maxPeriod
         self._numPartitions = int(numWorkers)
+        self._backend = backend
+        self._executor = executor
         self._startTime = 0.0
         self._endTime = 0.0
         self._finalPatterns = {}
@@ -213,12 +271,71 @@ class Parallel_PPFP:
         Start the mining process
 
         """
-        self._minSup = self._convert(self._minSup)
+        self.mine()
+
+    def mine(self):
+        """
+        Start the mining process
+
+        """
         self._startTime = time.time()
+        if self._backend == 'spark':
+            self._mineSpark()
+        else:
+            self._mineLocal()
+
+        # Track execution time and memory usage
+        self._endTime = time.time()
+        process = psutil.Process(os.getpid())
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+
+        print("Periodic frequent patterns were generated successfully using Parallel Periodic FPGrowth algorithm")
 
+    def _mineLocal(self):
+        """
+        Mines the partitions on local worker processes as PFPGrowth does: the first item of every transaction is its
+        timestamp, the number of transactions is the last timestamp, and the items that are not periodic-frequent are
+        dropped before the transactions are encoded as rank arrays in shared memory.
+        """
+        with open(self._inputData, 'r', encoding='utf-8') as f:
+            database = [[x for x in line.rstrip().split(self._sep) if x] for line in f]
+        database = [line for line in database if line]
+        self._lno = len(database)
+        self._minSup = self._convert(self._minSup)
+        self._maxPeriod = self._convert(self._maxPeriod)
+
+        stamps = _ab._np.array([int(line[0]) for line in database], dtype=_ab._np.int64)
+        tsLists = defaultdict(list)
+        for ts, line in zip(stamps.tolist(), database):
+            for item in set(line[1:]):
+                tsLists[item].append(ts)
+        periodicItems = {}
+        for item, ts in tsLists.items():
+            if len(ts) >= self._minSup:
+                periodicity = int(_ab._np.diff(_ab._np.sort(_ab._np.append(ts, [0, self._lno]))).max())
+                if periodicity <= self._maxPeriod:
+                    periodicItems[item] = [len(ts), periodicity]
+
+        self._FPList = sorted(periodicItems, key=lambda x: (-periodicItems[x][0], x))
+        self._finalPatterns = {item: periodicItems[item] for item in self._FPList}
+        rank = dict([(item, index) for (index, item) in enumerate(self._FPList)])
+
+        items, offsets = _ab._parallel.encode([line[1:] for line in database], rank)
+        tasks = [(partition, self._numPartitions, self._FPList, self._minSup, self._maxPeriod, self._lno)
+                 for partition in range(self._numPartitions)]
+        with _ab._parallel.SharedArrays(items=items, offsets=offsets, stamps=stamps) as shared:
+            for patterns in _ab._parallel.run(_minePartition, shared, tasks, self._numPartitions, self._executor):
+                self._finalPatterns.update(patterns)
+
+    def _mineSpark(self):
+        """
+        Mines the partitions with Spark
+
+        """
         # Initialize SparkContext
-        conf = SparkConf().setAppName("Parallel_PPFP").setMaster("local[*]")
-        sc = SparkContext(conf=conf)
+        conf = _ab.SparkConf().setAppName("Parallel_PPFP").setMaster("local[*]")
+        sc = _ab.SparkContext(conf=conf)
 
         if isinstance(self._inputData, str):  # Check if input is a file path
             rdd = sc.textFile(self._inputData, self._numPartitions).map(lambda x: x.split(self._sep)).persist()
@@ -256,17 +373,9 @@ class Parallel_PPFP:
         # Update final patterns with results from frequent patterns
         self._finalPatterns.update(dict(result))
 
-        # Track execution time and memory usage
-        self._endTime = time.time()
-        process = psutil.Process(os.getpid())
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-
         # Stop the SparkContext
         sc.stop()
 
-        print("Periodic frequent patterns were generated successfully using Parallel Periodic FPGrowth algorithm")
-
     def _convert(self, value):
         """
         to convert the type of user specified minSup value
@@ -6,6 +6,7 @@ from .vertex import Vertex
 from .edge import Edge
 from .extendedEdge import ExtendedEdge
 from .sparseTriangularMatrix import SparseTriangularMatrix
+from .projection import Projection
 import time
 import math
 import matplotlib.pyplot as plt
@@ -66,6 +66,7 @@ class GSpan(_ab._gSpan):
         self.current_label = 0
         self.edge_label_mapping = {}
         self.current_edge_label = 0
+        self.adjacency = {}
 
 
     def mine(self):
@@ -338,91 +339,87 @@ class GSpan(_ab._gSpan):
         return extensions
 
 
-    def rightMostPathExtensions(self, c: _ab.DFSCode, graphDb, graphIds):
+    def rightMostPathExtensions(self, c: _ab.DFSCode, graphDb, projected):
         """
         The function `rightMostPathExtensions` generates extensions for a given DFS code by considering
-        rightmost paths in a graph database.
-        
+        rightmost paths in a graph database. Every embedding of the code is grown by one edge, so the
+        embeddings of each extension are obtained without searching the isomorphisms again.
+
         :param c: The parameter `c` in the `rightMostPathExtensions` method is of type `_ab.DFSCode`. It
         seems to represent a Depth-First Search code used in graph algorithms. The method is responsible
         for generating extensions based on the rightmost path in a graph
         :param graphDb: The `graphDb` parameter in the `rightMostPathExtensions` method is a
         database that stores graph data. It is used to retrieve graph objects based on
-        their IDs, which are provided in the `graphIds` parameter. The method then performs operations on
-        these graph objects to generate
-        :param graphIds: The `graphIds` parameter in the `rightMostPathExtensions` function represents a
-        list of graph identifiers. These identifiers are used to retrieve specific graphs from the
-        `graphDb` database in order to perform operations on them within the function. Each ID in the
-        `graphIds` list corresponds to an identifier.
+        their IDs, which are stored in the embeddings of `projected`.
+        :param projected: The embeddings of `c` as a `_ab.Projection`, or the identifiers of the graphs
+        to search when `c` is empty.
         :return: The function `rightMostPathExtensions` returns a dictionary `extensions` containing
-        extended edges as keys and sets of graph IDs as values.
+        extended edges as keys and the `_ab.Projection` of every extended code as values.
         """
         extensions = {}
         if c.isEmpty():
-            for iD in graphIds:
+            for iD in sorted(projected):
                 g = graphDb[iD]
                 # Skip graphs if pruning based on edge count is enabled and applicable
                 if GSpan.edge_count_pruning and c.size >= g.getEdgeCount():
                     self.pruneByEdgeCount += 1
                     continue
-                for v in g.vertices:
-                    for e in v.getEdgeList():
-                        # Organize the vertex labels to maintain consistent ordering
-                        v1L = g.getVLabel(e.v1)
-                        v2L = g.getVLabel(e.v2)
-                        if v1L < v2L:
-                            ee1 = _ab.ExtendedEdge(0, 1, v1L, v2L, e.getEdgeLabel())
-                        else:
-                            ee1 = _ab.ExtendedEdge(0, 1, v2L, v1L, e.getEdgeLabel())
-
-                        # Add the new or existing extensions to the dictionary                       
-                        setOfGraphIds = extensions.get(ee1, set())
-                        setOfGraphIds.add(iD)
-                        extensions[ee1] = setOfGraphIds
+                # Every edge is embedded from its smaller label to its larger label, in both directions if
+                # the labels are equal
+                for v, neighbors in self.adjacency[iD].items():
+                    vLabel = g.getVLabel(v)
+                    for x, xLabel, eLabel in neighbors:
+                        if vLabel <= xLabel:
+                            ee1 = _ab.ExtendedEdge(0, 1, vLabel, xLabel, eLabel)
+                            projection = extensions.get(ee1)
+                            if projection is None:
+                                projection = extensions[ee1] = _ab.Projection()
+                            projection.add(iD, v, x, -1)
         else:
-            # For non-empty DFS codes, extend based on the rightmost path of each graph
+            # For non-empty DFS codes, extend every embedding from the rightmost path
             rightMost = c.getRightMost()
-            for iD in graphIds:
+            rightMostPath = c.getRightMostPath()
+            eeList = c.getEeList()
+            backwardTargets = set(v for v in rightMostPath if c.notPreOfRm(v) and not c.containEdge(rightMost, v))
+            prunedId = None
+            for index in range(len(projected)):
+                iD = projected.graphIds[index]
                 g = graphDb[iD]
                 if GSpan.edge_count_pruning and c.size >= g.getEdgeCount():
-                    self.pruneByEdgeCount += 1
+                    if iD != prunedId:
+                        self.pruneByEdgeCount += 1
+                        prunedId = iD
                     continue
-                isoms = self.subgraphIsomorphisms(c, g)
-                for isom in isoms:
-                    invertedIsom = {}
-                    for key, value in isom.items():
-                        invertedIsom[value] = key
-                    mappedRM = isom.get(rightMost)
-                    mappedRMLabel = g.getVLabel(mappedRM)
-                    for x in g.getAllNeighbors(mappedRM):
-                        invertedX = invertedIsom.get(x.getId())
-                        if invertedX is not None and c.onRightMostPath(invertedX) and \
-                        c.notPreOfRm(invertedX) and not c.containEdge(rightMost, invertedX):
-                            
-                            ee = _ab.ExtendedEdge(rightMost, invertedX, mappedRMLabel, x.getLabel(),
-                                            g.getEdgeLabel(mappedRM, x.getId()))
-
-                            if ee not in extensions:
-                                extensions[ee] = set()
-                            extensions[ee].add(g.getId())
-
-                    mappedVertices = isom.values()
-                    for v in c.getRightMostPath():
-                        mappedV = isom[v]
-                        mappedVLabel = g.getVLabel(mappedV)
-                        for x in g.getAllNeighbors(mappedV):
-                            if x.getId() not in mappedVertices:
-                                ee = _ab.ExtendedEdge(v, rightMost + 1, mappedVLabel, x.getLabel(),
-                                                g.getEdgeLabel(mappedV, x.getId()))
-
-                                if ee not in extensions:
-                                    extensions[ee] = set()
-                                extensions[ee].add(g.getId())
+                adjacency = self.adjacency[iD]
+                isom = projected.isomorphism(index, eeList, rightMost + 1)
+                invertedIsom = {value: key for key, value in enumerate(isom)}
+
+                mappedRM = isom[rightMost]
+                mappedRMLabel = g.getVLabel(mappedRM)
+                for x, xLabel, eLabel in adjacency.get(mappedRM, ()):
+                    invertedX = invertedIsom.get(x)
+                    if invertedX is not None and invertedX in backwardTargets:
+                        ee = _ab.ExtendedEdge(rightMost, invertedX, mappedRMLabel, xLabel, eLabel)
+                        projection = extensions.get(ee)
+                        if projection is None:
+                            projection = extensions[ee] = _ab.Projection(projected)
+                        projection.add(iD, mappedRM, x, index)
+
+                for v in rightMostPath:
+                    mappedV = isom[v]
+                    mappedVLabel = g.getVLabel(mappedV)
+                    for x, xLabel, eLabel in adjacency.get(mappedV, ()):
+                        if x not in invertedIsom:
+                            ee = _ab.ExtendedEdge(v, rightMost + 1, mappedVLabel, xLabel, eLabel)
+                            projection = extensions.get(ee)
+                            if projection is None:
+                                projection = extensions[ee] = _ab.Projection(projected)
+                            projection.add(iD, mappedV, x, index)
         return extensions
 
 
 
-    def gspanDFS(self, c: _ab.DFSCode, graphDb, subgraphId):
+    def gspanDFS(self, c: _ab.DFSCode, graphDb, projected):
         """
         The `gspanDFS` function recursively explores graph patterns using the gSpan algorithm to find
         frequent subgraphs in a graph database.
@@ -433,8 +430,8 @@ class GSpan(_ab._gSpan):
         :type c: _ab.DFSCode
         :param graphDb: The `graphDb` parameter  refers to a graph database that the algorithm is 
         operating on.
-        :param subgraphId: The `subgraphId` parameter in the `gspanDFS` method refers to an
-        ID represents a specific subgraph within the graph database `graphDb`. 
+        :param projected: The embeddings of `c` in the graph database as a `_ab.Projection`, or the
+        identifiers of all the graphs when `c` is empty.
         :return: The `gspanDFS` method is a recursive function that is called within itself to explore the graph 
         structure and find frequent subgraphs. The function does not have a return value, but it modifies 
         the `self.frequentSubgraphs` list by appending new frequent subgraphs found during the DFS traversal.
@@ -442,9 +439,10 @@ class GSpan(_ab._gSpan):
 
         if c.size == self.maxNumberOfEdges - 1:
             return
-        extensions = self.rightMostPathExtensions(c, graphDb, subgraphId)
+        extensions = self.rightMostPathExtensions(c, graphDb, projected)
 
-        for extension, newGraphIds in extensions.items():
+        for extension, newProjected in extensions.items():
+            newGraphIds = newProjected.getGraphIds()
             sup = len(newGraphIds)
             
             if sup >= self.minSup:
@@ -455,32 +453,73 @@ class GSpan(_ab._gSpan):
                     subgraph = _ab.FrequentSubgraph(newC, newGraphIds, sup)
                     self.frequentSubgraphs.append(subgraph)
 
-                    self.gspanDFS(newC, graphDb, newGraphIds)
+                    self.gspanDFS(newC, graphDb, newProjected)
 
 
     def isCanonical(self, c: _ab.DFSCode):
         """
-        The function `isCanonical` checks if a given DFS code is canonical by comparing it with its
-        rightmost path extensions.
-        
+        The function `isCanonical` checks if a given DFS code is the minimum DFS code of its graph. It grows
+        the minimum DFS code of the graph of `c` one edge at a time and compares it with `c`. As long as both
+        are equal, the minimum code is the prefix of `c` itself, so only the
+        embeddings of that prefix in the graph are kept and extended, and the check stops at the first
+        extension smaller than the next edge of `c`.
+
         :param c: The parameter `c` is an instance of the `_ab.DFSCode` class
         :type c: _ab.DFSCode
-        :return: a boolean value. It returns True if the input DFSCode `c` is canonical, and False if it is
-        not canonical.
+        :return: True if no DFS code of the graph of `c` is smaller than `c`, False otherwise.
         """
+        g = _ab.Graph(-1, None, c)
+        adjacency = {v: [(e.another(v), g.getVLabel(e.another(v)), e.getEdgeLabel()) for e in vertex.getEdgeList()]
+                     for v, vertex in g.vMap.items()}
+
+        # Embeddings of the first edge, from its smaller label to its larger label
+        first = c.getAt(0)
+        isoms = []
+        for v, neighbors in adjacency.items():
+            vLabel = g.getVLabel(v)
+            for x, xLabel, eLabel in neighbors:
+                if vLabel <= xLabel:
+                    ee = _ab.ExtendedEdge(0, 1, vLabel, xLabel, eLabel)
+                    if ee.smallerThan(first):
+                        return False
+                    if ee == first:
+                        isoms.append([v, x])
+
         canC = _ab.DFSCode()
-        for i in range(c.size):
-            extensions = self.rightMostPathExtensionsFromSingle(canC, _ab.Graph(-1, None, c))
-            minEe = None
-            for ee in extensions.keys():
-                if minEe is None or ee.smallerThan(minEe):
-                    minEe = ee
-
-            if minEe is not None and minEe.smallerThan(c.getAt(i)):
-                return False
-            
-            if minEe is not None:
-                canC.add(minEe)
+        canC.add(first)
+        for i in range(1, c.size):
+            target = c.getAt(i)
+            rightMost = canC.getRightMost()
+            rightMostPath = canC.getRightMostPath()
+            backwardTargets = set(v for v in rightMostPath
+                                  if canC.notPreOfRm(v) and not canC.containEdge(rightMost, v))
+            newIsoms = []
+            for isom in isoms:
+                invertedIsom = {value: key for key, value in enumerate(isom)}
+                mappedRm = isom[rightMost]
+                mappedRmLabel = g.getVLabel(mappedRm)
+                extended = False
+                for x, xLabel, eLabel in adjacency[mappedRm]:
+                    invertedX = invertedIsom.get(x)
+                    if invertedX is not None and invertedX in backwardTargets:
+                        ee = _ab.ExtendedEdge(rightMost, invertedX, mappedRmLabel, xLabel, eLabel)
+                        if ee.smallerThan(target):
+                            return False
+                        if ee == target and not extended:
+                            newIsoms.append(isom)
+                            extended = True
+                for v in rightMostPath:
+                    mappedV = isom[v]
+                    mappedVLabel = g.getVLabel(mappedV)
+                    for x, xLabel, eLabel in adjacency[mappedV]:
+                        if x not in invertedIsom:
+                            ee = _ab.ExtendedEdge(v, rightMost + 1, mappedVLabel, xLabel, eLabel)
+                            if ee.smallerThan(target):
+                                return False
+                            if ee == target:
+                                newIsoms.append(isom + [x])
+            isoms = newIsoms
+            canC.add(target)
         return True
     
 
@@ -515,8 +554,16 @@ class GSpan(_ab._gSpan):
             else:
                 self.emptyGraphsRemoved += 1
 
+        # Neighbors of every vertex with their labels and the labels of the edges, read by the extensions
+        self.adjacency = {}
+        for iD in graphIds:
+            g = graphDb[iD]
+            self.adjacency[iD] = {v: sorted((e.another(v), g.getVLabel(e.another(v)), e.getEdgeLabel())
+                                            for e in vertex.getEdgeList()) for v, vertex in g.vMap.items()}
+
         if len(self.frequentVertexLabels) != 0:
             self.gspanDFS(_ab.DFSCode(), graphDb, graphIds)
+        self.adjacency = {}
 
 
     class Pair:
@@ -0,0 +1,93 @@
+# gSpan is a subgraph mining algorithm that uses DFS and DFS codes to mine subgraphs
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.subgraphMining.basic import gspan as alg
+#
+#             obj = alg.GSpan(iFile, minSupport)
+#
+#             obj.mine()
+#
+#             obj.run()
+#
+#             frequentGraphs = obj.getFrequentSubgraphs()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             obj.save(oFile)
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from array import array
+
+
+class Projection:
+    """
+    The embeddings of a DFS code in the graph database. The i-th embedding maps the last edge of the code on the edge
+    (v1[i], v2[i]) of the graph graphIds[i]; prev[i] is the index of the embedding of the code without its last
+    edge in the parent projection. An embedding of a code with k edges is thus stored as one edge plus a pointer, and
+    the embeddings of a child code are built by growing the embeddings of its parent by one edge.
+    """
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.graphIds = array('l')
+        self.v1 = array('l')
+        self.v2 = array('l')
+        self.prev = array('l')
+
+    def add(self, graphId, v1, v2, prev):
+        self.graphIds.append(graphId)
+        self.v1.append(v1)
+        self.v2.append(v2)
+        self.prev.append(prev)
+
+    def __len__(self):
+        return len(self.graphIds)
+
+    def getGraphIds(self):
+        return set(self.graphIds)
+
+    def isomorphism(self, index, eeList, numVertices):
+        """
+        Follows the parent pointers of an embedding to rebuild the vertex mapping of the whole DFS code.
+
+        :param index: index of the embedding in this projection
+        :param eeList: the extended edges of the DFS code of this projection
+        :param numVertices: number of vertices of the DFS code
+        :return: a list giving the graph vertex of every vertex of the DFS code
+        """
+        iso = [-1] * numVertices
+        projection = self
+        for ee in reversed(eeList):
+            iso[ee.v1] = projection.v1[index]
+            iso[ee.v2] = projection.v2[index]
+            index = projection.prev[index]
+            projection = projection.parent
+        return iso
@@ -1,4 +1,5 @@
 import threading
+import warnings
 
 class DfsThread(threading.Thread):
     """
@@ -9,9 +10,14 @@ class DfsThread(threading.Thread):
            candidates (Queue): A queue containing candidate subgraphs to be mined.
            minSup (int): The minimum support threshold for frequent subgraph mining.
            tkgInstance (TKGInstance): An instance of the Top-K Graphs (TKG) algorithm for dynamic subgraph mining.
+
+       .. deprecated::
+           TKG searches its candidates with a process pool and no longer uses this class, see numWorkers.
        """
 
     def __init__(self, graphDb, candidates, minSup, tkgInstance):
+        warnings.warn("DfsThread is deprecated, TKG searches its candidates with a process pool of numWorkers",
+                      DeprecationWarning, stacklevel=2)
         threading.Thread.__init__(self)
         self.graphDb = graphDb
         self.candidates = candidates
@@ -1,15 +1,17 @@
 from abc import ABC, abstractmethod
 from .graph import Graph
 from .DFSCode import DfsCode
-from .DFSThread import DfsThread
 from .frequentSubgraph import FrequentSubgraph
 from .vertex import Vertex
 from .edge import Edge
 from .extendedEdge import ExtendedEdge
 from .sparseTriangularMatrix import SparseTriangularMatrix
 from queue import PriorityQueue
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import multiprocessing as _multiprocessing
 import time
 import math
+import warnings
 import matplotlib.pyplot as plt
 import psutil as _psutil
 import os as _os
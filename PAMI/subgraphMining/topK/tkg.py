@@ -27,6 +27,35 @@
 
 from PAMI.subgraphMining.topK import abstract as _ab
 
+# State of a worker process of TKG.startWorkers, set once per process by _initWorker
+_worker = {}
+
+
+def _initWorker(graphDB, minSup, k, maxNumberOfEdges):
+    """
+    Stores the graph database and the shared minimum support in a worker process.
+
+    :param graphDB: the graph database
+    :param minSup: the minimum support shared by all the workers
+    :type minSup: multiprocessing.Value
+    :param k: the number of subgraphs mined
+    :param maxNumberOfEdges: the maximum number of edges of a subgraph
+    """
+    tkg = TKG(None, k, maxNumberOfEdges)
+    _worker.update(tkg=tkg, graphDB=graphDB, minSup=minSup)
+
+
+def _expandCandidate(dfsCode, graphIds):
+    """
+    :param dfsCode: the DFS code of a candidate
+    :param graphIds: the graphs containing the candidate
+    :return: the canonical extensions of the candidate whose support reaches the current minimum support
+    """
+    tkg = _worker['tkg']
+    tkg.minSup = _worker['minSup'].value
+    return tkg.expandCandidate(dfsCode, _worker['graphDB'], graphIds)
+
+
 
 class TKG(_ab._TKG):
     ELIMINATE_INFREQUENT_VERTICES = True
@@ -36,7 +65,8 @@ class TKG(_ab._TKG):
     DYNAMIC_SEARCH = True
     THREADED_DYNAMIC_SEARCH = True
 
-    def __init__(self, iFile, k, maxNumberOfEdges=float('inf'), outputSingleVertices=True, outputGraphIds=False):
+    def __init__(self, iFile, k, maxNumberOfEdges=float('inf'), outputSingleVertices=True, outputGraphIds=False,
+                 numWorkers=1, threadCount=None):
         self._memoryRSS = None
         self._memoryUSS = None
         self.runtime = None
@@ -54,7 +84,9 @@ class TKG(_ab._TKG):
         self.infrequentVerticesRemovedCount = 0
         self.infrequentVertexPairsRemovedCount = 0
         self.skipStrategyCount = 0
-        self.threadCount = 1
+        self.numWorkers = numWorkers
+        if threadCount is not None:
+            self.threadCount = threadCount
         self.edgeRemovedByLabel = 0
         self.eliminatedWithMaxSize = 0
         self.emptyGraphsRemoved = 0
@@ -63,6 +95,19 @@ class TKG(_ab._TKG):
         self.reverse_label_mapping = {}
         self.current_label = 0
 
+    @property
+    def threadCount(self):
+        """
+        Deprecated alias of numWorkers, kept for the callers of the thread based search.
+        """
+        _ab.warnings.warn("threadCount is deprecated, use numWorkers instead", DeprecationWarning, stacklevel=2)
+        return self.numWorkers
+
+    @threadCount.setter
+    def threadCount(self, value):
+        _ab.warnings.warn("threadCount is deprecated, use numWorkers instead", DeprecationWarning, stacklevel=2)
+        self.numWorkers = value
+
     def mine(self):
         """
         This Python function starts a mining process on a graph database, calculates runtime, pattern count,
@@ -354,27 +399,52 @@ class TKG(_ab._TKG):
             if self.DYNAMIC_SEARCH:
                 self.gspanDynamicDFS(_ab.DfsCode(), graphDB, graphIds)
                 
-                if self.THREADED_DYNAMIC_SEARCH:
-                    self.startThreads(graphDB, self.candidates, self.minSup)
-
-                else:
-                    while self.candidates:
-                        candidate = self.candidates.pop()
-                        if len(candidate.setOfGraphsIds) < self.minSup:
-                            continue
-                        self.gspanDynamicDFS(candidate.dfsCode, graphDB, candidate.setOfGraphsIds)
+                self.startWorkers(graphDB)
             else:
                 self.gspanDfs(_ab.DfsCode(), graphDB, graphIds)
 
-    def startThreads(self, graphDB, candidates, minSup):
-        threads = []
-        for _ in range(self.threadCount):
-            thread = _ab.DfsThread(graphDB, candidates, minSup, self)
-            thread.start()
-            threads.append(thread)
-    
-        for thread in threads:
-            thread.join()
+    def startWorkers(self, graphDB):
+        """
+        Expands the candidates, best support first, until no candidate reaches the minimum support.
+
+        With THREADED_DYNAMIC_SEARCH and more than one worker, the candidates are expanded by a pool of
+        numWorkers processes that receive the graph database once. The process running mine keeps the top-k
+        queue and the candidate queue, sends the best candidates to idle workers and stores the subgraphs they
+        report. Every time the k-th best support rises, the new minimum support is written to a shared value
+        that the workers read before checking the extensions of a candidate.
+
+        :param graphDB: the graph database
+        """
+        if not self.THREADED_DYNAMIC_SEARCH or self.numWorkers <= 1:
+            while not self.candidates.empty():
+                _, candidate = self.candidates.get()
+                if candidate.support < self.minSup:
+                    break
+                self.gspanDynamicDFS(candidate.dfsCode, graphDB, candidate.setOfGraphsIds)
+            return
+
+        minSup = _ab._multiprocessing.Value('i', self.minSup)
+        initargs = (graphDB, minSup, self.k, self.maxNumberOfEdges)
+        with _ab.ProcessPoolExecutor(max_workers=self.numWorkers, initializer=_initWorker,
+                                     initargs=initargs) as executor:
+            pending = set()
+            while True:
+                while len(pending) < self.numWorkers and not self.candidates.empty():
+                    _, candidate = self.candidates.get()
+                    if candidate.support < self.minSup:
+                        # the queue is ordered by support, no other candidate can be expanded
+                        self.candidates = _ab.PriorityQueue()
+                        break
+                    pending.add(executor.submit(_expandCandidate, candidate.dfsCode, candidate.setOfGraphsIds))
+                if not pending:
+                    break
+                finished, pending = _ab.wait(pending, return_when=_ab.FIRST_COMPLETED)
+                for future in finished:
+                    for subgraph in future.result():
+                        if subgraph.support >= self.minSup:
+                            self.savePattern(subgraph)
+                            self.registerAsCandidate(subgraph)
+                minSup.value = self.minSup
 
     def gspanDfs(self, c: _ab.DfsCode, graphDB, subgraphId):
         if c.size == self.maxNumberOfEdges - 1:
@@ -392,9 +462,21 @@ class TKG(_ab._TKG):
 
     
     def gspanDynamicDFS(self, c, graphDB, graphIds):
+        for subgraph in self.expandCandidate(c, graphDB, graphIds):
+            self.savePattern(subgraph)
+            self.registerAsCandidate(subgraph)
+
+    def expandCandidate(self, c, graphDB, graphIds):
+        """
+        :param c: the DFS code of a candidate
+        :param graphDB: the graph database
+        :param graphIds: the graphs containing the candidate
+        :return: the canonical extensions of the candidate whose support reaches the minimum support
+        """
         if c.size == self.maxNumberOfEdges - 1:
-            return
+            return []
 
+        subgraphs = []
         extensions = self.rightMostPathExtensions(c, graphDB, graphIds)
         for extension, newGraphIds in extensions.items():
             support = len(newGraphIds)
@@ -403,28 +485,77 @@ class TKG(_ab._TKG):
                 newC = c.copy()
                 newC.add(extension)
                 if self.isCanonical(newC):
-                    subgraph = _ab.FrequentSubgraph(newC, newGraphIds, support)
-                    self.savePattern(subgraph)
-                    self.registerAsCandidate(subgraph)
+                    subgraphs.append(_ab.FrequentSubgraph(newC, newGraphIds, support))
+        return subgraphs
     
     def registerAsCandidate(self, subgraph):
         self.candidates.put((-subgraph.support, subgraph))
 
     
     def isCanonical(self, c: _ab.DfsCode):
+        """
+        The function `isCanonical` checks if a given DFS code is the minimum DFS code of its graph. It grows
+        the minimum DFS code of the graph of `c` one edge at a time and compares it with `c`. As long as both
+        are equal, the minimum code is the prefix of `c` itself, so only the
+        embeddings of that prefix in the graph are kept and extended, and the check stops at the first
+        extension smaller than the next edge of `c`.
+
+        :param c: The parameter `c` is an instance of the `_ab.DfsCode` class
+        :type c: _ab.DfsCode
+        :return: True if no DFS code of the graph of `c` is smaller than `c`, False otherwise.
+        """
+        g = _ab.Graph(-1, None, c)
+        adjacency = {v: [(e.another(v), g.getVLabel(e.another(v)), e.getEdgeLabel()) for e in vertex.getEdgeList()]
+                     for v, vertex in g.vMap.items()}
+
+        # Embeddings of the first edge, from its smaller label to its larger label
+        first = c.getAt(0)
+        isoms = []
+        for v, neighbors in adjacency.items():
+            vLabel = g.getVLabel(v)
+            for x, xLabel, eLabel in neighbors:
+                if vLabel <= xLabel:
+                    ee = _ab.ExtendedEdge(0, 1, vLabel, xLabel, eLabel)
+                    if ee.smallerThan(first):
+                        return False
+                    if ee == first:
+                        isoms.append([v, x])
+
         canC = _ab.DfsCode()
-        for i in range(c.size):
-            extensions = self.rightMostPathExtensionsFromSingle(canC, _ab.Graph(-1, None, c))
-            minEe = None
-            for ee in extensions.keys():
-                if minEe is None or ee.smallerThan(minEe):
-                    minEe = ee
-
-            if minEe is not None and minEe.smallerThan(c.getAt(i)):
-                return False
-            
-            if minEe is not None:
-                canC.add(minEe)
+        canC.add(first)
+        for i in range(1, c.size):
+            target = c.getAt(i)
+            rightMost = canC.getRightMost()
+            rightMostPath = canC.getRightMostPath()
+            backwardTargets = set(v for v in rightMostPath
+                                  if canC.notPreOfRm(v) and not canC.containEdge(rightMost, v))
+            newIsoms = []
+            for isom in isoms:
+                invertedIsom = {value: key for key, value in enumerate(isom)}
+                mappedRm = isom[rightMost]
+                mappedRmLabel = g.getVLabel(mappedRm)
+                extended = False
+                for x, xLabel, eLabel in adjacency[mappedRm]:
+                    invertedX = invertedIsom.get(x)
+                    if invertedX is not None and invertedX in backwardTargets:
+                        ee = _ab.ExtendedEdge(rightMost, invertedX, mappedRmLabel, xLabel, eLabel)
+                        if ee.smallerThan(target):
+                            return False
+                        if ee == target and not extended:
+                            newIsoms.append(isom)
+                            extended = True
+                for v in rightMostPath:
+                    mappedV = isom[v]
+                    mappedVLabel = g.getVLabel(mappedV)
+                    for x, xLabel, eLabel in adjacency[mappedV]:
+                        if x not in invertedIsom:
+                            ee = _ab.ExtendedEdge(v, rightMost + 1, mappedVLabel, xLabel, eLabel)
+                            if ee.smallerThan(target):
+                                return False
+                            if ee == target:
+                                newIsoms.append(isom + [x])
+            isoms = newIsoms
+            canC.add(target)
         return True
 
 
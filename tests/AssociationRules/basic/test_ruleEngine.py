@@ -0,0 +1,93 @@
+import unittest
+import random
+import warnings
+from itertools import combinations
+import pandas as pd
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.AssociationRules.basic.ruleEngine import RuleEngine
+from PAMI.AssociationRules.basic.confidence import confidence
+from PAMI.AssociationRules.basic.lift import lift
+from PAMI.AssociationRules.basic.leverage import leverage
+
+warnings.filterwarnings("ignore")
+
+
+class TestRuleEngine(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(1)
+        self.dbSize = 300
+        self.df = pd.DataFrame({'Transactions': ["\t".join(str(x) for x in random.sample(range(15), random.randint(3, 10)))
+                                                 for _ in range(self.dbSize)]})
+        self.miner = ECLAT(self.df, 40)
+        self.miner.mine()
+        self.patterns = {tuple(sorted(k)): v for k, v in self.miner.getPatterns().items()}
+
+    def expected(self, minConf):
+        rules = {}
+        for itemset, sup in self.patterns.items():
+            for r in range(1, len(itemset)):
+                for antecedent in combinations(itemset, r):
+                    consequent = tuple(x for x in itemset if x not in antecedent)
+                    conf = sup / self.patterns[antecedent]
+                    if conf >= minConf:
+                        pX, pY = self.patterns[antecedent] / self.dbSize, self.patterns[consequent] / self.dbSize
+                        rules[(antecedent, consequent)] = (sup, conf, sup / self.dbSize / (pX * pY),
+                                                           sup / self.dbSize - pX * pY)
+        return rules
+
+    def test_rules(self):
+        for minConf in [0.0, 0.4, 0.6]:
+            engine = RuleEngine(self.miner, dbSize=self.dbSize)
+            rules = engine.mine(minConf)
+            expected = self.expected(minConf)
+            self.assertEqual(len(rules), len(expected))
+            for antecedent, consequent, sup, conf, lift, leverage, conviction in rules:
+                values = expected[(antecedent, consequent)]
+                self.assertEqual(sup, values[0])
+                for value, reference in zip((conf, lift, leverage), values[1:]):
+                    self.assertAlmostEqual(value, reference)
+                if conf < 1:
+                    pY = self.patterns[consequent] / self.dbSize
+                    self.assertAlmostEqual(conviction, (1 - pY) / (1 - conf))
+        self.assertGreater(len(self.expected(0.4)), 0)
+
+    def test_database_size_from_miner(self):
+        df = pd.DataFrame({'Transactions': ["a\tb", "a\tb", "a\tc", "b\tc", "a\tb\tc"]})
+        miner = FPGrowth(df, 2)
+        miner.mine()
+        engine = RuleEngine(miner)
+        self.assertEqual(engine.dbSize, 5)
+        rules = {(a, c): lift for a, c, _, _, lift, _, _ in engine.mine()}
+        # sup(a) = sup(b) = 4 and sup(ab) = 3 in 5 transactions: (3 / 5) / ((4 / 5) * (4 / 5))
+        self.assertAlmostEqual(rules[(('a',), ('b',))], 0.9375)
+        with self.assertRaises(ValueError):
+            RuleEngine(miner.getPatterns())
+
+    def test_confidence_from_miner(self):
+        obj = confidence(self.miner, 0.4)
+        obj.mine()
+        actual = {(a, c): (s, conf) for a, c, s, conf in obj.getAssociationRules()}
+        expected = {k: v[:2] for k, v in self.expected(0.4).items()}
+        self.assertEqual(actual.keys(), expected.keys())
+        for key, (sup, conf) in actual.items():
+            self.assertEqual(sup, expected[key][0])
+            self.assertAlmostEqual(conf, expected[key][1])
+
+    def test_lift_and_leverage(self):
+        df = pd.DataFrame({'Patterns': ["\t".join(k) for k in self.patterns],
+                           'Support': list(self.patterns.values())})
+        expected = self.expected(0.0)
+        for measure, index, threshold in [(lift, 2, 1.05), (leverage, 3, 0.005), (leverage, 3, -0.01)]:
+            obj = measure(df, threshold, dbLen=self.dbSize)
+            obj.mine()
+            actual = {(a, c): (s, value) for a, c, s, value in obj.getAssociationRules()}
+            self.assertEqual(actual.keys(), {k for k, v in expected.items() if v[index] >= threshold})
+            for key, (sup, value) in actual.items():
+                self.assertAlmostEqual(sup, expected[key][0] / self.dbSize)
+                self.assertAlmostEqual(value, expected[key][index])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import copy
+import json
+import os
+import shutil
+import tempfile
+import warnings
+from PAMI.benchmarks import datasets
+from PAMI.benchmarks.benchmark import Benchmark
+
+warnings.filterwarnings("ignore")
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.workDir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.workDir)
+
+    def test_fixed_seed(self):
+        first = datasets.transactional(os.path.join(self.workDir, 'a.txt'), databaseSize=200, seed=3)
+        second = datasets.transactional(os.path.join(self.workDir, 'b.txt'), databaseSize=200, seed=3)
+        with open(first) as f, open(second) as g:
+            self.assertEqual(f.read(), g.read())
+
+    def test_run_and_compare(self):
+        obj = Benchmark(families=['frequent'], workDir=self.workDir, isolate=False)
+        results = obj.run()
+        self.assertEqual(len(results), 12)
+        for algorithm in ['FPGrowth', 'ECLAT', 'ECLATbitset', 'Apriori']:
+            counts = [x['patterns'] for x in results if x['algorithm'] == algorithm]
+            self.assertEqual(counts, [x['patterns'] for x in results if x['algorithm'] == 'FPGrowth'])
+        oFile = os.path.join(self.workDir, 'results.json')
+        obj.save(oFile)
+        with open(oFile) as f:
+            self.assertEqual(json.load(f)['results'], results)
+        self.assertEqual(obj.compare(oFile), [])
+
+        baseline = copy.deepcopy(results)
+        baseline[0]['runtime'] = results[0]['runtime'] / 2
+        baseline[1]['patterns'] += 1
+        regressions = obj.compare(baseline, tolerance=0.5)
+        self.assertEqual([(x['algorithm'], x['parameters'], x['measure']) for x in regressions],
+                         [(results[0]['algorithm'], results[0]['parameters'], 'runtime'),
+                          (results[1]['algorithm'], results[1]['parameters'], 'patterns')])
+
+    def test_unknown_family(self):
+        with self.assertRaises(ValueError):
+            Benchmark(families=['unknown'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import os
+import random
+import warnings
+import pandas as pd
+from PAMI.contiguousFrequentPattern.basic.PositionMining import PositionMining
+
+warnings.filterwarnings("ignore")
+
+
+class TestPositionMining(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.sequences = ["".join(random.choice("abé€") for _ in range(random.randint(0, 60)))
+                          for _ in range(40)] + [""]
+        self.input_file = "test_position_mining_input.csv"
+        pd.DataFrame(self.sequences).to_csv(self.input_file)
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def expected(self, minsup, maxlength):
+        positions, offset = {}, 0
+        for seq in self.sequences:
+            for i in range(len(seq)):
+                for j in range(i + 1, min(len(seq), i + maxlength - 1) + 1):
+                    positions.setdefault(seq[i:j], []).append(offset + i)
+            offset += len(seq) + 1
+        return {k: v for k, v in positions.items() if len(v) >= minsup}
+
+    def test_patterns(self):
+        obj = PositionMining(5, self.input_file, maxlength=8)
+        obj.mine()
+        expected = self.expected(5, 8)
+        self.assertEqual(obj.getPatterns(), {k: len(v) for k, v in expected.items()})
+        for pattern, positions in expected.items():
+            self.assertEqual(obj.getPattern_positions(pattern).tolist(), positions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+import os
+import random
+import warnings
+import pandas as pd
+from PAMI.coveragePattern.basic.CMine import CMine
+
+warnings.filterwarnings("ignore")
+
+
+class TestCMineBitset(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(4)
+        self.dataset = [random.sample(range(12), random.randint(1, 4)) for _ in range(150)]
+        self.input_file = "test_cmine_bitset_input.txt"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join(str(x) for x in line) for line in self.dataset))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def expected(self, minRF, minCS, maxOR):
+        tids = {}
+        for tid, line in enumerate(self.dataset):
+            for item in line:
+                tids.setdefault(str(item), set()).add(tid)
+        n = len(self.dataset)
+        items = sorted((x for x in tids if len(tids[x]) >= minRF * n), key=lambda x: -len(tids[x]))
+        patterns = {}
+
+        def grow(pattern, covered, start):
+            if len(covered) >= minCS * n:
+                patterns[tuple(pattern)] = len(covered)
+            for j in range(start, len(items)):
+                if len(covered & tids[items[j]]) <= maxOR * len(tids[items[j]]):
+                    grow(pattern + [items[j]], covered | tids[items[j]], j + 1)
+
+        for i, item in enumerate(items):
+            grow([item], tids[item], i + 1)
+        return patterns
+
+    def test_patterns(self):
+        obj = CMine(self.input_file, 0.05, 0.4, 0.3, '\t')
+        obj.mine()
+        actual = {tuple(k.split("\t")): v for k, v in obj.getPatterns().items()}
+        self.assertEqual(actual, self.expected(0.05, 0.4, 0.3))
+        self.assertFalse(os.path.exists('output.txt'))
+
+    def test_dataframe(self):
+        df = pd.DataFrame({'Transactions': [",".join(str(x) for x in line) for line in self.dataset]})
+        obj = CMine(df, 0.05, 0.4, 0.3, ',')
+        obj.mine()
+        actual = {tuple(k.split("\t")): v for k, v in obj.getPatterns().items()}
+        self.assertEqual(actual, self.expected(0.05, 0.4, 0.3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import pickle
+import random
+from collections import Counter
+import numpy as np
+from PAMI.extras.FPTree import FPTree
+
+
+class TestFPTree(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        self.transactions = [sorted(random.sample(range(8), random.randint(0, 6))) for _ in range(300)]
+        self.stamps = np.arange(1, len(self.transactions) + 1, dtype=np.int64)
+        self.tree = FPTree.fromTransactions(self.transactions, payload=self.stamps)
+
+    def test_structure(self):
+        tree = self.tree
+        prefixes = set(tuple(t[:i]) for t in self.transactions for i in range(1, len(t) + 1))
+        self.assertEqual(len(tree), len(prefixes))
+        for node in range(1, len(tree) + 1):
+            path = tuple(tree.path(node) + [int(tree.item[node])])
+            owners = [i for i, t in enumerate(self.transactions) if tuple(t[:len(path)]) == path]
+            self.assertEqual(int(tree.count[node]), len(owners))
+            self.assertEqual(sorted(tree.nodePayload(np.array([node])).tolist()), [i + 1 for i in owners])
+        support = Counter(x for t in self.transactions for x in t)
+        self.assertEqual(tree.support.tolist(), [support[i] for i in range(tree.numItems)])
+        for item in range(tree.numItems):
+            self.assertEqual(int(tree.count[tree.nodes(item)].sum()), support[item])
+
+    def test_conditional_tree(self):
+        for item in range(self.tree.numItems):
+            expected = Counter(x for t in self.transactions if item in t for x in t if x < item)
+            newTree, ids = self.tree.conditionalTree(item, 30)
+            kept = sorted(x for x, count in expected.items() if count >= 30)
+            self.assertEqual(sorted(ids.tolist()), kept)
+            self.assertEqual([int(newTree.support[i]) for i in range(len(ids))], [expected[x] for x in ids.tolist()])
+            stamps = sorted(i + 1 for i, t in enumerate(self.transactions)
+                            if item in t and any(x in kept for x in t if x < item))
+            self.assertEqual(sorted(newTree.payload.tolist()), stamps)
+
+    def test_pickle(self):
+        tree = pickle.loads(pickle.dumps(self.tree))
+        for name in ('item', 'count', 'parent', 'first', 'next', 'support', 'payload', 'low', 'high'):
+            self.assertTrue(np.array_equal(getattr(tree, name), getattr(self.tree, name)))
+
+
+if __name__ == '__main__':
+    unittest.main()
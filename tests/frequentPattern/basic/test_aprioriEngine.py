@@ -0,0 +1,52 @@
+import unittest
+import random
+import warnings
+from collections import Counter
+from itertools import combinations
+import numpy as np
+import pandas as pd
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestAprioriEngine(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(8)
+        dense = [random.sample(range(15), random.randint(3, 12)) for _ in range(300)]
+        sparse = [random.sample(range(15, 200), random.randint(2, 6)) for _ in range(200)]
+        self.df = pd.DataFrame({'Transactions': ["\t".join(str(x) for x in line) for line in dense + sparse]})
+
+    def test_join(self):
+        level = [(0, 1), (0, 2), (0, 3), (1, 2)]
+        cands = Apriori._join(level)
+        # (0, 1, 3) and (0, 2, 3) are pruned because (1, 3) and (2, 3) are infrequent
+        self.assertEqual(cands, [((0, 1, 2), 0, 1)])
+
+    def test_count_pairs(self):
+        transactions = [np.array(sorted(random.sample(range(30), random.randint(2, 8))), dtype=np.int64)
+                        for _ in range(200)]
+        expected = Counter((a, b) for t in transactions for a, b in combinations(t.tolist(), 2))
+        rowStart = np.arange(30, dtype=np.int64)
+        rowStart = rowStart * 30 - rowStart * (rowStart + 1) // 2
+        # the sparse counts are used when the dense triangle would be larger than the limit
+        for limit in [1 << 22, 0]:
+            positions, counts = Apriori._countPairs(transactions, 30, limit)
+            first = np.searchsorted(rowStart, positions, side='right') - 1
+            second = positions - rowStart[first] + first + 1
+            self.assertEqual(dict(zip(zip(first.tolist(), second.tolist()), counts.tolist())), dict(expected))
+
+    def test_same_patterns(self):
+        reference = ECLAT(self.df, 20)
+        reference.mine()
+        expected = {tuple(sorted(k)): v for k, v in reference.getPatterns().items()}
+        for memorySaver in [True, False]:
+            obj = Apriori(self.df, 20)
+            obj.mine(memorySaver=memorySaver)
+            self.assertEqual({tuple(sorted(k)): v for k, v in obj.getPatterns().items()}, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
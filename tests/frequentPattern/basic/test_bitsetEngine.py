@@ -0,0 +1,49 @@
+import unittest
+import random
+import warnings
+import numpy as np
+import pandas as pd
+from PAMI.extras import bitset as bs
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.frequentPattern.basic.Aprioribitset import Aprioribitset
+
+warnings.filterwarnings("ignore")
+
+
+class TestBitsetEngine(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.dataset = [random.sample(range(25), random.randint(3, 18)) for _ in range(300)]
+        self.df = pd.DataFrame({'Transactions': ["\t".join(str(x) for x in line) for line in self.dataset]})
+
+    def _normalise(self, patterns):
+        return {tuple(sorted(k.split("\t") if isinstance(k, str) else k)): v for k, v in patterns.items()}
+
+    def test_bitset(self):
+        tidLists = [[0, 2, 5, 64, 130], [2, 5, 7, 130], []]
+        rows = bs.packLists(tidLists, 131)
+        self.assertEqual(rows.shape, (3, 3))
+        self.assertEqual(rows.dtype, np.uint64)
+        self.assertEqual(bs.popcount(rows).tolist(), [5, 4, 0])
+        self.assertEqual(bs.toList(rows[0]), tidLists[0])
+        intersections, counts = bs.andCount(rows[0], rows[1:])
+        self.assertEqual(counts.tolist(), [3, 0])
+        self.assertEqual(bs.toList(intersections[0]), [2, 5, 130])
+        unions, counts = bs.orCount(rows[0], rows[1:])
+        self.assertEqual(counts.tolist(), [6, 5])
+
+    def test_same_patterns(self):
+        reference = ECLAT(self.df, 40)
+        reference.mine()
+        expected = self._normalise(reference.getPatterns())
+        for alg in [ECLATbitset, Aprioribitset]:
+            for memorySaver in [True, False]:
+                obj = alg(self.df, 40)
+                obj.mine(memorySaver=memorySaver)
+                self.assertEqual(self._normalise(obj.getPatterns()), expected, alg.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+import random
+import warnings
+import pandas as pd
+from PAMI.extras import tidset as ts
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestECLATHybrid(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        dense = [random.sample(range(15), random.randint(9, 14)) for _ in range(200)]
+        sparse = [random.sample(range(15, 200), random.randint(2, 8)) for _ in range(200)]
+        self.df = pd.DataFrame({'Transactions': ["\t".join(str(x) for x in line) for line in dense + sparse]})
+
+    def test_kernels(self):
+        for _ in range(200):
+            a = sorted(random.sample(range(300), random.randint(0, 40)))
+            b = sorted(random.sample(range(300), random.randint(0, 200)))
+            self.assertEqual(ts.intersect(ts.fromList(a), ts.fromList(b)).tolist(), sorted(set(a) & set(b)))
+            self.assertEqual(ts.difference(ts.fromList(a), ts.fromList(b)).tolist(), sorted(set(a) - set(b)))
+            self.assertEqual(ts.difference(ts.fromList(b), ts.fromList(a)).tolist(), sorted(set(b) - set(a)))
+
+    def test_same_patterns(self):
+        for minSup in [80, 4]:
+            tidsets = ECLAT(self.df, minSup)
+            tidsets.mine()
+            hybrid = ECLAT(self.df, minSup)
+            hybrid.mine(hybrid=True)
+            self.assertEqual(tidsets.getPatterns(), hybrid.getPatterns())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import os
+import random
+import warnings
+import pandas as pd
+from collections import Counter
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+
+warnings.filterwarnings("ignore")
+
+
+class TestFPGrowthCounts(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        dataset = [random.sample(items, random.randint(1, 10)) for _ in range(400)]
+        # a group of identical transactions forms a single path
+        dataset += [["x1", "x2", "x3", "x4", "x5"]] * 60
+        self.input_file = "test_fpgrowth_counts.txt"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join(line) for line in dataset))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def expected(self, minSup):
+        obj = FPGrowth(self.input_file, minSup)
+        obj.mine()
+        return dict(sorted(Counter(len(pattern) for pattern in obj.getPatterns()).items()))
+
+    def test_count_only(self):
+        for minSup in (60, 30, 0.05):
+            obj = FPGrowth(self.input_file, minSup)
+            obj.mine(countOnly=True)
+            self.assertEqual(obj.getPatternCounts(), self.expected(minSup))
+            self.assertEqual(obj.getPatterns(), {})
+
+    def test_single_path(self):
+        data = pd.DataFrame({'Transactions': ["\t".join(["a", "b", "c", "d"])] * 5 + ["a\tb"] * 3})
+        obj = FPGrowth(data, 4)
+        obj.mine(countOnly=True)
+        self.assertEqual(obj.getPatternCounts(), {1: 4, 2: 6, 3: 4, 4: 1})
+        self.assertEqual(obj.countPatterns([6, 4]), {6: {1: 2, 2: 1}, 4: {1: 4, 2: 6, 3: 4, 4: 1}})
+
+    def test_sweep(self):
+        # no item reaches 500, so nothing is counted for that threshold
+        minSups = [500, 80, 60, 0.1, 30]
+        counts = FPGrowth(self.input_file, 1).countPatterns(minSups)
+        self.assertEqual(list(counts), minSups)
+        for minSup in minSups:
+            self.assertEqual(counts[minSup], self.expected(minSup))
+        self.assertEqual(counts[500], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import os
+import random
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestFPGrowthParallel(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        items = ["item-{}".format(i) for i in range(1, 21)]
+        dataset = [random.sample(items, random.randint(1, 12)) for _ in range(500)]
+        self.input_file = "test_fpgrowth_parallel.txt"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join(line) for line in dataset))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def patterns(self, obj):
+        obj.mine()
+        return {tuple(sorted(k)): v for k, v in obj.getPatterns().items()}
+
+    def test_serial_matches_eclat(self):
+        self.assertEqual(self.patterns(FPGrowth(self.input_file, 40)), self.patterns(ECLAT(self.input_file, 40)))
+
+    def test_parallel_matches_serial(self):
+        expected = self.patterns(FPGrowth(self.input_file, 40))
+        self.assertEqual(self.patterns(FPGrowth(self.input_file, 40, nJobs=2)), expected)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(self.patterns(FPGrowth(self.input_file, 40, executor=executor)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
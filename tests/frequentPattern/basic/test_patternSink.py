@@ -0,0 +1,108 @@
+import unittest
+import os
+import random
+import warnings
+import pandas as pd
+from PAMI.extras.PatternSink import BoundedSink, CallbackSink, FileSink, ParquetSink
+from PAMI.extras.TransactionStore import TransactionStore
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.periodicFrequentPattern.basic.PFECLAT import PFECLAT
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+from PAMI.periodicFrequentPattern.basic.PFPGrowthPlus import PFPGrowthPlus
+from PAMI.periodicFrequentPattern.basic.PSGrowth import PSGrowth
+from PAMI.periodicFrequentPattern.basic.PFPMC import PFPMC
+from PAMI.periodicFrequentPattern.basic import _PFECLAT
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+warnings.filterwarnings("ignore")
+
+
+class TestPatternSink(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        self.dataset = [random.sample(items, random.randint(1, 10)) for _ in range(300)]
+        self.input_file = "test_sink_input.txt"
+        self.temporal_file = "test_sink_temporal.txt"
+        self.output_file = "test_sink_output.txt"
+        self.parquet_file = "test_sink_output.parquet"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join(line) for line in self.dataset))
+        with open(self.temporal_file, 'w') as f:
+            f.write("\n".join(str(i + 1) + "\t" + "\t".join(line) for i, line in enumerate(self.dataset)))
+
+    def tearDown(self):
+        for name in [self.input_file, self.temporal_file, self.output_file, self.parquet_file]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def expected(self):
+        obj = FPGrowth(self.input_file, 40)
+        obj.mine()
+        return obj.getPatterns()
+
+    def test_callback(self):
+        received = {}
+        for iFile in [self.input_file, TransactionStore.load(self.input_file)]:
+            received.clear()
+            obj = ECLATbitset(iFile, 40)
+            obj.setSink(CallbackSink(lambda pattern, support: received.__setitem__(tuple(sorted(pattern)), support)))
+            obj.mine()
+            self.assertEqual(len(obj.getPatterns()), len(received))
+            self.assertEqual(received, {tuple(sorted(k)): v for k, v in self.expected().items()})
+
+    def test_file(self):
+        obj = FPGrowth(self.input_file, 40)
+        obj.setSink(FileSink(self.output_file, bufferSize=7))
+        obj.mine()
+        with open(self.output_file) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), len(self.expected()))
+        self.assertEqual(sorted(lines), sorted("\t".join(k) + ":" + str(v) for k, v in self.expected().items()))
+
+    def test_bounded(self):
+        obj = FPGrowth(self.input_file, 40)
+        obj.setSink(BoundedSink(10))
+        obj.mine()
+        kept = obj.getPatterns().getPatterns()
+        self.assertEqual(len(kept), 10)
+        supports = sorted(self.expected().values(), reverse=True)
+        self.assertEqual(sorted(kept.values(), reverse=True), supports[:10])
+        self.assertEqual(len(obj.getPatternsAsDataFrame()), 10)
+
+    def test_periodic(self):
+        for alg in [PFECLAT, PFPGrowth, PFPGrowthPlus, PSGrowth, PFPMC]:
+            received = []
+            obj = alg(self.temporal_file, 40, 20)
+            obj.setSink(CallbackSink(lambda pattern, value: received.append((frozenset(pattern), list(value[:2])))))
+            obj.mine()
+            reference = alg(self.temporal_file, 40, 20)
+            reference.mine()
+            expected = {frozenset(k.strip().split("\t")): list(v[:2]) for k, v in reference.getPatterns().items()}
+            self.assertTrue(expected, alg.__name__)
+            self.assertEqual(len(received), len(expected), alg.__name__)
+            self.assertEqual(dict(received), expected, alg.__name__)
+
+    def test_unsupported(self):
+        obj = _PFECLAT.PFECLAT(self.temporal_file, 40, 20)
+        with self.assertRaises(NotImplementedError):
+            obj.setSink(CallbackSink(print))
+        obj.setSink(None)
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_parquet(self):
+        obj = FPGrowth(self.input_file, 40)
+        obj.setSink(ParquetSink(self.parquet_file, rowGroupSize=16))
+        obj.mine()
+        df = pd.read_parquet(self.parquet_file)
+        self.assertEqual(dict(zip(df['Patterns'], df['Support'])), {"\t".join(k): v for k, v in self.expected().items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
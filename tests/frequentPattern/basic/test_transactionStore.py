@@ -0,0 +1,86 @@
+import unittest
+import os
+import random
+import warnings
+import numpy as np
+import pandas as pd
+from PAMI.extras.TransactionStore import TransactionStore
+from PAMI.extras.convert.CSV2Binary import CSV2Binary
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.frequentPattern.basic.ECLATDiffset import ECLATDiffset
+from PAMI.frequentPattern.basic.Aprioribitset import Aprioribitset
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic import _Apriori, _ECLATDiffset, _FPGrowth
+
+warnings.filterwarnings("ignore")
+
+
+class TestTransactionStore(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        self.dataset = [random.sample(items, random.randint(1, 10)) for _ in range(200)]
+        self.input_file = "test_store_input.txt"
+        self.binary_file = "test_store_input.pami"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join(line) for line in self.dataset))
+
+    def tearDown(self):
+        for name in [self.input_file, self.binary_file]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def test_encoding(self):
+        store = TransactionStore.load(self.input_file)
+        self.assertEqual(len(store), len(self.dataset))
+        self.assertEqual(store.decode(store.transaction(5)), tuple(self.dataset[5]))
+        supports = store.itemSupports()
+        for item, tids in zip(store.items, store.tidLists()):
+            self.assertEqual(len(tids), supports[store.itemIds[item]])
+            self.assertEqual(list(tids), [i for i, line in enumerate(self.dataset) if item in line])
+
+    def test_dataframe(self):
+        df = pd.DataFrame({'Transactions': ["\t".join(line) for line in self.dataset]})
+        store = TransactionStore.load(df)
+        self.assertEqual(store.transactionLists(), TransactionStore.load(self.input_file).transactionLists())
+        self.assertIs(TransactionStore.load(store), store)
+
+    def test_same_patterns(self):
+        store = TransactionStore.load(self.input_file)
+        for alg in [Apriori, ECLAT, ECLATbitset, ECLATDiffset]:
+            fromFile = alg(self.input_file, 30)
+            fromFile.mine()
+            fromStore = alg(store, 30)
+            fromStore.mine()
+            expected = {tuple(sorted(k)): v for k, v in fromFile.getPatterns().items()}
+            actual = {tuple(sorted(k)): v for k, v in fromStore.getPatterns().items()}
+            self.assertEqual(expected, actual, alg.__name__)
+
+    def test_binary(self):
+        CSV2Binary(self.input_file, self.binary_file).convert()
+        self.assertTrue(TransactionStore.isBinary(self.binary_file))
+        self.assertFalse(TransactionStore.isBinary(self.input_file))
+        text = TransactionStore.load(self.input_file)
+        binary = TransactionStore.load(self.binary_file)
+        self.assertIsInstance(binary.indices, np.memmap)
+        self.assertEqual(binary.items, text.items)
+        self.assertEqual(binary.transactionLists(), text.transactionLists())
+
+        for alg in [Apriori, Aprioribitset, ECLAT, ECLATbitset, ECLATDiffset, FPGrowth,
+                    _Apriori.Apriori, _ECLATDiffset.ECLATDiffset, _FPGrowth.FPGrowth]:
+            fromFile = alg(self.input_file, 30)
+            fromFile.mine()
+            fromBinary = alg(self.binary_file, 30)
+            fromBinary.mine()
+            expected = {tuple(sorted(k.split('\t') if isinstance(k, str) else k)): v
+                        for k, v in fromFile.getPatterns().items()}
+            actual = {tuple(sorted(k.split('\t') if isinstance(k, str) else k)): v
+                      for k, v in fromBinary.getPatterns().items()}
+            self.assertEqual(expected, actual, alg.__module__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import os
+import random
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+import numpy as np
+from PAMI.extras import parallel
+from PAMI.frequentPattern.pyspark import abstract as fpAbstract
+from PAMI.frequentPattern.pyspark.parallelFPGrowth import parallelFPGrowth
+from PAMI.frequentPattern.pyspark.parallelECLAT import parallelECLAT
+from PAMI.frequentPattern.pyspark.parallelApriori import parallelApriori
+from PAMI.periodicFrequentPattern.pyspark.parallelPFPGrowth import Parallel_PPFP
+from PAMI.partialPeriodicPattern.pyspark.parallel3PGrowth import parallel3PGrowth
+
+warnings.filterwarnings("ignore")
+
+
+def _key(pattern, sep='\t'):
+    return frozenset(pattern.split(sep) if isinstance(pattern, str) else pattern)
+
+
+class TestParallelLocalBackend(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(4)
+        self.dataset = [random.sample(range(12), random.randint(1, 6)) for _ in range(300)]
+        self.stamps = [2 * i + 1 + i % 3 for i in range(len(self.dataset))]
+        self.input_file = "test_parallel_local_input.txt"
+        self.temporal_file = "test_parallel_local_temporal.txt"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join(str(x) for x in line) for line in self.dataset))
+        with open(self.temporal_file, 'w') as f:
+            f.write("\n".join("\t".join([str(ts)] + [str(x) for x in line])
+                              for ts, line in zip(self.stamps, self.dataset)))
+
+    def tearDown(self):
+        for name in (self.input_file, self.temporal_file):
+            if os.path.exists(name):
+                os.remove(name)
+
+    def brute(self, measure, minimum):
+        patterns = {}
+        for length in range(1, 13):
+            found = False
+            for pattern in combinations(range(12), length):
+                value = measure([i for i, line in enumerate(self.dataset) if set(pattern) <= set(line)])
+                if value is not None and (value[0] if isinstance(value, list) else value) >= minimum:
+                    patterns[frozenset(str(x) for x in pattern)] = value
+                    found = True
+            if not found:
+                break
+        return patterns
+
+    def test_conditional_transactions(self):
+        items, offsets = parallel.encode([['a', 'b', 'c'], ['c', 'x'], ['b']], {'a': 0, 'b': 1, 'c': 2})
+        self.assertEqual(items.tolist(), [0, 1, 2, 2, 1])
+        transactions, owners = parallel.conditionalTransactions(items, offsets, 1, 2)
+        self.assertEqual(transactions, [[0, 1], [1]])
+        self.assertEqual(owners.tolist(), [0, 2])
+        transactions, owners = parallel.conditionalTransactions(items, offsets, 0, 2)
+        self.assertEqual(transactions, [[0, 1, 2], [2]])
+
+    def test_frequent(self):
+        expected = self.brute(len, 20)
+        for algorithm, sep in ((parallelFPGrowth, '\t'), (parallelECLAT, ' '), (parallelApriori, '\t')):
+            for numWorkers in (1, 2):
+                obj = algorithm(self.input_file, 20, numWorkers)
+                obj.mine()
+                actual = {_key(k, sep): v for k, v in obj.getPatterns().items()}
+                self.assertEqual(actual, expected, algorithm.__name__)
+
+    def test_periodic_frequent(self):
+        maxTS = len(self.dataset)
+
+        def measure(tids):
+            stamps = [self.stamps[i] for i in tids]
+            return [len(stamps), int(np.diff([0] + stamps + [maxTS]).max())] if stamps else None
+
+        expected = {k: v for k, v in self.brute(measure, 15).items() if v[1] <= 300}
+        for numWorkers in (1, 3):
+            obj = Parallel_PPFP(self.temporal_file, 15, 300, numWorkers)
+            obj.mine()
+            actual = {_key(k): list(v) for k, v in obj.getPatterns().items()}
+            self.assertEqual(actual, expected)
+
+    def test_partial_periodic(self):
+        expected = self.brute(lambda tids: int(np.count_nonzero(np.diff([self.stamps[i] for i in tids]) <= 30)), 15)
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            for numWorkers, executor in ((1, None), (2, None), (1, pool)):
+                obj = parallel3PGrowth(self.temporal_file, 15, 30, numWorkers, executor=executor)
+                obj.setPartitions(3)
+                obj.mine()
+                actual = {_key(k): v for k, v in obj.getPatterns().items()}
+                self.assertEqual(actual, expected)
+
+    def test_backend(self):
+        with self.assertRaises(ValueError):
+            parallelFPGrowth(self.input_file, 20, 2, backend='hadoop')
+        if fpAbstract._SparkContext is None:
+            with self.assertRaises(ImportError):
+                parallelFPGrowth(self.input_file, 20, 2, backend='spark')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import os
+import random
+import warnings
+from itertools import combinations
+import numpy as np
+from PAMI.fuzzyFrequentPattern.basic import FFIMiner as alg
+
+warnings.filterwarnings("ignore")
+
+
+class TestFFIMinerLists(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(4)
+        self.dataset = []
+        for _ in range(200):
+            items = random.sample(range(8), random.randint(2, 6))
+            self.dataset.append({"i" + str(x): round(random.random(), 2) for x in items})
+        self.input_file = "test_ffiminer_lists_input.txt"
+        with open(self.input_file, 'w') as f:
+            for line in self.dataset:
+                f.write("\t".join(line) + ":" + "\t".join(str(x) for x in line.values()) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def expected(self, minSup):
+        patterns = {}
+        items = sorted(set(x for line in self.dataset for x in line))
+        for length in range(1, len(items) + 1):
+            for pattern in combinations(items, length):
+                support = sum(min(line[x] for x in pattern) for line in self.dataset if set(pattern) <= set(line))
+                if support >= minSup:
+                    patterns[pattern] = support
+        return patterns
+
+    def test_intersect(self):
+        tids, values = alg._intersect(np.array([1, 3, 5, 9], dtype=np.int32),
+                                      np.array([0.5, 0.2, 0.9, 0.4], dtype=np.float32),
+                                      np.array([3, 4, 9], dtype=np.int32),
+                                      np.array([0.6, 0.1, 0.3], dtype=np.float32))
+        self.assertEqual(tids.tolist(), [3, 9])
+        np.testing.assert_allclose(values, [0.2, 0.3])
+        self.assertEqual(values.dtype, np.float32)
+
+    def test_repeated_items(self):
+        with open(self.input_file, 'w') as f:
+            f.write("a\tb\ta:2\t3\t4\na\tb:1\t2\nb\ta:2\t2\n")
+        obj = alg.FFIMiner(self.input_file, 1)
+        obj.mine()
+        actual = {tuple(sorted(k)): v for k, v in obj.getPatterns().items()}
+        # the last membership of a repeated item counts, once per transaction
+        self.assertEqual(actual, {('a',): 7, ('b',): 7, ('a', 'b'): 6})
+
+    def test_patterns(self):
+        obj = alg.FFIMiner(self.input_file, 8)
+        obj.mine()
+        actual = {tuple(sorted(k)): v for k, v in obj.getPatterns().items()}
+        expected = self.expected(8)
+        # memberships are stored in single precision
+        self.assertEqual(set(actual), set(expected))
+        for pattern, support in expected.items():
+            self.assertAlmostEqual(actual[pattern], support, places=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import os
+import random
+import warnings
+from itertools import combinations
+import numpy as np
+from PAMI.highUtilityPattern.basic.EFIM import EFIM
+
+warnings.filterwarnings("ignore")
+
+
+class TestEFIMArrays(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(4)
+        self.dataset = []
+        for _ in range(150):
+            items = random.sample(range(1, 12), random.randint(2, 7))
+            self.dataset.append({x: random.randint(1, 10) for x in items})
+        # repeated baskets are merged once projected
+        self.dataset += [{1: 3, 2: 4, 5: 1}, {1: 2, 2: 1, 5: 6}] * 20
+        self.input_file = "test_efimArrays_input.txt"
+        with open(self.input_file, 'w') as f:
+            for line in self.dataset:
+                items = list(line)
+                f.write("\t".join(str(x) for x in items) + ":" + str(sum(line.values())) + ":"
+                        + "\t".join(str(line[x]) for x in items) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def expected(self, minUtil):
+        patterns = {}
+        items = sorted(set(x for line in self.dataset for x in line))
+        for length in range(1, len(items) + 1):
+            for pattern in combinations(items, length):
+                utility = sum(sum(line[x] for x in pattern) for line in self.dataset if set(pattern) <= set(line))
+                if utility >= minUtil:
+                    patterns[tuple(sorted(str(x) for x in pattern))] = str(utility)
+        return patterns
+
+    def mine(self, minUtil):
+        obj = EFIM(self.input_file, minUtil)
+        obj.mine()
+        return {tuple(sorted(k.split("\t"))): v for k, v in obj.getPatterns().items()}
+
+    def test_patterns(self):
+        for minUtil in (500, 300):
+            self.assertEqual(self.mine(minUtil), self.expected(minUtil))
+
+    def test_merge(self):
+        obj = EFIM(self.input_file, 300)
+        # equal hashes for all the transactions of the same length: only identical ones may be merged
+        obj._multipliers = np.zeros(4, dtype=np.uint64)
+        items = np.array([1, 2, 1, 3, 1, 2, 4], dtype=np.int32)
+        utilities = np.array([1, 2, 3, 4, 5, 6, 7], dtype=np.int64)
+        database = obj._mergeTransactions(items, utilities, np.array([2, 2, 2, 1]), np.array([10, 20, 30, 40]))
+        self.assertEqual(len(database), 3)
+        merged = {tuple(database.items[s:e].tolist()): (database.utilities[s:e].tolist(), int(p)) for s, e, p in
+                  zip(database.offsets[:-1], database.offsets[1:], database.prefixUtilities)}
+        self.assertEqual(merged, {(1, 2): ([6, 8], 40), (1, 3): ([3, 4], 20), (4,): ([7], 40)})
+
+
+if __name__ == '__main__':
+    unittest.main()
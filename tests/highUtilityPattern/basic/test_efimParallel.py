@@ -0,0 +1,50 @@
+import unittest
+import os
+import random
+import warnings
+from itertools import combinations
+from PAMI.highUtilityPattern.basic.efimParallel import efimParallel
+
+warnings.filterwarnings("ignore")
+
+
+class TestEfimParallel(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.dataset = []
+        for _ in range(150):
+            items = random.sample(range(1, 12), random.randint(2, 7))
+            self.dataset.append({x: random.randint(1, 10) for x in items})
+        self.input_file = "test_efimParallel_input.txt"
+        with open(self.input_file, 'w') as f:
+            for line in self.dataset:
+                items = list(line)
+                f.write("\t".join(str(x) for x in items) + ":" + str(sum(line.values())) + ":"
+                        + "\t".join(str(line[x]) for x in items) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def expected(self, minUtil):
+        patterns = {}
+        items = sorted(set(x for line in self.dataset for x in line))
+        for length in range(1, len(items) + 1):
+            for pattern in combinations(items, length):
+                utility = sum(sum(line[x] for x in pattern) for line in self.dataset if set(pattern) <= set(line))
+                if utility >= minUtil:
+                    patterns[tuple(sorted(str(x) for x in pattern))] = utility
+        return patterns
+
+    def test_patterns(self):
+        expected = self.expected(300)
+        for threads, splitBudget in [(1, 1000), (2, 3)]:
+            obj = efimParallel(self.input_file, 300, threads=threads, splitBudget=splitBudget)
+            obj.mine()
+            actual = {tuple(sorted(k.split("\t"))): v for k, v in obj.getPatterns().items()}
+            self.assertEqual(actual, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
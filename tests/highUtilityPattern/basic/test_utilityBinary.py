@@ -0,0 +1,57 @@
+import unittest
+import os
+import random
+import warnings
+from PAMI.extras.TransactionStore import TransactionStore
+from PAMI.highUtilityPattern.basic.EFIM import EFIM
+from PAMI.highUtilityPattern.basic.HMiner import HMiner
+from PAMI.highUtilityPattern.basic.UPGrowth import UPGrowth
+from PAMI.highUtilityPattern.basic.efimParallel import efimParallel
+
+warnings.filterwarnings("ignore")
+
+
+def _key(pattern):
+    return frozenset(pattern.strip().split('\t') if isinstance(pattern, str) else pattern)
+
+
+class TestUtilityBinary(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.input_file = "test_utility_binary_input.txt"
+        self.binary_file = "test_utility_binary_input.pami"
+        lines = []
+        for _ in range(150):
+            items = random.sample(range(1, 13), random.randint(1, 6))
+            utilities = [random.randint(1, 9) for _ in items]
+            lines.append("\t".join(str(x) for x in items) + ":" + str(sum(utilities)) + ":" +
+                         "\t".join(str(x) for x in utilities))
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+        TransactionStore.fromFile(self.input_file, dbType='utility').save(self.binary_file)
+
+    def tearDown(self):
+        for name in [self.input_file, self.binary_file]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def test_round_trip(self):
+        store = TransactionStore.fromBinary(self.binary_file)
+        oFile = store.toTemporaryFile(self)
+        with open(oFile) as f, open(self.input_file) as g:
+            self.assertEqual(f.read(), g.read())
+
+    def test_every_miner(self):
+        for alg in [EFIM, HMiner, UPGrowth, efimParallel]:
+            fromFile = alg(self.input_file, 80)
+            fromFile.mine()
+            fromBinary = alg(self.binary_file, 80)
+            fromBinary.mine()
+            expected = {_key(k): v for k, v in fromFile.getPatterns().items()}
+            self.assertTrue(expected, alg.__name__)
+            self.assertEqual({_key(k): v for k, v in fromBinary.getPatterns().items()}, expected, alg.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
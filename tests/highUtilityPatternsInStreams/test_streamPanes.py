@@ -0,0 +1,60 @@
+import unittest
+import os
+import random
+import warnings
+from PAMI.highUtilityPatternsInStreams.HUPMS import HUPMS
+from PAMI.highUtilityPatternsInStreams.SHUGrowth import SHUGrowth
+
+warnings.filterwarnings("ignore")
+
+
+class TestStreamPanes(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(9)
+        self.dataset = []
+        for _ in range(120):
+            items = random.sample(range(12), random.randint(2, 5))
+            self.dataset.append({str(x): random.randint(1, 10) for x in items})
+        self.input_file = "test_stream_panes_input.txt"
+        with open(self.input_file, 'w') as f:
+            for line in self.dataset:
+                f.write(",".join(line) + ":" + str(sum(line.values())) + ":" + ",".join(str(x) for x in line.values()) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def utility(self, itemSet, start, end):
+        return sum(sum(line[x] for x in itemSet) for line in self.dataset[start:end] if set(itemSet) <= set(line))
+
+    def test_window_utilities(self):
+        for algorithm in [HUPMS, SHUGrowth]:
+            full = algorithm(self.input_file, "out.txt", 60, 3, 10, ",")
+            full.mine(incremental=False)
+            obj = algorithm(self.input_file, "out.txt", 60, 3, 10, ",")
+            obj.mine()
+            self.assertEqual(obj.getPatterns(), full.getPatterns())
+            self.assertEqual(len(obj.getPatterns()), 10)
+            self.assertGreater(sum(len(x) for x in obj.getPatterns().values()), 0)
+            for (start, end), patterns in obj.getPatterns().items():
+                for itemSet, utility in patterns:
+                    self.assertEqual(utility, self.utility(itemSet, start, end))
+
+    def test_accumulators(self):
+        obj = HUPMS(self.input_file, "out.txt", 60, 3, 10, ",")
+        panes = [self.dataset[i:i + 10] for i in range(0, 50, 10)]
+        for pane in panes[:3]:
+            obj._addPane(pane)
+        self.assertEqual(obj._windowUtilities([["1"], ["1", "2"]]),
+                         [self.utility(["1"], 0, 30), self.utility(["1", "2"], 0, 30)])
+        obj._evictPane()
+        obj._addPane(panes[3])
+        self.assertEqual(obj._windowUtilities([["1", "2"]]), [self.utility(["1", "2"], 10, 40)])
+        # the accumulators of the candidates that are no longer verified are released
+        self.assertEqual(list(obj._accumulators), [("1", "2")])
+        self.assertEqual(obj._accumulators[("1", "2")][0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
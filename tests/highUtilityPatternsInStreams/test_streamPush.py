@@ -0,0 +1,63 @@
+import unittest
+import os
+import random
+import asyncio
+import warnings
+from PAMI.highUtilityPatternsInStreams.HUPMS import HUPMS
+from PAMI.highUtilityPatternsInStreams.SHUGrowth import SHUGrowth
+
+warnings.filterwarnings("ignore")
+
+
+class TestStreamPush(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(10)
+        self.dataset = []
+        for _ in range(100):
+            items = random.sample(range(12), random.randint(2, 5))
+            self.dataset.append({str(x): random.randint(1, 10) for x in items})
+        self.lines = [",".join(line) + ":" + str(sum(line.values())) + ":" + ",".join(str(x) for x in line.values())
+                      for line in self.dataset]
+        self.input_file = "test_stream_push_input.txt"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join(self.lines) + "\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_windows(self):
+        for algorithm in [HUPMS, SHUGrowth]:
+            reference = algorithm(self.input_file, "out.txt", 60, 3, 10, ",")
+            reference.mine()
+            windows = {}
+            obj = algorithm(None, "out.txt", 60, 3, 10, ",")
+            obj.add_stream(iter(self.lines), lambda window, patterns: windows.update({window: patterns}))
+            self.assertEqual(windows, reference.getPatterns())
+            self.assertEqual(len(obj._panes), 3)
+            self.assertEqual(obj.current_patterns(), reference.getPatterns()[(70, 100)])
+
+    def test_async_stream(self):
+        async def stream():
+            for line in self.dataset:
+                yield line
+
+        reference = HUPMS(self.input_file, "out.txt", 60, 3, 10, ",")
+        reference.mine()
+        windows = {}
+        obj = HUPMS(None, "out.txt", 60, 3, 10, ",")
+        asyncio.run(obj.add_stream(stream(), lambda window, patterns: windows.update({window: patterns})))
+        self.assertEqual(windows, reference.getPatterns())
+
+    def test_panes(self):
+        obj = SHUGrowth(None, "out.txt", 60, 3, 10, ",")
+        for i in range(0, 50, 10):
+            obj.add_pane([(list(line), list(line.values())) for line in self.dataset[i:i + 10]])
+        reference = SHUGrowth(self.input_file, "out.txt", 60, 3, 10, ",")
+        reference.mine()
+        self.assertEqual(obj.current_patterns(), reference.getPatterns()[(20, 50)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import random
+import warnings
+from itertools import combinations
+import numpy as np
+from PAMI.extras import tidset as ts
+from PAMI.localPeriodicPattern.basic.LPPMDepth import LPPMDepth
+from PAMI.localPeriodicPattern.basic.LPPMBreadth import LPPMBreadth
+from PAMI.localPeriodicPattern.basic.LPPGrowth import LPPGrowth
+
+warnings.filterwarnings("ignore")
+
+
+def scan(stamps, maxPer, maxSoPer, minDur, end):
+    periods, start, soPer = set(), -1, 0
+    for previous, current in zip(stamps, stamps[1:]):
+        per = current - previous
+        if per <= maxPer and start == -1:
+            start, soPer = previous, maxSoPer
+        if start != -1:
+            soPer = max(0, soPer + per - maxPer)
+            if soPer > maxSoPer:
+                if previous - start >= minDur:
+                    periods.add((start, previous))
+                start = -1
+    if start != -1:
+        soPer = max(0, soPer + end - stamps[-1] - maxPer)
+        if soPer > maxSoPer and stamps[-1] - start >= minDur:
+            periods.add((start, stamps[-1]))
+        if soPer <= maxSoPer and end - start >= minDur:
+            periods.add((start, end))
+    return periods
+
+
+class TestLPPMIntervals(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(6)
+        self.dataset = [random.sample(range(6), random.randint(1, 4)) for _ in range(400)]
+        self.input_file = "test_lppm_intervals_input.txt"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join([str(i + 1)] + [str(x) for x in line]) for i, line in enumerate(self.dataset)))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_local_periods(self):
+        for _ in range(300):
+            end = random.randint(2, 600)
+            stamps = sorted(random.sample(range(1, end + 1), random.randint(0, end // 2)))
+            arguments = (random.randint(1, 6), random.randint(0, 8) + random.choice([0, 0.5]), random.randint(0, 40))
+            self.assertEqual(ts.localPeriods(np.array(stamps, dtype=np.int64), *arguments, end, blockSize=4),
+                             scan(stamps, *arguments, end))
+
+    def test_patterns(self):
+        expected = {}
+        for length in range(1, 7):
+            for pattern in combinations(range(6), length):
+                stamps = [i + 1 for i, line in enumerate(self.dataset) if set(pattern) <= set(line)]
+                periods = scan(stamps, 6, 8, 20, len(self.dataset)) if stamps else set()
+                if periods:
+                    expected[tuple(str(x) for x in pattern)] = periods
+        # an interval still open at the end of the database ends at tsmax in every miner
+        for algorithm in (LPPMDepth, LPPMBreadth, LPPGrowth):
+            obj = algorithm(self.input_file, 6, 8, 20, '\t')
+            obj.mine()
+            actual = {tuple(sorted([k] if isinstance(k, str) else k)): v for k, v in obj.getPatterns().items()}
+            self.assertEqual(actual, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import os
+import random
+import warnings
+from itertools import combinations
+import numpy as np
+from PAMI.extras import tidset as ts
+from PAMI.partialPeriodicPattern.basic.PPP_ECLAT import PPP_ECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestPPP_ECLAT(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(6)
+        self.dataset = [random.sample(range(10), random.randint(2, 7)) for _ in range(300)]
+        self.input_file = "test_ppp_eclat_input.txt"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join([str(i + 1)] + [str(x) for x in line]) for i, line in enumerate(self.dataset)))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def expected(self, minPS, period):
+        patterns = {}
+        items = sorted(set(x for line in self.dataset for x in line))
+        for length in range(1, len(items) + 1):
+            for pattern in combinations(items, length):
+                stamps = [i + 1 for i, line in enumerate(self.dataset) if set(pattern) <= set(line)]
+                perSup = int(np.count_nonzero(np.diff(stamps) <= period))
+                if perSup >= minPS:
+                    patterns[tuple(str(x) for x in pattern)] = perSup
+        return patterns
+
+    def test_periodic_intersect(self):
+        a = np.array([1, 2, 5, 9, 10, 20, 21], dtype=np.int64)
+        b = np.array([2, 3, 5, 10, 20, 21, 40], dtype=np.int64)
+        for blockSize in [1, 2, 4096]:
+            tids, count = ts.periodicIntersect(a, b, 3, blockSize=blockSize)
+            self.assertEqual(tids.tolist(), [2, 5, 10, 20, 21])
+            # the gaps are 3, 5, 10 and 1
+            self.assertEqual(count, 2)
+            self.assertEqual(ts.periodicIntersect(a, b, 3, 2, blockSize=blockSize)[1], 2)
+            self.assertIsNone(ts.periodicIntersect(a, b, 3, 3, blockSize=blockSize))
+            # an empty or single timestamp intersection has no gaps but still reaches a minimum of 0
+            for other in [np.array([], dtype=np.int64), np.array([4, 6], dtype=np.int64)]:
+                tids, count = ts.periodicIntersect(a, other, 3, 0, blockSize=blockSize)
+                self.assertEqual((tids.tolist(), count), ([], 0))
+            tids, count = ts.periodicIntersect(a, np.array([9], dtype=np.int64), 3, 0, blockSize=blockSize)
+            self.assertEqual((tids.tolist(), count), ([9], 0))
+            self.assertIsNone(ts.periodicIntersect(a, np.array([9], dtype=np.int64), 3, 1, blockSize=blockSize))
+
+    def test_patterns(self):
+        obj = PPP_ECLAT(self.input_file, 15, 6, "\t")
+        obj.mine()
+        actual = {tuple(sorted(k.split("\t"))): v for k, v in obj.getPatterns().items()}
+        self.assertEqual(actual, self.expected(15, 6))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import os
+import random
+import warnings
+from itertools import combinations
+import numpy as np
+from PAMI.extras import tidset as ts
+from PAMI.periodicFrequentPattern.basic.PFECLAT import PFECLAT
+
+warnings.filterwarnings("ignore")
+
+
+class TestPFECLAT(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(2)
+        self.dataset = [random.sample(range(10), random.randint(2, 7)) for _ in range(300)]
+        self.input_file = "test_pfeclat_input.txt"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join([str(i + 1)] + [str(x) for x in line]) for i, line in enumerate(self.dataset)))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def expected(self, minSup, maxPer):
+        patterns = {}
+        items = sorted(set(x for line in self.dataset for x in line))
+        for length in range(1, len(items) + 1):
+            found = False
+            for pattern in combinations(items, length):
+                stamps = [i + 1 for i, line in enumerate(self.dataset) if set(pattern) <= set(line)]
+                if len(stamps) < minSup:
+                    continue
+                found = True
+                per = int(np.diff([0] + stamps + [len(self.dataset)]).max())
+                if per <= maxPer:
+                    patterns[tuple(str(x) for x in pattern)] = [len(stamps), per]
+            if not found:
+                break
+        return patterns
+
+    def test_max_gap(self):
+        stamps = np.array([3, 4, 10, 11, 30], dtype=np.int64)
+        self.assertEqual(ts.maxGap(stamps, 0, 32), 19)
+        self.assertEqual(ts.maxGap(stamps, 0, 32, blockSize=2), 19)
+        self.assertGreater(ts.maxGap(stamps, 0, 32, limit=5, blockSize=1), 5)
+        self.assertEqual(ts.maxGap(np.array([], dtype=np.int64), 0, 32), 32)
+
+    def test_patterns(self):
+        obj = PFECLAT(self.input_file, 20, 30)
+        obj.mine()
+        actual = {tuple(sorted(k.split("\t"))): v for k, v in obj.getPatterns().items()}
+        self.assertEqual(actual, self.expected(20, 30))
+
+    def test_retain_timestamps(self):
+        obj = PFECLAT(self.input_file, 20, 30)
+        obj.mine(retainTimestamps=True)
+        for pattern, value in obj.getPatterns().items():
+            items = set(int(x) for x in pattern.split("\t"))
+            stamps = [i + 1 for i, line in enumerate(self.dataset) if items <= set(line)]
+            self.assertEqual(value[2].tolist(), stamps)
+
+
+if __name__ == '__main__':
+    unittest.main()
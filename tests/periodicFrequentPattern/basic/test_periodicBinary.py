@@ -0,0 +1,51 @@
+import unittest
+import os
+import random
+import warnings
+from PAMI.extras.TransactionStore import TransactionStore
+from PAMI.periodicFrequentPattern.basic.PFECLAT import PFECLAT
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+from PAMI.periodicFrequentPattern.basic.PFPGrowthPlus import PFPGrowthPlus
+from PAMI.periodicFrequentPattern.basic.PFPMC import PFPMC
+from PAMI.periodicFrequentPattern.basic.PSGrowth import PSGrowth
+from PAMI.periodicFrequentPattern.basic import _PFECLAT, _PFPGrowth
+
+warnings.filterwarnings("ignore")
+
+
+def _key(pattern):
+    return frozenset(pattern.strip().split('\t') if isinstance(pattern, str) else pattern)
+
+
+class TestPeriodicBinary(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.input_file = "test_periodic_binary_input.txt"
+        self.binary_file = "test_periodic_binary_input.pami"
+        with open(self.input_file, 'w') as f:
+            f.write("\n".join("\t".join([str(i + 1)] + [str(x) for x in random.sample(range(1, 13), random.randint(1, 6))])
+                              for i in range(200)) + "\n")
+        TransactionStore.fromFile(self.input_file, dbType='temporal').save(self.binary_file)
+
+    def tearDown(self):
+        for name in [self.input_file, self.binary_file]:
+            if os.path.exists(name):
+                os.remove(name)
+
+    def test_every_miner(self):
+        for alg in [PFECLAT, PFPGrowth, PFPGrowthPlus, PFPMC, PSGrowth, _PFECLAT.PFECLAT, _PFPGrowth.PFPGrowth]:
+            results = []
+            for iFile in [self.input_file, self.binary_file]:
+                obj = alg(iFile, 20, 30)
+                if hasattr(obj, 'mine'):
+                    obj.mine()
+                else:
+                    obj.startMine()
+                results.append({_key(k): tuple(v) for k, v in obj.getPatterns().items()})
+            self.assertTrue(results[0], alg.__module__)
+            self.assertEqual(results[1], results[0], alg.__module__)
+
+
+if __name__ == '__main__':
+    unittest.main()
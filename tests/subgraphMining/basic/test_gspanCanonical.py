@@ -0,0 +1,62 @@
+import unittest
+import os
+import random
+from PAMI.subgraphMining.basic.gspan import GSpan
+from PAMI.subgraphMining.basic import abstract as _ab
+
+
+class TestGSpanCanonical(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(9)
+        self.input_file = "test_gspan_canonical_input.txt"
+        with open(self.input_file, 'w') as f:
+            for t in range(30):
+                n = random.randint(5, 8)
+                f.write(f"t # {t}\n")
+                for v in range(n):
+                    f.write(f"v {v} {random.randint(0, 1)}\n")
+                edges = set((random.randrange(v), v) for v in range(1, n))
+                for _ in range(random.randint(1, 3)):
+                    a, b = random.sample(range(n), 2)
+                    edges.add((min(a, b), max(a, b)))
+                for a, b in sorted(edges):
+                    f.write(f"e {a} {b} 0\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    @staticmethod
+    def fullCheck(gspan, c):
+        # rebuilds the minimum DFS code from scratch at every prefix length
+        canC = _ab.DFSCode()
+        for i in range(c.size):
+            extensions = gspan.rightMostPathExtensionsFromSingle(canC, _ab.Graph(-1, None, c))
+            minEe = None
+            for ee in extensions:
+                if minEe is None or ee.smallerThan(minEe):
+                    minEe = ee
+            if minEe.smallerThan(c.getAt(i)):
+                return False
+            canC.add(minEe)
+        return True
+
+    def test_is_canonical(self):
+        gspan = GSpan(self.input_file, 0.2)
+        codes = []
+        isCanonical = gspan.isCanonical
+
+        def record(c):
+            codes.append(c)
+            return isCanonical(c)
+
+        gspan.isCanonical = record
+        gspan.mine()
+        self.assertTrue(any(not isCanonical(c) for c in codes))
+        for c in codes:
+            self.assertEqual(isCanonical(c), self.fullCheck(gspan, c))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import os
+import random
+from PAMI.subgraphMining.basic.gspan import GSpan
+
+
+class TestGSpanProjection(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        self.input_file = "test_gspan_projection_input.txt"
+        with open(self.input_file, 'w') as f:
+            for t in range(30):
+                n = random.randint(4, 7)
+                f.write(f"t # {t}\n")
+                for v in range(n):
+                    f.write(f"v {v} {random.randint(0, 1)}\n")
+                edges = set((random.randrange(v), v) for v in range(1, n))
+                for _ in range(random.randint(0, 3)):
+                    a, b = random.sample(range(n), 2)
+                    edges.add((min(a, b), max(a, b)))
+                for a, b in sorted(edges):
+                    f.write(f"e {a} {b} {random.randint(0, 1)}\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_support(self):
+        gspan = GSpan(self.input_file, 0.1)
+        gspan.mine()
+        graphDb = gspan.readGraphs(self.input_file)
+        for g in graphDb:
+            g.precalculateVertexNeighbors()
+            g.precalculateLabelsToVertices()
+        codes = set()
+        for subgraph in gspan.frequentSubgraphs:
+            self.assertNotIn(str(subgraph.dfsCode), codes)
+            codes.add(str(subgraph.dfsCode))
+            if subgraph.dfsCode.getEeList()[0].getEdgeLabel() == -1:
+                continue
+            # the embeddings grown edge by edge must give the graphs found by the isomorphism search
+            expected = set(i for i, g in enumerate(graphDb) if gspan.subgraphIsomorphisms(subgraph.dfsCode, g))
+            self.assertEqual(subgraph.setOfGraphsIds, expected)
+        self.assertTrue(any(subgraph.dfsCode.size >= 3 for subgraph in gspan.frequentSubgraphs))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import os
+import random
+from queue import PriorityQueue
+from PAMI.subgraphMining.topK.tkg import TKG
+from PAMI.subgraphMining.topK.DFSThread import DfsThread
+
+
+class TestTKGWorkers(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.input_file = "test_tkg_workers_input.txt"
+        with open(self.input_file, 'w') as f:
+            for t in range(40):
+                n = random.randint(6, 10)
+                f.write(f"t # {t}\n")
+                for v in range(n):
+                    f.write(f"v {v} {random.randint(0, 2)}\n")
+                edges = set((random.randrange(v), v) for v in range(1, n))
+                for _ in range(random.randint(1, 3)):
+                    a, b = random.sample(range(n), 2)
+                    edges.add((min(a, b), max(a, b)))
+                for a, b in sorted(edges):
+                    f.write(f"e {a} {b} 0\n")
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_supports(self):
+        results = []
+        for numWorkers in [1, 2]:
+            tkg = TKG(self.input_file, 25, numWorkers=numWorkers)
+            tkg.mine()
+            results.append(([subgraph.support for subgraph in tkg.getSubgraphsList()], tkg.getMinSupport()))
+        self.assertEqual(len(results[0][0]), 25)
+        self.assertEqual(results[0], results[1])
+
+    def test_thread_count_alias(self):
+        with self.assertWarns(DeprecationWarning):
+            tkg = TKG(self.input_file, 25, threadCount=2)
+        self.assertEqual(tkg.numWorkers, 2)
+        with self.assertWarns(DeprecationWarning):
+            tkg.threadCount = 3
+        self.assertEqual(tkg.numWorkers, 3)
+
+    def test_dfs_thread_deprecated(self):
+        with self.assertWarns(DeprecationWarning):
+            thread = DfsThread(None, PriorityQueue(), 25, None)
+        thread.start()
+        thread.join()
+
+
+if __name__ == '__main__':
+    unittest.main()